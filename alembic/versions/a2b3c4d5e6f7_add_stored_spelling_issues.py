@@ -0,0 +1,51 @@
+"""add stored spelling issues
+
+Adds spelling_issues (encrypted) and spelling_dictionary_version to
+transcriptions and cleaned_entries. Spelling issues are computed when a
+text is completed or edited instead of on every read.
+
+Revision ID: a2b3c4d5e6f7
+Revises: f1a2b3c4d5e6
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from schema_config import get_schema
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2b3c4d5e6f7'
+down_revision: Union[str, None] = 'f1a2b3c4d5e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    schema = get_schema()
+    for table in ('transcriptions', 'cleaned_entries'):
+        op.add_column(
+            table,
+            sa.Column('spelling_issues', sa.LargeBinary(), nullable=True),
+            schema=schema
+        )
+        op.add_column(
+            table,
+            sa.Column(
+                'spelling_dictionary_version',
+                sa.String(32),
+                nullable=True,
+                comment='Spell-check dictionary version spelling_issues were computed with'
+            ),
+            schema=schema
+        )
+
+
+def downgrade() -> None:
+    schema = get_schema()
+    for table in ('cleaned_entries', 'transcriptions'):
+        op.drop_column(table, 'spelling_dictionary_version', schema=schema)
+        op.drop_column(table, 'spelling_issues', schema=schema)
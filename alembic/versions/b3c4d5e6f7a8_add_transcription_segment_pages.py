@@ -0,0 +1,51 @@
+"""add transcription segment pages
+
+Adds transcription_segment_pages table: diarized segments split into
+encrypted pages, indexed by segment position and time range. Only new
+transcriptions are stored in pages; existing transcriptions.segments blobs
+are kept as they are and still read from there.
+
+Revision ID: b3c4d5e6f7a8
+Revises: a2b3c4d5e6f7
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from schema_config import get_schema
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3c4d5e6f7a8'
+down_revision: Union[str, None] = 'a2b3c4d5e6f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    schema = get_schema()
+    op.create_table(
+        'transcription_segment_pages',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('transcription_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('page_index', sa.Integer(), nullable=False),
+        sa.Column('first_position', sa.Integer(), nullable=False),
+        sa.Column('segment_count', sa.Integer(), nullable=False),
+        sa.Column('start_time', sa.Float(), nullable=False),
+        sa.Column('end_time', sa.Float(), nullable=False),
+        sa.Column('has_speaker', sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column('segments', sa.LargeBinary(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(['transcription_id'], [f'{schema}.transcriptions.id'], ondelete='CASCADE'),
+        sa.UniqueConstraint('transcription_id', 'page_index', name='uq_transcription_segment_page'),
+        schema=schema
+    )
+
+
+def downgrade() -> None:
+    schema = get_schema()
+    op.drop_table('transcription_segment_pages', schema=schema)
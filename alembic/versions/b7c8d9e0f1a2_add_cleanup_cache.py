@@ -0,0 +1,71 @@
+"""add cleanup cache
+
+Adds a cache of deterministic cleanup outputs:
+- cleanup_cache table (one row per voice entry and cleanup input key)
+- cache_hit column on cleaned_entries
+
+Revision ID: b7c8d9e0f1a2
+Revises: f8a9b0c1d2e3
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from schema_config import get_schema
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c8d9e0f1a2'
+down_revision: Union[str, None] = 'f8a9b0c1d2e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    schema = get_schema()
+    # Create cleanup_cache table (outputs encrypted under the voice entry's DEK)
+    op.create_table(
+        'cleanup_cache',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('voice_entry_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('cache_key', sa.String(64), nullable=False),
+        sa.Column('cleaned_text', postgresql.BYTEA(), nullable=False),
+        sa.Column('prompt_template_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(['voice_entry_id'], [f'{schema}.voice_entries.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['prompt_template_id'], [f'{schema}.prompt_templates.id'], ondelete='SET NULL'),
+        sa.UniqueConstraint('voice_entry_id', 'cache_key', name='uq_cleanup_cache_entry_key'),
+        schema=schema
+    )
+
+    op.create_index(
+        'ix_cleanup_cache_voice_entry_id',
+        'cleanup_cache',
+        ['voice_entry_id'],
+        schema=schema
+    )
+
+    # Add cache_hit column to cleaned_entries
+    op.add_column(
+        'cleaned_entries',
+        sa.Column(
+            'cache_hit',
+            sa.Boolean(),
+            nullable=False,
+            server_default='false',
+            comment='Whether the cleaned text was reused from the cleanup cache'
+        ),
+        schema=schema
+    )
+
+
+def downgrade() -> None:
+    schema = get_schema()
+    op.drop_column('cleaned_entries', 'cache_hit', schema=schema)
+
+    op.drop_index('ix_cleanup_cache_voice_entry_id', table_name='cleanup_cache', schema=schema)
+    op.drop_table('cleanup_cache', schema=schema)
@@ -0,0 +1,76 @@
+"""add prompt template change trigger
+
+Supports the in-process prompt template cache:
+- BEFORE UPDATE: bump version when prompt_text is edited in place
+  (cleanup cache keys include the template version)
+- AFTER INSERT/UPDATE/DELETE: NOTIFY prompt_templates_changed with
+  "{schema}:{entry_type}" so every worker drops its cached template
+
+Revision ID: c8d9e0f1a2b3
+Revises: b7c8d9e0f1a2
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from schema_config import get_schema
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d9e0f1a2b3'
+down_revision: Union[str, None] = 'b7c8d9e0f1a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    schema = get_schema()
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION {schema}.prompt_templates_bump_version()
+        RETURNS trigger AS $$
+        BEGIN
+            IF NEW.prompt_text IS DISTINCT FROM OLD.prompt_text AND NEW.version = OLD.version THEN
+                NEW.version := OLD.version + 1;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(f"""
+        CREATE TRIGGER prompt_templates_bump_version
+        BEFORE UPDATE ON {schema}.prompt_templates
+        FOR EACH ROW EXECUTE FUNCTION {schema}.prompt_templates_bump_version()
+    """)
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION {schema}.prompt_templates_notify_changed()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM pg_notify('prompt_templates_changed', TG_TABLE_SCHEMA || ':' || OLD.entry_type);
+            ELSE
+                PERFORM pg_notify('prompt_templates_changed', TG_TABLE_SCHEMA || ':' || NEW.entry_type);
+                IF TG_OP = 'UPDATE' AND NEW.entry_type IS DISTINCT FROM OLD.entry_type THEN
+                    PERFORM pg_notify('prompt_templates_changed', TG_TABLE_SCHEMA || ':' || OLD.entry_type);
+                END IF;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(f"""
+        CREATE TRIGGER prompt_templates_notify_changed
+        AFTER INSERT OR UPDATE OR DELETE ON {schema}.prompt_templates
+        FOR EACH ROW EXECUTE FUNCTION {schema}.prompt_templates_notify_changed()
+    """)
+
+
+def downgrade() -> None:
+    schema = get_schema()
+    op.execute(f"DROP TRIGGER IF EXISTS prompt_templates_notify_changed ON {schema}.prompt_templates")
+    op.execute(f"DROP FUNCTION IF EXISTS {schema}.prompt_templates_notify_changed()")
+    op.execute(f"DROP TRIGGER IF EXISTS prompt_templates_bump_version ON {schema}.prompt_templates")
+    op.execute(f"DROP FUNCTION IF EXISTS {schema}.prompt_templates_bump_version()")
@@ -0,0 +1,67 @@
+"""add transcription hedging
+
+Adds hedged transcription requests:
+- transcription_hedging preference on user_preferences (opt-in)
+- hedge_model_used and hedge_extra_audio_seconds on transcriptions
+
+Revision ID: d9e0f1a2b3c4
+Revises: c8d9e0f1a2b3
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from schema_config import get_schema
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9e0f1a2b3c4'
+down_revision: Union[str, None] = 'c8d9e0f1a2b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    schema = get_schema()
+    op.add_column(
+        'user_preferences',
+        sa.Column(
+            'transcription_hedging',
+            sa.Boolean(),
+            nullable=False,
+            server_default='false',
+            comment='Send a hedge request to another provider when transcription is slow'
+        ),
+        schema=schema
+    )
+
+    op.add_column(
+        'transcriptions',
+        sa.Column(
+            'hedge_model_used',
+            sa.String(50),
+            nullable=True,
+            comment='Model of the hedge request, if one was sent'
+        ),
+        schema=schema
+    )
+    op.add_column(
+        'transcriptions',
+        sa.Column(
+            'hedge_extra_audio_seconds',
+            sa.Float(),
+            nullable=True,
+            comment='Audio seconds billed for the hedge request'
+        ),
+        schema=schema
+    )
+
+
+def downgrade() -> None:
+    schema = get_schema()
+    op.drop_column('transcriptions', 'hedge_extra_audio_seconds', schema=schema)
+    op.drop_column('transcriptions', 'hedge_model_used', schema=schema)
+    op.drop_column('user_preferences', 'transcription_hedging', schema=schema)
@@ -0,0 +1,56 @@
+"""add idempotency keys
+
+Adds idempotency_keys table: responses of requests sent with an
+Idempotency-Key header, replayed when the request is retried.
+
+Revision ID: e0f1a2b3c4d5
+Revises: d9e0f1a2b3c4
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from schema_config import get_schema
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e0f1a2b3c4d5'
+down_revision: Union[str, None] = 'd9e0f1a2b3c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    schema = get_schema()
+    op.create_table(
+        'idempotency_keys',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('endpoint', sa.String(100), nullable=False),
+        sa.Column('key', sa.String(255), nullable=False),
+        sa.Column('request_fingerprint', sa.String(64), nullable=False),
+        sa.Column('status_code', sa.Integer(), nullable=True),
+        sa.Column('response_body', postgresql.JSONB(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], [f'{schema}.users.id'], ondelete='CASCADE'),
+        sa.UniqueConstraint('user_id', 'endpoint', 'key', name='uq_idempotency_key_user_endpoint_key'),
+        schema=schema
+    )
+
+    op.create_index(
+        'ix_idempotency_keys_expires_at',
+        'idempotency_keys',
+        ['expires_at'],
+        schema=schema
+    )
+
+
+def downgrade() -> None:
+    schema = get_schema()
+    op.drop_index('ix_idempotency_keys_expires_at', table_name='idempotency_keys', schema=schema)
+    op.drop_table('idempotency_keys', schema=schema)
@@ -0,0 +1,64 @@
+"""add job checkpoints
+
+Adds job_checkpoints table: unfinished background jobs with their
+progress, resumed after a shutdown or a crashed worker.
+
+Revision ID: f1a2b3c4d5e6
+Revises: e0f1a2b3c4d5
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from schema_config import get_schema
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a2b3c4d5e6'
+down_revision: Union[str, None] = 'e0f1a2b3c4d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    schema = get_schema()
+    op.create_table(
+        'job_checkpoints',
+        sa.Column('job_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('kind', sa.String(20), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('voice_entry_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('task', sa.String(50), nullable=False),
+        sa.Column('params', postgresql.JSONB(), nullable=False),
+        sa.Column('progress', postgresql.JSONB(), nullable=True),
+        sa.Column('owner', sa.String(32), nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(['user_id'], [f'{schema}.users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['voice_entry_id'], [f'{schema}.voice_entries.id'], ondelete='CASCADE'),
+        schema=schema
+    )
+
+    op.create_index(
+        'ix_job_checkpoints_voice_entry_id',
+        'job_checkpoints',
+        ['voice_entry_id'],
+        schema=schema
+    )
+    op.create_index(
+        'ix_job_checkpoints_owner_heartbeat_at',
+        'job_checkpoints',
+        ['owner', 'heartbeat_at'],
+        schema=schema
+    )
+
+
+def downgrade() -> None:
+    schema = get_schema()
+    op.drop_index('ix_job_checkpoints_owner_heartbeat_at', table_name='job_checkpoints', schema=schema)
+    op.drop_index('ix_job_checkpoints_voice_entry_id', table_name='job_checkpoints', schema=schema)
+    op.drop_table('job_checkpoints', schema=schema)
@@ -43,18 +43,66 @@ class Settings(BaseSettings):
     DEFAULT_LLM_PROVIDER: str = "groq"  # Options: groq, runpod_llm_gams
     LLM_TIMEOUT_SECONDS: int = 120
     LLM_MAX_RETRIES: int = 2
+    LLM_CLEANUP_WINDOW_OVERLAP_TOKENS: int = 100  # Context repeated across cleanup windows of long transcripts
+    LLM_CLEANUP_MAX_CONCURRENT_WINDOWS: int = 8  # Max cleanup windows of one transcript in flight
+    PROMPT_TEMPLATE_CACHE_TTL_SECONDS: int = 300  # Max age of cached active prompt templates (changes are pushed via NOTIFY)
+    LLM_CLEANUP_CACHE_ENABLED: bool = True  # Reuse outputs of identical deterministic (temperature 0) cleanups
+
+    # Provider model listings (GET /options)
+    PROVIDER_MODELS_REFRESH_SECONDS: int = 3600  # Age after which cached provider model lists are refreshed in the background
+    PROVIDER_MODELS_FETCH_TIMEOUT_SECONDS: float = 5.0  # Max wait for a model list that has never been fetched
+
+    # Circuit breakers per provider endpoint (fail fast during provider outages)
+    CIRCUIT_BREAKER_ENABLED: bool = True
+    CIRCUIT_BREAKER_WINDOW_SECONDS: float = 120.0  # Rolling window of call outcomes and latencies
+    CIRCUIT_BREAKER_MIN_CALLS: int = 5  # Calls in the window before the circuit may open
+    CIRCUIT_BREAKER_FAILURE_RATE: float = 0.5  # Share of failed calls that opens the circuit
+    CIRCUIT_BREAKER_SLOW_CALL_SECONDS: float = 0.0  # Calls slower than this count as slow (0 = ignore latency)
+    CIRCUIT_BREAKER_SLOW_CALL_RATE: float = 0.8  # Share of slow calls that opens the circuit
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = 60.0  # Seconds before a probe call is let through
+    CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS: int = 1  # Concurrent probe calls while half-open
+
+    # Fair scheduling of transcription and cleanup background jobs
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_MAX_CONCURRENT_JOBS: int = 8  # Jobs running at once in this process
+    SCHEDULER_MAX_JOBS_PER_USER: int = 2  # Jobs of one user running at once
+    SCHEDULER_INTERACTIVE_MAX_SECONDS: float = 300.0  # Jobs with up to this much audio use the priority lane
+    SCHEDULER_QUANTUM_SECONDS: float = 600.0  # Audio seconds credited per user per round-robin turn
+
+    # Idempotency-Key support for upload, transcription and cleanup requests
+    IDEMPOTENCY_KEY_TTL_SECONDS: int = 86400  # How long a completed response is replayed for retries
+    IDEMPOTENCY_KEY_LOCK_SECONDS: int = 600  # How long an in-progress request blocks retries with its key
+
+    # Graceful shutdown and resume of background jobs
+    SHUTDOWN_DRAIN_SECONDS: int = 45  # How long running jobs may finish on shutdown before they are checkpointed
+    JOB_HEARTBEAT_SECONDS: int = 30  # How often workers refresh their job checkpoints and resume released ones
+    JOB_STALE_SECONDS: int = 180  # Checkpoints without a heartbeat for this long are resumed by another worker
+
+    # Startup: ready once the database and encryption are up; heavy optional
+    # components (spell-check dictionary) load in the background (see /health/ready)
+    STARTUP_WARMUP_IN_BACKGROUND: bool = True  # False = startup waits for them
 
     # Groq API Configuration (for both transcription and LLM)
     GROQ_API_KEY: Optional[str] = None  # Required when using Groq provider
     GROQ_TRANSCRIPTION_MODEL: str = "whisper-large-v3"  # Groq's Whisper model
     GROQ_LLM_MODEL: str = "meta-llama/llama-4-maverick-17b-128e-instruct"  # Groq's chat model
+    GROQ_LLM_CONTEXT_WINDOW: int = 131072  # Context length of GROQ_LLM_MODEL (tokens)
+    GROQ_CHUNK_DURATION_SECONDS: int = 600  # Max audio per Whisper request (longer audio is chunked)
+    GROQ_CHUNK_OVERLAP_SECONDS: int = 5  # Overlap at cuts that could not be aligned to silence
+    GROQ_USE_SILENCE_DETECTION: bool = True  # Align chunk boundaries to silences
+    GROQ_CHUNK_FORMAT: str = "flac"  # Upload encoding: flac (lossless), opus (smallest), wav
+    GROQ_MAX_CONCURRENT_CHUNKS: int = 4  # Max parallel chunk requests
+    GROQ_TRANSCRIPTION_RPM: int = 20  # Whisper requests per minute allowed by the Groq plan
 
     # AssemblyAI API Configuration
     ASSEMBLYAI_API_KEY: Optional[str] = None  # Required when using AssemblyAI provider
     ASSEMBLYAI_MODEL: str = "universal"
-    ASSEMBLYAI_POLL_INTERVAL: float = 3.0  # Seconds between status polls
+    ASSEMBLYAI_POLL_INTERVAL: float = 3.0  # Minimum seconds between status polls
     ASSEMBLYAI_TIMEOUT: int = 1000  # Max seconds to wait for transcription
     ASSEMBLYAI_AUTO_DELETE: bool = True  # Auto-delete transcript after extraction (GDPR compliance)
+    ASSEMBLYAI_POLL_MAX_INTERVAL: float = 30.0  # Upper bound for the adaptive poll interval
+    ASSEMBLYAI_WEBHOOK_URL: Optional[str] = None  # Public URL of /api/v1/webhooks/assemblyai (None = polling only)
+    ASSEMBLYAI_WEBHOOK_SECRET: Optional[str] = None  # Shared secret AssemblyAI echoes in the webhook auth header
 
     # RunPod API Configuration (for Slovenian transcription using PROTOVERB model)
     RUNPOD_API_KEY: Optional[str] = None  # Required when using RunPod provider
@@ -67,6 +115,16 @@ class Settings(BaseSettings):
     RUNPOD_TIMEOUT: int = 300  # Max seconds per chunk (5 minutes)
     RUNPOD_MAX_RETRIES: int = 3  # Max retry attempts on failure
 
+    # RunPod async job mode (/run + /status instead of /runsync)
+    RUNPOD_ASYNC_JOBS: bool = False  # Submit jobs via /run and poll /status (resumable on retry/restart)
+    RUNPOD_WARMUP_ENABLED: bool = True  # Send {"warmup": true} jobs on POST /warmup and uploads
+    RUNPOD_WARMUP_DEBOUNCE_SECONDS: float = 60.0  # Min seconds between warmups of one endpoint
+    RUNPOD_WARMUP_WARM_SECONDS: float = 300.0  # Jobs this soon after a warmup count as warm hits (worker idle timeout)
+    RUNPOD_POLL_INITIAL_INTERVAL: float = 1.0  # Seconds before the first /status poll
+    RUNPOD_POLL_MAX_INTERVAL: float = 10.0  # Upper bound for the per-job poll backoff
+    RUNPOD_JOB_STATE_PATH: str = "/app/data/cache/runpod_jobs.json"  # Submitted job ids (empty = memory only)
+    RUNPOD_JOB_RESUME_TTL_SECONDS: int = 1800  # RunPod keeps /run results for 30 minutes
+
     # RunPod NLP Pipeline Configuration
     RUNPOD_PUNCTUATE: bool = True  # Enable punctuation & capitalization by default
     RUNPOD_DENORMALIZE: bool = True  # Enable text denormalization by default
@@ -77,6 +135,20 @@ class Settings(BaseSettings):
     SLOVENE_ASR_NFA_ENDPOINT_ID: Optional[str] = None  # NeMo ClusteringDiarizer + NFA alignment
     SLOVENE_ASR_MMS_ENDPOINT_ID: Optional[str] = None  # NeMo ClusteringDiarizer + MMS alignment
     SLOVENE_ASR_PYANNOTE_ENDPOINT_ID: Optional[str] = None  # pyannote 3.1 diarization + NFA alignment
+    SLOVENE_ASR_AUDIO_FORMAT: str = "wav"  # Upload encoding: wav, flac (lossless), opus (smallest); flac/opus need upgraded handlers
+
+    # Transcription hedging (users opt in via preferences; the hedge request is billed too)
+    TRANSCRIPTION_HEDGING_ENABLED: bool = True  # Allow hedging for users who opted in
+    TRANSCRIPTION_HEDGE_PERCENTILE: float = 95.0  # Percentile of the primary's latency per audio second
+    TRANSCRIPTION_HEDGE_DEFAULT_SECONDS_PER_AUDIO_SECOND: float = 1.0  # Until enough latencies were observed
+    TRANSCRIPTION_HEDGE_DEFAULT_DELAY_SECONDS: float = 60.0  # Min deadline until enough latencies were observed
+    TRANSCRIPTION_HEDGE_MIN_DELAY_SECONDS: float = 15.0
+    TRANSCRIPTION_HEDGE_MIN_SAMPLES: int = 20  # Latencies needed before the percentile is used
+    TRANSCRIPTION_HEDGE_LATENCY_WINDOW: int = 200  # Latencies kept per model
+
+    # Diarized segments are stored in encrypted pages, served by time window
+    TRANSCRIPTION_SEGMENT_PAGE_SIZE: int = 100  # Segments per encrypted page
+    TRANSCRIPTION_SEGMENTS_MAX_LIMIT: int = 1000  # Max segments per GET /transcriptions/{id}/segments
 
     # GaMS LLM on RunPod Configuration (Slovenian text cleanup)
     # Reuses RUNPOD_API_KEY for authentication
@@ -87,6 +159,9 @@ class Settings(BaseSettings):
     RUNPOD_LLM_GAMS_DEFAULT_TEMPERATURE: float = 0.0  # Lower = more deterministic
     RUNPOD_LLM_GAMS_DEFAULT_TOP_P: float = 0.0  # Nucleus sampling parameter
     RUNPOD_LLM_GAMS_MAX_TOKENS: int = 2048  # Max tokens to generate
+    RUNPOD_LLM_GAMS_CONTEXT_WINDOW: int = 4096  # MAX_MODEL_LEN of the GaMS handler (tokens)
+    RUNPOD_LLM_GAMS_BATCH_WINDOW: float = 0.05  # Seconds to collect concurrent cleanups into one batch call (0 = no waiting)
+    RUNPOD_LLM_GAMS_MAX_BATCH_SIZE: int = 8  # Send a batch as soon as it has this many prompts (1 = no batching)
 
     # CORS Configuration
     CORS_ORIGINS: str = "*"
@@ -123,11 +198,14 @@ class Settings(BaseSettings):
     # Spell-check Configuration
     SPELLCHECK_ENABLED: bool = True  # Enable spell-checking for supported languages
     SPELLCHECK_WORDLIST_PATH: str = "/app/data/dictionaries/sl-words.txt"  # Word list (baked into image)
-    SPELLCHECK_CACHE_PATH: str = "/app/data/cache"  # Pickle cache (mounted volume for persistence)
+    SPELLCHECK_DICTIONARY_PATH: str = "/app/data/dictionaries/sl-symspell.dict"  # Compact dictionary (baked into image)
+    SPELLCHECK_CACHE_PATH: str = "/app/data/cache"  # Dictionary built at runtime if none in image (mounted volume)
     SPELLCHECK_MAX_EDIT_DISTANCE: int = 2  # Max edit distance for suggestions (1-3)
     SPELLCHECK_PREFIX_LENGTH: int = 7  # SymSpell optimization parameter
     SPELLCHECK_SUGGESTION_COUNT: int = 5  # Max suggestions per misspelled word
     SPELLCHECK_MIN_WORD_LENGTH: int = 2  # Skip words shorter than this
+    SPELLCHECK_WORD_CACHE_SIZE: int = 100000  # Process-wide LRU of word -> verdict (0 disables)
+    SPELLCHECK_LOOKUP_THREADS: int = 2  # Worker threads for dictionary lookups (off the event loop)
 
     # Test Configuration (Optional - only used in E2E tests)
     NOTION_TEST_API_KEY: Optional[str] = None
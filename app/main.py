@@ -7,7 +7,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
 from app.database import check_db_connection
-from app.routes import upload, health, entries, transcription, auth, cleanup, notion, user_preferences, models
+from app.routes import upload, health, entries, transcription, auth, cleanup, notion, user_preferences, models, webhooks, warmup
 from app.middleware.logging import RequestLoggingMiddleware
 from app.services.envelope_encryption import create_envelope_encryption_service
 from app.services.provider_registry import (
@@ -37,6 +37,23 @@ async def lifespan(app: FastAPI):
     else:
         logger.error("Failed to connect to database")
 
+    # Keep cached prompt templates in sync with other workers
+    from app.services.prompt_template_cache import get_prompt_template_cache
+    get_prompt_template_cache().start_listener()
+
+    # Share provider circuit breaker transitions with other workers
+    from app.services.circuit_breaker import get_circuit_breaker_registry
+    get_circuit_breaker_registry().start_listener()
+
+    # Cancel background jobs when another worker deletes or cancels their records
+    from app.services.background_jobs import get_background_job_registry
+    get_background_job_registry().start_listener()
+
+    # Drain background jobs from SIGTERM on; checkpoint running jobs and
+    # resume jobs interrupted in other (or previous) processes
+    get_background_job_registry().install_signal_handlers()
+    get_background_job_registry().start_heartbeat()
+
     # Create storage directory if it doesn't exist
     from pathlib import Path
     storage_path = Path(settings.AUDIO_STORAGE_PATH)
@@ -60,6 +77,13 @@ async def lifespan(app: FastAPI):
     logger.info(f"Available transcription providers: {get_available_transcription_providers()}")
     logger.info(f"Available LLM providers: {get_available_llm_providers()}")
 
+    # Create default provider services once and start fetching their model lists
+    from app.services.provider_registry import get_provider_service_registry
+    try:
+        get_provider_service_registry().start()
+    except ValueError as e:
+        raise RuntimeError(str(e)) from e
+
     # Store default provider names in app.state for backwards compatibility
     app.state.default_transcription_provider = settings.DEFAULT_TRANSCRIPTION_PROVIDER
     app.state.default_llm_provider = settings.DEFAULT_LLM_PROVIDER
@@ -75,26 +99,48 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize encryption service: {e}", exc_info=True)
         raise RuntimeError(f"Cannot start application without encryption service: {e}") from e
 
-    # Initialize Slovenian spell-check service (optional - graceful degradation)
+    # Warm up heavy optional components in worker threads (optional - graceful
+    # degradation); the app is ready meanwhile and reports them in /health/ready
+    from app.services.startup_warmup import get_component_warmer
+    warmer = get_component_warmer()
     if settings.SPELLCHECK_ENABLED:
         from app.services.spellcheck import initialize_slovenian_spellcheck
-        try:
-            if initialize_slovenian_spellcheck():
-                logger.info("Slovenian spell-check service initialized")
-            else:
-                logger.warning("Slovenian spell-check service failed to initialize (spell-check disabled)")
-        except Exception as e:
-            logger.warning(f"Spell-check initialization error (disabled): {e}")
+        warmer.register("spellcheck_sl", initialize_slovenian_spellcheck)
     else:
         logger.info("Spell-check service disabled via configuration")
 
+    if settings.STARTUP_WARMUP_IN_BACKGROUND:
+        warmer.start()
+    else:
+        await warmer.warm_all()
+
     yield
 
     # Shutdown
     logger.info("Shutting down AI Journal Backend Service")
+
+    # Let background jobs finish (they still need the encryption service);
+    # jobs running past the deadline are checkpointed for a resume
+    await get_background_job_registry().drain(settings.SHUTDOWN_DRAIN_SECONDS)
+    await get_background_job_registry().stop_heartbeat()
+
     app.state.encryption_service = None
     logger.info("Encryption service cleaned up")
 
+    # Stop the RunPod status poller (submitted job ids stay in the job store
+    # so the next process resumes them instead of resubmitting)
+    from app.services.runpod_jobs import get_runpod_job_poller
+    await get_runpod_job_poller().close()
+
+    await warmer.close()
+    from app.services.spellcheck_engine import get_spellcheck_engine
+    get_spellcheck_engine().shutdown()
+
+    await get_prompt_template_cache().stop_listener()
+    await get_circuit_breaker_registry().stop_listener()
+    await get_background_job_registry().stop_listener()
+    await get_provider_service_registry().close()
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -159,6 +205,16 @@ app.include_router(
     models.router,
     tags=["Models"]
 )
+app.include_router(
+    webhooks.router,
+    prefix="/api/v1",
+    tags=["Webhooks"]
+)
+app.include_router(
+    warmup.router,
+    prefix="/api/v1",
+    tags=["Warmup"]
+)
 
 
 @app.get("/", include_in_schema=False)
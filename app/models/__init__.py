@@ -4,7 +4,11 @@ SQLAlchemy models for the journal service.
 from app.models.user import User
 from app.models.voice_entry import VoiceEntry
 from app.models.transcription import Transcription
+from app.models.transcription_segment_page import TranscriptionSegmentPage
 from app.models.cleaned_entry import CleanedEntry, CleanupStatus
+from app.models.cleanup_cache import CleanupCacheEntry
+from app.models.idempotency_key import IdempotencyKey
+from app.models.job_checkpoint import JobCheckpoint
 from app.models.prompt_template import PromptTemplate
 from app.models.notion_sync import NotionSync, SyncStatus
 from app.models.data_encryption_key import DataEncryptionKey
@@ -13,8 +17,12 @@ __all__ = [
     "User",
     "VoiceEntry",
     "Transcription",
+    "TranscriptionSegmentPage",
     "CleanedEntry",
     "CleanupStatus",
+    "CleanupCacheEntry",
+    "IdempotencyKey",
+    "JobCheckpoint",
     "PromptTemplate",
     "NotionSync",
     "SyncStatus",
@@ -70,6 +70,14 @@ class CleanedEntry(Base):
     user_edited_text = Column(LargeBinary, nullable=True, doc="Encrypted user-edited text (BYTEA)")
     user_edited_at = Column(DateTime(timezone=True), nullable=True, comment="When user last edited")
 
+    # Spell-check results of the user edit, or of cleaned_text if not edited
+    spelling_issues = Column(LargeBinary, nullable=True, doc="Encrypted JSON array of spelling issues")
+    spelling_dictionary_version = Column(
+        String(32),
+        nullable=True,
+        comment="Spell-check dictionary version spelling_issues were computed with"
+    )
+
     # Processing metadata
     prompt_template_id = Column(
         Integer,
@@ -80,6 +88,13 @@ class CleanedEntry(Base):
     model_name = Column(String(100), nullable=False)
     temperature = Column(Float, nullable=True, comment="LLM sampling temperature (0-2)")
     top_p = Column(Float, nullable=True, comment="LLM nucleus sampling (0-1)")
+    cache_hit = Column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default="false",
+        comment="Whether the cleaned text was reused from the cleanup cache"
+    )
     status = Column(
         SQLEnum(
             CleanupStatus,
@@ -0,0 +1,63 @@
+"""
+CleanupCacheEntry model for reusing deterministic LLM cleanup outputs.
+"""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    String,
+    DateTime,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base, DB_SCHEMA
+
+
+class CleanupCacheEntry(Base):
+    """
+    Cached cleanup output for one voice entry.
+
+    Keyed by an HMAC over the transcription plaintext and everything that
+    determines the LLM output (prompt template and version, provider, model,
+    sampling parameters), so the key reveals nothing about the text.
+
+    The output is encrypted under the voice entry's DEK, like its cleaned
+    entries, so deleting (or crypto-shredding) the entry also removes the
+    cache. The ciphertext can be copied into a new cleaned entry of the same
+    voice entry without decrypting it.
+    """
+    __tablename__ = "cleanup_cache"
+    __table_args__ = (
+        UniqueConstraint("voice_entry_id", "cache_key", name="uq_cleanup_cache_entry_key"),
+        {"schema": DB_SCHEMA},
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    voice_entry_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey(f"{DB_SCHEMA}.voice_entries.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    cache_key = Column(String(64), nullable=False, doc="Hex HMAC-SHA256 of the cleanup inputs")
+
+    cleaned_text = Column(LargeBinary, nullable=False, doc="Encrypted cleaned text (BYTEA)")
+    prompt_template_id = Column(
+        Integer,
+        ForeignKey(f"{DB_SCHEMA}.prompt_templates.id", ondelete="SET NULL"),
+        nullable=True
+    )
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<CleanupCacheEntry(id={self.id}, "
+            f"voice_entry_id={self.voice_entry_id}, "
+            f"cache_key={self.cache_key[:12]}...)>"
+        )
@@ -0,0 +1,64 @@
+"""
+IdempotencyKey model for replaying responses of retried requests.
+"""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    String,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from app.database import Base, DB_SCHEMA
+
+
+class IdempotencyKey(Base):
+    """
+    Response of a request sent with an Idempotency-Key header.
+
+    A row is inserted before the request does any work (status_code NULL
+    while it is in progress) and completed with the response, so a retry
+    with the same key replays the original response instead of creating
+    new records and provider jobs.
+
+    request_fingerprint is a SHA-256 over the request parameters (and the
+    uploaded file), so a key reused for a different request is rejected.
+    Rows expire at expires_at: in-progress rows after
+    IDEMPOTENCY_KEY_LOCK_SECONDS, completed rows after
+    IDEMPOTENCY_KEY_TTL_SECONDS.
+    """
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        UniqueConstraint("user_id", "endpoint", "key", name="uq_idempotency_key_user_endpoint_key"),
+        Index("ix_idempotency_keys_expires_at", "expires_at"),
+        {"schema": DB_SCHEMA},
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey(f"{DB_SCHEMA}.users.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    endpoint = Column(String(100), nullable=False, doc="Endpoint name the key was used for")
+    key = Column(String(255), nullable=False, doc="Client-provided Idempotency-Key header")
+    request_fingerprint = Column(String(64), nullable=False, doc="Hex SHA-256 of the request")
+
+    status_code = Column(Integer, nullable=True, doc="Response status code (NULL while in progress)")
+    response_body = Column(JSONB, nullable=True, doc="Response body to replay")
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<IdempotencyKey(id={self.id}, "
+            f"endpoint={self.endpoint}, "
+            f"status_code={self.status_code})>"
+        )
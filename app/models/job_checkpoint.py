@@ -0,0 +1,66 @@
+"""
+JobCheckpoint model for resuming background jobs after a restart.
+"""
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    String,
+    DateTime,
+    ForeignKey,
+    Index,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from app.database import Base, DB_SCHEMA
+
+
+class JobCheckpoint(Base):
+    """
+    A transcription, cleanup or Notion sync job that has not finished yet.
+
+    Written when the job starts and deleted when it ends (completed, failed
+    or cancelled). While the job runs, owner is the worker running it and
+    heartbeat_at is refreshed periodically. A job interrupted by a shutdown
+    is released (owner NULL) with its progress, e.g. the RunPod job ids of
+    submitted and completed chunks. Released checkpoints, and checkpoints
+    whose owner stopped sending heartbeats, are claimed by a live worker and
+    resumed by calling the task named in `task` with `params`.
+
+    params only holds identifiers and job options, never transcription or
+    cleanup text.
+    """
+    __tablename__ = "job_checkpoints"
+    __table_args__ = (
+        Index("ix_job_checkpoints_owner_heartbeat_at", "owner", "heartbeat_at"),
+        {"schema": DB_SCHEMA},
+    )
+
+    job_id = Column(UUID(as_uuid=True), primary_key=True, doc="Transcription, cleaned entry or Notion sync id")
+    kind = Column(String(20), nullable=False, doc="Job kind (transcription, cleanup, notion_sync)")
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey(f"{DB_SCHEMA}.users.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    voice_entry_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey(f"{DB_SCHEMA}.voice_entries.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+
+    task = Column(String(50), nullable=False, doc="Name of the resumable task that runs the job")
+    params = Column(JSONB, nullable=False, doc="Task arguments (JSON)")
+    progress = Column(JSONB, nullable=True, doc="Saved progress (e.g. RunPod job ids of chunks)")
+
+    owner = Column(String(32), nullable=True, doc="Worker running the job (NULL = waiting for resume)")
+    heartbeat_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<JobCheckpoint(job_id={self.job_id}, "
+            f"kind={self.kind}, "
+            f"owner={self.owner})>"
+        )
@@ -30,11 +30,16 @@ class Transcription(Base):
         temperature: Sampling temperature parameter
         enable_diarization: Whether speaker diarization was requested
         speaker_count: Expected number of speakers (1-10)
-        segments: Encrypted JSON array of segments with speaker labels
+        segments: Encrypted JSON array of segments with speaker labels (transcriptions
+            stored before segment pages; newer ones use TranscriptionSegmentPage)
+        spelling_issues: Encrypted JSON array of spelling issues of the text
+        spelling_dictionary_version: Dictionary version spelling_issues were computed with
         transcription_started_at: When transcription processing began
         transcription_completed_at: When transcription finished
         error_message: Error details if status is 'failed'
         is_primary: Whether this is the primary transcription to display
+        hedge_model_used: Model of the hedge request, if one was sent (model_used is the winner)
+        hedge_extra_audio_seconds: Audio seconds billed for the hedge request
         created_at: Record creation time
         updated_at: Last update time
     """
@@ -107,13 +112,27 @@ class Transcription(Base):
         comment="Expected number of speakers (1-10)"
     )
 
-    # Encrypted segments with speaker labels (JSON array)
+    # Encrypted segments with speaker labels (JSON array); new transcriptions
+    # store them in transcription_segment_pages instead
     segments: Mapped[bytes | None] = mapped_column(
         LargeBinary,
         nullable=True,
         doc="Encrypted JSON array of segments with speaker labels"
     )
 
+    # Spell-check results of transcribed_text (computed on completion)
+    spelling_issues: Mapped[bytes | None] = mapped_column(
+        LargeBinary,
+        nullable=True,
+        doc="Encrypted JSON array of spelling issues"
+    )
+
+    spelling_dictionary_version: Mapped[str | None] = mapped_column(
+        String(32),
+        nullable=True,
+        comment="Spell-check dictionary version spelling_issues were computed with"
+    )
+
     # Timing
     transcription_started_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
@@ -139,6 +158,19 @@ class Transcription(Base):
         index=True
     )
 
+    # Hedging (extra request sent when the primary provider was slow)
+    hedge_model_used: Mapped[str | None] = mapped_column(
+        String(50),
+        nullable=True,
+        comment="Model of the hedge request, if one was sent"
+    )
+
+    hedge_extra_audio_seconds: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+        comment="Audio seconds billed for the hedge request"
+    )
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -0,0 +1,61 @@
+"""
+TranscriptionSegmentPage model for windowed access to diarized segments.
+"""
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base, DB_SCHEMA
+
+
+class TranscriptionSegmentPage(Base):
+    """
+    A fixed-size page of a transcription's segments, encrypted on its own.
+
+    The segments of a diarized transcription (with word-level timings for
+    some providers) are split into pages of TRANSCRIPTION_SEGMENT_PAGE_SIZE
+    segments. The unencrypted columns index each page by position and time
+    range, so a window of the transcript is served by decrypting only the
+    pages that overlap it.
+
+    Segment positions (first_position) count segments from 0 in transcript
+    order and are used as pagination cursors; they do not depend on the
+    provider's segment ids.
+    """
+    __tablename__ = "transcription_segment_pages"
+    __table_args__ = (
+        UniqueConstraint("transcription_id", "page_index", name="uq_transcription_segment_page"),
+        {"schema": DB_SCHEMA},
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    transcription_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey(f"{DB_SCHEMA}.transcriptions.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    page_index = Column(Integer, nullable=False, doc="Page number within the transcription (from 0)")
+    first_position = Column(Integer, nullable=False, doc="Position of the page's first segment")
+    segment_count = Column(Integer, nullable=False)
+    start_time = Column(Float, nullable=False, doc="Earliest segment start (seconds)")
+    end_time = Column(Float, nullable=False, doc="Latest segment end (seconds)")
+    has_speaker = Column(Boolean, nullable=False, default=False, doc="Whether any segment has a speaker label")
+    segments = Column(LargeBinary, nullable=False, doc="Encrypted JSON array of the page's segments")
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<TranscriptionSegmentPage(transcription_id={self.transcription_id}, "
+            f"page_index={self.page_index}, "
+            f"segment_count={self.segment_count})>"
+        )
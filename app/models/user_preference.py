@@ -4,7 +4,7 @@ SQLAlchemy model for user_preferences table.
 import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
-from sqlalchemy import String, DateTime, ForeignKey, Index
+from sqlalchemy import Boolean, String, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base, DB_SCHEMA
@@ -21,6 +21,8 @@ class UserPreference(Base):
         id: Unique identifier (UUID4)
         user_id: Foreign key to users table (unique - one preference record per user)
         preferred_transcription_language: Language code for Whisper transcription (default: 'auto')
+        preferred_llm_model: Preferred LLM model for cleanup
+        transcription_hedging: Send a hedge request to another provider when transcription is slow
         created_at: Record creation timestamp (UTC)
         updated_at: Last update timestamp (UTC)
     """
@@ -50,6 +52,14 @@ class UserPreference(Base):
         server_default="auto"
     )
 
+    transcription_hedging: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default="false",
+        comment="Send a hedge request to another provider when transcription is slow"
+    )
+
     # LLM preferences
     preferred_llm_model: Mapped[str | None] = mapped_column(
         String,
@@ -2,12 +2,12 @@
 API routes for LLM cleanup operations.
 """
 from uuid import UUID
-from typing import Annotated, Optional
+from typing import Annotated, Any, Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, status, BackgroundTasks, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_session
 from app.middleware.jwt import get_current_user
 from app.models.user import User
 from app.models.cleaned_entry import CleanupStatus
@@ -17,8 +17,23 @@ from app.schemas.cleanup import (
     CleanedEntryDetail,
     UserEditRequest,
 )
-from app.schemas.voice_entry import DeleteResponse
+from app.schemas.voice_entry import CancelResponse, DeleteResponse
+from app.services.cleanup_cache import (
+    compute_cleanup_cache_key,
+    get_prompt_identity,
+    is_deterministic_cleanup,
+)
 from app.services.database import db_service
+from app.services.idempotency import IdempotentRequest
+from app.services.background_jobs import (
+    CANCELLED_MESSAGE,
+    CLEANUP_JOB,
+    JobResume,
+    ensure_accepting_jobs,
+    get_background_job_registry,
+    register_resumable_task,
+)
+from app.services.job_scheduler import cleanup_cost_seconds, get_job_scheduler
 from app.services.llm_cleanup_base import LLMCleanupService
 from app.services.envelope_encryption import (
     EnvelopeEncryptionService,
@@ -27,10 +42,10 @@ from app.services.envelope_encryption import (
 )
 from app.services.provider_registry import (
     get_effective_llm_provider,
-    get_llm_service_for_provider,
+    get_provider_service_registry,
 )
 from app.config import settings
-from app.services.spellcheck import get_slovenian_spellcheck_service
+from app.services.spellcheck import compute_spelling_issues, load_spelling_issues
 from app.utils.encryption_helpers import (
     decrypt_text,
     encrypt_text,
@@ -73,11 +88,19 @@ async def process_cleanup_background(
     temperature: float = None,
     top_p: float = None,
     llm_model: str = None,
-    llm_provider: str = None
+    llm_provider: str = None,
+    transcription_id: Optional[UUID] = None
 ):
     """
     Background task to process LLM cleanup.
 
+    Waits for a slot from the fair job scheduler first; the cost of a
+    cleanup is the audio duration estimated from the text length. Runs as a
+    registered background job, cancelled when the cleaned entry (or its
+    transcription or voice entry) is deleted or via
+    POST /cleaned-entries/{id}/cancel, and checkpointed so a shutdown
+    resumes it (the text is decrypted again on resume, never stored).
+
     Args:
         cleaned_entry_id: UUID of the cleaned entry to update
         transcription_text: Raw transcription text to clean (already decrypted if was encrypted)
@@ -88,33 +111,170 @@ async def process_cleanup_background(
         top_p: Top-p for cleanup nucleus sampling (0.0-1.0)
         llm_model: Model to use for cleanup (optional, uses service default if None)
         llm_provider: LLM provider name (e.g., 'ollama', 'groq'). If None, uses default.
+        transcription_id: Transcription being cleaned (its deletion cancels the cleanup)
+
+    Returns:
+        True if the task ran to the end, False if it was cancelled or interrupted
+    """
+    async def scheduled() -> None:
+        async with get_job_scheduler().slot(
+            user_id, cleanup_cost_seconds(transcription_text), kind="cleanup"
+        ):
+            await _run_cleanup_background(
+                cleaned_entry_id=cleaned_entry_id,
+                transcription_text=transcription_text,
+                entry_type=entry_type,
+                user_id=user_id,
+                voice_entry_id=voice_entry_id,
+                temperature=temperature,
+                top_p=top_p,
+                llm_model=llm_model,
+                llm_provider=llm_provider
+            )
+
+    return await get_background_job_registry().run(
+        CLEANUP_JOB,
+        cleaned_entry_id,
+        scheduled(),
+        voice_entry_id=voice_entry_id,
+        transcription_id=transcription_id,
+        resume=JobResume("cleanup", user_id, dict(
+            cleaned_entry_id=cleaned_entry_id,
+            entry_type=entry_type,
+            user_id=user_id,
+            voice_entry_id=voice_entry_id,
+            temperature=temperature,
+            top_p=top_p,
+            llm_model=llm_model,
+            llm_provider=llm_provider
+        ))
+    )
+
+
+async def resume_cleanup_background(params: Dict[str, Any]) -> None:
+    """
+    Resume a checkpointed cleanup after a shutdown.
+
+    The transcription text is decrypted again from the cleaned entry's
+    transcription.
+
+    Args:
+        params: Arguments of process_cleanup_background without the text (as JSON)
+    """
+    cleaned_entry_id = UUID(params["cleaned_entry_id"])
+    voice_entry_id = UUID(params["voice_entry_id"])
+    user_id = UUID(params["user_id"])
+
+    async with get_session() as db:
+        cleaned_entry = await db_service.get_cleaned_entry_by_id(db, cleaned_entry_id)
+        if cleaned_entry is None or cleaned_entry.status not in (CleanupStatus.PENDING, CleanupStatus.PROCESSING):
+            return
+
+        transcription = await db_service.get_transcription_by_id(db, cleaned_entry.transcription_id)
+        transcription_text = None
+        if transcription is not None and transcription.transcribed_text is not None:
+            transcription_text = await decrypt_text(
+                encryption_service=create_envelope_encryption_service(),
+                db=db,
+                encrypted_bytes=transcription.transcribed_text,
+                voice_entry_id=voice_entry_id,
+                user_id=user_id,
+            )
+
+        if not transcription_text:
+            await db_service.update_cleaned_entry_processing(
+                db=db,
+                cleaned_entry_id=cleaned_entry_id,
+                cleanup_status=CleanupStatus.FAILED,
+                error_message="Failed to decrypt transcription text"
+            )
+            await db.commit()
+            return
+
+    await process_cleanup_background(
+        cleaned_entry_id=cleaned_entry_id,
+        transcription_text=transcription_text,
+        entry_type=params["entry_type"],
+        user_id=user_id,
+        voice_entry_id=voice_entry_id,
+        temperature=params.get("temperature"),
+        top_p=params.get("top_p"),
+        llm_model=params.get("llm_model"),
+        llm_provider=params.get("llm_provider"),
+        transcription_id=cleaned_entry.transcription_id
+    )
+
+
+register_resumable_task("cleanup", resume_cleanup_background)
+
+
+async def _get_cleanup_language(db: AsyncSession, transcription_id: UUID) -> Optional[str]:
+    """
+    Get the language of a cleanup (the language of its transcription).
+
+    Args:
+        db: Database session
+        transcription_id: UUID of the transcription that was cleaned up
+
+    Returns:
+        Language code, or None if the transcription no longer exists
+    """
+    transcription = await db_service.get_transcription_by_id(db=db, transcription_id=transcription_id)
+    return transcription.language_code if transcription else None
+
+
+async def _run_cleanup_background(
+    cleaned_entry_id: UUID,
+    transcription_text: str,
+    entry_type: str,
+    user_id: UUID,
+    voice_entry_id: UUID,
+    temperature: float = None,
+    top_p: float = None,
+    llm_model: str = None,
+    llm_provider: str = None
+):
+    """
+    Process LLM cleanup (holding a scheduler slot).
+
+    Args:
+        cleaned_entry_id: UUID of the cleaned entry to update
+        transcription_text: Raw transcription text to clean (already decrypted if was encrypted)
+        entry_type: Type of entry (dream, journal, etc.)
+        user_id: User ID (for auto-sync and encryption check)
+        voice_entry_id: Voice entry ID (for auto-sync and DEK lookup)
+        temperature: Temperature for cleanup LLM sampling (0.0-2.0)
+        top_p: Top-p for cleanup nucleus sampling (0.0-1.0)
+        llm_model: Model to use for cleanup (optional, uses service default if None)
+        llm_provider: LLM provider name (e.g., 'ollama', 'groq'). If None, uses default.
+
+    Deterministic cleanups (temperature 0) of a transcription text that was
+    already cleaned with the same prompt, model and parameters reuse the
+    cached output instead of calling the LLM (see app.services.cleanup_cache).
     """
     from app.database import get_session
     from app.models.notion_sync import SyncStatus as NotionSyncStatus
     from app.routes.notion import process_notion_sync_background
-    from app.services.llm_cleanup import create_llm_cleanup_service
 
     # Use specified provider or fall back to settings default
     effective_provider = llm_provider or settings.DEFAULT_LLM_PROVIDER
 
     async with get_session() as db:
-        # Create LLM service using factory with database session for prompt lookup
-        llm_service = create_llm_cleanup_service(
-            provider=effective_provider,
-            db_session=db
-        )
+        # Shared LLM service (prompt templates come from the shared template cache)
+        llm_service = get_provider_service_registry().get_llm_service(effective_provider)
 
         # Initialize encryption service for potential output encryption
         encryption_service = create_envelope_encryption_service()
 
         try:
             # Update status to processing
-            await db_service.update_cleaned_entry_processing(
+            processing_entry = await db_service.update_cleaned_entry_processing(
                 db=db,
                 cleaned_entry_id=cleaned_entry_id,
                 cleanup_status=CleanupStatus.PROCESSING
             )
             await db.commit()
+            language_code = await _get_cleanup_language(db, processing_entry.transcription_id)
 
             logger.info(
                 f"Starting LLM cleanup for entry {cleaned_entry_id}",
@@ -122,41 +282,131 @@ async def process_cleanup_background(
                 top_p=top_p
             )
 
-            # Step 1: Cleanup (plain text with paragraph breaks)
-            cleanup_result = await llm_service.cleanup_transcription(
-                transcription_text=transcription_text,
-                entry_type=entry_type,
-                temperature=temperature,
-                top_p=top_p,
-                model=llm_model
-            )
+            # Step 1: Reuse a cached output of an identical deterministic cleanup
+            cache_key = None
+            cached = None
+            if settings.LLM_CLEANUP_CACHE_ENABLED and is_deterministic_cleanup(effective_provider, temperature):
+                try:
+                    prompt_identity, expected_template_id = await get_prompt_identity(db, entry_type)
+                    cache_key = compute_cleanup_cache_key(
+                        transcription_text=transcription_text,
+                        prompt_identity=prompt_identity,
+                        provider=effective_provider,
+                        model_name=(
+                            f"{effective_provider}-{llm_model}" if llm_model
+                            else llm_service.get_model_name()
+                        ),
+                        temperature=temperature,
+                        top_p=top_p
+                    )
+                    cached = await db_service.get_cleanup_cache_entry(db, voice_entry_id, cache_key)
+                except Exception as cache_error:
+                    # The cache is an optimization - clean up normally
+                    await db.rollback()
+                    cache_key = None
+                    logger.warning(
+                        f"Cleanup cache lookup failed: {str(cache_error)}",
+                        cleaned_entry_id=str(cleaned_entry_id)
+                    )
 
-            logger.info(f"Cleanup completed for entry {cleaned_entry_id}")
+            if cached is not None:
+                # Same voice entry, same DEK: the ciphertext is reused as-is
+                logger.info(
+                    f"Cleanup cache hit for entry {cleaned_entry_id}",
+                    voice_entry_id=str(voice_entry_id)
+                )
+                cached_text = await decrypt_text(
+                    encryption_service,
+                    db,
+                    cached.cleaned_text,
+                    voice_entry_id,
+                    user_id,
+                )
+                encrypted_spelling_issues, spelling_dictionary_version = await compute_spelling_issues(
+                    encryption_service,
+                    db,
+                    cached_text,
+                    language_code,
+                    voice_entry_id,
+                    user_id,
+                )
+                await db_service.update_cleaned_entry_processing(
+                    db=db,
+                    cleaned_entry_id=cleaned_entry_id,
+                    cleanup_status=CleanupStatus.COMPLETED,
+                    cleaned_text=cached.cleaned_text,
+                    prompt_template_id=cached.prompt_template_id,
+                    cache_hit=True,
+                    spelling_issues=encrypted_spelling_issues,
+                    spelling_dictionary_version=spelling_dictionary_version
+                )
+                await db.commit()
+            else:
+                # Step 2: Cleanup (plain text with paragraph breaks)
+                cleanup_result = await llm_service.cleanup_transcription(
+                    transcription_text=transcription_text,
+                    entry_type=entry_type,
+                    temperature=temperature,
+                    top_p=top_p,
+                    model=llm_model
+                )
 
-            # Step 2: Encrypt results (encryption is always on)
-            encrypted_cleaned_text = await encrypt_text(
-                encryption_service,
-                db,
-                cleanup_result["cleaned_text"],
-                voice_entry_id,
-                user_id,
-            )
-            logger.info(
-                "Cleanup results encrypted",
-                cleaned_entry_id=str(cleaned_entry_id),
-                encrypted_text_length=len(encrypted_cleaned_text)
-            )
+                logger.info(f"Cleanup completed for entry {cleaned_entry_id}")
 
-            # Step 3: Store encrypted results
-            await db_service.update_cleaned_entry_processing(
-                db=db,
-                cleaned_entry_id=cleaned_entry_id,
-                cleanup_status=CleanupStatus.COMPLETED,
-                cleaned_text=encrypted_cleaned_text,
-                prompt_template_id=cleanup_result.get("prompt_template_id"),
-                llm_raw_response=cleanup_result.get("llm_raw_response") if settings.LLM_STORE_RAW_RESPONSE else None
-            )
-            await db.commit()
+                # Step 3: Encrypt results (encryption is always on)
+                encrypted_cleaned_text = await encrypt_text(
+                    encryption_service,
+                    db,
+                    cleanup_result["cleaned_text"],
+                    voice_entry_id,
+                    user_id,
+                )
+                logger.info(
+                    "Cleanup results encrypted",
+                    cleaned_entry_id=str(cleaned_entry_id),
+                    encrypted_text_length=len(encrypted_cleaned_text)
+                )
+
+                # Step 4: Spell-check once here; reads serve the stored issues
+                encrypted_spelling_issues, spelling_dictionary_version = await compute_spelling_issues(
+                    encryption_service,
+                    db,
+                    cleanup_result["cleaned_text"],
+                    language_code,
+                    voice_entry_id,
+                    user_id,
+                )
+
+                # Step 5: Store encrypted results
+                await db_service.update_cleaned_entry_processing(
+                    db=db,
+                    cleaned_entry_id=cleaned_entry_id,
+                    cleanup_status=CleanupStatus.COMPLETED,
+                    cleaned_text=encrypted_cleaned_text,
+                    prompt_template_id=cleanup_result.get("prompt_template_id"),
+                    llm_raw_response=cleanup_result.get("llm_raw_response") if settings.LLM_STORE_RAW_RESPONSE else None,
+                    spelling_issues=encrypted_spelling_issues,
+                    spelling_dictionary_version=spelling_dictionary_version
+                )
+                await db.commit()
+
+                # Only cache if the service used the prompt the key was computed for
+                if cache_key is not None and cleanup_result.get("prompt_template_id") == expected_template_id:
+                    try:
+                        await db_service.store_cleanup_cache_entry(
+                            db=db,
+                            voice_entry_id=voice_entry_id,
+                            cache_key=cache_key,
+                            cleaned_text=encrypted_cleaned_text,
+                            prompt_template_id=expected_template_id
+                        )
+                        await db.commit()
+                    except Exception as cache_error:
+                        await db.rollback()
+                        logger.warning(
+                            f"Failed to cache cleanup output: {str(cache_error)}",
+                            cleaned_entry_id=str(cleaned_entry_id)
+                        )
 
             logger.info(f"LLM cleanup completed for entry {cleaned_entry_id}")
 
@@ -220,9 +470,8 @@ async def process_cleanup_background(
                     )
                     await db.commit()
 
-                    # Trigger Notion sync in background
-                    import asyncio
-                    asyncio.create_task(process_notion_sync_background(
+                    # Trigger Notion sync in background (drained on shutdown)
+                    get_background_job_registry().spawn(process_notion_sync_background(
                         sync_id=sync_record.id,
                         user_id=user_id,
                         entry_id=voice_entry_id,
@@ -284,6 +533,7 @@ async def process_cleanup_background(
     "/transcriptions/{transcription_id}/cleanup",
     response_model=CleanupResponse,
     status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(ensure_accepting_jobs)],
     summary="Trigger LLM cleanup for a transcription",
     description="Start background processing to clean and analyze a transcription using LLM"
 )
@@ -293,7 +543,8 @@ async def trigger_cleanup(
     current_user: Annotated[User, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db),
     request: CleanupTriggerRequest = CleanupTriggerRequest(),
-    encryption_service: Optional[EnvelopeEncryptionService] = Depends(get_encryption_service)
+    encryption_service: Optional[EnvelopeEncryptionService] = Depends(get_encryption_service),
+    idempotency_key: Optional[str] = Header(None, description="Client-generated key; retries with the same key return the original response")
 ):
     """
     Trigger LLM cleanup for a completed transcription.
@@ -305,6 +556,9 @@ async def trigger_cleanup(
     4. Returns immediately with cleanup ID and status
 
     Query the cleanup status using GET /api/v1/cleaned-entries/{cleanup_id}
+
+    A retry sent with the same Idempotency-Key header returns the original
+    response without starting another cleanup.
     """
     # Validate and get effective LLM provider
     try:
@@ -316,7 +570,7 @@ async def trigger_cleanup(
         )
 
     # Get LLM service to obtain model name for database record
-    llm_service = get_llm_service_for_provider(effective_llm_provider)
+    llm_service = get_provider_service_registry().get_llm_service(effective_llm_provider)
     # Get the transcription
     transcription = await db_service.get_transcription_by_id(
         db=db,
@@ -349,71 +603,89 @@ async def trigger_cleanup(
             detail="Voice entry not found"
         )
 
-    # Get the transcription text (always encrypted)
-    transcription_text = await decrypt_text(
-        encryption_service=encryption_service,
-        db=db,
-        encrypted_bytes=transcription.transcribed_text,
-        voice_entry_id=voice_entry.id,
-        user_id=current_user.id,
+    # A retry whose response was lost gets the original response
+    idempotency = IdempotentRequest(idempotency_key, current_user.id, "cleanup")
+    replay = await idempotency.begin(
+        db,
+        {"transcription_id": transcription_id, **request.model_dump(), "llm_provider": effective_llm_provider}
     )
+    if replay is not None:
+        return replay
 
-    # Verify there's text to clean
-    if not transcription_text:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Transcription has no text to clean"
+    try:
+        # Get the transcription text (always encrypted)
+        transcription_text = await decrypt_text(
+            encryption_service=encryption_service,
+            db=db,
+            encrypted_bytes=transcription.transcribed_text,
+            voice_entry_id=voice_entry.id,
+            user_id=current_user.id,
         )
 
-    # Create cleaned entry record
-    # Determine cleanup model name in {provider}-{model} format
-    if request.llm_model:
-        # User specified a custom model
-        cleanup_model_name = f"{effective_llm_provider}-{request.llm_model}"
-    else:
-        # Use default from service
-        cleanup_model_name = llm_service.get_model_name()
+        # Verify there's text to clean
+        if not transcription_text:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Transcription has no text to clean"
+            )
 
-    cleaned_entry = await db_service.create_cleaned_entry(
-        db=db,
-        voice_entry_id=voice_entry.id,
-        transcription_id=transcription_id,
-        user_id=current_user.id,
-        model_name=cleanup_model_name,
-        temperature=request.temperature,
-        top_p=request.top_p
-    )
+        # Create cleaned entry record
+        # Determine cleanup model name in {provider}-{model} format
+        if request.llm_model:
+            # User specified a custom model
+            cleanup_model_name = f"{effective_llm_provider}-{request.llm_model}"
+        else:
+            # Use default from service
+            cleanup_model_name = llm_service.get_model_name()
 
-    await db.commit()
+        cleaned_entry = await db_service.create_cleaned_entry(
+            db=db,
+            voice_entry_id=voice_entry.id,
+            transcription_id=transcription_id,
+            user_id=current_user.id,
+            model_name=cleanup_model_name,
+            temperature=request.temperature,
+            top_p=request.top_p
+        )
 
-    # Start background processing with decrypted text
-    background_tasks.add_task(
-        process_cleanup_background,
-        cleaned_entry_id=cleaned_entry.id,
-        transcription_text=transcription_text,
-        entry_type=voice_entry.entry_type,
-        user_id=current_user.id,
-        voice_entry_id=voice_entry.id,
-        temperature=request.temperature,
-        top_p=request.top_p,
-        llm_model=request.llm_model,
-        llm_provider=effective_llm_provider
-    )
+        await db.commit()
 
-    logger.info(
-        f"Cleanup triggered for transcription {transcription_id}, "
-        f"cleanup_id={cleaned_entry.id}"
-    )
+        # Start background processing with decrypted text
+        background_tasks.add_task(
+            process_cleanup_background,
+            cleaned_entry_id=cleaned_entry.id,
+            transcription_text=transcription_text,
+            entry_type=voice_entry.entry_type,
+            user_id=current_user.id,
+            voice_entry_id=voice_entry.id,
+            temperature=request.temperature,
+            top_p=request.top_p,
+            llm_model=request.llm_model,
+            llm_provider=effective_llm_provider,
+            transcription_id=transcription_id
+        )
 
-    return CleanupResponse(
-        id=cleaned_entry.id,
-        voice_entry_id=voice_entry.id,
-        transcription_id=transcription_id,
-        status=cleaned_entry.status,
-        model_name=cleaned_entry.model_name,
-        created_at=cleaned_entry.created_at,
-        message="Cleanup processing started in background"
-    )
+        logger.info(
+            f"Cleanup triggered for transcription {transcription_id}, "
+            f"cleanup_id={cleaned_entry.id}"
+        )
+
+        response = CleanupResponse(
+            id=cleaned_entry.id,
+            voice_entry_id=voice_entry.id,
+            transcription_id=transcription_id,
+            status=cleaned_entry.status,
+            model_name=cleaned_entry.model_name,
+            created_at=cleaned_entry.created_at,
+            message="Cleanup processing started in background"
+        )
+        await idempotency.complete(db, status.HTTP_202_ACCEPTED, response)
+
+        return response
+
+    except Exception:
+        await idempotency.release(db)
+        raise
 
 
 @router.get(
@@ -468,25 +740,23 @@ async def get_cleaned_entry(
             user_id=current_user.id,
         )
 
-    # Run spell-check for Slovenian text (on-the-fly)
+    # Spelling issues stored on completion and on edits (recomputed if the dictionary changed)
     spelling_issues = None
     if (
         decrypted_text
         and cleaned_entry.status == CleanupStatus.COMPLETED
         and settings.SPELLCHECK_ENABLED
     ):
-        # Get transcription to check language
-        # TODO: Maybe add language to cleanup table as well?
-        transcription = await db_service.get_transcription_by_id(
+        spelling_issues = await load_spelling_issues(
+            encryption_service=encryption_service,
             db=db,
-            transcription_id=cleaned_entry.transcription_id,
+            record=cleaned_entry,
+            # Use user-edited text if available, otherwise use cleaned text
+            text=decrypted_user_edit or decrypted_text,
+            language_code=await _get_cleanup_language(db, cleaned_entry.transcription_id),
+            voice_entry_id=cleaned_entry.voice_entry_id,
+            user_id=current_user.id,
         )
-        if transcription and transcription.language_code == "sl":
-            spellcheck_service = get_slovenian_spellcheck_service()
-            if spellcheck_service and spellcheck_service.is_loaded():
-                # Use user-edited text if available, otherwise use cleaned text
-                text_to_check = decrypted_user_edit or decrypted_text
-                spelling_issues = spellcheck_service.check_text(text_to_check)
 
     return CleanedEntryDetail(
         id=cleaned_entry.id,
@@ -499,6 +769,7 @@ async def get_cleaned_entry(
         model_name=cleaned_entry.model_name,
         temperature=cleaned_entry.temperature,
         top_p=cleaned_entry.top_p,
+        cache_hit=cleaned_entry.cache_hit,
         error_message=cleaned_entry.error_message,
         is_primary=cleaned_entry.is_primary,
         processing_time_seconds=cleaned_entry.processing_time_seconds,
@@ -585,6 +856,7 @@ async def get_cleaned_entries_by_entry(
             model_name=ce.model_name,
             temperature=ce.temperature,
             top_p=ce.top_p,
+            cache_hit=ce.cache_hit,
             error_message=ce.error_message,
             is_primary=ce.is_primary,
             processing_time_seconds=ce.processing_time_seconds,
@@ -713,6 +985,7 @@ async def set_primary_cleanup(
         model_name=updated_cleanup.model_name,
         temperature=updated_cleanup.temperature,
         top_p=updated_cleanup.top_p,
+        cache_hit=updated_cleanup.cache_hit,
         error_message=updated_cleanup.error_message,
         is_primary=updated_cleanup.is_primary,
         processing_time_seconds=updated_cleanup.processing_time_seconds,
@@ -819,6 +1092,19 @@ async def save_user_edit(
         user_id=current_user.id,
     )
 
+    # Spell-check the edit now so reads serve stored issues (saved with the request's commit)
+    spelling_issues = None
+    if settings.SPELLCHECK_ENABLED:
+        spelling_issues = await load_spelling_issues(
+            encryption_service=encryption_service,
+            db=db,
+            record=updated_cleanup,
+            text=decrypted_user_edit,
+            language_code=await _get_cleanup_language(db, updated_cleanup.transcription_id),
+            voice_entry_id=updated_cleanup.voice_entry_id,
+            user_id=current_user.id,
+        )
+
     logger.info(
         "User edit saved",
         cleanup_id=str(cleanup_id),
@@ -836,6 +1122,7 @@ async def save_user_edit(
         model_name=updated_cleanup.model_name,
         temperature=updated_cleanup.temperature,
         top_p=updated_cleanup.top_p,
+        cache_hit=updated_cleanup.cache_hit,
         error_message=updated_cleanup.error_message,
         is_primary=updated_cleanup.is_primary,
         processing_time_seconds=updated_cleanup.processing_time_seconds,
@@ -847,6 +1134,7 @@ async def save_user_edit(
         prompt_description=updated_cleanup.prompt_template.description if updated_cleanup.prompt_template else None,
         user_edited_text=decrypted_user_edit,
         user_edited_at=updated_cleanup.user_edited_at,
+        spelling_issues=spelling_issues,
     )
 
 
@@ -913,6 +1201,19 @@ async def revert_user_edit(
         user_id=current_user.id,
     )
 
+    # Spell-check the cleaned text again (saved with the request's commit)
+    spelling_issues = None
+    if settings.SPELLCHECK_ENABLED:
+        spelling_issues = await load_spelling_issues(
+            encryption_service=encryption_service,
+            db=db,
+            record=updated_cleanup,
+            text=decrypted_cleaned_text,
+            language_code=await _get_cleanup_language(db, updated_cleanup.transcription_id),
+            voice_entry_id=updated_cleanup.voice_entry_id,
+            user_id=current_user.id,
+        )
+
     logger.info(
         "User edit reverted",
         cleanup_id=str(cleanup_id),
@@ -930,6 +1231,7 @@ async def revert_user_edit(
         model_name=updated_cleanup.model_name,
         temperature=updated_cleanup.temperature,
         top_p=updated_cleanup.top_p,
+        cache_hit=updated_cleanup.cache_hit,
         error_message=updated_cleanup.error_message,
         is_primary=updated_cleanup.is_primary,
         processing_time_seconds=updated_cleanup.processing_time_seconds,
@@ -941,6 +1243,7 @@ async def revert_user_edit(
         prompt_description=updated_cleanup.prompt_template.description if updated_cleanup.prompt_template else None,
         user_edited_text=None,
         user_edited_at=None,
+        spelling_issues=spelling_issues,
     )
 
 
@@ -1007,6 +1310,9 @@ async def delete_cleaned_entry(
     # Commit database transaction
     await db.commit()
 
+    # Stop paying for work whose results would be thrown away
+    get_background_job_registry().cancel(CLEANUP_JOB, cleaned_entry_id)
+
     logger.info(
         "Cleaned entry deleted successfully",
         cleaned_entry_id=str(cleaned_entry_id),
@@ -1017,3 +1323,79 @@ async def delete_cleaned_entry(
         message="Cleaned entry deleted successfully",
         deleted_id=cleaned_entry_id
     )
+
+
+@router.post(
+    "/cleaned-entries/{cleaned_entry_id}/cancel",
+    response_model=CancelResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Cancel cleanup",
+    description="Stop a pending or processing LLM cleanup, including its provider jobs. The cleaned entry is marked as failed.",
+    responses={
+        200: {"description": "Cleanup cancelled"},
+        404: {"description": "Cleaned entry not found or not authorized"},
+        409: {"description": "Cleanup already finished"},
+    }
+)
+async def cancel_cleanup(
+    cleaned_entry_id: UUID,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_db)
+) -> CancelResponse:
+    """
+    Cancel a pending or processing cleanup.
+
+    The background job is cancelled in whichever worker runs it. A cleanup
+    still waiting for its transcription (upload-transcribe-cleanup) is not
+    started once the transcription finishes.
+
+    Args:
+        cleaned_entry_id: UUID of the cleaned entry to cancel
+        current_user: Authenticated user from JWT token
+        db: Database session
+
+    Returns:
+        CancelResponse with the cancelled entry ID and new status
+
+    Raises:
+        HTTPException: 404 if not found/unauthorized, 409 if already finished
+    """
+    cleaned_entry = await db_service.get_cleaned_entry_by_id(
+        db=db,
+        cleaned_entry_id=cleaned_entry_id,
+        user_id=current_user.id
+    )
+
+    if not cleaned_entry:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Cleaned entry not found"
+        )
+
+    if cleaned_entry.status not in (CleanupStatus.PENDING, CleanupStatus.PROCESSING):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Cleanup is already {cleaned_entry.status.value}"
+        )
+
+    get_background_job_registry().cancel(CLEANUP_JOB, cleaned_entry_id)
+
+    await db_service.update_cleaned_entry_processing(
+        db=db,
+        cleaned_entry_id=cleaned_entry_id,
+        cleanup_status=CleanupStatus.FAILED,
+        error_message=CANCELLED_MESSAGE
+    )
+    await db.commit()
+
+    logger.info(
+        "Cleanup cancelled",
+        cleaned_entry_id=str(cleaned_entry_id),
+        user_id=str(current_user.id)
+    )
+
+    return CancelResponse(
+        message="Cleanup cancelled",
+        cancelled_id=cleaned_entry_id,
+        status=CleanupStatus.FAILED.value
+    )
@@ -21,6 +21,7 @@ from app.schemas.voice_entry import (
     DeleteResponse
 )
 from app.schemas.transcription import TranscriptionResponse
+from app.services.background_jobs import VOICE_ENTRY_SCOPE, get_background_job_registry
 from app.services.database import db_service
 from app.services.storage import storage_service
 from app.services.envelope_encryption import (
@@ -513,6 +514,9 @@ async def delete_entry(
     # Commit database transaction
     await db.commit()
 
+    # Stop transcription and cleanup jobs whose results would be thrown away
+    get_background_job_registry().cancel(VOICE_ENTRY_SCOPE, entry_id)
+
     # Attempt to delete audio file (best effort)
     if file_path:
         file_deleted = await storage_service.delete_file(file_path)
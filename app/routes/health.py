@@ -2,11 +2,21 @@
 Health check endpoint for monitoring.
 """
 from datetime import datetime, timezone
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, Request, status, Depends
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.schemas.voice_entry import HealthResponse
+from app.schemas.voice_entry import (
+    CircuitBreakerStatus,
+    ComponentWarmupStatus,
+    HealthResponse,
+    ReadinessResponse,
+    SchedulerLaneStatus,
+)
 from app.database import get_db
+from app.services.background_jobs import get_background_job_registry
+from app.services.circuit_breaker import get_circuit_breaker_registry
+from app.services.job_scheduler import get_job_scheduler
+from app.services.startup_warmup import get_component_warmer
 from app.utils.logger import get_logger
 
 logger = get_logger("health")
@@ -31,9 +41,25 @@ async def health_check(db: AsyncSession = Depends(get_db)) -> HealthResponse:
     - Application is running
     - Database connection is working
 
+    Also reports provider circuit breakers (an open circuit does not make the
+    service unhealthy; jobs for that provider fail fast until it recovers) and
+    the queue wait times of the background job scheduler per lane. While the
+    worker drains its background jobs for a shutdown it reports 503, so load
+    balancers stop sending it new work.
+
     Returns:
         HealthResponse with status and timestamp (200 if healthy, 503 if not)
     """
+    if get_background_job_registry().draining:
+        logger.info("Health check: draining for shutdown")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "status": "draining",
+                "timestamp": datetime.now(timezone.utc).isoformat()
+            }
+        )
+
     # Check database connection by executing a simple query
     try:
         await db.execute(text("SELECT 1"))
@@ -47,7 +73,15 @@ async def health_check(db: AsyncSession = Depends(get_db)) -> HealthResponse:
         return HealthResponse(
             status="healthy",
             database="connected",
-            timestamp=datetime.now(timezone.utc)
+            timestamp=datetime.now(timezone.utc),
+            circuits={
+                name: CircuitBreakerStatus(**snapshot)
+                for name, snapshot in get_circuit_breaker_registry().snapshot().items()
+            },
+            scheduler={
+                lane: SchedulerLaneStatus(**stats)
+                for lane, stats in get_job_scheduler().snapshot().items()
+            }
         )
     else:
         logger.warning("Health check: database connection failed")
@@ -59,3 +93,77 @@ async def health_check(db: AsyncSession = Depends(get_db)) -> HealthResponse:
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
         )
+
+
+@router.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    summary="Readiness check",
+    description="Check the service can serve requests; reports background warm-up of optional components",
+    responses={
+        200: {"description": "Service is ready"},
+        503: {"description": "Service is not ready"}
+    }
+)
+async def readiness_check(request: Request, db: AsyncSession = Depends(get_db)) -> ReadinessResponse:
+    """
+    Readiness check endpoint.
+
+    Ready when the database answers and the encryption service is up. Heavy
+    optional components (spell-check dictionary) warm up in the background
+    after startup; their state is reported in `components` but does not
+    affect readiness (requests degrade as if they were disabled until then).
+
+    Returns:
+        ReadinessResponse with status and component warm-up states (200 if
+        ready, 503 if not)
+    """
+    timestamp = datetime.now(timezone.utc)
+    components = {
+        name: ComponentWarmupStatus(**snapshot)
+        for name, snapshot in get_component_warmer().snapshot().items()
+    }
+
+    if get_background_job_registry().draining:
+        logger.info("Readiness check: draining for shutdown")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "status": "draining",
+                "timestamp": timestamp.isoformat()
+            }
+        )
+
+    try:
+        await db.execute(text("SELECT 1"))
+        db_healthy = True
+    except Exception as e:
+        logger.error(f"Database readiness check failed: {e}")
+        db_healthy = False
+
+    encryption_ready = getattr(request.app.state, "encryption_service", None) is not None
+
+    if db_healthy and encryption_ready:
+        return ReadinessResponse(
+            status="ready",
+            database="connected",
+            encryption="ready",
+            timestamp=timestamp,
+            components=components
+        )
+
+    logger.warning(
+        "Readiness check: not ready",
+        database=db_healthy,
+        encryption=encryption_ready
+    )
+    raise HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail={
+            "status": "not_ready",
+            "database": "connected" if db_healthy else "disconnected",
+            "encryption": "ready" if encryption_ready else "unavailable",
+            "components": {name: component.model_dump() for name, component in components.items()},
+            "timestamp": timestamp.isoformat()
+        }
+    )
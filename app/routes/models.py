@@ -12,10 +12,9 @@ from app.schemas.models import (
     ParameterConfig
 )
 from app.services.provider_registry import (
-    get_transcription_service_for_provider,
-    get_llm_service_for_provider,
     get_available_transcription_providers,
     get_available_llm_providers,
+    get_provider_service_registry,
 )
 from app.utils.logger import get_logger
 
@@ -32,6 +31,9 @@ async def get_options() -> UnifiedOptionsResponse:
     Returns available models and provider-specific parameters with constraints.
     Frontend uses this to dynamically render configuration UI.
 
+    Model lists are served from the provider service registry's in-memory
+    cache and refreshed in the background.
+
     **No authentication required** - this endpoint is public.
 
     Returns:
@@ -46,13 +48,10 @@ async def get_options() -> UnifiedOptionsResponse:
         available_transcription = get_available_transcription_providers()
         available_llm = get_available_llm_providers()
 
-        # Create services for default providers
-        transcription_service = get_transcription_service_for_provider(settings.DEFAULT_TRANSCRIPTION_PROVIDER)
-        llm_service = get_llm_service_for_provider(settings.DEFAULT_LLM_PROVIDER)
-
-        # Get models from services
-        transcription_models = await transcription_service.list_available_models()
-        llm_models = await llm_service.list_available_models()
+        # Get models of default providers (cached)
+        registry = get_provider_service_registry()
+        transcription_models = await registry.list_models("transcription", settings.DEFAULT_TRANSCRIPTION_PROVIDER)
+        llm_models = await registry.list_models("llm", settings.DEFAULT_LLM_PROVIDER)
 
         # Get provider-specific parameters
         transcription_params = TRANSCRIPTION_PROVIDER_PARAMETERS.get(
@@ -8,7 +8,7 @@ Handles:
 """
 
 from uuid import UUID
-from typing import Annotated, Optional
+from typing import Annotated, Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -30,6 +30,13 @@ from app.services.encryption import encrypt_notion_key, decrypt_notion_key
 from app.services.envelope_encryption import EnvelopeEncryptionService, get_encryption_service
 from app.services.notion_service import NotionService, NotionValidationError, NotionAPIError
 from app.services.database import db_service
+from app.services.background_jobs import (
+    NOTION_SYNC_JOB,
+    JobResume,
+    ensure_accepting_jobs,
+    get_background_job_registry,
+    register_resumable_task,
+)
 from app.utils.encryption_helpers import decrypt_text
 from app.utils.logger import get_logger
 
@@ -202,6 +209,95 @@ async def process_notion_sync_background(
     Background task to sync dream to Notion.
 
     Creates a new page if existing_page_id is None, otherwise updates the existing page.
+    Runs as a registered background job, drained on shutdown and resumed
+    afterwards if it did not finish in time.
+
+    Args:
+        sync_id: NotionSync record ID
+        user_id: User ID (for decryption)
+        entry_id: Voice entry ID to sync
+        database_id: Notion database ID
+        encrypted_api_key: Encrypted Notion API key
+        existing_page_id: Optional existing Notion page ID to update
+
+    Returns:
+        True if the task ran to the end, False if it was cancelled or interrupted
+    """
+    return await get_background_job_registry().run(
+        NOTION_SYNC_JOB,
+        sync_id,
+        _run_notion_sync_background(
+            sync_id=sync_id,
+            user_id=user_id,
+            entry_id=entry_id,
+            database_id=database_id,
+            encrypted_api_key=encrypted_api_key,
+            existing_page_id=existing_page_id
+        ),
+        voice_entry_id=entry_id,
+        resume=JobResume("notion_sync", user_id, dict(
+            sync_id=sync_id,
+            user_id=user_id,
+            entry_id=entry_id,
+            database_id=database_id,
+            existing_page_id=existing_page_id
+        ))
+    )
+
+
+async def resume_notion_sync_background(params: Dict[str, Any]) -> None:
+    """
+    Resume a checkpointed Notion sync after a shutdown.
+
+    The encrypted API key is read from the user again (not checkpointed).
+
+    Args:
+        params: Arguments of process_notion_sync_background without the key (as JSON)
+    """
+    from app.database import get_session
+
+    sync_id = UUID(params["sync_id"])
+    user_id = UUID(params["user_id"])
+
+    async with get_session() as db:
+        sync_record = await db_service.get_notion_sync_by_id(db, sync_id)
+        if sync_record is None or sync_record.status not in (SyncStatus.PENDING, SyncStatus.PROCESSING):
+            return
+
+        user = await db_service.get_user_by_id(db, user_id)
+        if user is None or not user.notion_enabled or not user.notion_api_key_encrypted:
+            await db_service.update_notion_sync_status(
+                db=db,
+                sync_id=sync_id,
+                status=SyncStatus.FAILED,
+                error_message="Notion integration is no longer configured"
+            )
+            await db.commit()
+            return
+
+    await process_notion_sync_background(
+        sync_id=sync_id,
+        user_id=user_id,
+        entry_id=UUID(params["entry_id"]),
+        database_id=params["database_id"],
+        encrypted_api_key=user.notion_api_key_encrypted,
+        existing_page_id=params.get("existing_page_id")
+    )
+
+
+register_resumable_task("notion_sync", resume_notion_sync_background)
+
+
+async def _run_notion_sync_background(
+    sync_id: UUID,
+    user_id: UUID,
+    entry_id: UUID,
+    database_id: str,
+    encrypted_api_key: str,
+    existing_page_id: Optional[str] = None
+):
+    """
+    Sync dream to Notion (see process_notion_sync_background).
 
     Args:
         sync_id: NotionSync record ID
@@ -349,6 +445,7 @@ async def process_notion_sync_background(
     "/sync/{entry_id}",
     response_model=NotionSyncResponse,
     status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(ensure_accepting_jobs)],
     summary="Sync entry to Notion",
     description="Sync a voice entry to Notion. "
                 "Automatically creates a new page or updates existing one. "
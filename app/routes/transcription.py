@@ -1,16 +1,16 @@
 """
 API routes for audio transcription operations.
 """
-import json
 from uuid import UUID
 from pathlib import Path
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
+from typing import Annotated, Any, Dict, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status, BackgroundTasks, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_session
 from app.models.user import User
 from app.services.database import db_service
+from app.services.idempotency import IdempotentRequest
 from app.services.transcription import TranscriptionService
 from app.services.envelope_encryption import (
     EnvelopeEncryptionService,
@@ -19,7 +19,7 @@ from app.services.envelope_encryption import (
 )
 from app.services.provider_registry import (
     get_effective_transcription_provider,
-    get_transcription_service_for_provider,
+    get_provider_service_registry,
 )
 from app.middleware.jwt import get_current_user
 from app.schemas.transcription import (
@@ -30,8 +30,10 @@ from app.schemas.transcription import (
     TranscriptionStatusResponse,
     TranscriptionCreate,
     TranscriptionSegment,
+    TranscriptionSegmentDetail,
+    TranscriptionSegmentsResponse,
 )
-from app.schemas.voice_entry import DeleteResponse
+from app.schemas.voice_entry import CancelResponse, DeleteResponse
 from app.utils.encryption_helpers import (
     decrypt_audio_to_temp,
     cleanup_temp_file,
@@ -40,7 +42,26 @@ from app.utils.encryption_helpers import (
 )
 from app.utils.logger import get_logger
 from app.config import settings
-from app.services.spellcheck import get_slovenian_spellcheck_service
+from app.services.background_jobs import (
+    CANCELLED_MESSAGE,
+    TRANSCRIPTION_JOB,
+    JobResume,
+    ensure_accepting_jobs,
+    get_background_job_registry,
+    register_resumable_task,
+)
+from app.services.job_scheduler import get_job_scheduler
+from app.services.spellcheck import compute_spelling_issues, load_spelling_issues
+from app.services.transcription_segments import (
+    load_segment_window,
+    load_segments,
+    store_segment_pages,
+)
+from app.services.transcription_hedging import (
+    get_hedge_service,
+    hedge_deadline,
+    transcribe_with_hedging,
+)
 
 logger = get_logger("transcription_routes")
 
@@ -58,11 +79,127 @@ async def process_transcription_task(
     temperature: Optional[float] = None,
     transcription_model: Optional[str] = None,
     enable_diarization: bool = False,
-    speaker_count: int = 1
+    speaker_count: int = 1,
+    audio_duration_seconds: Optional[float] = None,
+    resume: Optional[JobResume] = None
 ):
     """
     Background task to process audio transcription.
 
+    Waits for a slot from the fair job scheduler first, so one user's bulk
+    uploads cannot hold up other users' short recordings. Runs as a
+    registered background job, cancelled when the transcription or its
+    entry is deleted or via POST /transcriptions/{id}/cancel, and
+    checkpointed so a shutdown resumes it instead of leaving it processing.
+
+    Args:
+        transcription_id: UUID of transcription record
+        entry_id: UUID of voice entry
+        user_id: UUID of the user (for encryption/decryption)
+        audio_file_path: Path to audio file
+        language: Language code for transcription
+        transcription_provider: Transcription provider name (e.g., 'groq', 'assemblyai')
+        beam_size: Beam size for transcription (1-10, optional)
+        temperature: Temperature for transcription sampling (0.0-1.0, optional)
+        transcription_model: Model to use for transcription (optional, uses service default if None)
+        enable_diarization: Enable speaker diarization
+        speaker_count: Expected number of speakers
+        audio_duration_seconds: Audio duration (scheduling cost; None = unknown)
+        resume: How to resume the job (defaults to this task with these arguments)
+
+    Returns:
+        True if the task ran to the end, False if it was cancelled or interrupted
+    """
+    async def scheduled() -> None:
+        async with get_job_scheduler().slot(user_id, audio_duration_seconds, kind="transcription"):
+            await _run_transcription_task(
+                transcription_id=transcription_id,
+                entry_id=entry_id,
+                user_id=user_id,
+                audio_file_path=audio_file_path,
+                language=language,
+                transcription_provider=transcription_provider,
+                beam_size=beam_size,
+                temperature=temperature,
+                transcription_model=transcription_model,
+                enable_diarization=enable_diarization,
+                speaker_count=speaker_count
+            )
+
+    if resume is None:
+        resume = JobResume("transcription", user_id, dict(
+            transcription_id=transcription_id,
+            entry_id=entry_id,
+            user_id=user_id,
+            audio_file_path=audio_file_path,
+            language=language,
+            transcription_provider=transcription_provider,
+            beam_size=beam_size,
+            temperature=temperature,
+            transcription_model=transcription_model,
+            enable_diarization=enable_diarization,
+            speaker_count=speaker_count,
+            audio_duration_seconds=audio_duration_seconds
+        ))
+
+    return await get_background_job_registry().run(
+        TRANSCRIPTION_JOB, transcription_id, scheduled(), voice_entry_id=entry_id, resume=resume
+    )
+
+
+async def is_transcription_unfinished(transcription_id: UUID) -> bool:
+    """
+    Whether a transcription still waits for its job (checked before resuming it).
+
+    Args:
+        transcription_id: UUID of transcription record
+
+    Returns:
+        True if the transcription exists and is pending or processing
+    """
+    async with get_session() as db:
+        transcription = await db_service.get_transcription_by_id(db, transcription_id)
+    return transcription is not None and transcription.status in ("pending", "processing")
+
+
+async def resume_transcription_task(params: Dict[str, Any]) -> None:
+    """
+    Resume a checkpointed transcription after a shutdown.
+
+    Args:
+        params: Arguments of process_transcription_task (as JSON)
+    """
+    transcription_id = UUID(params["transcription_id"])
+    if not await is_transcription_unfinished(transcription_id):
+        return
+
+    await process_transcription_task(**{
+        **params,
+        "transcription_id": transcription_id,
+        "entry_id": UUID(params["entry_id"]),
+        "user_id": UUID(params["user_id"]),
+    })
+
+
+register_resumable_task("transcription", resume_transcription_task)
+
+
+async def _run_transcription_task(
+    transcription_id: UUID,
+    entry_id: UUID,
+    user_id: UUID,
+    audio_file_path: str,
+    language: str,
+    transcription_provider: str,
+    beam_size: Optional[int] = None,
+    temperature: Optional[float] = None,
+    transcription_model: Optional[str] = None,
+    enable_diarization: bool = False,
+    speaker_count: int = 1
+):
+    """
+    Process audio transcription (holding a scheduler slot).
+
     Args:
         transcription_id: UUID of transcription record
         entry_id: UUID of voice entry
@@ -78,8 +215,8 @@ async def process_transcription_task(
     """
     from app.database import AsyncSessionLocal
 
-    # Create transcription service for this provider
-    transcription_service = get_transcription_service_for_provider(
+    # Shared transcription service for this provider
+    transcription_service = get_provider_service_registry().get_transcription_service(
         transcription_provider,
         model=transcription_model
     )
@@ -138,15 +275,35 @@ async def process_transcription_task(
                     temp_path=actual_audio_path
                 )
 
+            # Hedge slow transcriptions for users who opted in
+            hedge_service = None
+            if settings.TRANSCRIPTION_HEDGING_ENABLED and voice_entry.duration_seconds > 0:
+                preferences = await db_service.get_user_preferences(db, user_id)
+                if preferences.transcription_hedging:
+                    hedge_service = get_hedge_service(
+                        transcription_provider,
+                        transcription_model,
+                        enable_diarization
+                    )
+
             # Perform transcription
-            result = await transcription_service.transcribe_audio(
-                audio_path=Path(actual_audio_path),
-                language=language,
-                beam_size=beam_size,
-                temperature=temperature,
-                model=transcription_model,
-                enable_diarization=enable_diarization,
-                speaker_count=speaker_count
+            result, hedge = await transcribe_with_hedging(
+                primary=transcription_service,
+                secondary=hedge_service,
+                deadline_seconds=hedge_deadline(
+                    transcription_service.get_model_name(),
+                    voice_entry.duration_seconds
+                ),
+                transcribe_kwargs=dict(
+                    audio_path=Path(actual_audio_path),
+                    language=language,
+                    beam_size=beam_size,
+                    temperature=temperature,
+                    model=transcription_model,
+                    enable_diarization=enable_diarization,
+                    speaker_count=speaker_count
+                ),
+                audio_seconds=voice_entry.duration_seconds,
             )
 
             diarization_applied = result.get("diarization_applied", False)
@@ -158,7 +315,8 @@ async def process_transcription_task(
                 text_length=len(result["text"]),
                 beam_size=result.get("beam_size"),
                 diarization_applied=diarization_applied,
-                segment_count=len(segments)
+                segment_count=len(segments),
+                hedge_fired=hedge.hedge_fired
             )
 
             # Encrypt the transcription result (encryption is always on)
@@ -179,31 +337,45 @@ async def process_transcription_task(
                 encrypted_length=len(encrypted_text)
             )
 
-            # Encrypt segments if diarization was applied and segments exist
-            encrypted_segments = None
+            # Store segments in encrypted pages if diarization was applied and segments exist
             if diarization_applied and segments:
-                segments_json = json.dumps(segments)
-                encrypted_segments = await encrypt_text(
+                page_count = await store_segment_pages(
                     encryption_service,
                     db,
-                    segments_json,
+                    transcription_id,
+                    segments,
                     entry_id,
                     user_id,
                 )
                 logger.info(
                     "Transcription segments encrypted",
                     transcription_id=str(transcription_id),
-                    segment_count=len(segments)
+                    segment_count=len(segments),
+                    page_count=page_count
                 )
 
+            # Spell-check once here; reads serve the stored issues
+            encrypted_spelling_issues, spelling_dictionary_version = await compute_spelling_issues(
+                encryption_service,
+                db,
+                result["text"],
+                language,
+                entry_id,
+                user_id,
+            )
+
             # Update with encrypted result
             await db_service.update_transcription_status(
                 db=db,
                 transcription_id=transcription_id,
                 status="completed",
                 transcribed_text=encrypted_text,
-                segments=encrypted_segments,
+                spelling_issues=encrypted_spelling_issues,
+                spelling_dictionary_version=spelling_dictionary_version,
                 diarization_applied=diarization_applied,
+                model_used=hedge.service.get_model_name() if hedge.hedge_won else None,
+                hedge_model_used=hedge.hedge_service.get_model_name() if hedge.hedge_fired else None,
+                hedge_extra_audio_seconds=voice_entry.duration_seconds if hedge.hedge_fired else None,
             )
             await db.commit()
 
@@ -268,6 +440,7 @@ async def process_transcription_task(
     "/entries/{entry_id}/transcribe",
     response_model=TranscriptionTriggerResponse,
     status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(ensure_accepting_jobs)],
     summary="Trigger audio transcription",
     description="Start background transcription of an audio file using the specified or configured transcription provider"
 )
@@ -276,7 +449,8 @@ async def trigger_transcription(
     request_data: TranscriptionTriggerRequest,
     background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None, description="Client-generated key; retries with the same key return the original response")
 ):
     """
     Trigger transcription for a voice entry audio file.
@@ -289,6 +463,7 @@ async def trigger_transcription(
         request_data: Transcription parameters (language, provider)
         background_tasks: FastAPI background tasks
         db: Database session
+        idempotency_key: Retries with the same key return the original response
 
     Returns:
         TranscriptionTriggerResponse with transcription ID and status
@@ -306,7 +481,7 @@ async def trigger_transcription(
         )
 
     # Get transcription service to obtain model name for database record
-    transcription_service = get_transcription_service_for_provider(
+    transcription_service = get_provider_service_registry().get_transcription_service(
         effective_provider,
         model=request_data.transcription_model
     )
@@ -329,54 +504,69 @@ async def trigger_transcription(
             detail=f"Entry not found: {entry_id}"
         )
 
-    # Create transcription record
-    transcription_data = TranscriptionCreate(
-        entry_id=entry_id,
-        status="pending",
-        model_used=model_name,
-        language_code=request_data.language,
-        is_primary=False,  # Can be set later via set-primary endpoint
-        beam_size=request_data.beam_size,
-        temperature=request_data.temperature,
-        enable_diarization=request_data.enable_diarization,
-        speaker_count=request_data.speaker_count
-    )
+    # A retry whose response was lost gets the original response
+    idempotency = IdempotentRequest(idempotency_key, current_user.id, "transcribe")
+    replay = await idempotency.begin(db, {"entry_id": entry_id, **request_data.model_dump()})
+    if replay is not None:
+        return replay
 
-    transcription = await db_service.create_transcription(db, transcription_data)
-    await db.commit()
+    try:
+        # Create transcription record
+        transcription_data = TranscriptionCreate(
+            entry_id=entry_id,
+            status="pending",
+            model_used=model_name,
+            language_code=request_data.language,
+            is_primary=False,  # Can be set later via set-primary endpoint
+            beam_size=request_data.beam_size,
+            temperature=request_data.temperature,
+            enable_diarization=request_data.enable_diarization,
+            speaker_count=request_data.speaker_count
+        )
 
-    logger.info(
-        f"Transcription record created",
-        transcription_id=str(transcription.id),
-        entry_id=str(entry_id),
-        enable_diarization=request_data.enable_diarization,
-        speaker_count=request_data.speaker_count
-    )
+        transcription = await db_service.create_transcription(db, transcription_data)
+        await db.commit()
 
-    # Add background task for transcription processing
-    background_tasks.add_task(
-        process_transcription_task,
-        transcription_id=transcription.id,
-        entry_id=entry_id,
-        user_id=current_user.id,
-        audio_file_path=entry.file_path,
-        language=request_data.language,
-        transcription_provider=effective_provider,
-        beam_size=request_data.beam_size,
-        temperature=request_data.temperature,
-        transcription_model=request_data.transcription_model,
-        enable_diarization=request_data.enable_diarization,
-        speaker_count=request_data.speaker_count
-    )
+        logger.info(
+            f"Transcription record created",
+            transcription_id=str(transcription.id),
+            entry_id=str(entry_id),
+            enable_diarization=request_data.enable_diarization,
+            speaker_count=request_data.speaker_count
+        )
 
-    logger.info(f"Background transcription task queued", transcription_id=str(transcription.id))
+        # Add background task for transcription processing
+        background_tasks.add_task(
+            process_transcription_task,
+            transcription_id=transcription.id,
+            entry_id=entry_id,
+            user_id=current_user.id,
+            audio_file_path=entry.file_path,
+            language=request_data.language,
+            transcription_provider=effective_provider,
+            beam_size=request_data.beam_size,
+            temperature=request_data.temperature,
+            transcription_model=request_data.transcription_model,
+            enable_diarization=request_data.enable_diarization,
+            speaker_count=request_data.speaker_count,
+            audio_duration_seconds=entry.duration_seconds
+        )
 
-    return TranscriptionTriggerResponse(
-        transcription_id=transcription.id,
-        entry_id=entry_id,
-        status="processing",
-        message="Transcription started in background"
-    )
+        logger.info(f"Background transcription task queued", transcription_id=str(transcription.id))
+
+        response = TranscriptionTriggerResponse(
+            transcription_id=transcription.id,
+            entry_id=entry_id,
+            status="processing",
+            message="Transcription started in background"
+        )
+        await idempotency.complete(db, status.HTTP_202_ACCEPTED, response)
+
+        return response
+
+    except Exception:
+        await idempotency.release(db)
+        raise
 
 
 @router.get(
@@ -387,6 +577,9 @@ async def trigger_transcription(
 )
 async def get_transcription(
     transcription_id: UUID,
+    include_segments: Annotated[bool, Query(
+        description="Include all segments (false: load them with GET /transcriptions/{id}/segments)"
+    )] = True,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     encryption_service: Optional[EnvelopeEncryptionService] = Depends(get_encryption_service)
@@ -396,6 +589,7 @@ async def get_transcription(
 
     Args:
         transcription_id: UUID of the transcription
+        include_segments: Whether to decrypt and return all segments
         db: Database session
 
     Returns:
@@ -435,34 +629,31 @@ async def get_transcription(
         user_id=current_user.id,
     )
 
-    # Decrypt segments if they exist
-    decrypted_segments = None
-    diarization_applied = False
-    if transcription.segments is not None:
-        segments_json = await decrypt_text(
+    # Decrypt segments if they exist (skipped with include_segments=false)
+    segments_data, diarization_applied = await load_segments(
+        encryption_service,
+        db,
+        transcription,
+        entry.id,
+        current_user.id,
+        with_segments=include_segments,
+    )
+    decrypted_segments = (
+        [TranscriptionSegment(**s) for s in segments_data] if segments_data is not None else None
+    )
+
+    # Spelling issues stored on completion (recomputed if the dictionary changed)
+    spelling_issues = None
+    if transcription.status == "completed":
+        spelling_issues = await load_spelling_issues(
             encryption_service=encryption_service,
             db=db,
-            encrypted_bytes=transcription.segments,
+            record=transcription,
+            text=decrypted_text,
+            language_code=transcription.language_code,
             voice_entry_id=entry.id,
             user_id=current_user.id,
         )
-        if segments_json:
-            segments_data = json.loads(segments_json)
-            decrypted_segments = [TranscriptionSegment(**s) for s in segments_data]
-            # Check if any segment has a speaker label to determine if diarization was applied
-            diarization_applied = any(s.speaker is not None for s in decrypted_segments)
-
-    # Run spell-check for Slovenian transcriptions (on-the-fly)
-    spelling_issues = None
-    if (
-        decrypted_text
-        and transcription.status == "completed"
-        and transcription.language_code == "sl"
-        and settings.SPELLCHECK_ENABLED
-    ):
-        spellcheck_service = get_slovenian_spellcheck_service()
-        if spellcheck_service and spellcheck_service.is_loaded():
-            spelling_issues = spellcheck_service.check_text(decrypted_text)
 
     logger.info(f"Transcription retrieved", transcription_id=str(transcription_id))
 
@@ -478,6 +669,7 @@ async def get_transcription(
         speaker_count=transcription.speaker_count,
         segments=decrypted_segments,
         diarization_applied=diarization_applied,
+        hedge_model_used=transcription.hedge_model_used,
         transcription_started_at=transcription.transcription_started_at,
         transcription_completed_at=transcription.transcription_completed_at,
         error_message=transcription.error_message,
@@ -486,6 +678,115 @@ async def get_transcription(
     )
 
 
+@router.get(
+    "/transcriptions/{transcription_id}/segments",
+    response_model=TranscriptionSegmentsResponse,
+    summary="Get a window of transcription segments",
+    description="Retrieve the segments overlapping a time range, in pages (decrypts only the stored pages of the range)",
+    responses={
+        200: {"description": "Segments retrieved"},
+        400: {"description": "Invalid time range"},
+        404: {"description": "Transcription not found or not authorized"},
+        500: {"description": "Segments could not be decrypted"}
+    }
+)
+async def get_transcription_segments(
+    transcription_id: UUID,
+    from_seconds: Annotated[Optional[float], Query(alias="from", ge=0, description="Window start in seconds")] = None,
+    to_seconds: Annotated[Optional[float], Query(alias="to", ge=0, description="Window end in seconds (exclusive)")] = None,
+    cursor: Annotated[int, Query(ge=0, description="next_cursor of the previous response")] = 0,
+    limit: Annotated[Optional[int], Query(ge=1, le=settings.TRANSCRIPTION_SEGMENTS_MAX_LIMIT)] = None,
+    include_words: Annotated[bool, Query(description="Include word-level timings")] = True,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    encryption_service: Optional[EnvelopeEncryptionService] = Depends(get_encryption_service)
+) -> TranscriptionSegmentsResponse:
+    """
+    Get the segments of a transcription that overlap a time range.
+
+    Args:
+        transcription_id: UUID of the transcription
+        from_seconds: Window start in seconds (default: beginning)
+        to_seconds: Window end in seconds, exclusive (default: end)
+        cursor: Position of the first segment (next_cursor of the previous response)
+        limit: Max segments to return (default TRANSCRIPTION_SEGMENT_PAGE_SIZE)
+        include_words: Include word-level timings of segments that have them
+        db: Database session
+
+    Returns:
+        TranscriptionSegmentsResponse with the segments and the next cursor
+
+    Raises:
+        HTTPException: If the range is invalid or transcription not found
+    """
+    if from_seconds is not None and to_seconds is not None and to_seconds <= from_seconds:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'to' must be greater than 'from'"
+        )
+
+    transcription = await db_service.get_transcription_by_id(db, transcription_id)
+
+    if not transcription:
+        logger.warning(f"Transcription not found", transcription_id=str(transcription_id))
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Transcription not found: {transcription_id}"
+        )
+
+    # Verify the transcription's entry belongs to the current user
+    entry = await db_service.get_entry_by_id(db, transcription.entry_id, current_user.id)
+    if not entry:
+        logger.warning(
+            f"Unauthorized access to transcription",
+            transcription_id=str(transcription_id),
+            user_id=str(current_user.id)
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Transcription not found: {transcription_id}"
+        )
+
+    try:
+        window = await load_segment_window(
+            encryption_service,
+            db,
+            transcription,
+            entry.id,
+            current_user.id,
+            start=from_seconds,
+            end=to_seconds,
+            cursor=cursor,
+            limit=limit,
+            include_words=include_words,
+        )
+    except RuntimeError as e:
+        logger.error(
+            f"Failed to load transcription segments",
+            transcription_id=str(transcription_id),
+            error=str(e)
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to decrypt transcription segments"
+        )
+
+    logger.info(
+        f"Transcription segments retrieved",
+        transcription_id=str(transcription_id),
+        segment_count=len(window.segments),
+        next_cursor=window.next_cursor
+    )
+
+    return TranscriptionSegmentsResponse(
+        transcription_id=transcription.id,
+        segments=[TranscriptionSegmentDetail(**s) for s in window.segments],
+        next_cursor=window.next_cursor,
+        total_segments=window.total_segments,
+        diarization_applied=window.diarization_applied,
+    )
+
+
 @router.get(
     "/entries/{entry_id}/transcriptions",
     response_model=TranscriptionListResponse,
@@ -536,20 +837,16 @@ async def list_transcriptions(
             )
 
         # Decrypt segments if they exist
-        decrypted_segments = None
-        diarization_applied = False
-        if t.segments is not None:
-            segments_json = await decrypt_text(
-                encryption_service=encryption_service,
-                db=db,
-                encrypted_bytes=t.segments,
-                voice_entry_id=entry_id,
-                user_id=current_user.id,
-            )
-            if segments_json:
-                segments_data = json.loads(segments_json)
-                decrypted_segments = [TranscriptionSegment(**s) for s in segments_data]
-                diarization_applied = any(s.speaker is not None for s in decrypted_segments)
+        segments_data, diarization_applied = await load_segments(
+            encryption_service,
+            db,
+            t,
+            entry_id,
+            current_user.id,
+        )
+        decrypted_segments = (
+            [TranscriptionSegment(**s) for s in segments_data] if segments_data is not None else None
+        )
 
         transcription_responses.append(TranscriptionResponse(
             id=t.id,
@@ -565,6 +862,7 @@ async def list_transcriptions(
             speaker_count=t.speaker_count,
             segments=decrypted_segments,
             diarization_applied=diarization_applied,
+            hedge_model_used=t.hedge_model_used,
             transcription_started_at=t.transcription_started_at,
             transcription_completed_at=t.transcription_completed_at,
             error_message=t.error_message,
@@ -655,20 +953,16 @@ async def set_primary_transcription(
         )
 
     # Decrypt segments if they exist
-    decrypted_segments = None
-    diarization_applied = False
-    if updated_transcription.segments is not None:
-        segments_json = await decrypt_text(
-            encryption_service=encryption_service,
-            db=db,
-            encrypted_bytes=updated_transcription.segments,
-            voice_entry_id=updated_transcription.entry_id,
-            user_id=current_user.id,
-        )
-        if segments_json:
-            segments_data = json.loads(segments_json)
-            decrypted_segments = [TranscriptionSegment(**s) for s in segments_data]
-            diarization_applied = any(s.speaker is not None for s in decrypted_segments)
+    segments_data, diarization_applied = await load_segments(
+        encryption_service,
+        db,
+        updated_transcription,
+        updated_transcription.entry_id,
+        current_user.id,
+    )
+    decrypted_segments = (
+        [TranscriptionSegment(**s) for s in segments_data] if segments_data is not None else None
+    )
 
     logger.info(f"Transcription set as primary", transcription_id=str(transcription_id))
 
@@ -686,6 +980,7 @@ async def set_primary_transcription(
         speaker_count=updated_transcription.speaker_count,
         segments=decrypted_segments,
         diarization_applied=diarization_applied,
+        hedge_model_used=updated_transcription.hedge_model_used,
         transcription_started_at=updated_transcription.transcription_started_at,
         transcription_completed_at=updated_transcription.transcription_completed_at,
         error_message=updated_transcription.error_message,
@@ -762,6 +1057,9 @@ async def delete_transcription(
     # Commit database transaction
     await db.commit()
 
+    # Stop paying for work whose results would be thrown away
+    get_background_job_registry().cancel(TRANSCRIPTION_JOB, transcription_id)
+
     logger.info(
         "Transcription deleted successfully",
         transcription_id=str(transcription_id),
@@ -772,3 +1070,77 @@ async def delete_transcription(
         message="Transcription deleted successfully",
         deleted_id=transcription_id
     )
+
+
+@router.post(
+    "/transcriptions/{transcription_id}/cancel",
+    response_model=CancelResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Cancel transcription",
+    description="Stop a pending or processing transcription, including its provider jobs. The transcription is marked as failed.",
+    responses={
+        200: {"description": "Transcription cancelled"},
+        404: {"description": "Transcription not found or not authorized"},
+        409: {"description": "Transcription already finished"},
+    }
+)
+async def cancel_transcription(
+    transcription_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+) -> CancelResponse:
+    """
+    Cancel a pending or processing transcription.
+
+    The background job is cancelled in whichever worker runs it; its RunPod
+    jobs are cancelled on RunPod and chunk requests are abandoned.
+
+    Args:
+        transcription_id: UUID of the transcription to cancel
+        db: Database session
+        current_user: Authenticated user from JWT token
+
+    Returns:
+        CancelResponse with the cancelled transcription ID and new status
+
+    Raises:
+        HTTPException: 404 if not found/unauthorized, 409 if already finished
+    """
+    transcription = await db_service.get_transcription_by_id(db, transcription_id)
+    entry = (
+        await db_service.get_entry_by_id(db, transcription.entry_id, current_user.id)
+        if transcription else None
+    )
+    if not entry:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Transcription not found: {transcription_id}"
+        )
+
+    if transcription.status not in ("pending", "processing"):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Transcription is already {transcription.status}"
+        )
+
+    get_background_job_registry().cancel(TRANSCRIPTION_JOB, transcription_id)
+
+    await db_service.update_transcription_status(
+        db,
+        transcription_id,
+        "failed",
+        error_message=CANCELLED_MESSAGE
+    )
+    await db.commit()
+
+    logger.info(
+        "Transcription cancelled",
+        transcription_id=str(transcription_id),
+        user_id=str(current_user.id)
+    )
+
+    return CancelResponse(
+        message="Transcription cancelled",
+        cancelled_id=transcription_id,
+        status="failed"
+    )
@@ -3,8 +3,8 @@ Upload endpoint for audio file uploads.
 """
 import uuid
 from datetime import datetime, timezone
-from typing import Optional
-from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException, status, Request, BackgroundTasks
+from typing import Any, Dict, Optional
+from fastapi import APIRouter, UploadFile, File, Form, Header, Depends, HTTPException, status, Request, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -18,12 +18,20 @@ from app.services.database import db_service
 from app.services.transcription import TranscriptionService
 from app.services.audio_preprocessing import preprocessing_service
 from app.services.envelope_encryption import EnvelopeEncryptionService, get_encryption_service
+from app.services.background_jobs import (
+    JobResume,
+    ensure_accepting_jobs,
+    get_background_job_registry,
+    register_resumable_task,
+)
+from app.services.idempotency import IdempotentRequest
 from app.services.provider_registry import (
     get_effective_transcription_provider,
     get_effective_llm_provider,
-    get_transcription_service_for_provider,
+    get_provider_service_registry,
 )
 from app.middleware.jwt import get_current_user
+from app.routes.warmup import warm_endpoints_for_upload
 from app.utils.validators import validate_audio_file
 from app.utils.logger import get_logger
 from app.utils.audio import get_audio_duration
@@ -90,7 +98,8 @@ async def transcription_then_cleanup_task(
     llm_provider: Optional[str] = None,
     llm_model: Optional[str] = None,
     enable_diarization: bool = False,
-    speaker_count: int = 1
+    speaker_count: int = 1,
+    audio_duration_seconds: Optional[float] = None
 ):
     """
     Background task that runs transcription, then triggers cleanup when done.
@@ -109,13 +118,40 @@ async def transcription_then_cleanup_task(
         llm_provider: LLM provider name (e.g., 'ollama', 'groq')
         enable_diarization: Enable speaker diarization
         speaker_count: Expected number of speakers
+        audio_duration_seconds: Audio duration (scheduling cost of the transcription)
+
+    Transcription and cleanup take separate scheduler slots and are
+    cancelled separately; a cleanup cancelled while the transcription runs
+    is skipped. The transcription is checkpointed as this whole task, so a
+    transcription resumed after a shutdown still starts the cleanup.
     """
     # Import here to avoid circular imports
     from app.routes.transcription import process_transcription_task
     from app.routes.cleanup import process_cleanup_background
 
+    resume = JobResume("transcription_then_cleanup", user_id, dict(
+        transcription_id=transcription_id,
+        entry_id=entry_id,
+        audio_file_path=audio_file_path,
+        language=language,
+        transcription_provider=transcription_provider,
+        cleaned_entry_id=cleaned_entry_id,
+        entry_type=entry_type,
+        user_id=user_id,
+        transcription_beam_size=transcription_beam_size,
+        transcription_temperature=transcription_temperature,
+        transcription_model=transcription_model,
+        cleanup_temperature=cleanup_temperature,
+        cleanup_top_p=cleanup_top_p,
+        llm_provider=llm_provider,
+        llm_model=llm_model,
+        enable_diarization=enable_diarization,
+        speaker_count=speaker_count,
+        audio_duration_seconds=audio_duration_seconds
+    ))
+
     # Run transcription
-    await process_transcription_task(
+    completed = await process_transcription_task(
         transcription_id=transcription_id,
         entry_id=entry_id,
         user_id=user_id,
@@ -126,14 +162,29 @@ async def transcription_then_cleanup_task(
         temperature=transcription_temperature,
         transcription_model=transcription_model,
         enable_diarization=enable_diarization,
-        speaker_count=speaker_count
+        speaker_count=speaker_count,
+        audio_duration_seconds=audio_duration_seconds,
+        resume=resume
     )
 
+    # Interrupted by a shutdown (or deferred while draining): the cleanup stays
+    # pending and is started by the resumed task. A cancelled transcription
+    # continues below, which fails the cleanup.
+    if not completed and get_background_job_registry().draining:
+        logger.info(f"Transcription {transcription_id} left for resume, cleanup {cleaned_entry_id} stays pending")
+        return
+
     # Check if transcription succeeded
     from app.database import get_session
     from app.main import app
 
     async with get_session() as db:
+        # The cleanup may have been cancelled (or deleted) while transcribing
+        cleaned_entry = await db_service.get_cleaned_entry_by_id(db, cleaned_entry_id)
+        if cleaned_entry is None or cleaned_entry.status != CleanupStatus.PENDING:
+            logger.info(f"Cleanup {cleaned_entry_id} no longer pending, skipping it")
+            return
+
         transcription_result = await db_service.get_transcription_by_id(
             db=db,
             transcription_id=transcription_id
@@ -174,7 +225,8 @@ async def transcription_then_cleanup_task(
                     temperature=cleanup_temperature,
                     top_p=cleanup_top_p,
                     llm_model=llm_model,
-                    llm_provider=llm_provider
+                    llm_provider=llm_provider,
+                    transcription_id=transcription_id
                 )
             else:
                 # Decryption failed
@@ -198,6 +250,31 @@ async def transcription_then_cleanup_task(
             await db.commit()
 
 
+async def resume_transcription_then_cleanup_task(params: Dict[str, Any]) -> None:
+    """
+    Resume a checkpointed transcription-then-cleanup task after a shutdown.
+
+    Args:
+        params: Arguments of transcription_then_cleanup_task (as JSON)
+    """
+    from app.routes.transcription import is_transcription_unfinished
+
+    transcription_id = uuid.UUID(params["transcription_id"])
+    if not await is_transcription_unfinished(transcription_id):
+        return
+
+    await transcription_then_cleanup_task(**{
+        **params,
+        "transcription_id": transcription_id,
+        "entry_id": uuid.UUID(params["entry_id"]),
+        "cleaned_entry_id": uuid.UUID(params["cleaned_entry_id"]),
+        "user_id": uuid.UUID(params["user_id"]),
+    })
+
+
+register_resumable_task("transcription_then_cleanup", resume_transcription_then_cleanup_task)
+
+
 @router.post(
     "/upload",
     response_model=VoiceEntryUploadResponse,
@@ -217,6 +294,7 @@ async def upload_audio(
     entry_type: str = Form("dream", description="Type of voice entry (dream, journal, meeting, note, etc.)"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None, description="Client-generated key; retries with the same key return the original response"),
     encryption_service: Optional[EnvelopeEncryptionService] = Depends(get_encryption_service),
 ) -> VoiceEntryUploadResponse:
     """
@@ -234,6 +312,15 @@ async def upload_audio(
     - Database transaction is rolled back automatically
     - Saved file is deleted if database write fails
     """
+    # A retry of an upload whose response was lost gets the original response
+    idempotency = IdempotentRequest(idempotency_key, current_user.id, "upload")
+    replay = await idempotency.begin(db, {"entry_type": entry_type}, upload=file)
+    if replay is not None:
+        return replay
+
+    # Transcription and cleanup usually follow; boot RunPod workers meanwhile
+    warm_endpoints_for_upload()
+
     file_id = uuid.uuid4()
     saved_file_path = None
 
@@ -315,8 +402,7 @@ async def upload_audio(
             is_encrypted=entry.is_encrypted,
         )
 
-        # Return response
-        return VoiceEntryUploadResponse(
+        response = VoiceEntryUploadResponse(
             id=entry.id,
             original_filename=entry.original_filename,
             saved_filename=entry.saved_filename,
@@ -325,12 +411,19 @@ async def upload_audio(
             uploaded_at=entry.uploaded_at,
             message="File uploaded successfully"
         )
+        await idempotency.complete(db, status.HTTP_201_CREATED, response)
+
+        # Return response
+        return response
 
     except HTTPException:
         # Re-raise HTTP exceptions (validation errors, etc.)
+        await idempotency.release(db)
         raise
 
     except Exception as e:
+        await idempotency.release(db)
+
         # Rollback: Delete saved file if it exists and database write failed
         if saved_file_path:
             logger.warning(
@@ -356,6 +449,7 @@ async def upload_audio(
     "/upload-and-transcribe",
     response_model=VoiceEntryUploadAndTranscribeResponse,
     status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(ensure_accepting_jobs)],
     summary="Upload audio file and start transcription",
     description="Upload an audio file and immediately start transcription in a single request. Returns both entry details and transcription ID.",
     responses={
@@ -379,6 +473,7 @@ async def upload_and_transcribe(
     speaker_count: int = Form(1, ge=1, le=10, description="Expected number of speakers (1-10). Only used if enable_diarization=True."),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None, description="Client-generated key; retries with the same key return the original response"),
     encryption_service: Optional[EnvelopeEncryptionService] = Depends(get_encryption_service),
 ) -> VoiceEntryUploadAndTranscribeResponse:
     """
@@ -407,11 +502,33 @@ async def upload_and_transcribe(
         )
 
     # Get transcription service to obtain model name for database record
-    transcription_service = get_transcription_service_for_provider(
+    transcription_service = get_provider_service_registry().get_transcription_service(
         effective_transcription_provider,
         model=transcription_model
     )
 
+    # A retry of an upload whose response was lost gets the original response
+    idempotency = IdempotentRequest(idempotency_key, current_user.id, "upload-and-transcribe")
+    replay = await idempotency.begin(
+        db,
+        {
+            "entry_type": entry_type,
+            "language": language,
+            "transcription_beam_size": transcription_beam_size,
+            "transcription_temperature": transcription_temperature,
+            "transcription_model": transcription_model,
+            "transcription_provider": effective_transcription_provider,
+            "enable_diarization": enable_diarization,
+            "speaker_count": speaker_count,
+        },
+        upload=file
+    )
+    if replay is not None:
+        return replay
+
+    # A cleanup usually follows the transcription; boot its RunPod worker meanwhile
+    warm_endpoints_for_upload(warm_transcription=False)
+
     file_id = uuid.uuid4()
     saved_file_path = None
 
@@ -546,7 +663,8 @@ async def upload_and_transcribe(
             temperature=transcription_temperature,
             transcription_model=transcription_model,
             enable_diarization=enable_diarization,
-            speaker_count=speaker_count
+            speaker_count=speaker_count,
+            audio_duration_seconds=entry.duration_seconds
         )
 
         logger.info(
@@ -554,8 +672,7 @@ async def upload_and_transcribe(
             transcription_id=str(transcription.id)
         )
 
-        # Return response
-        return VoiceEntryUploadAndTranscribeResponse(
+        response = VoiceEntryUploadAndTranscribeResponse(
             entry_id=entry.id,
             transcription_id=transcription.id,
             original_filename=entry.original_filename,
@@ -567,12 +684,19 @@ async def upload_and_transcribe(
             transcription_language=effective_language,
             message="File uploaded and transcription started"
         )
+        await idempotency.complete(db, status.HTTP_202_ACCEPTED, response)
+
+        # Return response
+        return response
 
     except HTTPException:
         # Re-raise HTTP exceptions (validation errors, etc.)
+        await idempotency.release(db)
         raise
 
     except Exception as e:
+        await idempotency.release(db)
+
         # Rollback: Delete saved file if it exists and database write failed
         if saved_file_path:
             logger.warning(
@@ -598,6 +722,7 @@ async def upload_and_transcribe(
     "/upload-transcribe-cleanup",
     response_model=UploadTranscribeCleanupResponse,
     status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(ensure_accepting_jobs)],
     summary="Upload, transcribe, and cleanup audio file (complete workflow)",
     description="Upload an audio file, transcribe it, and clean it with LLM - all in one request. This is the recommended workflow for most use cases.",
     responses={
@@ -625,6 +750,7 @@ async def upload_transcribe_and_cleanup(
     llm_provider: Optional[str] = Form(None, description="LLM provider (e.g., 'ollama', 'groq'). If not provided, uses configured default."),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None, description="Client-generated key; retries with the same key return the original response"),
     encryption_service: Optional[EnvelopeEncryptionService] = Depends(get_encryption_service),
 ) -> UploadTranscribeCleanupResponse:
     """
@@ -666,11 +792,37 @@ async def upload_transcribe_and_cleanup(
         )
 
     # Get transcription service to obtain model name for database record
-    transcription_service = get_transcription_service_for_provider(
+    transcription_service = get_provider_service_registry().get_transcription_service(
         effective_transcription_provider,
         model=transcription_model
     )
 
+    # A retry of an upload whose response was lost gets the original response
+    idempotency = IdempotentRequest(idempotency_key, current_user.id, "upload-transcribe-cleanup")
+    replay = await idempotency.begin(
+        db,
+        {
+            "entry_type": entry_type,
+            "language": language,
+            "transcription_beam_size": transcription_beam_size,
+            "transcription_temperature": transcription_temperature,
+            "transcription_model": transcription_model,
+            "transcription_provider": effective_transcription_provider,
+            "enable_diarization": enable_diarization,
+            "speaker_count": speaker_count,
+            "cleanup_temperature": cleanup_temperature,
+            "cleanup_top_p": cleanup_top_p,
+            "llm_model": llm_model,
+            "llm_provider": effective_llm_provider,
+        },
+        upload=file
+    )
+    if replay is not None:
+        return replay
+
+    # Cleanup runs after transcription; boot its RunPod worker meanwhile
+    warm_endpoints_for_upload(llm_provider=effective_llm_provider, warm_transcription=False)
+
     file_id = uuid.uuid4()
     saved_file_path = None
 
@@ -842,7 +994,8 @@ async def upload_transcribe_and_cleanup(
             llm_model=llm_model,
             llm_provider=effective_llm_provider,
             enable_diarization=enable_diarization,
-            speaker_count=speaker_count
+            speaker_count=speaker_count,
+            audio_duration_seconds=entry.duration_seconds
         )
 
         logger.info(
@@ -851,8 +1004,7 @@ async def upload_transcribe_and_cleanup(
             cleanup_id=str(cleaned_entry.id)
         )
 
-        # Return response
-        return UploadTranscribeCleanupResponse(
+        response = UploadTranscribeCleanupResponse(
             entry_id=entry.id,
             original_filename=entry.original_filename,
             saved_filename=entry.saved_filename,
@@ -867,12 +1019,19 @@ async def upload_transcribe_and_cleanup(
             cleanup_model=cleaned_entry.model_name,
             message="File uploaded, transcription and cleanup started"
         )
+        await idempotency.complete(db, status.HTTP_202_ACCEPTED, response)
+
+        # Return response
+        return response
 
     except HTTPException:
         # Re-raise HTTP exceptions (validation errors, etc.)
+        await idempotency.release(db)
         raise
 
     except Exception as e:
+        await idempotency.release(db)
+
         # Rollback: Delete saved file if it exists and database write failed
         if saved_file_path:
             logger.warning(
@@ -95,6 +95,7 @@ async def update_user_preferences(
         current_user.id,
         preferred_transcription_language=preferences_data.preferred_transcription_language,
         preferred_llm_model=preferences_data.preferred_llm_model,
+        transcription_hedging=preferences_data.transcription_hedging,
     )
     await db.commit()
 
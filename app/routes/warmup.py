@@ -0,0 +1,200 @@
+"""
+API routes for pre-warming RunPod endpoints.
+"""
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.middleware.jwt import get_current_user
+from app.models.user import User
+from app.schemas.warmup import (
+    WarmupEndpointMetrics,
+    WarmupEndpointStatus,
+    WarmupMetricsResponse,
+    WarmupRequest,
+    WarmupResponse,
+)
+from app.services.database import db_service
+from app.services.provider_registry import (
+    LLM_PROVIDERS,
+    get_effective_llm_provider,
+    get_effective_transcription_provider,
+    get_provider_service_registry,
+    is_llm_provider_configured,
+)
+from app.services.runpod_warmup import get_endpoint_warmer
+from app.utils.logger import get_logger
+
+logger = get_logger("warmup_routes")
+
+router = APIRouter()
+
+
+def request_endpoint_warmups(
+    transcription_provider: Optional[str] = None,
+    transcription_model: Optional[str] = None,
+    llm_provider: Optional[str] = None,
+    warm_transcription: bool = True,
+    warm_llm: bool = True,
+) -> List[WarmupEndpointStatus]:
+    """
+    Send warmups to the endpoints a user is about to use (non-blocking).
+
+    Args:
+        transcription_provider: Transcription provider (None = configured default)
+        transcription_model: Transcription model / RunPod variant
+        llm_provider: LLM provider (None = configured default)
+        warm_transcription: Whether to warm the transcription endpoint
+        warm_llm: Whether to warm the LLM endpoint
+
+    Returns:
+        Status per warmed service
+
+    Raises:
+        ValueError: If a provider is not valid or not configured
+    """
+    registry = get_provider_service_registry()
+    statuses = []
+
+    if warm_transcription:
+        service = registry.get_transcription_service(
+            get_effective_transcription_provider(transcription_provider),
+            model=transcription_model
+        )
+        statuses.append(WarmupEndpointStatus(
+            service="transcription",
+            model=service.get_model_name(),
+            warmup_sent=service.request_warmup()
+        ))
+
+    if warm_llm:
+        service = registry.get_llm_service(get_effective_llm_provider(llm_provider))
+        statuses.append(WarmupEndpointStatus(
+            service="llm",
+            model=service.get_model_name(),
+            warmup_sent=service.request_warmup()
+        ))
+
+    return statuses
+
+
+def warm_endpoints_for_upload(
+    transcription_provider: Optional[str] = None,
+    transcription_model: Optional[str] = None,
+    llm_provider: Optional[str] = None,
+    warm_transcription: bool = True,
+) -> None:
+    """
+    Warm endpoints when an upload starts; failures never affect the upload.
+
+    Args:
+        transcription_provider: Transcription provider (None = configured default)
+        transcription_model: Transcription model / RunPod variant
+        llm_provider: LLM provider (None = configured default)
+        warm_transcription: False when transcription is submitted right away
+                            (the job itself boots the worker)
+    """
+    try:
+        request_endpoint_warmups(
+            transcription_provider=transcription_provider,
+            transcription_model=transcription_model,
+            llm_provider=llm_provider,
+            warm_transcription=warm_transcription,
+        )
+    except Exception as e:
+        logger.warning(f"Endpoint warmup on upload failed", error=str(e))
+
+
+def _preferred_llm_provider(preferred_llm_model: Optional[str]) -> Optional[str]:
+    """Provider of a 'provider-model' preference, if it is configured."""
+    if not preferred_llm_model:
+        return None
+    for provider in LLM_PROVIDERS:
+        if preferred_llm_model.startswith(f"{provider}-") and is_llm_provider_configured(provider):
+            return provider
+    return None
+
+
+@router.post(
+    "/warmup",
+    response_model=WarmupResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Pre-warm provider endpoints",
+    description="Boot RunPod workers for the transcription and LLM endpoints the user is about to use"
+)
+async def warmup_endpoints(
+    request_data: Optional[WarmupRequest] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> WarmupResponse:
+    """
+    Pre-warm endpoints before an upload.
+
+    Clients call this when the user starts recording. Warmups are cheap
+    no-op jobs, debounced per endpoint; providers without cold starts are
+    skipped. Returns without waiting for the workers.
+
+    Args:
+        request_data: Providers to warm (optional)
+        current_user: Authenticated user
+        db: Database session
+
+    Returns:
+        WarmupResponse with the warmup status per service
+
+    Raises:
+        HTTPException: If a provider is not valid or not configured
+    """
+    request_data = request_data or WarmupRequest()
+
+    llm_provider = request_data.llm_provider
+    if llm_provider is None:
+        preferences = await db_service.get_user_preferences(db, current_user.id)
+        await db.commit()
+        llm_provider = _preferred_llm_provider(preferences.preferred_llm_model)
+
+    try:
+        statuses = request_endpoint_warmups(
+            transcription_provider=request_data.transcription_provider,
+            transcription_model=request_data.transcription_model,
+            llm_provider=llm_provider,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    logger.info(
+        f"Warmup requested",
+        user_id=str(current_user.id),
+        sent=[s.model for s in statuses if s.warmup_sent]
+    )
+
+    return WarmupResponse(endpoints=statuses)
+
+
+@router.get(
+    "/warmup/metrics",
+    response_model=WarmupMetricsResponse,
+    summary="Warmup metrics",
+    description="Warmups sent and warm-hit rate per RunPod endpoint since process start"
+)
+async def get_warmup_metrics(
+    current_user: User = Depends(get_current_user)
+) -> WarmupMetricsResponse:
+    """
+    Get warmup counters per endpoint.
+
+    Args:
+        current_user: Authenticated user
+
+    Returns:
+        WarmupMetricsResponse keyed by model name
+    """
+    return WarmupMetricsResponse(endpoints={
+        endpoint: WarmupEndpointMetrics(**counters)
+        for endpoint, counters in get_endpoint_warmer().metrics().items()
+    })
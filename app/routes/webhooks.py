@@ -0,0 +1,72 @@
+"""
+Webhook receivers for external providers.
+
+AssemblyAI calls the webhook when a transcript finishes. The shared poller then
+fetches the transcript immediately instead of waiting for its next poll.
+"""
+import hmac
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, status
+
+from app.config import settings
+from app.schemas.transcription import AssemblyAIWebhookPayload, AssemblyAIWebhookResponse
+from app.services.assemblyai_poller import get_assemblyai_poller
+from app.utils.logger import get_logger
+
+logger = get_logger("webhooks")
+router = APIRouter()
+
+
+@router.post(
+    "/webhooks/assemblyai",
+    response_model=AssemblyAIWebhookResponse,
+    summary="AssemblyAI completion webhook",
+    description="Receives transcript completion notifications from AssemblyAI",
+    responses={
+        200: {"description": "Notification accepted"},
+        401: {"description": "Invalid webhook secret"},
+        404: {"description": "Webhook not enabled"}
+    }
+)
+async def assemblyai_webhook(
+    payload: AssemblyAIWebhookPayload,
+    x_assemblyai_webhook_secret: Optional[str] = Header(default=None)
+) -> AssemblyAIWebhookResponse:
+    """
+    Resolve a pending AssemblyAI transcription immediately.
+
+    The transcript is always fetched via the API (the webhook body only carries
+    id and status). In multi-worker deployments the notification may reach a
+    worker that is not waiting for the transcript; that worker ignores it and
+    the owning worker's fallback poll picks up the result.
+
+    Returns:
+        AssemblyAIWebhookResponse with whether this worker tracked the transcript
+    """
+    if not settings.ASSEMBLYAI_WEBHOOK_URL:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="AssemblyAI webhook is not enabled"
+        )
+
+    if settings.ASSEMBLYAI_WEBHOOK_SECRET and not hmac.compare_digest(
+        x_assemblyai_webhook_secret or "",
+        settings.ASSEMBLYAI_WEBHOOK_SECRET
+    ):
+        logger.warning("AssemblyAI webhook rejected: invalid secret")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid webhook secret"
+        )
+
+    tracked = get_assemblyai_poller().notify(payload.transcript_id)
+
+    logger.info(
+        "AssemblyAI webhook received",
+        transcript_id=payload.transcript_id,
+        transcript_status=payload.status,
+        tracked=tracked
+    )
+
+    return AssemblyAIWebhookResponse(transcript_id=payload.transcript_id, tracked=tracked)
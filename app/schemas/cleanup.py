@@ -61,6 +61,7 @@ class CleanedEntryDetail(BaseModel):
     model_name: str = Field(description="LLM model used")
     temperature: Optional[float] = Field(None, description="Temperature used for LLM")
     top_p: Optional[float] = Field(None, description="Top-p value used for LLM")
+    cache_hit: bool = Field(False, description="Whether the cleaned text was reused from an identical earlier cleanup")
     error_message: Optional[str] = Field(None, description="Error details if failed")
     is_primary: bool = Field(description="Whether this is the primary cleanup to display")
     processing_time_seconds: Optional[float] = Field(None, description="Processing duration")
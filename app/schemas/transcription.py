@@ -21,6 +21,33 @@ class TranscriptionSegment(BaseModel):
     )
 
 
+class SegmentWord(BaseModel):
+    """Word-level timing within a segment."""
+    word: str
+    start: float = Field(description="Start time in seconds")
+    end: float = Field(description="End time in seconds")
+
+
+class TranscriptionSegmentDetail(TranscriptionSegment):
+    """Transcription segment with word-level timings (if the provider returned them)."""
+    words: Optional[List[SegmentWord]] = Field(
+        default=None,
+        description="Word-level timings (null if not requested or not available)"
+    )
+
+
+class TranscriptionSegmentsResponse(BaseModel):
+    """Schema for a window of a transcription's segments."""
+    transcription_id: UUID
+    segments: List[TranscriptionSegmentDetail]
+    next_cursor: Optional[int] = Field(
+        default=None,
+        description="Cursor of the next window (null if there are no more segments in the time range)"
+    )
+    total_segments: int = Field(description="Number of segments of the whole transcription")
+    diarization_applied: bool = False
+
+
 class TranscriptionBase(BaseModel):
     """Base schema with common transcription fields."""
     status: str
@@ -96,6 +123,10 @@ class TranscriptionResponse(TranscriptionBase):
     speaker_count: int = 1
     segments: Optional[list[TranscriptionSegment]] = None
     diarization_applied: bool = False
+    hedge_model_used: Optional[str] = Field(
+        default=None,
+        description="Model of the hedge request sent because the primary was slow (model_used produced the result)"
+    )
     transcription_started_at: Optional[datetime] = None
     transcription_completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
@@ -132,6 +163,10 @@ class TranscriptionStatusResponse(BaseModel):
     speaker_count: int = 1
     segments: Optional[list[TranscriptionSegment]] = None
     diarization_applied: bool = False
+    hedge_model_used: Optional[str] = Field(
+        default=None,
+        description="Model of the hedge request sent because the primary was slow (model_used produced the result)"
+    )
     transcription_started_at: Optional[datetime] = None
     transcription_completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
@@ -156,3 +191,17 @@ class TranscriptionUpdateStatus(BaseModel):
 class SetPrimaryTranscriptionRequest(BaseModel):
     """Schema for setting a transcription as primary."""
     transcription_id: UUID
+
+
+class AssemblyAIWebhookPayload(BaseModel):
+    """Completion notification sent by AssemblyAI to the webhook route."""
+    transcript_id: str = Field(description="AssemblyAI transcript ID")
+    status: str = Field(description="Transcript status ('completed' or 'error')")
+
+
+class AssemblyAIWebhookResponse(BaseModel):
+    """Acknowledgement returned to AssemblyAI."""
+    transcript_id: str
+    tracked: bool = Field(
+        description="Whether this worker was waiting for the transcript"
+    )
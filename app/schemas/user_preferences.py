@@ -22,6 +22,10 @@ class UserPreferencesResponse(BaseModel):
         default=None,
         description="Preferred LLM model in format 'provider-model' (e.g., 'ollama-llama3.2:3b', 'groq-llama-3.3-70b-versatile')"
     )
+    transcription_hedging: bool = Field(
+        default=False,
+        description="Send a second (billed) request to another provider when transcription is slower than usual"
+    )
     created_at: datetime
     updated_at: datetime
 
@@ -43,6 +47,10 @@ class UserPreferencesUpdate(BaseModel):
         None,
         description="Preferred LLM model in format 'provider-model' (e.g., 'ollama-llama3.2:3b', 'groq-llama-3.3-70b-versatile')"
     )
+    transcription_hedging: Optional[bool] = Field(
+        None,
+        description="Send a second (billed) request to another provider when transcription is slower than usual"
+    )
 
     @field_validator('preferred_transcription_language')
     @classmethod
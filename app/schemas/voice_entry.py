@@ -3,7 +3,7 @@ Pydantic schemas for voice entry request/response validation.
 """
 from datetime import datetime
 from uuid import UUID
-from typing import Optional, Any
+from typing import Dict, Optional, Any
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -46,11 +46,59 @@ class VoiceEntryUploadResponse(VoiceEntryResponse):
     message: str = "File uploaded successfully"
 
 
+class CircuitBreakerStatus(BaseModel):
+    """Schema for the state of one provider circuit breaker."""
+    state: str = Field(..., description="closed, open or half_open")
+    calls: int = Field(..., description="Calls in the rolling window")
+    failure_rate: Optional[float] = Field(None, description="Share of failed calls in the window")
+    p95_latency_seconds: Optional[float] = None
+    retry_after_seconds: Optional[float] = Field(None, description="Seconds until a probe call (open circuits)")
+    times_opened: int
+    rejected_calls: int
+
+
+class SchedulerLaneStatus(BaseModel):
+    """Schema for the queue of one job scheduler lane."""
+    queued: int
+    queued_users: int
+    dispatched: int = Field(..., description="Jobs started since process start")
+    avg_wait_seconds: Optional[float] = Field(None, description="Queue wait over recent jobs")
+    p95_wait_seconds: Optional[float] = None
+    max_wait_seconds: Optional[float] = None
+
+
 class HealthResponse(BaseModel):
     """Schema for health check endpoint response."""
     status: str
     database: str
     timestamp: datetime
+    circuits: Dict[str, CircuitBreakerStatus] = Field(
+        default_factory=dict,
+        description="Provider circuit breakers by endpoint (open circuits fail fast)"
+    )
+    scheduler: Dict[str, SchedulerLaneStatus] = Field(
+        default_factory=dict,
+        description="Background job queues by lane (interactive, bulk)"
+    )
+
+
+class ComponentWarmupStatus(BaseModel):
+    """Schema for the warm-up state of one optional component."""
+    status: str = Field(..., description="pending, warming, ready or failed")
+    elapsed_seconds: Optional[float] = Field(None, description="Warm-up time so far (total once finished)")
+    error: Optional[str] = None
+
+
+class ReadinessResponse(BaseModel):
+    """Schema for readiness check endpoint response."""
+    status: str
+    database: str
+    encryption: str
+    timestamp: datetime
+    components: Dict[str, ComponentWarmupStatus] = Field(
+        default_factory=dict,
+        description="Optional components warming up in the background (do not affect readiness)"
+    )
 
 
 class VoiceEntryUploadAndTranscribeResponse(BaseModel):
@@ -138,3 +186,10 @@ class DeleteResponse(BaseModel):
     """Schema for delete operation response."""
     message: str
     deleted_id: UUID
+
+
+class CancelResponse(BaseModel):
+    """Schema for cancel operation response."""
+    message: str
+    cancelled_id: UUID
+    status: str
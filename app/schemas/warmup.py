@@ -0,0 +1,50 @@
+"""
+Pydantic schemas for RunPod endpoint warmup.
+"""
+from typing import Dict, List, Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class WarmupRequest(BaseModel):
+    """Providers the client is about to use (defaults: user preference, then configured default)."""
+    transcription_provider: Optional[str] = Field(
+        None,
+        description="Transcription provider (e.g., 'clarin-slovene-asr'). If not provided, uses configured default."
+    )
+    transcription_model: Optional[str] = Field(
+        None,
+        description="Transcription model / RunPod variant (e.g., 'pyannote'). If not provided, uses provider default."
+    )
+    llm_provider: Optional[str] = Field(
+        None,
+        description="LLM provider (e.g., 'runpod_llm_gams'). If not provided, uses preferred LLM model's provider or configured default."
+    )
+
+
+class WarmupEndpointStatus(BaseModel):
+    """Warmup outcome for one service."""
+    service: Literal["transcription", "llm"]
+    model: str = Field(..., description="Model name of the service (e.g., 'clarin-slovene-asr-pyannote')")
+    warmup_sent: bool = Field(
+        ...,
+        description="Whether a warmup job was sent (false if the provider has no cold starts or was warmed recently)"
+    )
+
+
+class WarmupResponse(BaseModel):
+    """Response for POST /warmup."""
+    endpoints: List[WarmupEndpointStatus]
+
+
+class WarmupEndpointMetrics(BaseModel):
+    """Warmup counters of one endpoint since process start."""
+    warmups_sent: int
+    warmups_failed: int
+    jobs: int
+    warm_hits: int = Field(..., description="Jobs submitted within RUNPOD_WARMUP_WARM_SECONDS of a warmup")
+    warm_hit_rate: Optional[float] = Field(None, description="warm_hits / jobs (null before the first job)")
+
+
+class WarmupMetricsResponse(BaseModel):
+    """Response for GET /warmup/metrics, keyed by model name."""
+    endpoints: Dict[str, WarmupEndpointMetrics]
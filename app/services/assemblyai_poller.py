@@ -0,0 +1,348 @@
+"""
+Shared status poller for AssemblyAI transcripts.
+
+Instead of one polling loop (and one HTTP client) per transcription job, a
+single background task tracks every pending transcript id and wakes the
+waiting jobs through futures.
+
+Poll intervals adapt to each job:
+- The first poll happens right after submission (short clips finish fast).
+- While the job is younger than its expected turnaround (a fraction of the
+  audio duration) it is polled sparsely, about twice before the expected
+  finish.
+- Past the expected turnaround the interval grows with elapsed time.
+All intervals are clamped to [poll interval, ASSEMBLYAI_POLL_MAX_INTERVAL].
+
+When a webhook is configured, AssemblyAI calls the webhook route on completion
+and notify() triggers an immediate fetch, so polling is only a safety net.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger("transcription.assemblyai_poller")
+
+# AssemblyAI transcript endpoint (EU data residency)
+ASSEMBLYAI_TRANSCRIPT_URL = "https://api.eu.assemblyai.com/v2/transcript"
+
+# AssemblyAI turnaround is typically a fraction of the audio duration
+EXPECTED_TURNAROUND_RATIO = 0.3
+
+
+@dataclass
+class _PendingTranscript:
+    """Book-keeping for a transcript tracked by the poller."""
+
+    transcript_id: str
+    api_key: str
+    future: asyncio.Future
+    expected_seconds: float
+    min_interval: float
+    webhook: bool
+    started_at: float
+    next_poll_at: float
+    last_status: Optional[str] = None
+    waiters: int = 0
+
+
+class AssemblyAIPoller:
+    """
+    Single background poller for all pending AssemblyAI transcripts.
+
+    Usage:
+        poller = get_assemblyai_poller()
+        result = await poller.wait(transcript_id, api_key, timeout=1000, audio_duration=120)
+    """
+
+    def __init__(
+        self,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+    ):
+        """
+        Initialize poller.
+
+        Args:
+            min_interval: Minimum seconds between polls of one transcript (defaults to config)
+            max_interval: Maximum seconds between polls of one transcript (defaults to config)
+        """
+        self.min_interval = min_interval or settings.ASSEMBLYAI_POLL_INTERVAL
+        self.max_interval = max_interval or settings.ASSEMBLYAI_POLL_MAX_INTERVAL
+
+        self._jobs: Dict[str, _PendingTranscript] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of transcripts currently tracked."""
+        return len(self._jobs)
+
+    def next_interval(
+        self,
+        elapsed: float,
+        expected_seconds: float,
+        min_interval: Optional[float] = None,
+        webhook: bool = False,
+    ) -> float:
+        """
+        Compute the delay before the next poll of a transcript.
+
+        Args:
+            elapsed: Seconds since the transcript was submitted
+            expected_seconds: Expected turnaround (0 if audio duration unknown)
+            min_interval: Per-job minimum interval (defaults to the poller's)
+            webhook: Whether a webhook will announce completion
+
+        Returns:
+            Seconds until the next poll
+        """
+        min_interval = min_interval or self.min_interval
+        max_interval = max(self.max_interval, min_interval)
+
+        if webhook:
+            # Webhook resolves jobs - polling is only a safety net
+            return max_interval
+
+        if elapsed < expected_seconds:
+            interval = (expected_seconds - elapsed) / 2
+        else:
+            interval = (elapsed - expected_seconds) * 0.1
+
+        return min(max(interval, min_interval), max_interval)
+
+    def _ensure_running(self) -> None:
+        """Start the background task (again) if it is not running on this loop."""
+        loop = asyncio.get_running_loop()
+
+        if self._loop is not loop:
+            # Futures from a previous loop cannot be awaited here
+            self._jobs = {}
+            self._wakeup = asyncio.Event()
+            self._task = None
+            self._loop = loop
+
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    def track(
+        self,
+        transcript_id: str,
+        api_key: str,
+        audio_duration: Optional[float] = None,
+        min_interval: Optional[float] = None,
+        webhook: bool = False,
+    ) -> asyncio.Future:
+        """
+        Start tracking a transcript.
+
+        Args:
+            transcript_id: AssemblyAI transcript id
+            api_key: AssemblyAI API key
+            audio_duration: Audio duration in seconds (used to pace polls)
+            min_interval: Minimum seconds between polls (defaults to the poller's)
+            webhook: Whether a webhook will announce completion
+
+        Returns:
+            Future resolved with the completed transcript payload
+        """
+        self._ensure_running()
+
+        pending = self._jobs.get(transcript_id)
+        if pending is None:
+            now = time.monotonic()
+            pending = _PendingTranscript(
+                transcript_id=transcript_id,
+                api_key=api_key,
+                future=self._loop.create_future(),
+                expected_seconds=(audio_duration or 0.0) * EXPECTED_TURNAROUND_RATIO,
+                min_interval=min_interval or self.min_interval,
+                webhook=webhook,
+                started_at=now,
+                next_poll_at=now,  # First poll right away
+            )
+            self._jobs[transcript_id] = pending
+            self._wakeup.set()
+
+        return pending.future
+
+    def untrack(self, transcript_id: str) -> None:
+        """Stop tracking a transcript (e.g. all its waiters gave up)."""
+        pending = self._jobs.pop(transcript_id, None)
+        if pending is not None and not pending.future.done():
+            pending.future.cancel()
+        if pending is not None:
+            # Let the background task re-plan (or exit when nothing is left)
+            self._wakeup.set()
+
+    def notify(self, transcript_id: str) -> bool:
+        """
+        Fetch a transcript immediately (called from the webhook route).
+
+        Args:
+            transcript_id: AssemblyAI transcript id
+
+        Returns:
+            True if the transcript is tracked by this process
+        """
+        pending = self._jobs.get(transcript_id)
+        if pending is None:
+            return False
+
+        pending.next_poll_at = time.monotonic()
+        self._wakeup.set()
+        return True
+
+    async def wait(
+        self,
+        transcript_id: str,
+        api_key: str,
+        timeout: float,
+        audio_duration: Optional[float] = None,
+        min_interval: Optional[float] = None,
+        webhook: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Wait for a transcript to complete.
+
+        Args:
+            transcript_id: AssemblyAI transcript id
+            api_key: AssemblyAI API key
+            timeout: Maximum seconds to wait
+            audio_duration: Audio duration in seconds (used to pace polls)
+            min_interval: Minimum seconds between polls (defaults to the poller's)
+            webhook: Whether a webhook will announce completion
+
+        Returns:
+            Completed transcript payload
+
+        Raises:
+            RuntimeError: If the transcription fails, polling fails or times out
+        """
+        future = self.track(transcript_id, api_key, audio_duration, min_interval, webhook)
+        pending = self._jobs[transcript_id]
+        pending.waiters += 1
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"AssemblyAI transcription timed out after {timeout}s")
+        finally:
+            # Other waiters of the same transcript share its future - keep polling for them
+            pending.waiters -= 1
+            if pending.waiters == 0 and self._jobs.get(transcript_id) is pending:
+                self.untrack(transcript_id)
+
+    async def _run(self) -> None:
+        """Background loop - exits once no transcripts are pending."""
+        while self._jobs:
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                await self._poll_until_idle(client)
+            # Transcripts tracked while the client was closing saw this task
+            # still running and did not start another - loop back for them
+
+    async def _poll_until_idle(self, client: httpx.AsyncClient) -> None:
+        """Poll due transcripts until none are pending."""
+        while self._jobs:
+            now = time.monotonic()
+            due = [job for job in self._jobs.values() if job.next_poll_at <= now]
+
+            if due:
+                await asyncio.gather(
+                    *(self._poll(client, job) for job in due),
+                    return_exceptions=True,
+                )
+
+            if not self._jobs:
+                break
+
+            sleep_for = max(
+                0.0,
+                min(job.next_poll_at for job in self._jobs.values()) - time.monotonic(),
+            )
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=sleep_for)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll(self, client: httpx.AsyncClient, job: _PendingTranscript) -> None:
+        """Fetch one transcript and resolve its future if it is finished."""
+        try:
+            response = await client.get(
+                f"{ASSEMBLYAI_TRANSCRIPT_URL}/{job.transcript_id}",
+                headers={"Authorization": job.api_key},
+            )
+
+            if response.status_code != 200:
+                self._finish(job, error=RuntimeError(
+                    f"AssemblyAI poll failed: {response.status_code} - {response.text}"
+                ))
+                return
+
+            data = response.json()
+
+        except Exception as e:
+            self._finish(job, error=e)
+            return
+
+        status = data["status"]
+        job.last_status = status
+
+        if status == "completed":
+            logger.info(f"Transcription completed: id={job.transcript_id}")
+            self._finish(job, result=data)
+        elif status == "error":
+            error_msg = data.get("error", "Unknown error")
+            self._finish(job, error=RuntimeError(f"AssemblyAI transcription failed: {error_msg}"))
+        else:
+            elapsed = time.monotonic() - job.started_at
+            job.next_poll_at = time.monotonic() + self.next_interval(
+                elapsed, job.expected_seconds, job.min_interval, job.webhook
+            )
+            logger.debug(
+                f"Transcription in progress: id={job.transcript_id}, "
+                f"status={status}, elapsed={elapsed:.1f}s"
+            )
+
+    def _finish(
+        self,
+        job: _PendingTranscript,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Stop tracking a transcript and wake its waiter."""
+        self._jobs.pop(job.transcript_id, None)
+
+        if job.future.done():
+            return
+
+        if error is not None:
+            job.future.set_exception(error)
+        else:
+            job.future.set_result(result)
+
+
+# Global poller instance
+_poller: Optional[AssemblyAIPoller] = None
+
+
+def get_assemblyai_poller() -> AssemblyAIPoller:
+    """
+    Get or create the global AssemblyAI poller.
+
+    Returns:
+        Shared AssemblyAIPoller instance
+    """
+    global _poller
+    if _poller is None:
+        _poller = AssemblyAIPoller()
+    return _poller
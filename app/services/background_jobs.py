@@ -0,0 +1,634 @@
+"""
+Cooperative cancellation of transcription and cleanup background jobs.
+
+Deleting a transcription, cleaned entry or voice entry used to leave its
+background job running: it kept calling RunPod or Groq, retried, and then
+failed on the missing row. Background jobs now run as tasks registered here,
+keyed by transcription or cleaned entry id (and the voice entry they belong
+to). Deleting a record, or POST .../cancel, cancels its jobs:
+
+- The job task is cancelled; asyncio propagates the cancellation into
+  awaited chunk fan-outs (gather) and provider calls, and a job still
+  waiting for a scheduler slot leaves the queue.
+- A RunPod job whose wait is cancelled this way is cancelled on RunPod via
+  its /cancel API (see run_runpod_job), instead of being left to finish for
+  a later resume.
+
+Jobs run in the worker that accepted the request, so cancellations are also
+sent to the other workers with a NOTIFY (payload
+"{schema}:{instance}:{scope}:{id}"); every worker LISTENs and cancels its
+own matching jobs.
+
+Graceful shutdown: jobs started with a JobResume have a row in
+job_checkpoints while they run (owned by this worker, refreshed by a
+heartbeat). On SIGTERM the worker stops accepting new jobs (503 on the
+routes starting them, /health reports draining), lets running jobs finish
+for up to SHUTDOWN_DRAIN_SECONDS and then interrupts the rest. Interrupted
+jobs release their checkpoint together with their progress (recorded with
+record_job_progress, e.g. the RunPod job ids of submitted and completed
+chunks, so a resume does not pay for them again). Every worker claims
+released checkpoints, and those of workers that died without draining, on
+startup and on each heartbeat, and resumes them through the task
+registered under the checkpoint's name. Records left pending or processing
+without a checkpoint are marked as failed on startup.
+"""
+
+import asyncio
+import contextvars
+import signal
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+
+from app.config import settings
+from app.database import DB_SCHEMA, get_session
+from app.services.database import db_service
+from app.services.pg_listener import PgListener
+from app.utils.logger import get_logger
+
+logger = get_logger("services.background_jobs")
+
+# Job kinds (also cancellation scopes)
+TRANSCRIPTION_JOB = "transcription"
+CLEANUP_JOB = "cleanup"
+NOTION_SYNC_JOB = "notion_sync"
+# Cancellation scope: every job of a voice entry
+VOICE_ENTRY_SCOPE = "voice_entry"
+
+# Error message of records whose job was cancelled (they are marked as failed)
+CANCELLED_MESSAGE = "Cancelled by user"
+
+# Error message of records left unfinished by a process that died without a checkpoint
+INTERRUPTED_MESSAGE = "Interrupted by a server restart, please retry"
+
+# Retry-After (seconds) of requests rejected while draining
+DRAIN_RETRY_AFTER_SECONDS = 30
+
+# Seconds interrupted jobs get to save their checkpoints after the drain deadline
+INTERRUPT_GRACE_SECONDS = 5.0
+
+# NOTIFY channel for cancellations
+BACKGROUND_JOBS_CHANNEL = "background_jobs_cancelled"
+
+# Identifies this process in notifications (its own are ignored)
+_INSTANCE_ID = uuid.uuid4().hex[:12]
+
+# Tasks resuming checkpointed jobs, by name; called with the checkpoint params
+ResumableTask = Callable[[Dict[str, Any]], Awaitable[Any]]
+_resumable_tasks: Dict[str, ResumableTask] = {}
+
+
+def register_resumable_task(name: str, task: ResumableTask) -> None:
+    """
+    Register the task that resumes checkpointed jobs of a JobResume.task name.
+
+    Args:
+        name: Task name stored in checkpoints
+        task: Coroutine function called with the checkpoint params
+    """
+    _resumable_tasks[name] = task
+
+
+@dataclass(frozen=True)
+class JobResume:
+    """How to resume a job after a shutdown: a resumable task and its arguments."""
+
+    task: str
+    user_id: UUID
+    # JSON-serializable arguments (identifiers and options, never text)
+    params: Dict[str, Any]
+
+
+@dataclass(eq=False)
+class _BackgroundJob:
+    """A running background job."""
+
+    kind: str
+    job_id: UUID
+    voice_entry_id: UUID
+    transcription_id: Optional[UUID]
+    resume: Optional[JobResume] = None
+    progress: Dict[str, Any] = field(default_factory=dict)
+    progress_saved: bool = True
+    task: Optional[asyncio.Task] = None
+    finished: asyncio.Event = field(default_factory=asyncio.Event)
+    cancel_requested: bool = False
+    interrupted: bool = False
+
+    def matches(self, scope: str, scope_id: UUID) -> bool:
+        """Whether a cancellation of scope_id in scope applies to this job."""
+        if scope == VOICE_ENTRY_SCOPE:
+            return self.voice_entry_id == scope_id
+        if scope == TRANSCRIPTION_JOB:
+            # Cleanups of a transcription go with it
+            return (
+                (self.kind == TRANSCRIPTION_JOB and self.job_id == scope_id)
+                or self.transcription_id == scope_id
+            )
+        return self.kind == scope and self.job_id == scope_id
+
+
+# Job of the current task (inherited by tasks it creates)
+_current_job: contextvars.ContextVar[Optional[_BackgroundJob]] = contextvars.ContextVar(
+    "background_job", default=None
+)
+
+
+def is_cancel_requested() -> bool:
+    """
+    Whether the background job running the current task was cancelled.
+
+    Lets code handling CancelledError tell a cancelled job (results will be
+    thrown away) from a shutdown or a hedge that lost.
+
+    Returns:
+        True if the current job's cancellation was requested
+    """
+    job = _current_job.get()
+    return job is not None and job.cancel_requested
+
+
+def get_job_progress(key: str) -> Optional[Any]:
+    """
+    Get progress saved by the current background job (or before it was interrupted).
+
+    Args:
+        key: Progress key
+
+    Returns:
+        Saved value or None
+    """
+    job = _current_job.get()
+    return None if job is None else job.progress.get(key)
+
+
+def record_job_progress(key: str, value: Optional[Any]) -> None:
+    """
+    Record progress of the current background job.
+
+    Saved to its checkpoint with the next heartbeat and when the job is
+    interrupted. A no-op outside background jobs.
+
+    Args:
+        key: Progress key
+        value: JSON-serializable value (None forgets the key)
+    """
+    job = _current_job.get()
+    if job is None:
+        return
+    if value is None:
+        job.progress.pop(key, None)
+    else:
+        job.progress[key] = value
+    job.progress_saved = False
+
+
+def ensure_accepting_jobs() -> None:
+    """
+    Dependency of routes that start background jobs: reject them while draining.
+
+    Raises:
+        HTTPException: 503 with Retry-After while the worker shuts down
+    """
+    if get_background_job_registry().draining:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is shutting down, please retry",
+            headers={"Retry-After": str(DRAIN_RETRY_AFTER_SECONDS)}
+        )
+
+
+class BackgroundJobRegistry:
+    """
+    Running transcription and cleanup jobs, cancellable by id.
+
+    Usage:
+        registry = get_background_job_registry()
+        registry.start_listener()                      # on startup (cross-worker cancels)
+        registry.start_heartbeat()                     # on startup (checkpoints, resume)
+        await registry.run(TRANSCRIPTION_JOB, transcription_id, work(), voice_entry_id=entry_id,
+                           resume=JobResume("transcription", user_id, params))
+        registry.cancel(VOICE_ENTRY_SCOPE, entry_id)   # e.g. after deleting the entry
+        await registry.drain(settings.SHUTDOWN_DRAIN_SECONDS)  # on shutdown
+    """
+
+    def __init__(self):
+        """Initialize registry."""
+        self._jobs: Dict[Tuple[str, UUID], _BackgroundJob] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listener = PgListener(BACKGROUND_JOBS_CHANNEL, self._on_notification)
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._drain_task: Optional[asyncio.Task] = None
+        self._draining = False
+        # Progress of claimed checkpoints, taken by run() when the job restarts
+        self._resumed_progress: Dict[UUID, Dict[str, Any]] = {}
+        # Keeps fire-and-forget tasks referenced until they finish
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _check_loop(self) -> None:
+        """Forget jobs and drain state bound to a previous event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._jobs = {}
+            self._resumed_progress = {}
+            self._drain_task = None
+            self._draining = False
+            self._loop = loop
+
+    @property
+    def draining(self) -> bool:
+        """Whether the worker is shutting down (new jobs are not started)."""
+        return self._draining
+
+    async def run(
+        self,
+        kind: str,
+        job_id: UUID,
+        work: Awaitable[None],
+        voice_entry_id: UUID,
+        transcription_id: Optional[UUID] = None,
+        resume: Optional[JobResume] = None,
+    ) -> bool:
+        """
+        Run a job as a cancellable task and wait for it.
+
+        With resume, the job is checkpointed while it runs. When the worker
+        is draining the job is not started: its checkpoint is released right
+        away so another worker runs it.
+
+        Args:
+            kind: TRANSCRIPTION_JOB, CLEANUP_JOB or NOTION_SYNC_JOB
+            job_id: Transcription, cleaned entry or Notion sync id
+            work: Coroutine doing the job
+            voice_entry_id: Voice entry the job belongs to
+            transcription_id: Transcription a cleanup job belongs to
+            resume: How to resume the job after a shutdown (None = not resumable)
+
+        Returns:
+            True if the job ran to the end, False if it was cancelled or
+            interrupted by the drain deadline
+
+        Raises:
+            asyncio.CancelledError: If the caller was cancelled (after the
+                                    checkpoint was released)
+            RuntimeError: If the checkpoint could not be created (the job is
+                          not started)
+        """
+        self._check_loop()
+        key = (kind, job_id)
+        if key in self._jobs:
+            logger.warning(f"Background job already running", kind=kind, job_id=str(job_id))
+
+        job = _BackgroundJob(
+            kind,
+            job_id,
+            voice_entry_id,
+            transcription_id,
+            resume=resume,
+            progress=self._resumed_progress.pop(job_id, {})
+        )
+
+        if not self._draining and not await self._save_checkpoint(job, owner=_INSTANCE_ID):
+            # A running job without a checkpoint looks orphaned to a worker
+            # that starts meanwhile (fail_orphaned_jobs) and would be failed
+            work.close()
+            raise RuntimeError(f"Failed to create checkpoint of background job {job_id}, not started")
+        if self._draining:
+            work.close()
+            logger.info(f"Shutting down, leaving background job for resume", kind=kind, job_id=str(job_id))
+            await self._save_checkpoint(job, owner=None)
+            return False
+
+        # The job is visible in the task's context and in tasks it creates
+        context = contextvars.copy_context()
+        context.run(_current_job.set, job)
+        job.task = self._loop.create_task(work, context=context)
+        self._jobs[key] = job
+
+        keep_checkpoint = False
+        try:
+            await job.task
+            return True
+        except asyncio.CancelledError:
+            if job.cancel_requested:
+                logger.info(f"Background job cancelled", kind=kind, job_id=str(job_id))
+                return False
+            # Shutdown: release the checkpoint with the progress made so far
+            keep_checkpoint = True
+            await self._save_checkpoint(job, owner=None)
+            if not job.interrupted:
+                raise
+            logger.info(f"Background job interrupted for resume", kind=kind, job_id=str(job_id))
+            return False
+        finally:
+            if self._jobs.get(key) is job:
+                del self._jobs[key]
+            if job.resume is not None and not keep_checkpoint:
+                await self._delete_checkpoint(job_id)
+            job.finished.set()
+
+    def spawn(self, work: Awaitable[Any]) -> asyncio.Task:
+        """
+        Run a coroutine (typically one calling run()) without waiting for it.
+
+        Args:
+            work: Coroutine to run
+
+        Returns:
+            The task, kept referenced until it finishes
+        """
+        self._check_loop()
+        task = self._loop.create_task(work)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def cancel(self, scope: str, scope_id: UUID) -> int:
+        """
+        Cancel matching jobs here and in the other workers.
+
+        Args:
+            scope: TRANSCRIPTION_JOB (with its cleanups), CLEANUP_JOB or VOICE_ENTRY_SCOPE
+            scope_id: Id of the transcription, cleaned entry or voice entry
+
+        Returns:
+            Number of jobs cancelled in this worker
+        """
+        cancelled = self._cancel_local(scope, scope_id)
+
+        self._listener.announce(f"{DB_SCHEMA}:{_INSTANCE_ID}:{scope}:{scope_id}")
+
+        return cancelled
+
+    def _cancel_local(self, scope: str, scope_id: UUID) -> int:
+        """Cancel matching jobs of this worker."""
+        if self._loop is not asyncio.get_running_loop():
+            return 0
+
+        cancelled = 0
+        for job in list(self._jobs.values()):
+            if job.matches(scope, scope_id) and not job.cancel_requested:
+                job.cancel_requested = True
+                job.task.cancel()
+                cancelled += 1
+                logger.info(
+                    f"Cancelling background job",
+                    kind=job.kind,
+                    job_id=str(job.job_id),
+                    scope=scope
+                )
+        return cancelled
+
+    def running(self) -> int:
+        """Number of running jobs."""
+        return len(self._jobs)
+
+    async def drain(self, timeout: float) -> None:
+        """
+        Stop starting jobs, wait for running ones and interrupt them at the deadline.
+
+        Interrupted jobs release their checkpoints for a resume elsewhere.
+        Safe to call more than once; later calls wait for the first drain.
+
+        Args:
+            timeout: Seconds running jobs get to finish
+        """
+        self._check_loop()
+        self._start_drain(timeout)
+        await asyncio.shield(self._drain_task)
+
+    def begin_drain(self) -> None:
+        """Start draining with the configured deadline, without waiting (on SIGTERM)."""
+        self._check_loop()
+        self._start_drain(settings.SHUTDOWN_DRAIN_SECONDS)
+
+    def _start_drain(self, timeout: float) -> None:
+        """Set the draining flag and start the drain task once."""
+        self._draining = True
+        if self._drain_task is None:
+            self._drain_task = self._loop.create_task(self._drain(timeout))
+
+    async def _drain(self, timeout: float) -> None:
+        """Wait for running jobs up to timeout, then interrupt the rest."""
+        jobs = list(self._jobs.values())
+        if not jobs:
+            return
+
+        logger.info(f"Draining background jobs", running=len(jobs), timeout_seconds=timeout)
+        await asyncio.wait([job.task for job in jobs], timeout=timeout)
+
+        remaining = [job for job in jobs if not job.task.done()]
+        for job in remaining:
+            job.interrupted = True
+            job.task.cancel()
+        if remaining:
+            logger.warning(f"Drain deadline reached, interrupting background jobs", count=len(remaining))
+
+        # Let the runners save or delete their checkpoints
+        waiters = [self._loop.create_task(job.finished.wait()) for job in jobs]
+        _, pending = await asyncio.wait(waiters, timeout=INTERRUPT_GRACE_SECONDS)
+        for waiter in pending:
+            waiter.cancel()
+
+        logger.info(f"Background jobs drained", interrupted=len(remaining))
+
+    def install_signal_handlers(self) -> None:
+        """
+        Start draining as soon as the server gets SIGTERM or SIGINT.
+
+        The server's own handler still runs (it stops accepting connections
+        and waits for in-flight requests, which include the jobs started by
+        them), so the drain deadline starts with the signal rather than with
+        the lifespan shutdown. Nothing is installed without a server handler
+        or outside the main thread.
+        """
+        loop = asyncio.get_running_loop()
+
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            previous = signal.getsignal(sig)
+            if not callable(previous) or previous is signal.default_int_handler:
+                continue
+
+            def handler(signum, frame, previous=previous):
+                loop.call_soon_threadsafe(self.begin_drain)
+                previous(signum, frame)
+
+            try:
+                signal.signal(sig, handler)
+            except ValueError:
+                return
+
+    async def _save_checkpoint(self, job: _BackgroundJob, owner: Optional[str]) -> bool:
+        """
+        Create or release the checkpoint of a resumable job (failures are logged).
+
+        Returns:
+            False if saving failed, True otherwise (also for jobs without resume)
+        """
+        if job.resume is None:
+            return True
+        try:
+            async with get_session() as session:
+                await db_service.save_job_checkpoint(
+                    session,
+                    job_id=job.job_id,
+                    kind=job.kind,
+                    user_id=job.resume.user_id,
+                    voice_entry_id=job.voice_entry_id,
+                    task=job.resume.task,
+                    params=jsonable_encoder(job.resume.params),
+                    progress=dict(job.progress),
+                    owner=owner
+                )
+                await session.commit()
+            job.progress_saved = True
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to save job checkpoint", job_id=str(job.job_id), error=str(e))
+            return False
+
+    @staticmethod
+    async def _delete_checkpoint(job_id: UUID) -> None:
+        """Delete the checkpoint of a finished job (failures are logged)."""
+        try:
+            async with get_session() as session:
+                await db_service.delete_job_checkpoint(session, job_id)
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"Failed to delete job checkpoint", job_id=str(job_id), error=str(e))
+
+    async def _flush_checkpoints(self) -> None:
+        """Refresh the heartbeat of this worker's checkpoints and save new progress."""
+        jobs = [job for job in self._jobs.values() if job.resume is not None]
+        if not jobs:
+            return
+
+        async with get_session() as session:
+            await db_service.touch_job_checkpoints(session, _INSTANCE_ID)
+            for job in jobs:
+                if not job.progress_saved:
+                    job.progress_saved = True
+                    await db_service.update_job_checkpoint_progress(session, job.job_id, dict(job.progress))
+            await session.commit()
+
+    async def resume_jobs(self, fail_orphans: bool = False) -> int:
+        """
+        Claim released and stale checkpoints and resume their jobs.
+
+        Args:
+            fail_orphans: Also mark records left pending/processing without a
+                          checkpoint as failed (on startup)
+
+        Returns:
+            Number of jobs resumed
+        """
+        self._check_loop()
+        if self._draining:
+            return 0
+
+        stale_before = datetime.utcnow() - timedelta(seconds=settings.JOB_STALE_SECONDS)
+        async with get_session() as session:
+            checkpoints = await db_service.claim_job_checkpoints(session, _INSTANCE_ID, stale_before)
+            failed = 0
+            if fail_orphans:
+                failed = await db_service.fail_orphaned_jobs(session, stale_before, INTERRUPTED_MESSAGE)
+            await session.commit()
+
+        if failed:
+            logger.warning(f"Marked unfinished records without a checkpoint as failed", count=failed)
+
+        for checkpoint in checkpoints:
+            self.spawn(self._resume(
+                checkpoint.job_id, checkpoint.task, checkpoint.params, checkpoint.progress or {}
+            ))
+        return len(checkpoints)
+
+    async def _resume(self, job_id: UUID, task_name: str, params: Dict[str, Any], progress: Dict[str, Any]) -> None:
+        """Run the resumable task of a claimed checkpoint."""
+        task = _resumable_tasks.get(task_name)
+        if task is None:
+            logger.error(f"No resumable task registered, dropping job", task=task_name, job_id=str(job_id))
+            await self._delete_checkpoint(job_id)
+            return
+
+        logger.info(f"Resuming background job", task=task_name, job_id=str(job_id), saved_progress=len(progress))
+        self._resumed_progress[job_id] = progress
+        try:
+            await task(params)
+        except Exception as e:
+            logger.error(f"Resumed background job failed", task=task_name, job_id=str(job_id), error=str(e), exc_info=True)
+        finally:
+            # Progress not taken: the task did not restart the job (e.g. its record is gone)
+            if self._resumed_progress.pop(job_id, None) is not None:
+                await self._delete_checkpoint(job_id)
+
+    def start_heartbeat(self) -> None:
+        """Start the checkpoint heartbeat and resume sweep (idempotent)."""
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._check_loop()
+            self._heartbeat_task = self._loop.create_task(self._heartbeat())
+
+    async def stop_heartbeat(self) -> None:
+        """Stop the heartbeat (used on shutdown and in tests)."""
+        if self._heartbeat_task is not None and not self._heartbeat_task.done():
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+        self._heartbeat_task = None
+
+    async def _heartbeat(self) -> None:
+        """Resume jobs left by previous processes, then keep checkpoints fresh."""
+        fail_orphans = True
+        while True:
+            try:
+                await self._flush_checkpoints()
+                await self.resume_jobs(fail_orphans=fail_orphans)
+                fail_orphans = False
+            except Exception as e:
+                logger.warning(f"Background job heartbeat failed: {str(e)}")
+
+            await asyncio.sleep(settings.JOB_HEARTBEAT_SECONDS)
+
+    def _on_notification(self, connection, pid, channel: str, payload: str) -> None:
+        """Apply a cancellation sent by another worker."""
+        try:
+            schema, instance, scope, scope_id = payload.split(":", 3)
+            scope_id = UUID(scope_id)
+        except ValueError:
+            logger.warning(f"Invalid background job notification", payload=payload)
+            return
+        if schema != DB_SCHEMA or instance == _INSTANCE_ID:
+            return
+        self._cancel_local(scope, scope_id)
+
+    def start_listener(self) -> None:
+        """Start listening for other workers' cancellations (idempotent)."""
+        self._listener.start()
+
+    async def stop_listener(self) -> None:
+        """Stop the listener (used on shutdown and in tests)."""
+        await self._listener.stop()
+
+
+# Global registry instance
+_background_job_registry: Optional[BackgroundJobRegistry] = None
+
+
+def get_background_job_registry() -> BackgroundJobRegistry:
+    """
+    Get or create the global background job registry.
+
+    Returns:
+        Shared BackgroundJobRegistry instance
+    """
+    global _background_job_registry
+    if _background_job_registry is None:
+        _background_job_registry = BackgroundJobRegistry()
+    return _background_job_registry
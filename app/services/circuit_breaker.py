@@ -0,0 +1,455 @@
+"""
+Circuit breakers for provider endpoints.
+
+During a RunPod or Groq outage every job would otherwise go through its full
+retry loop (with exponential sleeps) before failing, holding coroutines and
+database sessions for minutes. A breaker per provider endpoint keeps the
+outcomes and latencies of recent calls in a rolling window. When too many of
+them fail (or are too slow) the circuit opens and calls fail fast with
+CircuitOpenError. After CIRCUIT_BREAKER_OPEN_SECONDS a probe call is let
+through (half-open): success closes the circuit, failure opens it again.
+
+Only provider-side failures count: timeouts, connection errors and 5xx.
+Client errors (4xx) and rate limiting (429) mean the provider is up.
+
+Shared state: when a circuit opens or closes, the worker sends a NOTIFY
+(payload "{schema}:{instance}:{state}:{seconds}:{name}"). Every worker
+LISTENs and applies the transition to its own breaker of the same name, so
+an outage detected by one worker stops retries in all of them.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterator, Optional
+
+import httpx
+
+from app.config import settings
+from app.database import DB_SCHEMA
+from app.services.pg_listener import PgListener
+from app.utils.logger import get_logger
+
+logger = get_logger("services.circuit_breaker")
+
+# Circuit states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# NOTIFY channel for circuit transitions
+CIRCUIT_BREAKERS_CHANNEL = "circuit_breakers_changed"
+
+# Identifies this process in notifications (its own are ignored)
+_INSTANCE_ID = uuid.uuid4().hex[:12]
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider whose circuit is open."""
+
+    def __init__(self, name: str, retry_after: float):
+        """
+        Initialize error.
+
+        Args:
+            name: Circuit name (provider endpoint)
+            retry_after: Seconds until the next probe call is allowed
+        """
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(
+            f"{name} is temporarily unavailable (circuit open), "
+            f"retry in {max(1, round(retry_after))}s"
+        )
+
+
+def is_provider_failure(error: BaseException) -> bool:
+    """
+    Whether an error means the provider is unhealthy.
+
+    Args:
+        error: Exception raised by a provider call
+
+    Returns:
+        False for client errors and rate limiting (HTTP 4xx), True otherwise
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+    else:
+        # Groq SDK errors carry status_code
+        status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code >= 500
+    return True
+
+
+@dataclass
+class _CallRecord:
+    """Outcome of one call in the rolling window."""
+
+    at: float  # time.monotonic() when the call finished
+    failed: bool
+    seconds: float
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker with rolling failure-rate and latency windows.
+
+    Usage:
+        breaker = get_circuit_breaker("clarin-slovene-asr-pyannote")
+        with breaker.guard():          # raises CircuitOpenError while open
+            result = await call_provider()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window_seconds: Optional[float] = None,
+        min_calls: Optional[int] = None,
+        failure_rate_threshold: Optional[float] = None,
+        slow_call_seconds: Optional[float] = None,
+        slow_call_rate_threshold: Optional[float] = None,
+        open_seconds: Optional[float] = None,
+        half_open_max_calls: Optional[int] = None,
+    ):
+        """
+        Initialize breaker (None arguments default to config).
+
+        Args:
+            name: Circuit name (provider endpoint, e.g. service model name)
+            window_seconds: Age of calls kept in the rolling window
+            min_calls: Calls in the window before the circuit may open
+            failure_rate_threshold: Share of failed calls that opens the circuit
+            slow_call_seconds: Calls slower than this count as slow (0 = ignore latency)
+            slow_call_rate_threshold: Share of slow calls that opens the circuit
+            open_seconds: Seconds the circuit stays open before a probe
+            half_open_max_calls: Concurrent probe calls while half-open
+        """
+        self.name = name
+        self.window_seconds = _default(window_seconds, settings.CIRCUIT_BREAKER_WINDOW_SECONDS)
+        self.min_calls = _default(min_calls, settings.CIRCUIT_BREAKER_MIN_CALLS)
+        self.failure_rate_threshold = _default(
+            failure_rate_threshold, settings.CIRCUIT_BREAKER_FAILURE_RATE
+        )
+        self.slow_call_seconds = _default(slow_call_seconds, settings.CIRCUIT_BREAKER_SLOW_CALL_SECONDS)
+        self.slow_call_rate_threshold = _default(
+            slow_call_rate_threshold, settings.CIRCUIT_BREAKER_SLOW_CALL_RATE
+        )
+        self.open_seconds = _default(open_seconds, settings.CIRCUIT_BREAKER_OPEN_SECONDS)
+        self.half_open_max_calls = _default(
+            half_open_max_calls, settings.CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS
+        )
+
+        # Called with (breaker, state, open_seconds) on local open/close transitions
+        self.on_state_change: Optional[Callable[["CircuitBreaker", str, float], None]] = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        """Forget all state (new event loop)."""
+        self._state = CLOSED
+        self._calls: Deque[_CallRecord] = deque()
+        self._open_until = 0.0
+        self._probes = 0
+        self.times_opened = 0
+        self.rejected_calls = 0
+
+    def _check_loop(self) -> None:
+        """Reset state recorded under a previous event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._reset()
+            self._loop = loop
+
+    @property
+    def state(self) -> str:
+        """Current state (an open circuit turns half-open when its open period ends)."""
+        if self._state == OPEN and time.monotonic() >= self._open_until:
+            self._state = HALF_OPEN
+            self._probes = 0
+            logger.info(f"Circuit half-open, allowing probe", circuit=self.name)
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit lets a probe call through."""
+        return max(0.0, self._open_until - time.monotonic())
+
+    def before_call(self) -> None:
+        """
+        Check whether a call may be made.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or half-open with all probe slots taken)
+        """
+        self._check_loop()
+        if not settings.CIRCUIT_BREAKER_ENABLED:
+            return
+
+        state = self.state
+        if state == CLOSED:
+            return
+        if state == HALF_OPEN and self._probes < self.half_open_max_calls:
+            self._probes += 1
+            return
+
+        self.rejected_calls += 1
+        raise CircuitOpenError(self.name, self.retry_after())
+
+    def record_success(self, seconds: float) -> None:
+        """
+        Record a call the provider answered.
+
+        Args:
+            seconds: Call duration
+        """
+        self._record(False, seconds)
+
+    def record_failure(self, seconds: float) -> None:
+        """
+        Record a call that failed on the provider side.
+
+        Args:
+            seconds: Call duration
+        """
+        self._record(True, seconds)
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        Run one provider call under the breaker.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (the call is not made)
+        """
+        self.before_call()
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            if is_provider_failure(e):
+                self.record_failure(time.monotonic() - started)
+            else:
+                self.record_success(time.monotonic() - started)
+            raise
+        except BaseException:
+            # Cancelled: outcome unknown, only free the probe slot
+            self._probes = max(0, self._probes - 1)
+            raise
+        else:
+            self.record_success(time.monotonic() - started)
+
+    def apply_remote(self, state: str, open_seconds: float) -> None:
+        """
+        Apply a transition announced by another worker.
+
+        Args:
+            state: OPEN or CLOSED
+            open_seconds: Remaining open period (for OPEN)
+        """
+        self._check_loop()
+        if state == OPEN:
+            if self._state == OPEN:
+                self._open_until = max(self._open_until, time.monotonic() + open_seconds)
+            else:
+                self._open(open_seconds, notify=False)
+        elif state == CLOSED and self._state != CLOSED:
+            self._close(notify=False)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get state and window statistics.
+
+        Returns:
+            Dict with state, calls, failure_rate, p95_latency_seconds,
+            retry_after_seconds, times_opened and rejected_calls
+        """
+        self._evict(time.monotonic())
+        calls = list(self._calls)
+        latencies = sorted(call.seconds for call in calls)
+        state = self.state
+
+        return {
+            "state": state,
+            "calls": len(calls),
+            "failure_rate": (
+                sum(call.failed for call in calls) / len(calls) if calls else None
+            ),
+            "p95_latency_seconds": (
+                latencies[max(0, int(round(0.95 * len(latencies))) - 1)] if latencies else None
+            ),
+            "retry_after_seconds": self.retry_after() if state == OPEN else None,
+            "times_opened": self.times_opened,
+            "rejected_calls": self.rejected_calls,
+        }
+
+    def _record(self, failed: bool, seconds: float) -> None:
+        """Add a call outcome and open or close the circuit if needed."""
+        now = time.monotonic()
+        state = self.state
+
+        if state == HALF_OPEN:
+            self._probes = max(0, self._probes - 1)
+            if failed or self._is_slow(seconds):
+                self._open(self.open_seconds)
+            else:
+                self._close()
+            return
+
+        if state == OPEN:
+            # Call started before the circuit opened
+            return
+
+        self._calls.append(_CallRecord(now, failed, seconds))
+        self._evict(now)
+        if self._should_open():
+            self._open(self.open_seconds)
+
+    def _is_slow(self, seconds: float) -> bool:
+        """Whether a call counts as slow."""
+        return self.slow_call_seconds > 0 and seconds >= self.slow_call_seconds
+
+    def _evict(self, now: float) -> None:
+        """Drop calls older than the window."""
+        while self._calls and now - self._calls[0].at > self.window_seconds:
+            self._calls.popleft()
+
+    def _should_open(self) -> bool:
+        """Whether the window's failure or slow-call rate exceeds its threshold."""
+        calls = len(self._calls)
+        if calls < self.min_calls:
+            return False
+        failures = sum(1 for call in self._calls if call.failed)
+        if failures / calls >= self.failure_rate_threshold:
+            return True
+        if self.slow_call_seconds > 0:
+            slow = sum(1 for call in self._calls if self._is_slow(call.seconds))
+            return slow / calls >= self.slow_call_rate_threshold
+        return False
+
+    def _open(self, open_seconds: float, notify: bool = True) -> None:
+        """Open the circuit for open_seconds."""
+        self._state = OPEN
+        self._open_until = time.monotonic() + open_seconds
+        self._calls.clear()
+        self._probes = 0
+        self.times_opened += 1
+        logger.warning(f"Circuit opened", circuit=self.name, open_seconds=open_seconds)
+        if notify and self.on_state_change is not None:
+            self.on_state_change(self, OPEN, open_seconds)
+
+    def _close(self, notify: bool = True) -> None:
+        """Close the circuit with an empty window."""
+        self._state = CLOSED
+        self._calls.clear()
+        self._probes = 0
+        logger.info(f"Circuit closed", circuit=self.name)
+        if notify and self.on_state_change is not None:
+            self.on_state_change(self, CLOSED, 0.0)
+
+
+def _default(value, default):
+    """Value, or the config default if None."""
+    return value if value is not None else default
+
+
+class CircuitBreakerRegistry:
+    """
+    Breakers by name, with cross-worker state via Postgres LISTEN/NOTIFY.
+
+    Usage:
+        registry = get_circuit_breaker_registry()
+        registry.start_listener()     # on startup (share transitions)
+        breaker = registry.get("groq-llm")
+        registry.snapshot()           # for /health
+    """
+
+    def __init__(self):
+        """Initialize registry."""
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._listener = PgListener(CIRCUIT_BREAKERS_CHANNEL, self._on_notification)
+
+    def get(self, name: str) -> CircuitBreaker:
+        """
+        Get or create the breaker of a provider endpoint.
+
+        Args:
+            name: Circuit name
+
+        Returns:
+            Shared CircuitBreaker instance
+        """
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name)
+            breaker.on_state_change = self._on_state_change
+            self._breakers[name] = breaker
+        return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get state and statistics of all breakers.
+
+        Returns:
+            Dict of circuit name to CircuitBreaker.snapshot()
+        """
+        return {name: breaker.snapshot() for name, breaker in sorted(self._breakers.items())}
+
+    def _on_state_change(self, breaker: CircuitBreaker, state: str, open_seconds: float) -> None:
+        """Announce a local transition to the other workers."""
+        self._listener.announce(f"{DB_SCHEMA}:{_INSTANCE_ID}:{state}:{open_seconds:.1f}:{breaker.name}")
+
+    def _on_notification(self, connection, pid, channel: str, payload: str) -> None:
+        """Apply a transition announced by another worker."""
+        try:
+            schema, instance, state, open_seconds, name = payload.split(":", 4)
+            open_seconds = float(open_seconds)
+        except ValueError:
+            logger.warning(f"Invalid circuit breaker notification", payload=payload)
+            return
+        if schema != DB_SCHEMA or instance == _INSTANCE_ID:
+            return
+        logger.info(f"Circuit state received from another worker", circuit=name, state=state)
+        self.get(name).apply_remote(state, open_seconds)
+
+    def start_listener(self) -> None:
+        """Start listening for other workers' transitions (idempotent)."""
+        self._listener.start()
+
+    async def stop_listener(self) -> None:
+        """Stop the listener (used on shutdown and in tests)."""
+        await self._listener.stop()
+
+
+# Global registry instance
+_circuit_breaker_registry: Optional[CircuitBreakerRegistry] = None
+
+
+def get_circuit_breaker_registry() -> CircuitBreakerRegistry:
+    """
+    Get or create the global circuit breaker registry.
+
+    Returns:
+        Shared CircuitBreakerRegistry instance
+    """
+    global _circuit_breaker_registry
+    if _circuit_breaker_registry is None:
+        _circuit_breaker_registry = CircuitBreakerRegistry()
+    return _circuit_breaker_registry
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """
+    Get or create the shared breaker of a provider endpoint.
+
+    Args:
+        name: Circuit name (e.g. "groq-transcription", a RunPod service model name)
+
+    Returns:
+        Shared CircuitBreaker instance
+    """
+    return get_circuit_breaker_registry().get(name)
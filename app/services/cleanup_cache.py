@@ -0,0 +1,107 @@
+"""
+Cache of deterministic LLM cleanup outputs.
+
+Re-running a cleanup with the same inputs (comparing providers, retrying
+from the UI, re-cleaning an unchanged transcription) is common. At
+temperature 0 the output only depends on the inputs, so it is looked up by a
+key over:
+- the transcription plaintext
+- the prompt template (id and version, or the built-in prompt text)
+- provider and model
+- temperature and top_p
+
+The key is an HMAC (keyed with the server's encryption key) so the stored
+key cannot be used to confirm guesses of the transcription text. Outputs are
+stored per voice entry, encrypted under its DEK (see CleanupCacheEntry).
+"""
+
+import hashlib
+import hmac
+from typing import Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.services.llm_cleanup_base import DREAM_CLEANUP_PROMPT, GENERIC_CLEANUP_PROMPT
+from app.services.prompt_template_cache import get_prompt_template_cache
+
+# Bump to invalidate all cached outputs (e.g. when response processing changes)
+CACHE_KEY_VERSION = "v1"
+
+
+def is_deterministic_cleanup(provider: str, temperature: Optional[float]) -> bool:
+    """
+    Check whether a cleanup is deterministic and may use the cache.
+
+    Args:
+        provider: Effective LLM provider name
+        temperature: Requested temperature (None = provider default)
+
+    Returns:
+        True if cleanup runs at temperature 0
+    """
+    if temperature is None:
+        # GaMS applies its configured default; Groq falls back to the API default (1.0)
+        if provider != "runpod_llm_gams":
+            return False
+        temperature = settings.RUNPOD_LLM_GAMS_DEFAULT_TEMPERATURE
+    return temperature == 0
+
+
+async def get_prompt_identity(db: AsyncSession, entry_type: str) -> Tuple[str, Optional[int]]:
+    """
+    Identify the prompt a cleanup of entry_type will use.
+
+    Mirrors the services' prompt lookup: the active valid template from the
+    database, otherwise the built-in prompt.
+
+    Args:
+        db: Database session (used on a prompt template cache miss)
+        entry_type: Entry type (dream, journal, etc.)
+
+    Returns:
+        Tuple of ("template:{id}:{version}" or "builtin:{prompt hash}", template_id or None)
+    """
+    template = await get_prompt_template_cache().get_active(entry_type, db)
+    if template is not None and template.is_valid:
+        return (f"template:{template.id}:{template.version}", template.id)
+
+    prompt = DREAM_CLEANUP_PROMPT if entry_type == "dream" else GENERIC_CLEANUP_PROMPT
+    return (f"builtin:{hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:16]}", None)
+
+
+def compute_cleanup_cache_key(
+    transcription_text: str,
+    prompt_identity: str,
+    provider: str,
+    model_name: str,
+    temperature: Optional[float],
+    top_p: Optional[float],
+) -> str:
+    """
+    Compute the cache key for a cleanup.
+
+    Args:
+        transcription_text: Transcription plaintext
+        prompt_identity: From get_prompt_identity
+        provider: Effective LLM provider name
+        model_name: Model name in {provider}-{model} format
+        temperature: Requested temperature
+        top_p: Requested top_p
+
+    Returns:
+        Hex HMAC-SHA256 (64 characters)
+    """
+    params = "\x1f".join([
+        CACHE_KEY_VERSION,
+        prompt_identity,
+        provider,
+        model_name,
+        repr(temperature),
+        repr(top_p),
+    ])
+    mac = hmac.new(settings.api_encryption_key.encode("utf-8"), digestmod=hashlib.sha256)
+    mac.update(params.encode("utf-8"))
+    mac.update(b"\x1e")
+    mac.update(transcription_text.encode("utf-8"))
+    return mac.hexdigest()
@@ -3,19 +3,25 @@ Database service for CRUD operations on voice entries and transcriptions.
 """
 from uuid import UUID
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 
 from app.models.user import User
 from app.models.voice_entry import VoiceEntry
 from app.models.transcription import Transcription
+from app.models.transcription_segment_page import TranscriptionSegmentPage
 from app.models.cleaned_entry import CleanedEntry, CleanupStatus
+from app.models.cleanup_cache import CleanupCacheEntry
+from app.models.idempotency_key import IdempotencyKey
+from app.models.job_checkpoint import JobCheckpoint
 from app.models.prompt_template import PromptTemplate
 from app.models.notion_sync import NotionSync, SyncStatus
 from app.models.user_preference import UserPreference
+from app.services.prompt_template_cache import get_prompt_template_cache
 from app.schemas.auth import UserCreate
 from app.schemas.voice_entry import VoiceEntryCreate
 from app.schemas.transcription import TranscriptionCreate
@@ -648,7 +654,12 @@ class DatabaseService:
         error_message: Optional[str] = None,
         beam_size: Optional[int] = None,
         segments: Optional[bytes] = None,
-        diarization_applied: bool = False
+        diarization_applied: bool = False,
+        model_used: Optional[str] = None,
+        hedge_model_used: Optional[str] = None,
+        hedge_extra_audio_seconds: Optional[float] = None,
+        spelling_issues: Optional[bytes] = None,
+        spelling_dictionary_version: Optional[str] = None
     ) -> Optional[Transcription]:
         """
         Update transcription status and related fields.
@@ -662,6 +673,11 @@ class DatabaseService:
             beam_size: Optional beam size used for transcription
             segments: Optional encrypted segments JSON (bytes)
             diarization_applied: Whether speaker diarization was applied
+            model_used: Model that produced the result, if it differs from the requested one (hedging)
+            hedge_model_used: Model of the hedge request, if one was sent
+            hedge_extra_audio_seconds: Audio seconds billed for the hedge request
+            spelling_issues: Optional encrypted spelling issues of the text (bytes)
+            spelling_dictionary_version: Dictionary version spelling_issues were computed with
 
         Returns:
             Updated Transcription instance
@@ -689,6 +705,14 @@ class DatabaseService:
                 # Save encrypted segments if diarization was applied
                 if segments is not None:
                     transcription.segments = segments
+                if model_used is not None:
+                    transcription.model_used = model_used
+                if hedge_model_used is not None:
+                    transcription.hedge_model_used = hedge_model_used
+                    transcription.hedge_extra_audio_seconds = hedge_extra_audio_seconds
+                if spelling_issues is not None:
+                    transcription.spelling_issues = spelling_issues
+                    transcription.spelling_dictionary_version = spelling_dictionary_version
                 # Note: enable_diarization and speaker_count are set at creation time
                 # diarization_applied is determined at read time from segments presence
                 # beam_size and temperature are also set at creation time and are immutable
@@ -786,6 +810,146 @@ class DatabaseService:
                 detail="Failed to set primary transcription"
             )
 
+    # ===== Transcription Segment Page Methods =====
+
+    async def replace_segment_pages(
+        self,
+        db: AsyncSession,
+        transcription_id: UUID,
+        pages: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Replace the segment pages of a transcription.
+
+        Args:
+            db: Database session
+            transcription_id: Transcription UUID
+            pages: Column values of each page (page_index, first_position,
+                segment_count, start_time, end_time, has_speaker, segments)
+
+        Raises:
+            HTTPException: If database operation fails
+        """
+        try:
+            await db.execute(
+                delete(TranscriptionSegmentPage).where(
+                    TranscriptionSegmentPage.transcription_id == transcription_id
+                )
+            )
+            if pages:
+                await db.execute(
+                    pg_insert(TranscriptionSegmentPage).values(
+                        [{"transcription_id": transcription_id, **page} for page in pages]
+                    )
+                )
+
+            logger.debug(
+                f"Transcription segment pages stored",
+                transcription_id=str(transcription_id),
+                page_count=len(pages)
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Failed to store transcription segment pages",
+                transcription_id=str(transcription_id),
+                error=str(e),
+                exc_info=True
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to store transcription segments"
+            )
+
+    async def get_segment_page_index(
+        self,
+        db: AsyncSession,
+        transcription_id: UUID
+    ) -> List[Any]:
+        """
+        Get the index of a transcription's segment pages (without the encrypted segments).
+
+        Args:
+            db: Database session
+            transcription_id: Transcription UUID
+
+        Returns:
+            Rows with page_index, first_position, segment_count, start_time,
+            end_time and has_speaker, ordered by page_index
+
+        Raises:
+            HTTPException: If database operation fails
+        """
+        try:
+            result = await db.execute(
+                select(
+                    TranscriptionSegmentPage.page_index,
+                    TranscriptionSegmentPage.first_position,
+                    TranscriptionSegmentPage.segment_count,
+                    TranscriptionSegmentPage.start_time,
+                    TranscriptionSegmentPage.end_time,
+                    TranscriptionSegmentPage.has_speaker,
+                )
+                .where(TranscriptionSegmentPage.transcription_id == transcription_id)
+                .order_by(TranscriptionSegmentPage.page_index)
+            )
+            return list(result.all())
+
+        except Exception as e:
+            logger.error(
+                f"Failed to get transcription segment page index",
+                transcription_id=str(transcription_id),
+                error=str(e),
+                exc_info=True
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to retrieve transcription segments"
+            )
+
+    async def get_segment_pages(
+        self,
+        db: AsyncSession,
+        transcription_id: UUID,
+        page_indexes: List[int]
+    ) -> List[TranscriptionSegmentPage]:
+        """
+        Get segment pages of a transcription.
+
+        Args:
+            db: Database session
+            transcription_id: Transcription UUID
+            page_indexes: Indexes of the pages to get
+
+        Returns:
+            List of TranscriptionSegmentPage instances, ordered by page_index
+
+        Raises:
+            HTTPException: If database operation fails
+        """
+        try:
+            result = await db.execute(
+                select(TranscriptionSegmentPage)
+                .where(
+                    TranscriptionSegmentPage.transcription_id == transcription_id,
+                    TranscriptionSegmentPage.page_index.in_(page_indexes)
+                )
+                .order_by(TranscriptionSegmentPage.page_index)
+            )
+            return list(result.scalars().all())
+
+        except Exception as e:
+            logger.error(
+                f"Failed to get transcription segment pages",
+                transcription_id=str(transcription_id),
+                error=str(e),
+                exc_info=True
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to retrieve transcription segments"
+            )
+
     # ===== Cleaned Entry / Cleanup Methods =====
 
     async def get_primary_cleanup_for_voice_entry(
@@ -1114,6 +1278,7 @@ class DatabaseService:
         user_id: UUID,
         preferred_transcription_language: Optional[str] = None,
         preferred_llm_model: Optional[str] = None,
+        transcription_hedging: Optional[bool] = None,
     ) -> UserPreference:
         """
         Update user preferences.
@@ -1123,6 +1288,7 @@ class DatabaseService:
             user_id: User's UUID
             preferred_transcription_language: Language code for transcription
             preferred_llm_model: Preferred LLM model in format 'provider-model'
+            transcription_hedging: Whether to hedge slow transcriptions
 
         Returns:
             Updated UserPreference instance
@@ -1139,6 +1305,8 @@ class DatabaseService:
                 preferences.preferred_transcription_language = preferred_transcription_language
             if preferred_llm_model is not None:
                 preferences.preferred_llm_model = preferred_llm_model
+            if transcription_hedging is not None:
+                preferences.transcription_hedging = transcription_hedging
 
             # Update timestamp
             preferences.updated_at = datetime.now(timezone.utc)
@@ -1151,6 +1319,7 @@ class DatabaseService:
                 user_id=str(user_id),
                 language=preferred_transcription_language,
                 preferred_llm_model=preferred_llm_model,
+                transcription_hedging=transcription_hedging,
             )
 
             return preferences
@@ -1346,7 +1515,10 @@ class DatabaseService:
         prompt_template_id: Optional[int] = None,
         llm_raw_response: Optional[str] = None,
         temperature: Optional[float] = None,
-        top_p: Optional[float] = None
+        top_p: Optional[float] = None,
+        cache_hit: Optional[bool] = None,
+        spelling_issues: Optional[bytes] = None,
+        spelling_dictionary_version: Optional[str] = None
     ) -> CleanedEntry:
         """
         Update cleaned entry with processing results.
@@ -1361,6 +1533,9 @@ class DatabaseService:
             llm_raw_response: Raw LLM response before parsing (optional)
             temperature: Temperature used for LLM (optional)
             top_p: Top-p value used for LLM (optional)
+            cache_hit: Whether the cleaned text came from the cleanup cache (optional)
+            spelling_issues: Encrypted spelling issues of the cleaned text (optional)
+            spelling_dictionary_version: Dictionary version spelling_issues were computed with (optional)
 
         Returns:
             Updated CleanedEntry instance
@@ -1387,6 +1562,11 @@ class DatabaseService:
                 cleaned_entry.prompt_template_id = prompt_template_id
             if llm_raw_response is not None:
                 cleaned_entry.llm_raw_response = llm_raw_response
+            if cache_hit is not None:
+                cleaned_entry.cache_hit = cache_hit
+            if spelling_issues is not None:
+                cleaned_entry.spelling_issues = spelling_issues
+                cleaned_entry.spelling_dictionary_version = spelling_dictionary_version
             # temperature and top_p are set at creation time and are immutable
 
             # Update timestamps based on status (use timezone-naive datetime)
@@ -1420,6 +1600,581 @@ class DatabaseService:
                 detail="Failed to update cleaned entry"
             )
 
+    async def get_cleanup_cache_entry(
+        self,
+        db: AsyncSession,
+        voice_entry_id: UUID,
+        cache_key: str
+    ) -> Optional[CleanupCacheEntry]:
+        """
+        Look up a cached cleanup output for a voice entry.
+
+        Args:
+            db: Database session
+            voice_entry_id: Voice entry UUID (cache entries are per-DEK)
+            cache_key: Key from compute_cleanup_cache_key
+
+        Returns:
+            CleanupCacheEntry if found, None otherwise
+        """
+        try:
+            result = await db.execute(
+                select(CleanupCacheEntry).where(
+                    CleanupCacheEntry.voice_entry_id == voice_entry_id,
+                    CleanupCacheEntry.cache_key == cache_key
+                )
+            )
+            return result.scalar_one_or_none()
+
+        except Exception as e:
+            logger.error(
+                f"Failed to get cleanup cache entry",
+                voice_entry_id=str(voice_entry_id),
+                error=str(e),
+                exc_info=True
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to retrieve cleanup cache entry"
+            )
+
+    async def store_cleanup_cache_entry(
+        self,
+        db: AsyncSession,
+        voice_entry_id: UUID,
+        cache_key: str,
+        cleaned_text: bytes,
+        prompt_template_id: Optional[int] = None
+    ) -> None:
+        """
+        Store a cleanup output in the cache (no-op if the key already exists).
+
+        Args:
+            db: Database session
+            voice_entry_id: Voice entry UUID
+            cache_key: Key from compute_cleanup_cache_key
+            cleaned_text: Cleaned text encrypted under the voice entry's DEK
+            prompt_template_id: ID of prompt template used (optional)
+
+        Raises:
+            HTTPException: If database operation fails
+        """
+        try:
+            # Concurrent identical cleanups produce the same output - keep the first
+            await db.execute(
+                pg_insert(CleanupCacheEntry)
+                .values(
+                    voice_entry_id=voice_entry_id,
+                    cache_key=cache_key,
+                    cleaned_text=cleaned_text,
+                    prompt_template_id=prompt_template_id
+                )
+                .on_conflict_do_nothing(constraint="uq_cleanup_cache_entry_key")
+            )
+
+            logger.debug(
+                f"Cleanup output cached",
+                voice_entry_id=str(voice_entry_id)
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Failed to store cleanup cache entry",
+                voice_entry_id=str(voice_entry_id),
+                error=str(e),
+                exc_info=True
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to store cleanup cache entry"
+            )
+
+    async def reserve_idempotency_key(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        endpoint: str,
+        key: str,
+        request_fingerprint: str,
+        expires_at: datetime
+    ) -> bool:
+        """
+        Claim an idempotency key for an in-progress request.
+
+        Expired keys of the user are deleted first, so an expired key can be
+        claimed again.
+
+        Args:
+            db: Database session
+            user_id: User UUID
+            endpoint: Endpoint name
+            key: Idempotency-Key header value
+            request_fingerprint: Hex SHA-256 of the request
+            expires_at: When the in-progress claim lapses (naive UTC)
+
+        Returns:
+            True if the key was claimed, False if it is already in use
+
+        Raises:
+            HTTPException: If database operation fails
+        """
+        try:
+            await db.execute(
+                delete(IdempotencyKey).where(
+                    IdempotencyKey.user_id == user_id,
+                    IdempotencyKey.expires_at <= datetime.utcnow()
+                )
+            )
+            result = await db.execute(
+                pg_insert(IdempotencyKey)
+                .values(
+                    user_id=user_id,
+                    endpoint=endpoint,
+                    key=key,
+                    request_fingerprint=request_fingerprint,
+                    expires_at=expires_at
+                )
+                .on_conflict_do_nothing(constraint="uq_idempotency_key_user_endpoint_key")
+                .returning(IdempotencyKey.id)
+            )
+            return result.scalar_one_or_none() is not None
+
+        except Exception as e:
+            logger.error(
+                f"Failed to reserve idempotency key",
+                user_id=str(user_id),
+                endpoint=endpoint,
+                error=str(e),
+                exc_info=True
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to reserve idempotency key"
+            )
+
+    async def get_idempotency_key(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        endpoint: str,
+        key: str
+    ) -> Optional[IdempotencyKey]:
+        """
+        Look up an idempotency key of a user.
+
+        Args:
+            db: Database session
+            user_id: User UUID
+            endpoint: Endpoint name
+            key: Idempotency-Key header value
+
+        Returns:
+            IdempotencyKey if found, None otherwise
+        """
+        try:
+            result = await db.execute(
+                select(IdempotencyKey).where(
+                    IdempotencyKey.user_id == user_id,
+                    IdempotencyKey.endpoint == endpoint,
+                    IdempotencyKey.key == key
+                )
+            )
+            return result.scalar_one_or_none()
+
+        except Exception as e:
+            logger.error(
+                f"Failed to get idempotency key",
+                user_id=str(user_id),
+                endpoint=endpoint,
+                error=str(e),
+                exc_info=True
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to retrieve idempotency key"
+            )
+
+    async def complete_idempotency_key(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        endpoint: str,
+        key: str,
+        status_code: int,
+        response_body: dict,
+        expires_at: datetime
+    ) -> None:
+        """
+        Store the response of a request holding an idempotency key.
+
+        Args:
+            db: Database session
+            user_id: User UUID
+            endpoint: Endpoint name
+            key: Idempotency-Key header value
+            status_code: Response status code
+            response_body: JSON-serializable response body
+            expires_at: Until when the response is replayed (naive UTC)
+
+        Raises:
+            HTTPException: If database operation fails
+        """
+        try:
+            await db.execute(
+                update(IdempotencyKey)
+                .where(
+                    IdempotencyKey.user_id == user_id,
+                    IdempotencyKey.endpoint == endpoint,
+                    IdempotencyKey.key == key
+                )
+                .values(
+                    status_code=status_code,
+                    response_body=response_body,
+                    expires_at=expires_at
+                )
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Failed to complete idempotency key",
+                user_id=str(user_id),
+                endpoint=endpoint,
+                error=str(e),
+                exc_info=True
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to store idempotent response"
+            )
+
+    async def delete_idempotency_key(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        endpoint: str,
+        key: str
+    ) -> None:
+        """
+        Release an idempotency key (its request failed and may be retried).
+
+        Args:
+            db: Database session
+            user_id: User UUID
+            endpoint: Endpoint name
+            key: Idempotency-Key header value
+
+        Raises:
+            HTTPException: If database operation fails
+        """
+        try:
+            await db.execute(
+                delete(IdempotencyKey).where(
+                    IdempotencyKey.user_id == user_id,
+                    IdempotencyKey.endpoint == endpoint,
+                    IdempotencyKey.key == key
+                )
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Failed to delete idempotency key",
+                user_id=str(user_id),
+                endpoint=endpoint,
+                error=str(e),
+                exc_info=True
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to delete idempotency key"
+            )
+
+    async def save_job_checkpoint(
+        self,
+        db: AsyncSession,
+        job_id: UUID,
+        kind: str,
+        user_id: UUID,
+        voice_entry_id: UUID,
+        task: str,
+        params: Dict[str, Any],
+        progress: Dict[str, Any],
+        owner: Optional[str]
+    ) -> None:
+        """
+        Create or replace the checkpoint of a background job.
+
+        Args:
+            db: Database session
+            job_id: Transcription, cleaned entry or Notion sync id
+            kind: Job kind
+            user_id: User UUID
+            voice_entry_id: Voice entry the job belongs to
+            task: Name of the resumable task running the job
+            params: Task arguments (JSON-serializable)
+            progress: Saved progress
+            owner: Worker running the job (None = waiting for resume)
+
+        Raises:
+            HTTPException: If database operation fails
+        """
+        try:
+            values = dict(
+                kind=kind,
+                user_id=user_id,
+                voice_entry_id=voice_entry_id,
+                task=task,
+                params=params,
+                progress=progress,
+                owner=owner,
+                heartbeat_at=datetime.utcnow()
+            )
+            await db.execute(
+                pg_insert(JobCheckpoint)
+                .values(job_id=job_id, **values)
+                .on_conflict_do_update(index_elements=[JobCheckpoint.job_id], set_=values)
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Failed to save job checkpoint",
+                job_id=str(job_id),
+                error=str(e),
+                exc_info=True
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to save job checkpoint"
+            )
+
+    async def update_job_checkpoint_progress(
+        self,
+        db: AsyncSession,
+        job_id: UUID,
+        progress: Dict[str, Any]
+    ) -> None:
+        """
+        Save the progress of a running job.
+
+        Args:
+            db: Database session
+            job_id: Job id
+            progress: Saved progress
+
+        Raises:
+            HTTPException: If database operation fails
+        """
+        try:
+            await db.execute(
+                update(JobCheckpoint)
+                .where(JobCheckpoint.job_id == job_id)
+                .values(progress=progress)
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Failed to update job checkpoint progress",
+                job_id=str(job_id),
+                error=str(e),
+                exc_info=True
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to update job checkpoint progress"
+            )
+
+    async def touch_job_checkpoints(self, db: AsyncSession, owner: str) -> None:
+        """
+        Refresh the heartbeat of all checkpoints owned by a worker.
+
+        Args:
+            db: Database session
+            owner: Worker id
+
+        Raises:
+            HTTPException: If database operation fails
+        """
+        try:
+            await db.execute(
+                update(JobCheckpoint)
+                .where(JobCheckpoint.owner == owner)
+                .values(heartbeat_at=datetime.utcnow())
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Failed to refresh job checkpoints",
+                owner=owner,
+                error=str(e),
+                exc_info=True
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to refresh job checkpoints"
+            )
+
+    async def delete_job_checkpoint(self, db: AsyncSession, job_id: UUID) -> None:
+        """
+        Delete the checkpoint of a finished job.
+
+        Args:
+            db: Database session
+            job_id: Job id
+
+        Raises:
+            HTTPException: If database operation fails
+        """
+        try:
+            await db.execute(
+                delete(JobCheckpoint).where(JobCheckpoint.job_id == job_id)
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Failed to delete job checkpoint",
+                job_id=str(job_id),
+                error=str(e),
+                exc_info=True
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to delete job checkpoint"
+            )
+
+    async def claim_job_checkpoints(
+        self,
+        db: AsyncSession,
+        owner: str,
+        stale_before: datetime,
+        limit: int = 100
+    ) -> List[JobCheckpoint]:
+        """
+        Claim checkpoints waiting for resume or whose owner stopped heartbeating.
+
+        Rows locked by a concurrent claim are skipped, so each job is
+        resumed by one worker.
+
+        Args:
+            db: Database session
+            owner: Worker claiming the jobs
+            stale_before: Heartbeats older than this (naive UTC) mark a dead owner
+            limit: Max checkpoints to claim
+
+        Returns:
+            Claimed checkpoints
+
+        Raises:
+            HTTPException: If database operation fails
+        """
+        try:
+            claimable = (
+                select(JobCheckpoint.job_id)
+                .where(
+                    (JobCheckpoint.owner.is_(None))
+                    | (JobCheckpoint.heartbeat_at < stale_before)
+                )
+                .order_by(JobCheckpoint.created_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            result = await db.execute(
+                update(JobCheckpoint)
+                .where(JobCheckpoint.job_id.in_(claimable.scalar_subquery()))
+                .values(owner=owner, heartbeat_at=datetime.utcnow())
+                .returning(JobCheckpoint)
+            )
+            return list(result.scalars().all())
+
+        except Exception as e:
+            logger.error(
+                f"Failed to claim job checkpoints",
+                owner=owner,
+                error=str(e),
+                exc_info=True
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to claim job checkpoints"
+            )
+
+    async def fail_orphaned_jobs(
+        self,
+        db: AsyncSession,
+        created_before: datetime,
+        error_message: str
+    ) -> int:
+        """
+        Mark pending/processing records without a job checkpoint as failed.
+
+        These were left behind by a process that died before checkpoints
+        existed (or before the job was registered) and will never finish.
+        Running jobs always have one: a job whose checkpoint cannot be
+        created is not started (BackgroundJobRegistry.run).
+        A pending cleanup whose transcription still has a checkpoint is
+        kept: it runs once the transcription is resumed.
+
+        Args:
+            db: Database session
+            created_before: Only records created before this (naive UTC) are considered
+            error_message: Error message stored on the records
+
+        Returns:
+            Number of records marked as failed
+
+        Raises:
+            HTTPException: If database operation fails
+        """
+        def has_checkpoint(job_id_column):
+            return select(JobCheckpoint.job_id).where(JobCheckpoint.job_id == job_id_column).exists()
+
+        # Compare each created_at with a value of its own column type:
+        # transcriptions and notion_syncs use timestamptz (aware), while
+        # cleaned_entries.created_at is a naive UTC timestamp. A naive value
+        # against timestamptz would be read in the session time zone.
+        created_before_naive = created_before.replace(tzinfo=None)
+        created_before_aware = created_before.replace(tzinfo=timezone.utc)
+
+        try:
+            transcriptions = await db.execute(
+                update(Transcription)
+                .where(
+                    Transcription.status.in_(("pending", "processing")),
+                    Transcription.created_at < created_before_aware,
+                    ~has_checkpoint(Transcription.id)
+                )
+                .values(status="failed", error_message=error_message)
+            )
+            cleanups = await db.execute(
+                update(CleanedEntry)
+                .where(
+                    CleanedEntry.status.in_((CleanupStatus.PENDING, CleanupStatus.PROCESSING)),
+                    CleanedEntry.created_at < created_before_naive,
+                    ~has_checkpoint(CleanedEntry.id),
+                    ~has_checkpoint(CleanedEntry.transcription_id)
+                )
+                .values(status=CleanupStatus.FAILED, error_message=error_message)
+            )
+            syncs = await db.execute(
+                update(NotionSync)
+                .where(
+                    NotionSync.status.in_((SyncStatus.PENDING, SyncStatus.PROCESSING)),
+                    NotionSync.created_at < created_before_aware,
+                    ~has_checkpoint(NotionSync.id)
+                )
+                .values(status=SyncStatus.FAILED, error_message=error_message)
+            )
+            return transcriptions.rowcount + cleanups.rowcount + syncs.rowcount
+
+        except Exception as e:
+            logger.error(
+                f"Failed to mark orphaned jobs as failed",
+                error=str(e),
+                exc_info=True
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to mark orphaned jobs as failed"
+            )
+
     async def get_latest_cleaned_entry(
         self,
         db: AsyncSession,
@@ -1532,6 +2287,8 @@ class DatabaseService:
         """
         Store encrypted user-edited text for a cleaned entry.
 
+        Spelling issues stored for the previous text are cleared.
+
         Args:
             db: Database session
             cleaned_entry_id: UUID of the cleaned entry
@@ -1552,6 +2309,8 @@ class DatabaseService:
 
             cleaned_entry.user_edited_text = encrypted_user_edited_text
             cleaned_entry.user_edited_at = datetime.now(timezone.utc)
+            cleaned_entry.spelling_issues = None
+            cleaned_entry.spelling_dictionary_version = None
 
             await db.flush()
             await db.refresh(cleaned_entry)
@@ -1587,6 +2346,8 @@ class DatabaseService:
         """
         Clear user-edited text (revert to AI-generated cleanup).
 
+        Spelling issues stored for the edit are cleared.
+
         Args:
             db: Database session
             cleaned_entry_id: UUID of the cleaned entry
@@ -1606,6 +2367,8 @@ class DatabaseService:
 
             cleaned_entry.user_edited_text = None
             cleaned_entry.user_edited_at = None
+            cleaned_entry.spelling_issues = None
+            cleaned_entry.spelling_dictionary_version = None
 
             await db.flush()
             await db.refresh(cleaned_entry)
@@ -2055,6 +2818,9 @@ class DatabaseService:
             await db.flush()
             await db.refresh(template)
 
+            # Other workers are notified by the prompt_templates trigger on commit
+            get_prompt_template_cache().invalidate(template.entry_type)
+
             logger.info(
                 f"Prompt template activated",
                 template_id=template_id,
@@ -0,0 +1,226 @@
+"""
+Request coalescing for the GaMS RunPod endpoint.
+
+The GaMS handler accepts {"batch": [{"prompt", "id"}, ...]} and generates all
+prompts in one vLLM call (continuous batching), which costs far less GPU time
+than the same prompts sent one by one and shares a single cold start.
+
+GamsBatchCoalescer collects cleanup prompts that arrive within a short window
+(or until a maximum batch size) and sends them as one batch request. Prompts
+are grouped by endpoint and sampling parameters, since the handler applies
+one set of sampling parameters to the whole batch. Results are routed back to
+each waiter by item id.
+
+A group that ends up with a single prompt is sent in the handler's single
+prompt mode, so the wire format is unchanged when there is no concurrency.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger("services.gams_batcher")
+
+# Sends one handler input ({"prompt": ...} or {"batch": [...]}) and returns its output
+SendFn = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+# (endpoint_id, api_key, temperature, top_p, max_tokens)
+BatchKey = Tuple[Any, ...]
+
+
+@dataclass
+class _PendingPrompt:
+    """A prompt waiting to be sent."""
+
+    prompt: str
+    future: asyncio.Future
+
+
+@dataclass
+class _PendingGroup:
+    """Prompts sharing one batch key."""
+
+    send: SendFn
+    params: Dict[str, Any]
+    prompts: List[_PendingPrompt] = field(default_factory=list)
+    flush_handle: Optional[asyncio.TimerHandle] = None
+
+
+class GamsBatchCoalescer:
+    """
+    Micro-batching coalescer for GaMS cleanup prompts.
+
+    Usage:
+        batcher = get_gams_batcher()
+        output = await batcher.submit(
+            key=(endpoint_id, api_key, temperature, top_p, max_tokens),
+            prompt=prompt,
+            params={"temperature": 0.3, "top_p": 0.9, "max_tokens": 2048},
+            send=send_input,
+        )
+        # output: {"text": str, "token_count": {...}, ...}
+    """
+
+    def __init__(
+        self,
+        window: Optional[float] = None,
+        max_batch_size: Optional[int] = None,
+    ):
+        """
+        Initialize coalescer.
+
+        Args:
+            window: Seconds to wait for more prompts after the first one (defaults to config)
+            max_batch_size: Flush as soon as a group has this many prompts (defaults to config)
+        """
+        self.window = window if window is not None else settings.RUNPOD_LLM_GAMS_BATCH_WINDOW
+        self.max_batch_size = (
+            max_batch_size if max_batch_size is not None else settings.RUNPOD_LLM_GAMS_MAX_BATCH_SIZE
+        )
+
+        if self.window < 0:
+            raise ValueError("window must be >= 0")
+        if self.max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+
+        self._groups: Dict[BatchKey, _PendingGroup] = {}
+        self._tasks: set = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of prompts waiting to be sent."""
+        return sum(len(group.prompts) for group in self._groups.values())
+
+    async def submit(
+        self,
+        key: BatchKey,
+        prompt: str,
+        params: Dict[str, Any],
+        send: SendFn,
+    ) -> Dict[str, Any]:
+        """
+        Queue a prompt and wait for its output.
+
+        Args:
+            key: Batch key - only prompts with equal keys share a batch
+            prompt: Formatted prompt
+            params: Sampling parameters sent with the batch (temperature, top_p, max_tokens)
+            send: Coroutine that sends a handler input and returns its output
+
+        Returns:
+            Handler output for this prompt ({"text": ..., "token_count": ...}),
+            or {"error": str} if the handler failed or returned no result for it
+
+        Raises:
+            Exception: Whatever the send call raised
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Futures and timers from a previous loop cannot be used here
+            self._groups = {}
+            self._tasks = set()
+            self._loop = loop
+
+        group = self._groups.get(key)
+        if group is None:
+            group = _PendingGroup(send=send, params=params)
+            self._groups[key] = group
+            group.flush_handle = loop.call_later(self.window, self._flush, key)
+
+        future = loop.create_future()
+        group.prompts.append(_PendingPrompt(prompt=prompt, future=future))
+
+        if len(group.prompts) >= self.max_batch_size:
+            self._flush(key)
+
+        return await future
+
+    def _flush(self, key: BatchKey) -> None:
+        """Take a group out of the queue and send it in the background."""
+        group = self._groups.pop(key, None)
+        if group is None:
+            return
+
+        if group.flush_handle is not None:
+            group.flush_handle.cancel()
+
+        # Waiters that gave up (cancelled) are not sent
+        prompts = [p for p in group.prompts if not p.future.done()]
+        if not prompts:
+            return
+
+        task = self._loop.create_task(self._send(group, prompts))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, group: _PendingGroup, prompts: List[_PendingPrompt]) -> None:
+        """Send one group and resolve its waiters."""
+        if len(prompts) == 1:
+            input_data = {"prompt": prompts[0].prompt, **group.params}
+        else:
+            input_data = {
+                "batch": [{"prompt": p.prompt, "id": str(i)} for i, p in enumerate(prompts)],
+                **group.params,
+            }
+
+        logger.debug(f"Sending GaMS request", batch_size=len(prompts))
+
+        try:
+            output = await group.send(input_data)
+        except BaseException as e:
+            for p in prompts:
+                if not p.future.done():
+                    p.future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        if len(prompts) == 1:
+            self._resolve(prompts[0], output)
+            return
+
+        if "error" in output:
+            for p in prompts:
+                self._resolve(p, {"error": output["error"]})
+            return
+
+        results = {str(item.get("id")): item for item in output.get("results", [])}
+        logger.info(
+            f"GaMS batch completed",
+            batch_size=len(prompts),
+            processing_time=output.get("processing_time"),
+        )
+
+        for i, p in enumerate(prompts):
+            item = results.get(str(i))
+            if item is None:
+                self._resolve(p, {"error": f"No result for batch item {i}"})
+            else:
+                self._resolve(p, {**item, "processing_time": output.get("processing_time")})
+
+    @staticmethod
+    def _resolve(pending: _PendingPrompt, output: Dict[str, Any]) -> None:
+        """Wake one waiter (unless it already gave up)."""
+        if not pending.future.done():
+            pending.future.set_result(output)
+
+
+# Global coalescer instance
+_batcher: Optional[GamsBatchCoalescer] = None
+
+
+def get_gams_batcher() -> GamsBatchCoalescer:
+    """
+    Get or create the global GaMS batch coalescer.
+
+    Returns:
+        Shared GamsBatchCoalescer instance
+    """
+    global _batcher
+    if _batcher is None:
+        _batcher = GamsBatchCoalescer()
+    return _batcher
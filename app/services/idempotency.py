@@ -0,0 +1,249 @@
+"""
+Idempotency-Key support for requests that create records and start jobs.
+
+Mobile clients on flaky networks retry uploads and transcription/cleanup
+triggers whose response they never received. Without a key every retry
+creates a new voice entry or transcription and starts another paid GPU/LLM
+job. A request sent with an Idempotency-Key header claims the key in the
+idempotency_keys table before doing any work and stores its response when
+done; a retry with the same key gets the stored response (with the
+original status code) without preprocessing, encryption or provider calls.
+
+- Keys are scoped per user and endpoint.
+- A key reused for a different request (other parameters or file) is
+  rejected with 422.
+- A retry arriving while the original request is still running gets 409.
+- A failed request releases its key so the client can retry.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from fastapi import HTTPException, UploadFile, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.services.database import db_service
+from app.utils.logger import get_logger
+
+logger = get_logger("services.idempotency")
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+# Set on replayed responses
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+# Chunk size for hashing uploaded files
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+async def compute_request_fingerprint(
+    endpoint: str,
+    params: Dict[str, Any],
+    upload: Optional[UploadFile] = None
+) -> str:
+    """
+    Hash everything that identifies a request.
+
+    Args:
+        endpoint: Endpoint name
+        params: Request parameters (path, form and body values)
+        upload: Uploaded file, hashed by content (rewound afterwards)
+
+    Returns:
+        Hex SHA-256 of the request
+    """
+    digest = hashlib.sha256()
+    digest.update(endpoint.encode("utf-8"))
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+
+    if upload is not None:
+        while chunk := await upload.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+        await upload.seek(0)
+
+    return digest.hexdigest()
+
+
+class IdempotentRequest:
+    """
+    Idempotency-Key handling of one request (a no-op without a key).
+
+    Usage:
+        idempotency = IdempotentRequest(idempotency_key, current_user.id, "upload-and-transcribe")
+        replay = await idempotency.begin(db, params, upload=file)
+        if replay is not None:
+            return replay
+        try:
+            response = ...  # create records, queue jobs
+            await idempotency.complete(db, status.HTTP_202_ACCEPTED, response)
+            return response
+        except Exception:
+            await idempotency.release(db)
+            raise
+    """
+
+    def __init__(self, key: Optional[str], user_id: UUID, endpoint: str):
+        """
+        Initialize request.
+
+        Args:
+            key: Idempotency-Key header value (None = header not sent)
+            user_id: User making the request
+            endpoint: Endpoint name (keys are scoped per endpoint)
+        """
+        self.key = key
+        self.user_id = user_id
+        self.endpoint = endpoint
+        self._claimed = False
+
+    async def begin(
+        self,
+        db: AsyncSession,
+        params: Dict[str, Any],
+        upload: Optional[UploadFile] = None
+    ) -> Optional[JSONResponse]:
+        """
+        Claim the key, or get the response stored for it.
+
+        Must be called before the request does any work. The claim is
+        committed right away so concurrent retries see it.
+
+        Args:
+            db: Database session
+            params: Request parameters for the fingerprint
+            upload: Uploaded file for the fingerprint
+
+        Returns:
+            Stored response to return instead of handling the request, or
+            None if the request should be handled
+
+        Raises:
+            HTTPException: 400 for an invalid key, 409 if the original request
+                           is still in progress, 422 if the key was used for a
+                           different request
+        """
+        if self.key is None:
+            return None
+
+        if not self.key or len(self.key) > MAX_KEY_LENGTH:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{IDEMPOTENCY_KEY_HEADER} must be 1-{MAX_KEY_LENGTH} characters"
+            )
+
+        fingerprint = await compute_request_fingerprint(self.endpoint, params, upload)
+
+        claimed = await db_service.reserve_idempotency_key(
+            db,
+            user_id=self.user_id,
+            endpoint=self.endpoint,
+            key=self.key,
+            request_fingerprint=fingerprint,
+            expires_at=datetime.utcnow() + timedelta(seconds=settings.IDEMPOTENCY_KEY_LOCK_SECONDS)
+        )
+        await db.commit()
+
+        if claimed:
+            self._claimed = True
+            return None
+
+        record = await db_service.get_idempotency_key(db, self.user_id, self.endpoint, self.key)
+
+        if record is not None and record.request_fingerprint != fingerprint:
+            logger.warning(
+                f"Idempotency key reused for a different request",
+                user_id=str(self.user_id),
+                endpoint=self.endpoint
+            )
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"{IDEMPOTENCY_KEY_HEADER} was already used for a different request"
+            )
+
+        # Missing record: the original request failed and released the key just now
+        if record is None or record.status_code is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"A request with this {IDEMPOTENCY_KEY_HEADER} is still being processed"
+            )
+
+        logger.info(
+            f"Replaying idempotent response",
+            user_id=str(self.user_id),
+            endpoint=self.endpoint,
+            status_code=record.status_code
+        )
+
+        return JSONResponse(
+            status_code=record.status_code,
+            content=record.response_body,
+            headers={IDEMPOTENT_REPLAYED_HEADER: "true"}
+        )
+
+    async def complete(self, db: AsyncSession, status_code: int, response: BaseModel) -> None:
+        """
+        Store the response for retries.
+
+        Failures are logged, not raised: the request itself succeeded, and
+        the unfinished claim lapses after IDEMPOTENCY_KEY_LOCK_SECONDS.
+
+        Args:
+            db: Database session
+            status_code: Response status code
+            response: Response model returned to the client
+        """
+        if not self._claimed:
+            return
+
+        try:
+            await db_service.complete_idempotency_key(
+                db,
+                user_id=self.user_id,
+                endpoint=self.endpoint,
+                key=self.key,
+                status_code=status_code,
+                response_body=jsonable_encoder(response),
+                expires_at=datetime.utcnow() + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL_SECONDS)
+            )
+            await db.commit()
+            self._claimed = False
+        except Exception as e:
+            logger.warning(
+                f"Failed to store idempotent response",
+                user_id=str(self.user_id),
+                endpoint=self.endpoint,
+                error=str(e)
+            )
+
+    async def release(self, db: AsyncSession) -> None:
+        """
+        Release the key after the request failed, so it can be retried.
+
+        Uncommitted changes of the failed request are rolled back. Failures
+        are logged, not raised, to keep the original error.
+
+        Args:
+            db: Database session
+        """
+        if not self._claimed:
+            return
+
+        try:
+            await db.rollback()
+            await db_service.delete_idempotency_key(db, self.user_id, self.endpoint, self.key)
+            await db.commit()
+            self._claimed = False
+        except Exception as e:
+            logger.warning(
+                f"Failed to release idempotency key",
+                user_id=str(self.user_id),
+                endpoint=self.endpoint,
+                error=str(e)
+            )
@@ -0,0 +1,363 @@
+"""
+Fair per-user scheduling of transcription and cleanup jobs.
+
+Background jobs used to start as soon as they were queued, so a user who
+bulk-uploads 50 long recordings monopolized the RunPod chunk fan-out and the
+LLM while everyone else's 2-minute memo waited behind them. Jobs now take a
+slot from this scheduler before they start:
+
+- At most SCHEDULER_MAX_CONCURRENT_JOBS jobs run at once, and at most
+  SCHEDULER_MAX_JOBS_PER_USER of them belong to one user.
+- Short jobs (audio up to SCHEDULER_INTERACTIVE_MAX_SECONDS) go to the
+  interactive lane, which is always served before the bulk lane.
+- Within a lane, users are served by deficit round-robin weighted by audio
+  duration: every round a user is credited SCHEDULER_QUANTUM_SECONDS and
+  may start jobs worth that much audio, so users share throughput in audio
+  seconds rather than in job counts.
+
+Queue wait times are recorded per lane and reported in /health.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Optional
+from uuid import UUID
+
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger("services.job_scheduler")
+
+# Lanes in priority order
+INTERACTIVE_LANE = "interactive"
+BULK_LANE = "bulk"
+
+# Rough speaking rate, to weigh cleanup jobs (which only have text) in audio seconds
+SPOKEN_CHARS_PER_SECOND = 15.0
+
+# Queue wait times kept per lane for percentiles
+WAIT_WINDOW = 500
+
+
+def cleanup_cost_seconds(transcription_text: str) -> float:
+    """
+    Estimate the audio duration behind a transcription text.
+
+    Args:
+        transcription_text: Text to be cleaned
+
+    Returns:
+        Estimated audio seconds (scheduling cost of the cleanup)
+    """
+    return len(transcription_text) / SPOKEN_CHARS_PER_SECOND
+
+
+@dataclass(eq=False)
+class _Job:
+    """A job waiting for (or holding) a slot."""
+
+    user: str
+    cost: float
+    lane: str
+    kind: str
+    enqueued_at: float
+    granted: asyncio.Future = field(repr=False)
+
+
+class _Lane:
+    """Per-user queues of one lane, served by deficit round-robin."""
+
+    def __init__(self, name: str, quantum: float):
+        """
+        Initialize lane.
+
+        Args:
+            name: Lane name
+            quantum: Audio seconds credited to a user per round
+        """
+        self.name = name
+        self.quantum = quantum
+        self.queues: Dict[str, Deque[_Job]] = {}
+        self.deficits: Dict[str, float] = {}
+        # Users with queued jobs in round-robin order; the first is being served
+        self.order: Deque[str] = deque()
+        self.waits: Deque[float] = deque(maxlen=WAIT_WINDOW)
+        self.dispatched = 0
+
+    def add(self, job: _Job) -> None:
+        """Queue a job at the end of its user's queue."""
+        queue = self.queues.get(job.user)
+        if queue is None:
+            queue = self.queues[job.user] = deque()
+            # A user arriving at an empty lane is served right away: credit its turn
+            self.deficits[job.user] = 0.0 if self.order else self.quantum
+            self.order.append(job.user)
+        queue.append(job)
+
+    def remove(self, job: _Job) -> None:
+        """Drop a queued job (its waiter was cancelled)."""
+        queue = self.queues.get(job.user)
+        if queue is not None and job in queue:
+            queue.remove(job)
+            if not queue:
+                self._drop_user(job.user)
+
+    def queued(self) -> int:
+        """Number of queued jobs."""
+        return sum(len(queue) for queue in self.queues.values())
+
+    def next_job(self, eligible: Callable[[str], bool]) -> Optional[_Job]:
+        """
+        Take the next job by deficit round-robin.
+
+        The user being served keeps starting jobs while their deficit covers
+        the next job's cost; then the next user in order is credited a
+        quantum. Users at their concurrency cap are skipped without credit.
+
+        Args:
+            eligible: Whether a user may start another job
+
+        Returns:
+            Next job, None if no eligible user has queued jobs
+        """
+        if not any(eligible(user) for user in self.order):
+            return None
+
+        while True:
+            user = self.order[0]
+            if eligible(user):
+                queue = self.queues[user]
+                if queue[0].cost <= self.deficits[user]:
+                    job = queue.popleft()
+                    self.deficits[user] -= job.cost
+                    if not queue:
+                        self._drop_user(user)
+                    return job
+
+            self.order.rotate(-1)
+            if eligible(self.order[0]):
+                self.deficits[self.order[0]] += self.quantum
+
+    def _drop_user(self, user: str) -> None:
+        """Forget a user whose queue is empty (unused credit is not kept)."""
+        del self.queues[user]
+        del self.deficits[user]
+        self.order.remove(user)
+
+
+class FairJobScheduler:
+    """
+    Concurrency slots for background jobs, shared fairly between users.
+
+    Usage:
+        scheduler = get_job_scheduler()
+        async with scheduler.slot(user_id, cost_seconds=entry.duration_seconds, kind="transcription"):
+            await run_transcription(...)
+    """
+
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        max_per_user: Optional[int] = None,
+        interactive_max_seconds: Optional[float] = None,
+        quantum_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize scheduler (None arguments default to config).
+
+        Args:
+            max_concurrent: Max jobs running at once
+            max_per_user: Max jobs of one user running at once
+            interactive_max_seconds: Max audio seconds of an interactive-lane job
+            quantum_seconds: Audio seconds credited to a user per round
+        """
+        self.max_concurrent = (
+            max_concurrent if max_concurrent is not None else settings.SCHEDULER_MAX_CONCURRENT_JOBS
+        )
+        self.max_per_user = (
+            max_per_user if max_per_user is not None else settings.SCHEDULER_MAX_JOBS_PER_USER
+        )
+        self.interactive_max_seconds = (
+            interactive_max_seconds if interactive_max_seconds is not None
+            else settings.SCHEDULER_INTERACTIVE_MAX_SECONDS
+        )
+        self.quantum_seconds = (
+            quantum_seconds if quantum_seconds is not None else settings.SCHEDULER_QUANTUM_SECONDS
+        )
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        """Forget queues and slots (new event loop)."""
+        self._lanes = {
+            INTERACTIVE_LANE: _Lane(INTERACTIVE_LANE, self.quantum_seconds),
+            BULK_LANE: _Lane(BULK_LANE, self.quantum_seconds),
+        }
+        self._running = 0
+        self._running_per_user: Dict[str, int] = {}
+
+    def _check_loop(self) -> None:
+        """Reset state bound to a previous event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._reset()
+            self._loop = loop
+
+    def lane_for(self, cost_seconds: Optional[float]) -> str:
+        """
+        Pick the lane of a job.
+
+        Args:
+            cost_seconds: Audio seconds of the job (None = unknown)
+
+        Returns:
+            INTERACTIVE_LANE for short jobs, BULK_LANE otherwise
+        """
+        if cost_seconds is not None and cost_seconds <= self.interactive_max_seconds:
+            return INTERACTIVE_LANE
+        return BULK_LANE
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        user_id: UUID,
+        cost_seconds: Optional[float],
+        kind: str,
+    ) -> AsyncIterator[None]:
+        """
+        Wait for a slot, hold it while the block runs.
+
+        Args:
+            user_id: Owner of the job
+            cost_seconds: Audio seconds of the job (None = unknown, bulk lane
+                          with one quantum as cost)
+            kind: Job kind for logging ("transcription", "cleanup")
+        """
+        if not settings.SCHEDULER_ENABLED:
+            yield
+            return
+
+        job = await self._acquire(str(user_id), cost_seconds, kind)
+        try:
+            yield
+        finally:
+            self._release(job)
+
+    async def _acquire(self, user: str, cost_seconds: Optional[float], kind: str) -> _Job:
+        """Queue a job and wait until it is dispatched."""
+        self._check_loop()
+
+        lane = self.lane_for(cost_seconds)
+        job = _Job(
+            user=user,
+            cost=cost_seconds if cost_seconds is not None else self.quantum_seconds,
+            lane=lane,
+            kind=kind,
+            enqueued_at=time.monotonic(),
+            granted=self._loop.create_future(),
+        )
+        self._lanes[lane].add(job)
+        self._dispatch()
+
+        if not job.granted.done():
+            logger.info(
+                f"Job queued",
+                kind=kind,
+                lane=lane,
+                user_id=user,
+                cost_s=round(job.cost, 1),
+                queued=self._lanes[lane].queued()
+            )
+
+        try:
+            await job.granted
+        except asyncio.CancelledError:
+            if job.granted.done() and not job.granted.cancelled():
+                # Slot was granted just before the cancellation
+                self._release(job)
+            else:
+                self._lanes[lane].remove(job)
+            raise
+        return job
+
+    def _release(self, job: _Job) -> None:
+        """Free a job's slot and start the next jobs."""
+        self._running -= 1
+        remaining = self._running_per_user.get(job.user, 0) - 1
+        if remaining > 0:
+            self._running_per_user[job.user] = remaining
+        else:
+            self._running_per_user.pop(job.user, None)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant free slots to queued jobs (interactive lane first)."""
+        while self._running < self.max_concurrent:
+            job = None
+            for lane in self._lanes.values():
+                job = lane.next_job(self._may_start)
+                if job is not None:
+                    break
+            if job is None:
+                return
+
+            self._running += 1
+            self._running_per_user[job.user] = self._running_per_user.get(job.user, 0) + 1
+
+            lane = self._lanes[job.lane]
+            lane.waits.append(time.monotonic() - job.enqueued_at)
+            lane.dispatched += 1
+            job.granted.set_result(None)
+
+    def _may_start(self, user: str) -> bool:
+        """Whether a user is below the per-user concurrency cap."""
+        return self._running_per_user.get(user, 0) < self.max_per_user
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get queue statistics per lane.
+
+        Returns:
+            Dict of lane name to queued, queued_users, dispatched and
+            queue wait (avg, p95, max seconds over the last WAIT_WINDOW jobs)
+        """
+        stats = {}
+        for name, lane in self._lanes.items():
+            waits = sorted(lane.waits)
+            stats[name] = {
+                "queued": lane.queued(),
+                "queued_users": len(lane.order),
+                "dispatched": lane.dispatched,
+                "avg_wait_seconds": sum(waits) / len(waits) if waits else None,
+                "p95_wait_seconds": (
+                    waits[max(0, int(round(0.95 * len(waits))) - 1)] if waits else None
+                ),
+                "max_wait_seconds": waits[-1] if waits else None,
+            }
+        return stats
+
+    @property
+    def running(self) -> int:
+        """Number of jobs holding a slot."""
+        return self._running
+
+
+# Global scheduler instance
+_job_scheduler: Optional[FairJobScheduler] = None
+
+
+def get_job_scheduler() -> FairJobScheduler:
+    """
+    Get or create the global job scheduler.
+
+    Returns:
+        Shared FairJobScheduler instance
+    """
+    global _job_scheduler
+    if _job_scheduler is None:
+        _job_scheduler = FairJobScheduler()
+    return _job_scheduler
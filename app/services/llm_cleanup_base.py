@@ -134,3 +134,14 @@ class LLMCleanupService(ABC):
             List of dicts with model information (id, name, optional metadata)
         """
         pass
+
+    def request_warmup(self) -> bool:
+        """
+        Ask the provider to get a worker ready (non-blocking).
+
+        Only providers with cold starts (RunPod endpoints) override this.
+
+        Returns:
+            True if a warmup was sent
+        """
+        return False
@@ -1,26 +1,35 @@
 """
 Groq LLM Cleanup Service implementation.
 """
+import asyncio
 import re
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
-from groq import AsyncGroq
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.models.prompt_template import PromptTemplate
+from app.services.circuit_breaker import CircuitOpenError, get_circuit_breaker
 from app.services.llm_cleanup_base import (
     LLMCleanupService,
     LLMCleanupError,
     DREAM_CLEANUP_PROMPT,
     GENERIC_CLEANUP_PROMPT,
 )
+from app.services.prompt_template_cache import get_prompt_template_cache
 from app.utils.logger import get_logger
+from app.utils.text_chunking import (
+    TextWindow,
+    cleanup_window_budget,
+    split_transcript,
+    stitch_cleaned_windows,
+)
 
 logger = get_logger("services.llm_cleanup_groq")
 
+# Max tokens generated per cleanup request (longer transcripts are cleaned in windows)
+CLEANUP_MAX_TOKENS = 5000
+
 
 class GroqLLMCleanupService(LLMCleanupService):
     """Service for cleaning transcriptions using Groq's chat completion API."""
@@ -37,14 +46,18 @@ class GroqLLMCleanupService(LLMCleanupService):
         Args:
             api_key: Groq API key (if None, uses settings.GROQ_API_KEY)
             model: Groq model name (if None, uses settings.GROQ_LLM_MODEL)
-            db_session: Optional database session for prompt template lookup
+            db_session: Optional database session for prompt template cache misses
         """
         self.api_key = api_key or settings.GROQ_API_KEY
         self.model = model or settings.GROQ_LLM_MODEL
         self.timeout = settings.LLM_TIMEOUT_SECONDS
         self.max_retries = settings.LLM_MAX_RETRIES
+        self.context_window = settings.GROQ_LLM_CONTEXT_WINDOW
+        self.window_overlap_tokens = settings.LLM_CLEANUP_WINDOW_OVERLAP_TOKENS
+        self.max_concurrent_windows = settings.LLM_CLEANUP_MAX_CONCURRENT_WINDOWS
         self.db_session = db_session
-        self.client = AsyncGroq(api_key=self.api_key)
+        self._client = None
+        self._circuit = get_circuit_breaker("groq-llm")
 
         # Cache for list_available_models() with 1-hour TTL
         self._models_cache: Optional[list[Dict[str, Any]]] = None
@@ -56,6 +69,18 @@ class GroqLLMCleanupService(LLMCleanupService):
 
         logger.info(f"GroqLLMCleanupService initialized with model={self.model}")
 
+    @property
+    def client(self):
+        """Groq API client, created on first use (the groq SDK is slow to import)."""
+        if self._client is None:
+            from groq import AsyncGroq
+            self._client = AsyncGroq(api_key=self.api_key)
+        return self._client
+
+    @client.setter
+    def client(self, client) -> None:
+        self._client = client
+
     def get_model_name(self) -> str:
         """Return model name in format: groq-{model}"""
         return f"groq-{self.model}"
@@ -68,24 +93,14 @@ class GroqLLMCleanupService(LLMCleanupService):
         """
         Get active prompt template from database.
 
+        Served from the shared prompt template cache; on a miss it is loaded
+        with self.db_session, or a new session if the service has none.
+
         Returns:
             Tuple of (prompt_text, template_id) if found, None otherwise
         """
-        if not self.db_session:
-            logger.warning("No database session provided, skipping DB prompt lookup")
-            return None
-
         try:
-            stmt = (
-                select(PromptTemplate)
-                .where(
-                    PromptTemplate.entry_type == entry_type,
-                    PromptTemplate.is_active == True
-                )
-                .order_by(PromptTemplate.updated_at.desc())
-            )
-            result = await self.db_session.execute(stmt)
-            template = result.scalars().first()
+            template = await get_prompt_template_cache().get_active(entry_type, self.db_session)
 
             if template:
                 # Validate prompt template
@@ -162,6 +177,8 @@ class GroqLLMCleanupService(LLMCleanupService):
         Clean up transcription text using Groq's chat completion API.
 
         Returns plain text with paragraph breaks (no JSON, no analysis).
+        Transcripts whose cleaned text would not fit into one response are
+        cleaned in overlapping windows, which are stitched back together.
 
         Args:
             transcription_text: Raw transcription text to clean
@@ -185,29 +202,161 @@ class GroqLLMCleanupService(LLMCleanupService):
         effective_model = model if model else self.model
 
         prompt_template, template_id = await self._get_cleanup_prompt(entry_type)
-        prompt = prompt_template.format(transcription_text=transcription_text)
+        windows = self._split_for_cleanup(prompt_template, transcription_text)
+
+        if len(windows) == 1:
+            result = await self._cleanup_with_retries(
+                prompt_template.format(transcription_text=transcription_text),
+                template_id=template_id,
+                temperature=temperature,
+                top_p=top_p,
+                model=effective_model
+            )
+        else:
+            result = await self._cleanup_windows(
+                prompt_template,
+                windows,
+                template_id=template_id,
+                temperature=temperature,
+                top_p=top_p,
+                model=effective_model
+            )
+
+        # Add prompt_template_id and parameters to result
+        result["prompt_template_id"] = template_id
+        result["temperature"] = temperature
+        result["top_p"] = top_p
+
+        return result
+
+    def _split_for_cleanup(self, prompt_template: str, transcription_text: str) -> List[TextWindow]:
+        """
+        Split a transcript into windows that fit the model context and output limit.
+
+        Args:
+            prompt_template: Cleanup prompt with a {transcription_text} placeholder
+            transcription_text: Raw transcription text
 
+        Returns:
+            Windows in order (a single window for transcripts that fit)
+        """
+        try:
+            max_window_tokens = cleanup_window_budget(
+                prompt_template, self.context_window, CLEANUP_MAX_TOKENS
+            )
+        except ValueError as e:
+            logger.warning(f"Cleaning transcript without windowing: {str(e)}")
+            return [TextWindow(index=0, text=transcription_text, tokens=0, overlap_words=0)]
+
+        windows = split_transcript(
+            transcription_text,
+            max_tokens=max_window_tokens,
+            overlap_tokens=min(self.window_overlap_tokens, max_window_tokens // 4)
+        )
+        if len(windows) > 1:
+            logger.info(
+                f"Transcript exceeds cleanup output limit, cleaning in {len(windows)} windows "
+                f"of up to {max_window_tokens} tokens"
+            )
+        return windows
+
+    async def _cleanup_windows(
+        self,
+        prompt_template: str,
+        windows: List[TextWindow],
+        template_id: Optional[int],
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        model: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Clean transcript windows concurrently and stitch the outputs.
+
+        Args:
+            prompt_template: Cleanup prompt with a {transcription_text} placeholder
+            windows: Transcript windows from _split_for_cleanup
+            template_id: Prompt template ID (for error reporting)
+            temperature: Temperature for sampling. If None, uses default.
+            top_p: Top-p for nucleus sampling. If None, Groq uses default.
+            model: Model to use. If None, uses self.model.
+
+        Returns:
+            Dict containing cleaned_text and llm_raw_response (stitched)
+
+        Raises:
+            LLMCleanupError: If any window fails after retries
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_windows)
+        tasks: List[asyncio.Task] = []
+
+        async def clean_window(window: TextWindow) -> Dict[str, Any]:
+            async with semaphore:
+                logger.info(f"Cleaning window {window.index + 1}/{len(windows)}")
+                try:
+                    return await self._cleanup_with_retries(
+                        prompt_template.format(transcription_text=window.text),
+                        template_id=template_id,
+                        temperature=temperature,
+                        top_p=top_p,
+                        model=model
+                    )
+                except Exception:
+                    # The first failure fails the cleanup: stop the other windows
+                    # before the semaphore is released, so queued ones never start
+                    for task in tasks:
+                        if task is not asyncio.current_task():
+                            task.cancel()
+                    raise
+
+        tasks.extend(asyncio.ensure_future(clean_window(window)) for window in windows)
+        results = await asyncio.gather(*tasks)
+
+        response_text = stitch_cleaned_windows(
+            [result["llm_raw_response"] for result in results], windows
+        )
+        return {
+            "cleaned_text": self._process_cleanup_response(response_text),
+            "llm_raw_response": response_text
+        }
+
+    async def _cleanup_with_retries(
+        self,
+        prompt: str,
+        template_id: Optional[int],
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        model: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Run one cleanup prompt with retries.
+
+        Args:
+            prompt: Formatted prompt to send to LLM
+            template_id: Prompt template ID (for error reporting)
+            temperature: Temperature for sampling. If None, uses default.
+            top_p: Top-p for nucleus sampling. If None, Groq uses default.
+            model: Model to use. If None, uses self.model.
+
+        Returns:
+            Dict containing cleaned_text and llm_raw_response
+
+        Raises:
+            LLMCleanupError: If cleanup fails after retries (includes debug info)
+        """
         last_raw_response = None
 
         for attempt in range(self.max_retries + 1):
             try:
                 logger.info(
                     f"LLM cleanup attempt {attempt + 1}/{self.max_retries + 1} "
-                    f"using Groq model {effective_model}, temperature={temperature}, top_p={top_p}"
+                    f"using Groq model {model}, temperature={temperature}, top_p={top_p}"
                 )
-                result = await self._call_groq_cleanup(
+                return await self._call_groq_cleanup(
                     prompt,
                     temperature=temperature,
                     top_p=top_p,
-                    model=effective_model
+                    model=model
                 )
-
-                # Add prompt_template_id and parameters to result
-                result["prompt_template_id"] = template_id
-                result["temperature"] = temperature
-                result["top_p"] = top_p
-
-                return result
             except Exception as e:
                 # Try to extract raw response if it's in the exception context
                 if hasattr(e, 'llm_raw_response'):
@@ -216,7 +365,8 @@ class GroqLLMCleanupService(LLMCleanupService):
                 logger.warning(
                     f"LLM cleanup attempt {attempt + 1} failed: {str(e)}"
                 )
-                if attempt == self.max_retries:
+                # Retrying against an open circuit only delays the failure
+                if attempt == self.max_retries or isinstance(e, CircuitOpenError):
                     logger.error("All LLM cleanup attempts failed")
                     # Raise custom exception with debug info
                     raise LLMCleanupError(
@@ -252,6 +402,7 @@ class GroqLLMCleanupService(LLMCleanupService):
             Dict containing cleaned_text and llm_raw_response
 
         Raises:
+            CircuitOpenError: If Groq's circuit is open
             Exception: If API call fails
         """
         effective_model = model if model else self.model
@@ -267,7 +418,7 @@ class GroqLLMCleanupService(LLMCleanupService):
                     }
                 ],
                 "temperature": temperature,
-                "max_tokens": 5000,
+                "max_tokens": CLEANUP_MAX_TOKENS,
                 "timeout": self.timeout
             }
 
@@ -276,7 +427,8 @@ class GroqLLMCleanupService(LLMCleanupService):
                 api_params["top_p"] = top_p
 
             # Call Groq chat completion API
-            response = await self.client.chat.completions.create(**api_params)
+            with self._circuit.guard():
+                response = await self.client.chat.completions.create(**api_params)
 
             # Extract response text
             response_text = response.choices[0].message.content
@@ -291,6 +443,8 @@ class GroqLLMCleanupService(LLMCleanupService):
                 "llm_raw_response": response_text
             }
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             logger.error(f"Groq cleanup API call failed: {str(e)}", exc_info=True)
             raise
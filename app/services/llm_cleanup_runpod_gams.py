@@ -12,18 +12,27 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.models.prompt_template import PromptTemplate
+from app.services.circuit_breaker import CircuitOpenError, get_circuit_breaker
 from app.services.llm_cleanup_base import (
     LLMCleanupError,
     LLMCleanupService,
     DREAM_CLEANUP_PROMPT,
     GENERIC_CLEANUP_PROMPT,
 )
+from app.services.gams_batcher import get_gams_batcher
+from app.services.prompt_template_cache import get_prompt_template_cache
+from app.services.runpod_jobs import run_runpod_job
+from app.services.runpod_warmup import get_endpoint_warmer
 from app.utils.logger import get_logger
+from app.utils.text_chunking import (
+    TextWindow,
+    cleanup_window_budget,
+    split_transcript,
+    stitch_cleaned_windows,
+)
 
 logger = get_logger("services.llm_cleanup_runpod_gams")
 
@@ -48,7 +57,7 @@ class RunPodGamsLLMCleanupService(LLMCleanupService):
             api_key: RunPod API key (if None, uses settings.RUNPOD_API_KEY)
             endpoint_id: RunPod endpoint ID (if None, uses settings.RUNPOD_LLM_GAMS_ENDPOINT_ID)
             model: GaMS model variant (if None, uses settings.RUNPOD_LLM_GAMS_MODEL)
-            db_session: Optional database session for prompt template lookup
+            db_session: Optional database session for prompt template cache misses
         """
         self.api_key = api_key or settings.RUNPOD_API_KEY
         self.endpoint_id = endpoint_id or settings.RUNPOD_LLM_GAMS_ENDPOINT_ID
@@ -58,8 +67,19 @@ class RunPodGamsLLMCleanupService(LLMCleanupService):
         self.default_temperature = settings.RUNPOD_LLM_GAMS_DEFAULT_TEMPERATURE
         self.default_top_p = settings.RUNPOD_LLM_GAMS_DEFAULT_TOP_P
         self.max_tokens = settings.RUNPOD_LLM_GAMS_MAX_TOKENS
+        self.context_window = settings.RUNPOD_LLM_GAMS_CONTEXT_WINDOW
+        self.window_overlap_tokens = settings.LLM_CLEANUP_WINDOW_OVERLAP_TOKENS
+        self.max_concurrent_windows = settings.LLM_CLEANUP_MAX_CONCURRENT_WINDOWS
+        self.async_jobs = settings.RUNPOD_ASYNC_JOBS
         self.db_session = db_session
 
+        # Shared across service instances: concurrent cleanups are coalesced
+        # into GaMS batch calls
+        self._batcher = get_gams_batcher()
+
+        # Shared per endpoint: outages make all cleanups fail fast
+        self._circuit = get_circuit_breaker(self.get_model_name())
+
         # Cache for available models (static for GaMS)
         self._models_cache: Optional[List[Dict[str, Any]]] = None
 
@@ -84,28 +104,31 @@ class RunPodGamsLLMCleanupService(LLMCleanupService):
         """Return provider name."""
         return "runpod_llm_gams"
 
+    def request_warmup(self) -> bool:
+        """
+        Submit a no-op warmup job so a worker boots before the cleanup arrives.
+
+        Returns:
+            True if a warmup was sent (False if debounced or disabled)
+        """
+        return get_endpoint_warmer().warm(
+            self.get_model_name(),
+            f"{RUNPOD_API_BASE}/{self.endpoint_id}",
+            self.api_key,
+        )
+
     async def _get_prompt_from_db(self, entry_type: str) -> Optional[Tuple[str, int]]:
         """
         Get active prompt template from database.
 
+        Served from the shared prompt template cache; on a miss it is loaded
+        with self.db_session, or a new session if the service has none.
+
         Returns:
             Tuple of (prompt_text, template_id) if found, None otherwise
         """
-        if not self.db_session:
-            logger.warning("No database session provided, skipping DB prompt lookup")
-            return None
-
         try:
-            stmt = (
-                select(PromptTemplate)
-                .where(
-                    PromptTemplate.entry_type == entry_type,
-                    PromptTemplate.is_active == True,
-                )
-                .order_by(PromptTemplate.updated_at.desc())
-            )
-            result = await self.db_session.execute(stmt)
-            template = result.scalars().first()
+            template = await get_prompt_template_cache().get_active(entry_type, self.db_session)
 
             if template:
                 if not template.is_valid:
@@ -175,6 +198,8 @@ class RunPodGamsLLMCleanupService(LLMCleanupService):
         Clean up transcription text using GaMS on RunPod.
 
         Returns plain text with paragraph breaks (no JSON, no analysis).
+        Transcripts that do not fit the model context are cleaned in
+        overlapping windows, which are stitched back together.
 
         Args:
             transcription_text: Raw transcription text to clean
@@ -199,9 +224,145 @@ class RunPodGamsLLMCleanupService(LLMCleanupService):
         )
         effective_top_p = top_p if top_p is not None else self.default_top_p
 
+        # One real job per cleanup, however many windows, batches and retries it takes
+        get_endpoint_warmer().record_job(self.get_model_name())
+
         prompt_template, template_id = await self._get_cleanup_prompt(entry_type)
-        prompt = prompt_template.format(transcription_text=transcription_text)
+        windows = self._split_for_cleanup(prompt_template, transcription_text)
+
+        if len(windows) == 1:
+            result = await self._cleanup_with_retries(
+                prompt=prompt_template.format(transcription_text=transcription_text),
+                template_id=template_id,
+                temperature=effective_temperature,
+                top_p=effective_top_p,
+            )
+        else:
+            result = await self._cleanup_windows(
+                prompt_template=prompt_template,
+                windows=windows,
+                template_id=template_id,
+                temperature=effective_temperature,
+                top_p=effective_top_p,
+            )
+
+        result["prompt_template_id"] = template_id
+        result["temperature"] = temperature
+        result["top_p"] = top_p
+
+        return result
+
+    def _split_for_cleanup(self, prompt_template: str, transcription_text: str) -> List[TextWindow]:
+        """
+        Split a transcript into windows that fit the GaMS context and output limit.
+
+        Args:
+            prompt_template: Cleanup prompt with a {transcription_text} placeholder
+            transcription_text: Raw transcription text
 
+        Returns:
+            Windows in order (a single window for transcripts that fit)
+        """
+        try:
+            max_window_tokens = cleanup_window_budget(
+                prompt_template, self.context_window, self.max_tokens
+            )
+        except ValueError as e:
+            logger.warning(f"Cleaning transcript without windowing: {str(e)}")
+            return [TextWindow(index=0, text=transcription_text, tokens=0, overlap_words=0)]
+
+        windows = split_transcript(
+            transcription_text,
+            max_tokens=max_window_tokens,
+            overlap_tokens=min(self.window_overlap_tokens, max_window_tokens // 4),
+        )
+        if len(windows) > 1:
+            logger.info(
+                f"Transcript exceeds GaMS context, cleaning in windows",
+                windows=len(windows),
+                max_window_tokens=max_window_tokens,
+            )
+        return windows
+
+    async def _cleanup_windows(
+        self,
+        prompt_template: str,
+        windows: List[TextWindow],
+        template_id: Optional[int],
+        temperature: float,
+        top_p: float,
+    ) -> Dict[str, Any]:
+        """
+        Clean transcript windows concurrently and stitch the outputs.
+
+        Concurrent windows share GaMS batch requests through the coalescer.
+
+        Args:
+            prompt_template: Cleanup prompt with a {transcription_text} placeholder
+            windows: Transcript windows from _split_for_cleanup
+            template_id: Prompt template ID (for error reporting)
+            temperature: Sampling temperature
+            top_p: Nucleus sampling parameter
+
+        Returns:
+            Dict containing cleaned_text and llm_raw_response (stitched)
+
+        Raises:
+            LLMCleanupError: If any window fails after retries
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_windows)
+        tasks: List[asyncio.Task] = []
+
+        async def clean_window(window: TextWindow) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self._cleanup_with_retries(
+                        prompt=prompt_template.format(transcription_text=window.text),
+                        template_id=template_id,
+                        temperature=temperature,
+                        top_p=top_p,
+                    )
+                except Exception:
+                    # The first failure fails the cleanup: stop the other windows
+                    # before the semaphore is released, so queued ones never start
+                    for task in tasks:
+                        if task is not asyncio.current_task():
+                            task.cancel()
+                    raise
+
+        tasks.extend(asyncio.ensure_future(clean_window(window)) for window in windows)
+        results = await asyncio.gather(*tasks)
+
+        response_text = stitch_cleaned_windows(
+            [result["llm_raw_response"] for result in results], windows
+        )
+        return {
+            "cleaned_text": self._process_cleanup_response(response_text),
+            "llm_raw_response": response_text,
+        }
+
+    async def _cleanup_with_retries(
+        self,
+        prompt: str,
+        template_id: Optional[int],
+        temperature: float,
+        top_p: float,
+    ) -> Dict[str, Any]:
+        """
+        Run one cleanup prompt with retries and exponential backoff.
+
+        Args:
+            prompt: Formatted prompt to send
+            template_id: Prompt template ID (for error reporting)
+            temperature: Sampling temperature
+            top_p: Nucleus sampling parameter
+
+        Returns:
+            Dict containing cleaned_text and llm_raw_response
+
+        Raises:
+            LLMCleanupError: If cleanup fails after retries
+        """
         last_raw_response = None
 
         for attempt in range(self.max_retries + 1):
@@ -209,22 +370,16 @@ class RunPodGamsLLMCleanupService(LLMCleanupService):
                 logger.info(
                     f"GaMS cleanup attempt {attempt + 1}/{self.max_retries + 1}",
                     model=self.model,
-                    temperature=effective_temperature,
-                    top_p=effective_top_p,
+                    temperature=temperature,
+                    top_p=top_p,
                 )
 
-                result = await self._call_runpod_cleanup(
+                return await self._call_runpod_cleanup(
                     prompt=prompt,
-                    temperature=effective_temperature,
-                    top_p=effective_top_p,
+                    temperature=temperature,
+                    top_p=top_p,
                 )
 
-                result["prompt_template_id"] = template_id
-                result["temperature"] = temperature
-                result["top_p"] = top_p
-
-                return result
-
             except Exception as e:
                 if hasattr(e, "llm_raw_response"):
                     last_raw_response = e.llm_raw_response
@@ -233,7 +388,8 @@ class RunPodGamsLLMCleanupService(LLMCleanupService):
                     f"GaMS cleanup attempt {attempt + 1} failed: {str(e)}"
                 )
 
-                if attempt == self.max_retries:
+                # Retrying against an open circuit only delays the failure
+                if attempt == self.max_retries or isinstance(e, CircuitOpenError):
                     logger.error("All GaMS cleanup attempts failed")
                     raise LLMCleanupError(
                         message=str(e),
@@ -259,7 +415,8 @@ class RunPodGamsLLMCleanupService(LLMCleanupService):
         """
         Call RunPod endpoint for GaMS cleanup.
 
-        Uses the /runsync endpoint for synchronous execution.
+        The prompt goes through the shared batch coalescer: concurrent cleanups
+        with the same sampling parameters are sent as one GaMS batch request.
 
         Args:
             prompt: Formatted prompt to send
@@ -272,6 +429,59 @@ class RunPodGamsLLMCleanupService(LLMCleanupService):
         Raises:
             Exception: If API call fails
         """
+        params = {
+            "temperature": temperature,
+            "top_p": top_p,
+            "max_tokens": self.max_tokens,
+        }
+
+        output = await self._batcher.submit(
+            key=(self.endpoint_id, self.api_key, temperature, top_p, self.max_tokens),
+            prompt=prompt,
+            params=params,
+            send=self._send_runpod_input,
+        )
+
+        if "error" in output:
+            raise Exception(f"GaMS handler error: {output['error']}")
+
+        response_text = output.get("text", "")
+
+        if not response_text:
+            raise Exception("Empty response from GaMS handler")
+
+        # Process response: convert <break> markers to paragraph breaks
+        cleaned_text = self._process_cleanup_response(response_text)
+
+        logger.info(
+            f"GaMS cleanup successful",
+            processing_time=output.get("processing_time"),
+            prompt_tokens=output.get("token_count", {}).get("prompt"),
+            completion_tokens=output.get("token_count", {}).get("completion"),
+        )
+
+        return {
+            "cleaned_text": cleaned_text,
+            "llm_raw_response": response_text,
+        }
+
+    async def _send_runpod_input(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send one handler input (single prompt or batch) to the RunPod endpoint.
+
+        Uses the /runsync endpoint for synchronous execution, or /run + /status
+        when RUNPOD_ASYNC_JOBS is enabled.
+
+        Args:
+            input_data: Handler input ({"prompt": ...} or {"batch": [...]}, plus sampling params)
+
+        Returns:
+            Handler output
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open
+            Exception: If API call fails
+        """
         url = f"{RUNPOD_API_BASE}/{self.endpoint_id}/runsync"
 
         headers = {
@@ -279,67 +489,54 @@ class RunPodGamsLLMCleanupService(LLMCleanupService):
             "Content-Type": "application/json",
         }
 
-        payload = {
-            "input": {
-                "prompt": prompt,
-                "temperature": temperature,
-                "top_p": top_p,
-                "max_tokens": self.max_tokens,
-            }
-        }
+        payload = {"input": input_data}
 
         start_time = time.time()
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, json=payload, headers=headers)
-
-                # Handle rate limiting
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 5))
-                    logger.warning(
-                        f"RunPod rate limited, retrying after {retry_after}s"
+            if self.async_jobs:
+                # /run + /status: a retry resumes the submitted job by id
+                with self._circuit.guard():
+                    output = await run_runpod_job(
+                        f"{RUNPOD_API_BASE}/{self.endpoint_id}",
+                        self.api_key,
+                        payload["input"],
+                        timeout=self.timeout,
                     )
-                    await asyncio.sleep(retry_after)
-                    raise Exception(f"Rate limited, retry after {retry_after}s")
-
-                response.raise_for_status()
-                data = response.json()
+            else:
+                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                    with self._circuit.guard():
+                        response = await client.post(url, json=payload, headers=headers)
+                        if response.status_code >= 500:
+                            response.raise_for_status()
+
+                    # Handle rate limiting
+                    if response.status_code == 429:
+                        retry_after = int(response.headers.get("Retry-After", 5))
+                        logger.warning(
+                            f"RunPod rate limited, retrying after {retry_after}s"
+                        )
+                        await asyncio.sleep(retry_after)
+                        raise Exception(f"Rate limited, retry after {retry_after}s")
+
+                    response.raise_for_status()
+                    data = response.json()
+
+                # Check for RunPod-level errors
+                if data.get("status") == "FAILED":
+                    error_msg = data.get("error", "Unknown RunPod error")
+                    raise Exception(f"RunPod job failed: {error_msg}")
+
+                # Extract output
+                output = data.get("output", {})
 
             elapsed = time.time() - start_time
             logger.debug(f"RunPod API call took {elapsed:.2f}s")
 
-            # Check for RunPod-level errors
-            if data.get("status") == "FAILED":
-                error_msg = data.get("error", "Unknown RunPod error")
-                raise Exception(f"RunPod job failed: {error_msg}")
-
-            # Extract output
-            output = data.get("output", {})
-
-            if "error" in output:
-                raise Exception(f"GaMS handler error: {output['error']}")
-
-            response_text = output.get("text", "")
-
-            if not response_text:
-                raise Exception("Empty response from GaMS handler")
-
-            # Process response: convert <break> markers to paragraph breaks
-            cleaned_text = self._process_cleanup_response(response_text)
-
-            logger.info(
-                f"GaMS cleanup successful",
-                processing_time=output.get("processing_time"),
-                prompt_tokens=output.get("token_count", {}).get("prompt"),
-                completion_tokens=output.get("token_count", {}).get("completion"),
-            )
-
-            return {
-                "cleaned_text": cleaned_text,
-                "llm_raw_response": response_text,
-            }
+            return output
 
+        except CircuitOpenError:
+            raise
         except httpx.TimeoutException:
             logger.error(f"RunPod request timed out after {self.timeout}s")
             raise Exception(f"Request timed out after {self.timeout}s")
@@ -8,9 +8,6 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 from uuid import UUID
 
-from notion_client import AsyncClient
-from notion_client.errors import APIResponseError
-
 from app.config import settings
 from app.utils.logger import get_logger
 from app.services.notion_rate_limiter import get_rate_limiter
@@ -52,6 +49,9 @@ class NotionService:
         Args:
             api_key: Decrypted Notion API key
         """
+        # The notion_client SDK is imported when a user syncs, not at app import
+        from notion_client import AsyncClient
+
         self.client = AsyncClient(auth=api_key)
         self.rate_limiter = get_rate_limiter()
         logger.info("Initialized Notion service")
@@ -79,6 +79,8 @@ class NotionService:
             >>> print(db_info["title"][0]["plain_text"])
             'Dream Journal'
         """
+        from notion_client.errors import APIResponseError
+
         try:
             # Step 1: Retrieve database to get data_source_id
             async with self.rate_limiter:
@@ -213,6 +215,8 @@ class NotionService:
             >>> print(page["url"])
             'https://notion.so/...'
         """
+        from notion_client.errors import APIResponseError
+
         try:
             # Format wake time as HH:MM
             wake_time = uploaded_at.strftime("%H:%M")
@@ -330,6 +334,8 @@ class NotionService:
             ...     dream_name="Lucid Flight Dream"
             ... )
         """
+        from notion_client.errors import APIResponseError
+
         try:
             properties = {}
 
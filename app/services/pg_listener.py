@@ -0,0 +1,144 @@
+"""
+Postgres LISTEN/NOTIFY channel shared by the per-worker caches and registries.
+
+Several in-process structures (prompt template cache, circuit breakers,
+background job registry) keep state per worker and share changes through a
+NOTIFY channel. PgListener holds the LISTEN connection of one channel
+(reconnecting on failure) and sends NOTIFYs on it; the owner only parses
+payloads.
+"""
+
+import asyncio
+from typing import Any, Callable, Optional, Set
+
+from sqlalchemy import text
+
+from app.config import settings
+from app.database import get_session
+from app.utils.logger import get_logger
+
+logger = get_logger("services.pg_listener")
+
+# Seconds between listener reconnect attempts
+LISTENER_RETRY_SECONDS = 5.0
+
+# asyncpg notification callback: (connection, pid, channel, payload)
+NotificationCallback = Callable[[Any, int, str, str], None]
+
+
+class PgListener:
+    """
+    LISTEN connection of one channel, with NOTIFY sending.
+
+    Usage:
+        listener = PgListener("circuit_breakers_changed", self._on_notification)
+        listener.start()           # on startup
+        listener.announce(payload) # other workers' callbacks get the payload
+        await listener.stop()      # on shutdown
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        on_notification: NotificationCallback,
+        on_connect: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Initialize listener.
+
+        Args:
+            channel: NOTIFY channel
+            on_notification: Called with (connection, pid, channel, payload)
+                for every notification, including this worker's own
+            on_connect: Called after each (re)connect, e.g. to drop state that
+                may have missed notifications while disconnected
+        """
+        self.channel = channel
+        self.on_notification = on_notification
+        self.on_connect = on_connect
+        self._task: Optional[asyncio.Task] = None
+        # Keeps fire-and-forget notifications referenced until they finish
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def listening(self) -> bool:
+        """Whether the listener task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start listening (idempotent; restarts a task of a previous event loop)."""
+        loop = asyncio.get_running_loop()
+        if not self.listening or self._task.get_loop() is not loop:
+            self._task = loop.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop listening (used on shutdown and in tests)."""
+        if self.listening:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def announce(self, payload: str) -> None:
+        """
+        Send a NOTIFY in the background while listening.
+
+        Without a listener (single-process setups, scripts, tests) no other
+        worker is listening either, so nothing is sent.
+
+        Args:
+            payload: Notification payload
+        """
+        if not self.listening:
+            return
+        task = asyncio.get_running_loop().create_task(self.notify(payload))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def notify(self, payload: str) -> None:
+        """
+        Send a NOTIFY (failures are logged, not raised).
+
+        Args:
+            payload: Notification payload
+        """
+        try:
+            async with get_session() as session:
+                await session.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {"channel": self.channel, "payload": payload}
+                )
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"Notification failed: {str(e)}", channel=self.channel)
+
+    async def _listen(self) -> None:
+        """Keep a LISTEN connection open, reconnecting on failure."""
+        import asyncpg
+
+        dsn = settings.database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(self.channel, self.on_notification)
+
+                if self.on_connect is not None:
+                    self.on_connect()
+                logger.info(f"Listening for notifications", channel=self.channel)
+
+                await closed.wait()
+                logger.warning(f"Listener connection closed", channel=self.channel)
+            except asyncio.CancelledError:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+                raise
+            except Exception as e:
+                logger.warning(f"Listener failed: {str(e)}", channel=self.channel)
+
+            await asyncio.sleep(LISTENER_RETRY_SECONDS)
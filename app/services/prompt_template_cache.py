@@ -0,0 +1,236 @@
+"""
+Shared cache of active prompt templates.
+
+Every cleanup needs the active prompt template for its entry type. Templates
+change rarely (activation of another version, an edit), so the active
+template per entry type - or the fact that there is none - is cached in
+process and shared by all LLM cleanup services.
+
+Invalidation:
+- A database trigger on prompt_templates sends a NOTIFY (payload
+  "{schema}:{entry_type}") on every insert/update/delete, and bumps the
+  version when a template's text is edited in place. Each worker LISTENs
+  and drops the affected entry type, so activations and edits reach all
+  workers as soon as they commit.
+- activate_prompt_template also invalidates locally (no listener needed in
+  single-process setups and scripts).
+- Entries expire after PROMPT_TEMPLATE_CACHE_TTL_SECONDS as a safety net
+  for notifications missed while the listener was reconnecting.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import DB_SCHEMA, get_session
+from app.models.prompt_template import PromptTemplate
+from app.services.pg_listener import PgListener
+from app.utils.logger import get_logger
+
+logger = get_logger("services.prompt_template_cache")
+
+# NOTIFY channel of the prompt_templates trigger (see migration c8d9e0f1a2b3)
+PROMPT_TEMPLATES_CHANNEL = "prompt_templates_changed"
+
+
+@dataclass(frozen=True)
+class PromptTemplateSnapshot:
+    """Detached copy of a prompt template (safe to share across sessions)."""
+
+    id: int
+    name: str
+    entry_type: str
+    prompt_text: Optional[str]
+    version: int
+    is_valid: bool
+
+    @classmethod
+    def from_model(cls, template: PromptTemplate) -> "PromptTemplateSnapshot":
+        """Copy the fields cleanup needs from an ORM instance."""
+        return cls(
+            id=template.id,
+            name=template.name,
+            entry_type=template.entry_type,
+            prompt_text=template.prompt_text,
+            version=template.version,
+            is_valid=template.is_valid,
+        )
+
+
+@dataclass
+class _CachedTemplate:
+    """Active template of one entry type (None = no active template)."""
+
+    template: Optional[PromptTemplateSnapshot]
+    loaded_at: float
+
+
+class PromptTemplateCache:
+    """
+    In-process cache of the active prompt template per entry type.
+
+    Usage:
+        cache = get_prompt_template_cache()
+        template = await cache.get_active(entry_type)        # own session on a miss
+        template = await cache.get_active(entry_type, db)    # or the caller's session
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: Max age of a cached entry (defaults to config, 0 = no caching)
+        """
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else settings.PROMPT_TEMPLATE_CACHE_TTL_SECONDS
+        )
+
+        self._entries: Dict[str, _CachedTemplate] = {}
+        # Bumped on invalidation; a load that raced an invalidation is not stored
+        self._generations: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Changes made while not listening were missed: drop everything on (re)connect
+        self._listener = PgListener(
+            PROMPT_TEMPLATES_CHANNEL, self._on_notification, on_connect=self.invalidate
+        )
+
+    async def get_active(
+        self,
+        entry_type: str,
+        db: Optional[AsyncSession] = None,
+    ) -> Optional[PromptTemplateSnapshot]:
+        """
+        Get the active prompt template for an entry type.
+
+        Args:
+            entry_type: Entry type (dream, journal, etc.)
+            db: Session to load with on a miss (a new session if None)
+
+        Returns:
+            Snapshot of the most recently updated active template, None if there is none
+
+        Raises:
+            Exception: If loading from the database fails (failures are not cached)
+        """
+        self._check_loop()
+
+        cached = self._fresh_entry(entry_type)
+        if cached is not None:
+            return cached.template
+
+        lock = self._locks.setdefault(entry_type, asyncio.Lock())
+        async with lock:
+            # Another waiter may have loaded it meanwhile
+            cached = self._fresh_entry(entry_type)
+            if cached is not None:
+                return cached.template
+
+            generation = self._generations.get(entry_type, 0)
+            template = await self._load(entry_type, db)
+
+            if self.ttl_seconds > 0 and self._generations.get(entry_type, 0) == generation:
+                self._entries[entry_type] = _CachedTemplate(template, time.monotonic())
+
+            logger.debug(
+                f"Prompt template loaded",
+                entry_type=entry_type,
+                template_id=template.id if template else None,
+            )
+            return template
+
+    def invalidate(self, entry_type: Optional[str] = None) -> None:
+        """
+        Drop cached templates.
+
+        Args:
+            entry_type: Entry type to drop (all entry types if None)
+        """
+        entry_types = [entry_type] if entry_type is not None else list(
+            set(self._entries) | set(self._generations)
+        )
+        for key in entry_types:
+            self._entries.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def _fresh_entry(self, entry_type: str) -> Optional[_CachedTemplate]:
+        """Cached entry if present and not expired."""
+        cached = self._entries.get(entry_type)
+        if cached is None or time.monotonic() - cached.loaded_at >= self.ttl_seconds:
+            return None
+        return cached
+
+    def _check_loop(self) -> None:
+        """Reset locks bound to a previous event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._locks = {}
+            self._entries = {}
+            self._loop = loop
+
+    @staticmethod
+    async def _load(
+        entry_type: str,
+        db: Optional[AsyncSession],
+    ) -> Optional[PromptTemplateSnapshot]:
+        """Query the active template (same query as before caching)."""
+        stmt = (
+            select(PromptTemplate)
+            .where(
+                PromptTemplate.entry_type == entry_type,
+                PromptTemplate.is_active == True
+            )
+            .order_by(PromptTemplate.updated_at.desc())
+        )
+
+        if db is not None:
+            result = await db.execute(stmt)
+            template = result.scalars().first()
+        else:
+            async with get_session() as session:
+                result = await session.execute(stmt)
+                template = result.scalars().first()
+
+        return PromptTemplateSnapshot.from_model(template) if template else None
+
+    # Cross-worker invalidation
+
+    def start_listener(self) -> None:
+        """Start listening for prompt template changes (idempotent)."""
+        self._check_loop()
+        self._listener.start()
+
+    async def stop_listener(self) -> None:
+        """Stop the listener (used on shutdown and in tests)."""
+        await self._listener.stop()
+
+    def _on_notification(self, connection, pid, channel: str, payload: str) -> None:
+        """Handle a NOTIFY from the prompt_templates trigger."""
+        schema, _, entry_type = payload.partition(":")
+        if schema != DB_SCHEMA:
+            return
+        logger.info(f"Prompt templates changed, invalidating cache", entry_type=entry_type)
+        self.invalidate(entry_type or None)
+
+
+# Global cache instance
+_prompt_template_cache: Optional[PromptTemplateCache] = None
+
+
+def get_prompt_template_cache() -> PromptTemplateCache:
+    """
+    Get or create the global prompt template cache.
+
+    Returns:
+        Shared PromptTemplateCache instance
+    """
+    global _prompt_template_cache
+    if _prompt_template_cache is None:
+        _prompt_template_cache = PromptTemplateCache()
+    return _prompt_template_cache
@@ -1,9 +1,13 @@
 """
 Provider Registry for transcription and LLM cleanup services.
 
-Provides centralized validation and factory functions for per-request provider selection.
+Provides centralized validation and factory functions for per-request provider selection,
+and a long-lived registry of service instances and model listings (ProviderServiceRegistry).
 """
-from typing import Optional, Dict, Any, List
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -479,3 +483,247 @@ def get_effective_llm_provider(requested_provider: Optional[str]) -> str:
         )
 
     return provider
+
+
+# Model list kinds served by ProviderServiceRegistry.list_models
+MODEL_KINDS = ("transcription", "llm")
+
+
+@dataclass
+class _CachedModels:
+    """Model list of one provider and when it was fetched."""
+
+    models: List[Dict[str, Any]]
+    fetched_at: float
+
+
+class ProviderServiceRegistry:
+    """
+    Long-lived provider service instances and model listings.
+
+    Services hold API clients, chunkers and rate limiters, so one instance per
+    (provider, variant) is created on first use and reused by all requests and
+    background tasks. Model lists are served from memory; once older than
+    PROVIDER_MODELS_REFRESH_SECONDS they are still returned while a refresh
+    runs in the background (stale-while-revalidate), so a slow or failing
+    model API does not delay /options.
+
+    Usage:
+        registry = get_provider_service_registry()
+        service = registry.get_transcription_service("clarin-slovene-asr", model="pyannote")
+        models = await registry.list_models("llm", "groq")
+    """
+
+    def __init__(
+        self,
+        refresh_seconds: Optional[float] = None,
+        fetch_timeout_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize registry.
+
+        Args:
+            refresh_seconds: Age after which model lists are refreshed (defaults to config)
+            fetch_timeout_seconds: Max wait for a never-fetched model list (defaults to config)
+        """
+        self.refresh_seconds = (
+            refresh_seconds if refresh_seconds is not None
+            else settings.PROVIDER_MODELS_REFRESH_SECONDS
+        )
+        self.fetch_timeout_seconds = (
+            fetch_timeout_seconds if fetch_timeout_seconds is not None
+            else settings.PROVIDER_MODELS_FETCH_TIMEOUT_SECONDS
+        )
+
+        self._transcription_services: Dict[Tuple[str, str], TranscriptionService] = {}
+        self._llm_services: Dict[str, LLMCleanupService] = {}
+        self._models: Dict[Tuple[str, str], _CachedModels] = {}
+        self._refreshes: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get_transcription_service(
+        self,
+        provider: str,
+        model: Optional[str] = None
+    ) -> TranscriptionService:
+        """
+        Get the shared transcription service for a provider.
+
+        Args:
+            provider: Provider name (e.g., "groq", "assemblyai", "clarin-slovene-asr")
+            model: RunPod variant for providers with multiple models (first available if None)
+
+        Returns:
+            TranscriptionService instance
+
+        Raises:
+            ValueError: If provider or model is not supported or not configured
+        """
+        self._check_loop()
+        provider = provider.lower()
+        variant = model.lower() if model else None
+
+        if variant is None:
+            available_runpods = get_available_runpods_for_provider(provider)
+            if available_runpods:
+                variant = available_runpods[0]["id"]
+
+        key = (provider, variant or "")
+        service = self._transcription_services.get(key)
+        if service is None:
+            service = get_transcription_service_for_provider(provider, model=variant)
+            self._transcription_services[key] = service
+        return service
+
+    def get_llm_service(self, provider: str) -> LLMCleanupService:
+        """
+        Get the shared LLM cleanup service for a provider.
+
+        Args:
+            provider: Provider name (e.g., "groq", "runpod_llm_gams")
+
+        Returns:
+            LLMCleanupService instance
+
+        Raises:
+            ValueError: If provider is not supported or not configured
+        """
+        self._check_loop()
+        provider = provider.lower()
+
+        service = self._llm_services.get(provider)
+        if service is None:
+            service = get_llm_service_for_provider(provider)
+            self._llm_services[provider] = service
+        return service
+
+    async def list_models(self, kind: str, provider: str) -> List[Dict[str, Any]]:
+        """
+        Get the model list of a provider from memory.
+
+        A stale list is returned immediately and refreshed in the background.
+        Only a list that was never fetched is waited for (up to
+        fetch_timeout_seconds; the fetch continues after a timeout).
+
+        Args:
+            kind: "transcription" or "llm"
+            provider: Provider name
+
+        Returns:
+            List of model dicts as returned by the service's list_available_models
+
+        Raises:
+            ValueError: If kind or provider is not supported or not configured
+            asyncio.TimeoutError: If the first fetch takes longer than fetch_timeout_seconds
+            RuntimeError: If the first fetch fails
+        """
+        if kind not in MODEL_KINDS:
+            raise ValueError(f"Unknown model kind: '{kind}'. Available: {', '.join(MODEL_KINDS)}")
+
+        self._check_loop()
+        key = (kind, provider.lower())
+
+        cached = self._models.get(key)
+        if cached is not None:
+            if time.monotonic() - cached.fetched_at >= self.refresh_seconds:
+                self._schedule_refresh(key)
+            return cached.models
+
+        task = self._schedule_refresh(key)
+        return await asyncio.wait_for(asyncio.shield(task), timeout=self.fetch_timeout_seconds)
+
+    def start(self) -> None:
+        """
+        Create the default providers' services and start fetching their model lists.
+
+        Does not wait for the model APIs; /options waits for a first fetch at most
+        fetch_timeout_seconds.
+
+        Raises:
+            ValueError: If a default provider is not configured
+        """
+        self._check_loop()
+        self.get_transcription_service(settings.DEFAULT_TRANSCRIPTION_PROVIDER)
+        self.get_llm_service(settings.DEFAULT_LLM_PROVIDER)
+
+        self._schedule_refresh(("transcription", settings.DEFAULT_TRANSCRIPTION_PROVIDER.lower()))
+        self._schedule_refresh(("llm", settings.DEFAULT_LLM_PROVIDER.lower()))
+
+    async def close(self) -> None:
+        """Cancel model list refreshes in flight (used on shutdown and in tests)."""
+        tasks = [task for task in self._refreshes.values() if not task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._refreshes = {}
+
+    def _schedule_refresh(self, key: Tuple[str, str]) -> asyncio.Task:
+        """Start a model list fetch unless one is already running."""
+        task = self._refreshes.get(key)
+        if task is None or task.done():
+            task = self._loop.create_task(self._refresh(key))
+            task.add_done_callback(self._on_refresh_done)
+            self._refreshes[key] = task
+        return task
+
+    async def _refresh(self, key: Tuple[str, str]) -> List[Dict[str, Any]]:
+        """Fetch and store a model list; keep the stale list on failure."""
+        kind, provider = key
+        try:
+            if kind == "transcription":
+                service = self.get_transcription_service(provider)
+            else:
+                service = self.get_llm_service(provider)
+            models = await service.list_available_models()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            cached = self._models.get(key)
+            logger.warning(
+                f"Failed to refresh {kind} models for provider {provider}: {str(e)}",
+                has_stale=cached is not None
+            )
+            if cached is not None:
+                return cached.models
+            raise
+
+        self._models[key] = _CachedModels(models, time.monotonic())
+        logger.debug(f"Refreshed {kind} models for provider {provider}", count=len(models))
+        return models
+
+    @staticmethod
+    def _on_refresh_done(task: asyncio.Task) -> None:
+        """Retrieve the outcome so failures nobody waited for are not reported as unhandled."""
+        if not task.cancelled():
+            task.exception()
+
+    def _check_loop(self) -> None:
+        """Drop services and refreshes bound to a previous event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._loop is not loop:
+            # API clients' connection pools belong to the loop they were used on
+            self._transcription_services = {}
+            self._llm_services = {}
+            self._refreshes = {}
+            self._loop = loop
+
+
+# Global registry instance
+_service_registry: Optional[ProviderServiceRegistry] = None
+
+
+def get_provider_service_registry() -> ProviderServiceRegistry:
+    """
+    Get or create the global provider service registry.
+
+    Returns:
+        Shared ProviderServiceRegistry instance
+    """
+    global _service_registry
+    if _service_registry is None:
+        _service_registry = ProviderServiceRegistry()
+    return _service_registry
@@ -0,0 +1,145 @@
+"""
+Rate limiter for provider API requests.
+
+Token bucket (requests per period) shared by all requests to one provider in
+this process, plus a cool-down that callers trigger when the provider answers
+429 so that every concurrent request backs off, not only the one that failed.
+Used for Groq and, configured by NotionRateLimiter, for the Notion API.
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional
+
+from app.utils.logger import get_logger
+
+logger = get_logger("rate_limiter")
+
+
+class ProviderRateLimiter:
+    """
+    Token bucket rate limiter with 429 cool-down.
+
+    Usage:
+        limiter = get_provider_rate_limiter("groq-transcription", 20, 60)
+        async with limiter:
+            response = await client.audio.transcriptions.create(...)
+
+        # On HTTP 429:
+        limiter.pause(retry_after_seconds)
+    """
+
+    def __init__(self, name: str, max_requests: int, period: float):
+        """
+        Initialize rate limiter.
+
+        Args:
+            name: Limiter name (for logging)
+            max_requests: Max requests per period (bucket capacity)
+            period: Period in seconds
+        """
+        if max_requests < 1:
+            raise ValueError("max_requests must be >= 1")
+        if period <= 0:
+            raise ValueError("period must be > 0")
+
+        self.name = name
+        self.max_requests = max_requests
+        self.period = period
+
+        # Token bucket state
+        self.tokens = float(max_requests)
+        self.last_refill = time.monotonic()
+
+        # No request may start before this (monotonic) time
+        self.paused_until = 0.0
+
+        # Created lazily: the limiter is shared process-wide and must not
+        # bind to the event loop that happened to construct it
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _refill_tokens(self) -> None:
+        """Add tokens at a constant rate, capped at bucket capacity."""
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        tokens_to_add = elapsed * (self.max_requests / self.period)
+
+        if tokens_to_add > 0:
+            self.tokens = min(self.max_requests, self.tokens + tokens_to_add)
+            self.last_refill = now
+
+    def pause(self, seconds: float) -> None:
+        """
+        Block all requests for a while (e.g. after a 429 with Retry-After).
+
+        Args:
+            seconds: Cool-down duration in seconds
+        """
+        until = time.monotonic() + max(0.0, seconds)
+        if until > self.paused_until:
+            self.paused_until = until
+            # The provider is saturated - drop burst capacity
+            self.tokens = 0.0
+            self.last_refill = time.monotonic()
+            logger.warning(f"Rate limiter paused", limiter=self.name, seconds=seconds)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+
+                self._refill_tokens()
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait_time = (1 - self.tokens) * (self.period / self.max_requests)
+                logger.debug(f"Rate limit reached, waiting", limiter=self.name, wait_time=wait_time)
+                await asyncio.sleep(wait_time)
+
+    async def __aenter__(self):
+        """Context manager entry - acquire token."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - nothing to cleanup."""
+        pass
+
+
+# Global limiter instances, one per provider/name
+_limiters: Dict[str, ProviderRateLimiter] = {}
+
+
+def get_provider_rate_limiter(
+    name: str,
+    max_requests: int,
+    period: float = 60.0
+) -> ProviderRateLimiter:
+    """
+    Get or create the shared rate limiter for a provider.
+
+    Args:
+        name: Limiter name (e.g. "groq-transcription")
+        max_requests: Max requests per period (used on creation)
+        period: Period in seconds (used on creation)
+
+    Returns:
+        Shared ProviderRateLimiter instance
+    """
+    limiter: Optional[ProviderRateLimiter] = _limiters.get(name)
+    if limiter is None:
+        limiter = ProviderRateLimiter(name, max_requests, period)
+        _limiters[name] = limiter
+    return limiter
@@ -0,0 +1,674 @@
+"""
+Asynchronous RunPod job client.
+
+RunPod serverless endpoints expose two execution modes:
+- /runsync: holds the HTTP connection open until the job finishes
+- /run + /status/{job_id}: returns a job id immediately, results are polled
+
+The synchronous mode ties a long transcription to a single HTTP request, so a
+client-side timeout or a process restart throws the work away and the retry
+submits (and pays for) the same job again. This module implements the job mode:
+
+- RunPodJobPoller: one background task per process that polls all outstanding
+  job ids (across endpoints) with per-job exponential backoff and wakes
+  waiters through futures.
+- RunPodJobStore: small JSON file mapping a request fingerprint to the RunPod
+  job id, so retries and restarted workers resume the existing job instead
+  of submitting a duplicate. Workers share the file and merge their changes
+  under a file lock.
+- run_runpod_job(): submit-or-resume + wait, used by the RunPod services.
+  When the wait is cancelled because its background job was cancelled, or
+  because its caller abandoned it (the losing request of a hedge, see
+  RunPodJobOwner), the job is cancelled on RunPod (/cancel) instead of being
+  kept for a resume.
+  Job ids are also recorded as progress of the running background job and
+  kept there after completion, so a job interrupted by a shutdown and resumed
+  by another worker picks up its submitted and completed RunPod jobs.
+"""
+
+import asyncio
+import contextvars
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set
+
+import httpx
+
+from app.config import settings
+from app.services.background_jobs import get_job_progress, is_cancel_requested, record_job_progress
+from app.utils.logger import get_logger
+
+logger = get_logger("services.runpod_jobs")
+
+# Job statuses after which RunPod will not change the job anymore
+TERMINAL_STATUSES = {"COMPLETED", "FAILED", "CANCELLED", "TIMED_OUT"}
+
+
+class RunPodJobNotFoundError(RuntimeError):
+    """Raised when RunPod no longer knows a job id (expired or purged)."""
+
+
+class RunPodJobOwner:
+    """
+    Caller that may stop waiting for the RunPod jobs of a request.
+
+    A task that claims ownership (own_runpod_jobs) runs its RunPod calls in
+    job mode even when /runsync is configured, so the job id is known. After
+    abandon(), cancelling the task cancels its jobs on RunPod instead of
+    keeping them for a resume that will never come.
+    """
+
+    def __init__(self):
+        """Initialize owner."""
+        self.abandoned = False
+
+    def abandon(self) -> None:
+        """Cancel the owned jobs on RunPod once their waits are cancelled."""
+        self.abandoned = True
+
+
+# Owner of the RunPod jobs run by the current task (inherited by tasks it creates)
+_job_owner: contextvars.ContextVar[Optional[RunPodJobOwner]] = contextvars.ContextVar(
+    "runpod_job_owner", default=None
+)
+
+
+def own_runpod_jobs(owner: RunPodJobOwner) -> None:
+    """
+    Make owner the owner of the RunPod jobs run by the current task.
+
+    Args:
+        owner: Owner (one per task; set it inside the task)
+    """
+    _job_owner.set(owner)
+
+
+def use_job_mode(async_jobs: bool) -> bool:
+    """
+    Whether a RunPod call should use job mode (/run + /status).
+
+    Args:
+        async_jobs: Mode configured for the service
+
+    Returns:
+        True if configured, or if the current task owns its jobs (cancelling
+        them needs their ids)
+    """
+    return async_jobs or _job_owner.get() is not None
+
+
+def runpod_job_fingerprint(base_url: str, input_data: Dict[str, Any]) -> str:
+    """
+    Compute a stable fingerprint for a RunPod request.
+
+    The fingerprint covers the endpoint and the full input payload, so two
+    calls with identical input resolve to the same RunPod job.
+
+    Args:
+        base_url: Endpoint base URL (https://api.runpod.ai/v2/{endpoint_id})
+        input_data: Input payload for the handler
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    digest.update(base_url.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(
+        json.dumps(input_data, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    )
+    return digest.hexdigest()
+
+
+class RunPodJobStore:
+    """
+    Persistent fingerprint -> job id map used to resume submitted jobs.
+
+    Stored as a small JSON file (only hashes and job ids, never payloads).
+    Entries older than the TTL are ignored because RunPod purges job results
+    after a retention window.
+
+    The file is shared by all workers: every change re-reads it under an
+    exclusive lock (path + ".lock"), applies the change and writes it back
+    atomically, so a worker does not overwrite jobs recorded by the others
+    and a retry handled by another worker still resumes the job.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: Optional[int] = None):
+        """
+        Initialize job store.
+
+        Args:
+            path: JSON file path (None keeps state in memory only)
+            ttl_seconds: Max age of a resumable entry (defaults to config)
+        """
+        self.path = Path(path) if path else None
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.RUNPOD_JOB_RESUME_TTL_SECONDS
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """Read the current entries (best effort; the file is replaced atomically)."""
+        if self.path is None:
+            return self._entries
+        if not self.path.exists():
+            return {}
+
+        try:
+            return json.loads(self.path.read_text())
+        except Exception as e:
+            logger.warning("Failed to read RunPod job state, starting empty", error=str(e))
+            return {}
+
+    def _write(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically replace the file with entries."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self.path)
+
+    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+        """Whether an entry is older than the TTL."""
+        return time.time() - entry.get("submitted_at", 0) > self.ttl_seconds
+
+    def _update(self, change: Callable[[Dict[str, Dict[str, Any]]], None]) -> None:
+        """
+        Apply a change to the entries under the file lock (best effort).
+
+        Expired entries are dropped on every write, so the file stays small.
+        """
+        if self.path is None:
+            change(self._entries)
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path.with_name(self.path.name + ".lock"), "w") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                entries = self._read()
+                change(entries)
+                self._write({
+                    fingerprint: entry for fingerprint, entry in entries.items()
+                    if not self._is_expired(entry)
+                })
+        except Exception as e:
+            logger.warning("Failed to persist RunPod job state", error=str(e))
+
+    def get(self, fingerprint: str) -> Optional[str]:
+        """
+        Get the job id for a fingerprint if it is still resumable.
+
+        Args:
+            fingerprint: Request fingerprint
+
+        Returns:
+            RunPod job id or None
+        """
+        entry = self._read().get(fingerprint)
+        if entry is None:
+            return None
+
+        if self._is_expired(entry):
+            self.remove(fingerprint)
+            return None
+
+        return entry.get("job_id")
+
+    def put(self, fingerprint: str, job_id: str) -> None:
+        """Record a submitted job."""
+        entry = {"job_id": job_id, "submitted_at": time.time()}
+        self._update(lambda entries: entries.__setitem__(fingerprint, entry))
+
+    def remove(self, fingerprint: str) -> None:
+        """Forget a job (finished, failed or expired)."""
+        self._update(lambda entries: entries.pop(fingerprint, None))
+
+
+@dataclass
+class _PendingJob:
+    """Book-keeping for a job tracked by the poller."""
+
+    job_id: str
+    base_url: str
+    api_key: str
+    future: asyncio.Future
+    interval: float
+    next_poll_at: float = field(default_factory=time.monotonic)
+    last_status: Optional[str] = None
+
+
+class RunPodJobPoller:
+    """
+    Shared /status poller for all outstanding RunPod jobs.
+
+    A single background task polls every tracked job id when it is due, using
+    one pooled HTTP client. Each job backs off exponentially between polls
+    (initial -> max interval), so short jobs resolve quickly while hour-long
+    transcriptions cost only a handful of requests per minute.
+
+    Usage:
+        poller = get_runpod_job_poller()
+        status = await poller.wait(base_url, api_key, job_id, timeout=300)
+    """
+
+    def __init__(
+        self,
+        initial_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        backoff_factor: float = 1.5,
+    ):
+        """
+        Initialize poller.
+
+        Args:
+            initial_interval: Seconds before the first status poll (defaults to config)
+            max_interval: Upper bound for the per-job poll interval (defaults to config)
+            backoff_factor: Multiplier applied to the interval after each poll
+        """
+        self.initial_interval = initial_interval or settings.RUNPOD_POLL_INITIAL_INTERVAL
+        self.max_interval = max_interval or settings.RUNPOD_POLL_MAX_INTERVAL
+        self.backoff_factor = backoff_factor
+
+        self._jobs: Dict[str, _PendingJob] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of jobs currently being polled."""
+        return len(self._jobs)
+
+    def _ensure_running(self) -> None:
+        """Start (or restart on a new event loop) the background poll task."""
+        loop = asyncio.get_running_loop()
+
+        if self._loop is not loop:
+            # Futures from a previous loop cannot be awaited here
+            self._jobs = {}
+            self._wakeup = asyncio.Event()
+            self._task = None
+            self._loop = loop
+
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    def track(self, base_url: str, api_key: str, job_id: str) -> asyncio.Future:
+        """
+        Start tracking a job and return the future resolved with its final status.
+
+        Tracking an already tracked job returns the existing future, so
+        concurrent waiters on the same job share a single poll stream.
+
+        Args:
+            base_url: Endpoint base URL
+            api_key: RunPod API key
+            job_id: RunPod job id
+
+        Returns:
+            Future resolved with the terminal /status payload
+        """
+        self._ensure_running()
+
+        pending = self._jobs.get(job_id)
+        if pending is None:
+            pending = _PendingJob(
+                job_id=job_id,
+                base_url=base_url,
+                api_key=api_key,
+                future=self._loop.create_future(),
+                interval=self.initial_interval,
+                next_poll_at=time.monotonic() + self.initial_interval,
+            )
+            self._jobs[job_id] = pending
+            self._wakeup.set()
+
+        return pending.future
+
+    async def wait(
+        self,
+        base_url: str,
+        api_key: str,
+        job_id: str,
+        timeout: float,
+    ) -> Dict[str, Any]:
+        """
+        Wait for a job to reach a terminal status.
+
+        On timeout the job keeps being polled, so a retry resuming the same
+        job id picks up the result without resubmitting.
+
+        Args:
+            base_url: Endpoint base URL
+            api_key: RunPod API key
+            job_id: RunPod job id
+            timeout: Max seconds to wait
+
+        Returns:
+            Terminal /status payload
+
+        Raises:
+            httpx.TimeoutException: If the job did not finish in time
+            RunPodJobNotFoundError: If RunPod does not know the job id
+        """
+        future = self.track(base_url, api_key, job_id)
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            pending = self._jobs.get(job_id)
+            status = pending.last_status if pending else None
+            raise httpx.TimeoutException(
+                f"RunPod job {job_id} not finished after {timeout}s (status: {status})"
+            )
+
+    async def _run(self) -> None:
+        """Background loop: poll due jobs, then sleep until the next one is due."""
+        async with httpx.AsyncClient(timeout=30) as client:
+            while True:
+                if not self._jobs:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                now = time.monotonic()
+                due = [job for job in self._jobs.values() if job.next_poll_at <= now]
+
+                if due:
+                    await asyncio.gather(
+                        *(self._poll_job(client, job) for job in due),
+                        return_exceptions=True,
+                    )
+
+                if not self._jobs:
+                    continue
+
+                sleep_for = max(
+                    0.0,
+                    min(job.next_poll_at for job in self._jobs.values()) - time.monotonic(),
+                )
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=sleep_for)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _poll_job(self, client: httpx.AsyncClient, job: _PendingJob) -> None:
+        """Poll a single job once and resolve its future if it finished."""
+        try:
+            response = await client.get(
+                f"{job.base_url}/status/{job.job_id}",
+                headers={"Authorization": f"Bearer {job.api_key}"},
+            )
+
+            if response.status_code == 404:
+                self._finish(job, error=RunPodJobNotFoundError(
+                    f"RunPod job {job.job_id} not found"
+                ))
+                return
+
+            response.raise_for_status()
+            data = response.json()
+
+        except Exception as e:
+            # Transient poll failure - keep the job and back off
+            logger.warning(
+                f"RunPod status poll failed",
+                job_id=job.job_id,
+                error=str(e),
+            )
+            self._schedule_next(job)
+            return
+
+        status = data.get("status")
+        job.last_status = status
+
+        if status in TERMINAL_STATUSES:
+            self._finish(job, result=data)
+        else:
+            self._schedule_next(job)
+
+    def _schedule_next(self, job: _PendingJob) -> None:
+        """Back off the job's poll interval."""
+        job.interval = min(job.interval * self.backoff_factor, self.max_interval)
+        job.next_poll_at = time.monotonic() + job.interval
+
+    def _finish(
+        self,
+        job: _PendingJob,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Stop tracking a job and wake its waiters."""
+        self._jobs.pop(job.job_id, None)
+
+        if job.future.done():
+            return
+
+        if error is not None:
+            job.future.set_exception(error)
+            # Avoid "exception was never retrieved" if every waiter timed out
+            job.future.exception()
+        else:
+            job.future.set_result(result)
+
+    async def close(self) -> None:
+        """Stop the background task (used on shutdown and in tests)."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+
+async def submit_runpod_job(
+    base_url: str,
+    api_key: str,
+    input_data: Dict[str, Any],
+    timeout: float = 30,
+) -> str:
+    """
+    Submit a job to a RunPod endpoint via /run.
+
+    Args:
+        base_url: Endpoint base URL
+        api_key: RunPod API key
+        input_data: Input payload for the handler
+        timeout: HTTP timeout for the submit request
+
+    Returns:
+        RunPod job id
+
+    Raises:
+        httpx.HTTPStatusError: On HTTP error
+        RuntimeError: If the response has no job id
+    """
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        response = await client.post(
+            f"{base_url}/run",
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+            json={"input": input_data},
+        )
+        response.raise_for_status()
+        data = response.json()
+
+    job_id = data.get("id")
+    if not job_id:
+        raise RuntimeError(f"RunPod /run returned no job id: {data}")
+
+    return job_id
+
+
+async def cancel_runpod_job(
+    base_url: str,
+    api_key: str,
+    job_id: str,
+    timeout: float = 10,
+) -> None:
+    """
+    Cancel a queued or running job via /cancel.
+
+    Args:
+        base_url: Endpoint base URL
+        api_key: RunPod API key
+        job_id: RunPod job id
+        timeout: HTTP timeout for the cancel request
+
+    Raises:
+        httpx.HTTPStatusError: On HTTP error
+    """
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        response = await client.post(
+            f"{base_url}/cancel/{job_id}",
+            headers={"Authorization": f"Bearer {api_key}"},
+        )
+        response.raise_for_status()
+
+
+# Keeps fire-and-forget cancel requests referenced until they finish
+_cancel_tasks: Set[asyncio.Task] = set()
+
+
+def _cancel_in_background(base_url: str, api_key: str, job_id: str) -> None:
+    """Cancel a job on RunPod without waiting (failures are logged)."""
+
+    async def cancel() -> None:
+        try:
+            await cancel_runpod_job(base_url, api_key, job_id)
+            logger.info(f"Cancelled RunPod job", job_id=job_id)
+        except Exception as e:
+            logger.warning(f"Failed to cancel RunPod job", job_id=job_id, error=str(e))
+
+    task = asyncio.get_running_loop().create_task(cancel())
+    _cancel_tasks.add(task)
+    task.add_done_callback(_cancel_tasks.discard)
+
+
+async def run_runpod_job(
+    base_url: str,
+    api_key: str,
+    input_data: Dict[str, Any],
+    timeout: float,
+    poller: Optional["RunPodJobPoller"] = None,
+    store: Optional[RunPodJobStore] = None,
+) -> Dict[str, Any]:
+    """
+    Run a RunPod job in async job mode, resuming a previously submitted job.
+
+    If a job with the same fingerprint was already submitted (by an earlier
+    attempt or a previous process), it is resumed by id instead of submitting
+    a duplicate. The id is forgotten once the job reaches a terminal state,
+    except in the running background job's progress, which keeps completed
+    ids so a resumed background job does not pay for them again.
+    If the wait is cancelled because the background job was cancelled (see
+    background_jobs) or its owner abandoned it (see RunPodJobOwner), the job
+    is cancelled on RunPod and forgotten; other cancellations (shutdown) keep
+    it for a resume.
+
+    Args:
+        base_url: Endpoint base URL
+        api_key: RunPod API key
+        input_data: Input payload for the handler
+        timeout: Max seconds to wait for completion
+        poller: Poller to use (defaults to the shared poller)
+        store: Job store to use (defaults to the shared store)
+
+    Returns:
+        Handler output (the "output" field of the status payload)
+
+    Raises:
+        httpx.TimeoutException: If the job did not finish in time (resumable)
+        httpx.HTTPStatusError: If submitting the job failed
+        RuntimeError: If the job failed, was cancelled or timed out on RunPod
+    """
+    poller = poller or get_runpod_job_poller()
+    store = store or get_runpod_job_store()
+
+    fingerprint = runpod_job_fingerprint(base_url, input_data)
+    progress_key = f"runpod:{fingerprint}"
+    # Jobs saved in the background job's checkpoint survive a move to another worker
+    job_id = store.get(fingerprint) or get_job_progress(progress_key)
+
+    async def wait(job_id: str) -> Dict[str, Any]:
+        try:
+            return await poller.wait(base_url, api_key, job_id, timeout=timeout)
+        except asyncio.CancelledError:
+            owner = _job_owner.get()
+            if is_cancel_requested() or (owner is not None and owner.abandoned):
+                store.remove(fingerprint)
+                record_job_progress(progress_key, None)
+                _cancel_in_background(base_url, api_key, job_id)
+            raise
+
+    if job_id:
+        logger.info(f"Resuming RunPod job", job_id=job_id)
+        try:
+            result = await wait(job_id)
+        except RunPodJobNotFoundError:
+            logger.warning(f"RunPod job expired, resubmitting", job_id=job_id)
+            store.remove(fingerprint)
+            job_id = None
+
+    if not job_id:
+        job_id = await submit_runpod_job(base_url, api_key, input_data)
+        store.put(fingerprint, job_id)
+        record_job_progress(progress_key, job_id)
+        logger.info(f"Submitted RunPod job", job_id=job_id)
+        try:
+            result = await wait(job_id)
+        except RunPodJobNotFoundError:
+            store.remove(fingerprint)
+            record_job_progress(progress_key, None)
+            raise
+
+    store.remove(fingerprint)
+
+    status = result.get("status")
+    if status == "COMPLETED":
+        # Kept in the background job's progress until the whole job finishes
+        return result.get("output", {})
+
+    record_job_progress(progress_key, None)
+    error = result.get("error", "Unknown error")
+    raise RuntimeError(f"RunPod job {status.lower() if status else 'failed'}: {error}")
+
+
+# Global poller and store instances
+_job_poller: Optional[RunPodJobPoller] = None
+_job_store: Optional[RunPodJobStore] = None
+
+
+def get_runpod_job_poller() -> RunPodJobPoller:
+    """
+    Get or create the global RunPod job poller.
+
+    Returns:
+        Shared RunPodJobPoller instance
+    """
+    global _job_poller
+    if _job_poller is None:
+        _job_poller = RunPodJobPoller()
+    return _job_poller
+
+
+def get_runpod_job_store() -> RunPodJobStore:
+    """
+    Get or create the global RunPod job store.
+
+    Returns:
+        Shared RunPodJobStore instance
+    """
+    global _job_store
+    if _job_store is None:
+        _job_store = RunPodJobStore(path=settings.RUNPOD_JOB_STATE_PATH or None)
+    return _job_store
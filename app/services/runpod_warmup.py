@@ -0,0 +1,181 @@
+"""
+Pre-warming of RunPod serverless endpoints.
+
+Cold starts dominate latency of the Slovene ASR variants and GaMS. A user
+who opens the app to record will upload within a minute or two, so the
+client calls POST /api/v1/warmup when recording starts (and uploads warm the
+LLM endpoint while transcription runs). A warmup is a {"warmup": true} job
+submitted via /run; the handlers answer it without processing anything, but
+RunPod boots a worker to run it.
+
+Warmups are debounced per endpoint (RUNPOD_WARMUP_DEBOUNCE_SECONDS). A real
+job submitted within RUNPOD_WARMUP_WARM_SECONDS of a warmup counts as a warm
+hit; per-endpoint counters are reported by GET /api/v1/warmup/metrics.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Set
+
+from app.config import settings
+from app.services.runpod_jobs import submit_runpod_job
+from app.utils.logger import get_logger
+
+logger = get_logger("services.runpod_warmup")
+
+# Handler input answered by the no-op fast path of the RunPod handlers
+WARMUP_INPUT = {"warmup": True}
+
+
+@dataclass
+class EndpointWarmupStats:
+    """Warmup counters of one endpoint."""
+
+    warmups_sent: int = 0
+    warmups_failed: int = 0
+    jobs: int = 0
+    warm_hits: int = 0
+    last_warmup_at: Optional[float] = None  # time.monotonic() of the last warmup sent
+
+    @property
+    def warm_hit_rate(self) -> Optional[float]:
+        """Share of jobs that followed a warmup (None before the first job)."""
+        return self.warm_hits / self.jobs if self.jobs else None
+
+
+class EndpointWarmer:
+    """
+    Debounced warmup jobs and warm-hit counters per RunPod endpoint.
+
+    Endpoints are identified by the service's model name (one endpoint per
+    model, e.g. "clarin-slovene-asr-pyannote"), which keeps endpoint ids out
+    of metrics.
+
+    Usage:
+        warmer = get_endpoint_warmer()
+        warmer.warm("runpod_llm_gams-GaMS-9B-Instruct", base_url, api_key)   # non-blocking
+        warmer.record_job("runpod_llm_gams-GaMS-9B-Instruct")                # on every real job
+    """
+
+    def __init__(
+        self,
+        debounce_seconds: Optional[float] = None,
+        warm_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize warmer.
+
+        Args:
+            debounce_seconds: Min seconds between warmups of one endpoint (defaults to config)
+            warm_seconds: Seconds after a warmup during which jobs count as warm hits (defaults to config)
+        """
+        self.debounce_seconds = (
+            debounce_seconds if debounce_seconds is not None
+            else settings.RUNPOD_WARMUP_DEBOUNCE_SECONDS
+        )
+        self.warm_seconds = (
+            warm_seconds if warm_seconds is not None else settings.RUNPOD_WARMUP_WARM_SECONDS
+        )
+        self._stats: Dict[str, EndpointWarmupStats] = {}
+        # Keeps fire-and-forget submissions referenced until they finish
+        self._tasks: Set[asyncio.Task] = set()
+
+    def warm(self, endpoint: str, base_url: str, api_key: str) -> bool:
+        """
+        Submit a warmup job unless the endpoint was warmed recently.
+
+        Returns immediately; the /run submission runs in the background.
+
+        Args:
+            endpoint: Endpoint name (service model name)
+            base_url: Endpoint base URL (https://api.runpod.ai/v2/{endpoint_id})
+            api_key: RunPod API key
+
+        Returns:
+            True if a warmup was sent, False if debounced or disabled
+        """
+        if not settings.RUNPOD_WARMUP_ENABLED:
+            return False
+
+        stats = self._stats.setdefault(endpoint, EndpointWarmupStats())
+        now = time.monotonic()
+        if stats.last_warmup_at is not None and now - stats.last_warmup_at < self.debounce_seconds:
+            return False
+
+        stats.last_warmup_at = now
+        stats.warmups_sent += 1
+
+        task = asyncio.get_running_loop().create_task(self._submit(endpoint, base_url, api_key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        logger.info(f"RunPod warmup sent", endpoint=endpoint)
+        return True
+
+    def record_job(self, endpoint: str) -> bool:
+        """
+        Count a real job and whether it followed a warmup.
+
+        Args:
+            endpoint: Endpoint name (service model name)
+
+        Returns:
+            True if the job is a warm hit
+        """
+        stats = self._stats.setdefault(endpoint, EndpointWarmupStats())
+        warm_hit = (
+            stats.last_warmup_at is not None
+            and time.monotonic() - stats.last_warmup_at < self.warm_seconds
+        )
+        stats.jobs += 1
+        if warm_hit:
+            stats.warm_hits += 1
+        return warm_hit
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get warmup counters per endpoint.
+
+        Returns:
+            Dict of endpoint name to warmups_sent, warmups_failed, jobs, warm_hits, warm_hit_rate
+        """
+        return {
+            endpoint: {
+                "warmups_sent": stats.warmups_sent,
+                "warmups_failed": stats.warmups_failed,
+                "jobs": stats.jobs,
+                "warm_hits": stats.warm_hits,
+                "warm_hit_rate": stats.warm_hit_rate,
+            }
+            for endpoint, stats in self._stats.items()
+        }
+
+    async def _submit(self, endpoint: str, base_url: str, api_key: str) -> None:
+        """Submit the warmup job (failures are logged, not raised)."""
+        try:
+            job_id = await submit_runpod_job(base_url, api_key, WARMUP_INPUT)
+            logger.debug(f"RunPod warmup job submitted", endpoint=endpoint, job_id=job_id)
+        except Exception as e:
+            stats = self._stats[endpoint]
+            stats.warmups_failed += 1
+            # Allow the next request to retry right away
+            stats.last_warmup_at = None
+            logger.warning(f"RunPod warmup failed", endpoint=endpoint, error=str(e))
+
+
+# Global warmer instance
+_endpoint_warmer: Optional[EndpointWarmer] = None
+
+
+def get_endpoint_warmer() -> EndpointWarmer:
+    """
+    Get or create the global endpoint warmer.
+
+    Returns:
+        Shared EndpointWarmer instance
+    """
+    global _endpoint_warmer
+    if _endpoint_warmer is None:
+        _endpoint_warmer = EndpointWarmer()
+    return _endpoint_warmer
@@ -1,9 +1,24 @@
 """
 Spell-check service factory and singleton management.
+
+Spelling issues are computed when a text is completed or edited and stored
+encrypted next to it (spelling_issues, spelling_dictionary_version columns
+of transcriptions and cleaned entries). Reads serve the stored issues and
+only recompute them if they are missing or were computed with another
+dictionary version.
 """
-from typing import Optional
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.schemas.spellcheck import SpellingIssue
+from app.services.envelope_encryption import EnvelopeEncryptionService
+from app.services.spellcheck_base import SpellCheckService
+from app.services.spellcheck_engine import get_spellcheck_engine
 from app.services.spellcheck_slovenian import SlovenianSpellCheckService
+from app.utils.encryption_helpers import decrypt_json, encrypt_json
 from app.utils.logger import get_logger
 
 logger = get_logger("services.spellcheck")
@@ -26,7 +41,9 @@ def initialize_slovenian_spellcheck() -> bool:
     """
     Initialize the Slovenian spell-check service singleton.
 
-    Called during app startup to pre-load the dictionary.
+    Called after app startup (in a worker thread, see
+    app.services.startup_warmup) to load the dictionary; until then texts
+    are not spell-checked.
 
     Returns:
         True if initialized successfully, False otherwise
@@ -34,12 +51,148 @@ def initialize_slovenian_spellcheck() -> bool:
     global _slovenian_service
 
     logger.info("Initializing Slovenian spell-check service...")
-    _slovenian_service = SlovenianSpellCheckService()
+    service = SlovenianSpellCheckService()
 
-    if _slovenian_service.load():
+    # Published only once loaded (runs in a worker thread while requests are served)
+    if service.load():
+        _slovenian_service = service
         logger.info("Slovenian spell-check service initialized successfully")
         return True
     else:
         logger.warning("Failed to initialize Slovenian spell-check service")
-        _slovenian_service = None
         return False
+
+
+def get_spellcheck_service(language_code: Optional[str]) -> Optional[SpellCheckService]:
+    """
+    Get the loaded spell-check service for a language.
+
+    Args:
+        language_code: Language of the text (e.g., "sl")
+
+    Returns:
+        Spell-check service, or None if texts in this language are not
+        spell-checked (disabled, unsupported language or dictionary not loaded)
+    """
+    if not settings.SPELLCHECK_ENABLED or language_code != SlovenianSpellCheckService.LANGUAGE_CODE:
+        return None
+    service = get_slovenian_spellcheck_service()
+    if service is None or not service.is_loaded():
+        return None
+    return service
+
+
+async def _check_text(service: SpellCheckService, text: str) -> List[SpellingIssue]:
+    """Check text with the shared engine (memoized, lookups off the event loop)."""
+    return await get_spellcheck_engine().check_text(service, text)
+
+
+async def compute_spelling_issues(
+    encryption_service: EnvelopeEncryptionService,
+    db: AsyncSession,
+    text: Optional[str],
+    language_code: Optional[str],
+    voice_entry_id: UUID,
+    user_id: UUID,
+) -> Tuple[Optional[bytes], Optional[str]]:
+    """
+    Spell-check a completed or edited text and encrypt the issues for storage.
+
+    Args:
+        encryption_service: Encryption service
+        db: Database session
+        text: Plaintext to check
+        language_code: Language of the text
+        voice_entry_id: VoiceEntry UUID (for DEK)
+        user_id: User UUID
+
+    Returns:
+        Tuple of (encrypted issues JSON, dictionary version), or (None, None)
+        if the text is not spell-checked or checking failed (reads then
+        compute the issues)
+    """
+    service = get_spellcheck_service(language_code)
+    if service is None or not text:
+        return None, None
+
+    try:
+        issues = await _check_text(service, text)
+        encrypted = await encrypt_json(
+            encryption_service,
+            db,
+            [issue.model_dump() for issue in issues],
+            voice_entry_id,
+            user_id,
+        )
+    except Exception as e:
+        logger.warning(
+            "Failed to compute spelling issues",
+            voice_entry_id=str(voice_entry_id),
+            error=str(e),
+        )
+        return None, None
+    return encrypted, service.get_dictionary_version()
+
+
+async def load_spelling_issues(
+    encryption_service: Optional[EnvelopeEncryptionService],
+    db: AsyncSession,
+    record: Any,
+    text: Optional[str],
+    language_code: Optional[str],
+    voice_entry_id: UUID,
+    user_id: UUID,
+) -> Optional[List[SpellingIssue]]:
+    """
+    Get the spelling issues of a stored text.
+
+    Returns the stored issues if they were computed with the current
+    dictionary version. Otherwise (no stored issues, dictionary updated)
+    they are recomputed and set on the record, to be saved with the
+    session's commit.
+
+    Args:
+        encryption_service: Encryption service
+        db: Database session
+        record: Transcription or CleanedEntry the text belongs to
+        text: Decrypted text the issues are for
+        language_code: Language of the text
+        voice_entry_id: VoiceEntry UUID (for DEK)
+        user_id: User UUID
+
+    Returns:
+        List of spelling issues, or None if the text is not spell-checked
+    """
+    service = get_spellcheck_service(language_code)
+    if service is None or not text:
+        return None
+
+    version = service.get_dictionary_version()
+    if record.spelling_issues is not None and record.spelling_dictionary_version == version:
+        stored = await decrypt_json(
+            encryption_service,
+            db,
+            record.spelling_issues,
+            voice_entry_id,
+            user_id,
+        )
+        if stored is not None:
+            return [SpellingIssue(**issue) for issue in stored]
+
+    stale = record.spelling_issues is not None
+    issues = await _check_text(service, text)
+    record.spelling_issues = await encrypt_json(
+        encryption_service,
+        db,
+        [issue.model_dump() for issue in issues],
+        voice_entry_id,
+        user_id,
+    )
+    record.spelling_dictionary_version = version
+
+    logger.info(
+        "Spelling issues recomputed",
+        voice_entry_id=str(voice_entry_id),
+        stale=stale,
+    )
+    return issues
@@ -2,7 +2,7 @@
 Abstract base class for spell-check services.
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, Iterable, List, Optional
 
 from app.schemas.spellcheck import SpellingIssue
 
@@ -28,6 +28,32 @@ class SpellCheckService(ABC):
         """
         pass
 
+    @abstractmethod
+    def extract_words(self, text: str) -> List[str]:
+        """
+        Get the unique, normalized words of a text that are spell-checked.
+
+        Args:
+            text: Text to check
+
+        Returns:
+            Words in order of first occurrence
+        """
+        pass
+
+    @abstractmethod
+    def lookup_words(self, words: Iterable[str]) -> Dict[str, Optional[List[str]]]:
+        """
+        Look up words returned by extract_words() in the dictionary.
+
+        Args:
+            words: Words to look up
+
+        Returns:
+            Dict of word -> suggested corrections, or None if spelled correctly
+        """
+        pass
+
     @abstractmethod
     def is_loaded(self) -> bool:
         """Check if the dictionary is loaded and ready."""
@@ -47,3 +73,12 @@ class SpellCheckService(ABC):
             True if loaded successfully, False otherwise
         """
         pass
+
+    @abstractmethod
+    def get_dictionary_version(self) -> str:
+        """
+        Get the version of the loaded dictionary and check settings.
+
+        Stored spell-check results computed with another version are stale.
+        """
+        pass
@@ -0,0 +1,409 @@
+"""
+Compact, memory-mapped SymSpell dictionary.
+
+A pickled SymSpell object holds the word list and its deletes index
+(every delete of every word up to the max edit distance -> words) as Python
+dicts, which every worker process unpickles into its own memory. This module
+stores the same data in one read-only file of flat arrays:
+
+    words     strings + counts, in insertion order
+    deletes   strings + postings (word ids, in the order SymSpell added them)
+
+Both are open-addressing hash tables over the strings (fixed hash, so the
+table is built once). The file is memory-mapped: opening it takes
+milliseconds, and its pages live in the OS page cache, shared by all
+worker processes instead of being copied into each.
+
+MappedWords and MappedDeletes implement the part of the dict interface
+SymSpell.lookup() uses, so lookups run SymSpell's own algorithm and return
+the same suggestions as the in-memory dictionary.
+
+This module only depends on symspellpy (no app settings), so
+scripts/generate_slovenian_wordlist.py can use it at image build time.
+"""
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+from symspellpy import SymSpell
+
+MAGIC = b"SYMD"
+FORMAT_VERSION = 1
+
+# Section order in the file; (offset, length) of each is stored in the header
+SECTIONS = (
+    "word_offsets",      # uint32[word_count + 1] into word_blob
+    "word_blob",         # UTF-8 words
+    "word_counts",       # uint64[word_count]
+    "word_slots",        # uint32[2^k] hash table (word id + 1, 0 = empty)
+    "delete_offsets",    # uint32[delete_count + 1] into delete_blob
+    "delete_blob",       # UTF-8 deletes
+    "delete_slots",      # uint32[2^k] hash table (delete id + 1, 0 = empty)
+    "posting_offsets",   # uint32[delete_count + 1] into postings
+    "postings",          # uint32 word ids
+)
+HEADER = struct.Struct("<4sIIIIIIB" + "QQ" * len(SECTIONS))
+BYTE_ORDER = {"little": 0, "big": 1}[sys.byteorder]
+ALIGNMENT = 8
+
+
+def _hash(data: bytes, shift: int) -> int:
+    """Slot of a key: Fibonacci hashing of its CRC32 (stable across processes)."""
+    return ((zlib.crc32(data) * 0x9E3779B1) & 0xFFFFFFFF) >> shift
+
+
+def _table_bits(count: int) -> int:
+    """Bits of a hash table size that keeps the load factor at most 0.5."""
+    bits = 0
+    while (1 << bits) < count * 2:
+        bits += 1
+    return bits
+
+
+def _build_string_table(keys: List[bytes]) -> Tuple[array, bytes, array]:
+    """Offsets, blob and hash slots of a string table."""
+    offsets = array("I", [0])
+    total = 0
+    for key in keys:
+        total += len(key)
+        offsets.append(total)
+    if total > 0xFFFFFFFF:
+        raise ValueError("String table too large for 32-bit offsets")
+
+    bits = _table_bits(len(keys))
+    shift, mask = 32 - bits, (1 << bits) - 1
+    slots = array("I", bytes(4 << bits))
+    for index, key in enumerate(keys):
+        slot = _hash(key, shift)
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = index + 1
+    return offsets, b"".join(keys), slots
+
+
+class _StringTable:
+    """Read-only string table: id <-> string via the mapped hash slots."""
+
+    def __init__(self, offsets: memoryview, blob: memoryview, slots: memoryview):
+        self._offsets = offsets
+        self._blob = blob
+        self._slots = slots
+        bits = len(slots).bit_length() - 1
+        self._shift = 32 - bits
+        self._mask = len(slots) - 1
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def index(self, key: str) -> int:
+        """Id of a string, or -1 if not in the table."""
+        data = key.encode("utf-8")
+        slot = _hash(data, self._shift)
+        while True:
+            entry = self._slots[slot]
+            if not entry:
+                return -1
+            start, end = self._offsets[entry - 1], self._offsets[entry]
+            if end - start == len(data) and self._blob[start:end] == data:
+                return entry - 1
+            slot = (slot + 1) & self._mask
+
+    def key(self, index: int) -> str:
+        """String with an id."""
+        return str(self._blob[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+
+class MappedWords:
+    """Words and their counts (SymSpell._words)."""
+
+    def __init__(self, table: _StringTable, counts: memoryview):
+        self._table = table
+        self._counts = counts
+        # (key, id) of the last membership test; lookup() tests, then gets
+        self._last: Tuple[Optional[str], int] = (None, -1)
+
+    def _index(self, key: str) -> int:
+        last_key, last_index = self._last
+        if key == last_key:
+            return last_index
+        index = self._table.index(key)
+        self._last = (key, index)
+        return index
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._index(key) >= 0
+
+    def __getitem__(self, key: str) -> int:
+        index = self._index(key)
+        if index < 0:
+            raise KeyError(key)
+        return self._counts[index]
+
+    def get(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        index = self._index(key)
+        return self._counts[index] if index >= 0 else default
+
+    def key(self, index: int) -> str:
+        return self._table.key(index)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self._table)):
+            yield self._table.key(index)
+
+
+class MappedDeletes:
+    """Deletes index (SymSpell._deletes): delete -> words it was derived from."""
+
+    def __init__(self, table: _StringTable, posting_offsets: memoryview, postings: memoryview, words: MappedWords):
+        self._table = table
+        self._posting_offsets = posting_offsets
+        self._postings = postings
+        self._words = words
+        self._last: Tuple[Optional[str], int] = (None, -1)
+
+    def _index(self, key: str) -> int:
+        last_key, last_index = self._last
+        if key == last_key:
+            return last_index
+        index = self._table.index(key)
+        self._last = (key, index)
+        return index
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._index(key) >= 0
+
+    def __getitem__(self, key: str) -> List[str]:
+        index = self._index(key)
+        if index < 0:
+            raise KeyError(key)
+        start, end = self._posting_offsets[index], self._posting_offsets[index + 1]
+        return [self._words.key(word_id) for word_id in self._postings[start:end]]
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+
+class CompactDictionary:
+    """
+    A compact dictionary file, memory-mapped read-only.
+
+    Attributes:
+        max_edit_distance: Max dictionary edit distance the deletes were built for
+        prefix_length: SymSpell prefix length the deletes were built for
+        words: MappedWords
+        deletes: MappedDeletes
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open a dictionary file.
+
+        Args:
+            path: File written by write_compact_dictionary()
+
+        Raises:
+            ValueError: If the file is not a compact dictionary of this format
+                or byte order
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views: List[memoryview] = []
+
+        try:
+            if len(self._mmap) < HEADER.size:
+                raise ValueError("Not a compact dictionary file")
+            fields = HEADER.unpack_from(self._mmap, 0)
+            magic, version, self.max_edit_distance, self.prefix_length, self._max_length, \
+                word_count, delete_count, byte_order = fields[:8]
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError("Not a compact dictionary file (or an older format)")
+            if byte_order != BYTE_ORDER:
+                raise ValueError("Compact dictionary was built on a machine of another byte order")
+
+            locations = fields[8:]
+            buffer = memoryview(self._mmap)
+            self._views.append(buffer)
+            sections = {}
+            for i, name in enumerate(SECTIONS):
+                offset, length = locations[2 * i], locations[2 * i + 1]
+                view = buffer[offset:offset + length]
+                self._views.append(view)
+                if name.endswith("_blob"):
+                    sections[name] = view
+                else:
+                    sections[name] = view.cast("Q" if name == "word_counts" else "I")
+                    self._views.append(sections[name])
+        except Exception:
+            self.close()
+            raise
+
+        self.words = MappedWords(
+            _StringTable(sections["word_offsets"], sections["word_blob"], sections["word_slots"]),
+            sections["word_counts"],
+        )
+        self.deletes = MappedDeletes(
+            _StringTable(sections["delete_offsets"], sections["delete_blob"], sections["delete_slots"]),
+            sections["posting_offsets"],
+            sections["postings"],
+            self.words,
+        )
+        if len(self.words) != word_count or len(self.deletes) != delete_count:
+            self.close()
+            raise ValueError("Compact dictionary file is truncated")
+
+    def to_symspell(self) -> SymSpell:
+        """
+        Get a SymSpell instance that looks words up in this dictionary.
+
+        The instance's dictionaries are replaced by the mapped ones
+        (attributes of symspellpy 6.9 used by lookup()); it must not be
+        modified.
+
+        Returns:
+            SymSpell backed by the memory-mapped file
+        """
+        symspell = SymSpell(
+            max_dictionary_edit_distance=self.max_edit_distance,
+            prefix_length=self.prefix_length,
+        )
+        symspell._words = self.words
+        symspell._deletes = self.deletes
+        symspell._max_length = self._max_length
+        return symspell
+
+    def close(self) -> None:
+        """Release the mapping (the dictionary must not be used afterwards)."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+
+def _align(f) -> None:
+    padding = -f.tell() % ALIGNMENT
+    if padding:
+        f.write(bytes(padding))
+
+
+def write_compact_dictionary(symspell: SymSpell, path: Union[str, Path]) -> Tuple[int, int]:
+    """
+    Write the dictionary of a SymSpell instance as a compact dictionary file.
+
+    Written to a temporary file and renamed, so processes opening the path
+    never see a partial file.
+
+    Args:
+        symspell: SymSpell with its dictionary loaded (symspellpy 6.9)
+        path: Output file
+
+    Returns:
+        Tuple of (word count, delete count)
+    """
+    words = list(symspell._words.items())
+    word_ids = {word: index for index, (word, _) in enumerate(words)}
+    deletes = list(symspell._deletes.items())
+
+    posting_offsets = array("I", [0])
+    postings = array("I")
+    for _, suggestions in deletes:
+        postings.extend(word_ids[word] for word in suggestions)
+        posting_offsets.append(len(postings))
+
+    word_offsets, word_blob, word_slots = _build_string_table([word.encode("utf-8") for word, _ in words])
+    delete_offsets, delete_blob, delete_slots = _build_string_table([delete.encode("utf-8") for delete, _ in deletes])
+    sections = {
+        "word_offsets": word_offsets,
+        "word_blob": word_blob,
+        "word_counts": array("Q", [min(count, 0xFFFFFFFFFFFFFFFF) for _, count in words]),
+        "word_slots": word_slots,
+        "delete_offsets": delete_offsets,
+        "delete_blob": delete_blob,
+        "delete_slots": delete_slots,
+        "posting_offsets": posting_offsets,
+        "postings": postings,
+    }
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(bytes(HEADER.size))
+            locations = []
+            for name in SECTIONS:
+                _align(f)
+                offset = f.tell()
+                data = sections[name]
+                f.write(data if isinstance(data, bytes) else data.tobytes())
+                locations.extend((offset, f.tell() - offset))
+            f.seek(0)
+            f.write(HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                symspell._max_dictionary_edit_distance,
+                symspell._prefix_length,
+                symspell._max_length,
+                len(words),
+                len(deletes),
+                BYTE_ORDER,
+                *locations,
+            ))
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return len(words), len(deletes)
+
+
+def build_symspell(wordlist_path: Union[str, Path], max_edit_distance: int, prefix_length: int) -> SymSpell:
+    """
+    Build an in-memory SymSpell dictionary from a word list.
+
+    Args:
+        wordlist_path: Word list file (one word per line, no frequencies)
+        max_edit_distance: Max dictionary edit distance
+        prefix_length: SymSpell prefix length
+
+    Returns:
+        SymSpell with all words added (count 1 each)
+    """
+    symspell = SymSpell(max_dictionary_edit_distance=max_edit_distance, prefix_length=prefix_length)
+    # Using create_dictionary_entry for each word (more reliable than load_dictionary)
+    with open(wordlist_path, "r", encoding="utf-8") as f:
+        for line in f:
+            word = line.strip()
+            if word:  # Skip empty lines
+                symspell.create_dictionary_entry(word, 1)
+    return symspell
+
+
+def build_compact_dictionary(
+    wordlist_path: Union[str, Path],
+    output_path: Union[str, Path],
+    max_edit_distance: int,
+    prefix_length: int,
+) -> Tuple[int, int]:
+    """
+    Build a compact dictionary file from a word list.
+
+    Args:
+        wordlist_path: Word list file (one word per line)
+        output_path: Compact dictionary file to write
+        max_edit_distance: Max dictionary edit distance
+        prefix_length: SymSpell prefix length
+
+    Returns:
+        Tuple of (word count, delete count)
+    """
+    return write_compact_dictionary(build_symspell(wordlist_path, max_edit_distance, prefix_length), output_path)
@@ -0,0 +1,208 @@
+"""
+Word-level memoized spell-check engine with an async API.
+
+check_text() of a spell-check service looks up every unique word of a text
+in the dictionary (SymSpell, max edit distance 2), which is CPU-bound and
+blocks the event loop for long transcripts. The engine instead:
+
+- memoizes word -> verdict in a process-wide bounded LRU (WordVerdictCache).
+  Word frequencies are Zipfian, so most words of a new text were already
+  looked up for earlier texts and cost a dict lookup.
+- looks up the remaining words as one batch in a worker thread.
+
+Lookups are pure Python, so worker threads do not run them in parallel; they
+keep the event loop responsive. A process pool would need its own copy of
+the dictionary (hundreds of MB) in every process.
+
+Verdicts are only valid for the dictionary they were computed with; the
+cache is cleared when the dictionary version changes.
+"""
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.config import settings
+from app.schemas.spellcheck import SpellingIssue
+from app.services.spellcheck_base import SpellCheckService
+from app.utils.logger import get_logger
+
+logger = get_logger("services.spellcheck_engine")
+
+
+class WordVerdictCache:
+    """
+    Bounded LRU of word -> suggested corrections (None = spelled correctly).
+
+    Thread-safe; shared by all requests and jobs of the process.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of words kept (0 disables caching)
+        """
+        self._max_size = max_size
+        self._version: Optional[str] = None
+        self._verdicts: "OrderedDict[str, Optional[Tuple[str, ...]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(
+        self,
+        version: str,
+        words: Iterable[str],
+    ) -> Tuple[Dict[str, Optional[List[str]]], List[str]]:
+        """
+        Get cached verdicts of words.
+
+        Args:
+            version: Dictionary version of the lookup (a new version clears the cache)
+            words: Words to get
+
+        Returns:
+            Tuple of (verdicts of cached words, words not in the cache)
+        """
+        found: Dict[str, Optional[List[str]]] = {}
+        missing: List[str] = []
+        with self._lock:
+            if version != self._version:
+                self._verdicts.clear()
+                self._version = version
+            for word in words:
+                try:
+                    verdict = self._verdicts[word]
+                except KeyError:
+                    missing.append(word)
+                    continue
+                self._verdicts.move_to_end(word)
+                found[word] = list(verdict) if verdict is not None else None
+            self.hits += len(found)
+            self.misses += len(missing)
+        return found, missing
+
+    def put_many(self, version: str, verdicts: Dict[str, Optional[List[str]]]) -> None:
+        """
+        Cache verdicts, evicting the least recently used words.
+
+        Args:
+            version: Dictionary version the verdicts were computed with
+            verdicts: Dict of word -> suggested corrections or None
+        """
+        with self._lock:
+            if self._version is None:
+                self._version = version
+            elif version != self._version:
+                # Dictionary changed while the words were looked up
+                return
+            for word, verdict in verdicts.items():
+                self._verdicts[word] = tuple(verdict) if verdict is not None else None
+                self._verdicts.move_to_end(word)
+            while len(self._verdicts) > self._max_size:
+                self._verdicts.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._verdicts)
+
+
+class SpellCheckEngine:
+    """
+    Checks texts with a spell-check service, memoizing word verdicts and
+    running dictionary lookups in worker threads.
+    """
+
+    def __init__(self, cache: WordVerdictCache, lookup_threads: int):
+        """
+        Initialize the engine.
+
+        Args:
+            cache: Word verdict cache
+            lookup_threads: Number of worker threads for dictionary lookups
+        """
+        self.cache = cache
+        self._lookup_threads = max(1, lookup_threads)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._lookup_threads,
+                thread_name_prefix="spellcheck",
+            )
+        return self._executor
+
+    async def check_text(self, service: SpellCheckService, text: str) -> List[SpellingIssue]:
+        """
+        Check text for spelling issues.
+
+        Same results as service.check_text(), without blocking the event loop
+        on dictionary lookups.
+
+        Args:
+            service: Loaded spell-check service
+            text: Text to check
+
+        Returns:
+            Deduplicated list of misspelled words with suggestions
+        """
+        if not service.is_loaded():
+            logger.warning("Spell-check called but dictionary not loaded")
+            return []
+
+        start_time = time.time()
+
+        words = service.extract_words(text)
+        version = service.get_dictionary_version()
+        verdicts, missing = self.cache.get_many(version, words)
+
+        if missing:
+            looked_up = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), service.lookup_words, missing
+            )
+            self.cache.put_many(version, looked_up)
+            verdicts.update(looked_up)
+
+        issues = [
+            SpellingIssue(word=word, suggestions=verdicts[word])
+            for word in words
+            if verdicts[word] is not None
+        ]
+
+        logger.info(
+            "Spell-check completed",
+            elapsed_ms=round((time.time() - start_time) * 1000, 2),
+            words_checked=len(words),
+            words_looked_up=len(missing),
+            issues_found=len(issues),
+        )
+        return issues
+
+    def shutdown(self) -> None:
+        """Stop the lookup threads (lookups in progress are not waited for)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_engine: Optional[SpellCheckEngine] = None
+
+
+def get_spellcheck_engine() -> SpellCheckEngine:
+    """
+    Get or create the global spell-check engine.
+
+    Returns:
+        Shared SpellCheckEngine instance
+    """
+    global _engine
+    if _engine is None:
+        _engine = SpellCheckEngine(
+            WordVerdictCache(settings.SPELLCHECK_WORD_CACHE_SIZE),
+            settings.SPELLCHECK_LOOKUP_THREADS,
+        )
+    return _engine
@@ -1,19 +1,24 @@
 """
 Slovenian spell-check service using SymSpellPy with Sloleks dictionary.
 """
-import pickle
+import fcntl
+import hashlib
 import re
 import time
 from pathlib import Path
-from typing import List, Optional
-
-from symspellpy import SymSpell, Verbosity
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 
 from app.config import settings
 from app.schemas.spellcheck import SpellingIssue
 from app.services.spellcheck_base import SpellCheckService
 from app.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    # symspellpy is imported when the dictionary is loaded, not at app import
+    from symspellpy import SymSpell
+
+    from app.services.spellcheck_dictionary import CompactDictionary
+
 
 logger = get_logger("services.spellcheck_slovenian")
 
@@ -26,8 +31,9 @@ class SlovenianSpellCheckService(SpellCheckService):
     """
     Slovenian spell-check service using SymSpellPy.
 
-    Loads dictionary from pickle if available (fast ~2-5s),
-    otherwise builds from word list and saves pickle (~60-90s).
+    Memory-maps a compact dictionary file if available (milliseconds; pages
+    are shared by all worker processes through the OS page cache),
+    otherwise builds it from the word list (~60-90s) and maps it.
     """
 
     LANGUAGE_CODE = "sl"
@@ -35,7 +41,7 @@ class SlovenianSpellCheckService(SpellCheckService):
     def __init__(
         self,
         wordlist_path: Optional[str] = None,
-        pickle_path: Optional[str] = None,
+        dictionary_path: Optional[str] = None,
         max_edit_distance: Optional[int] = None,
         prefix_length: Optional[int] = None,
         suggestion_count: Optional[int] = None,
@@ -46,21 +52,30 @@ class SlovenianSpellCheckService(SpellCheckService):
 
         Args:
             wordlist_path: Path to word list file (one word per line)
-            pickle_path: Path to pickle file for fast loading
+            dictionary_path: Path to compact dictionary file (built from the
+                word list if missing)
             max_edit_distance: Maximum edit distance for suggestions (default from config)
             prefix_length: SymSpell optimization parameter (default from config)
             suggestion_count: Maximum suggestions per word (default from config)
             min_word_length: Skip words shorter than this (default from config)
         """
-        self._symspell: Optional[SymSpell] = None
+        self._symspell: Optional["SymSpell"] = None
+        self._dictionary: Optional["CompactDictionary"] = None
         self._loaded = False
+        self._dictionary_version: Optional[str] = None
 
         # Paths - use provided or fall back to config
-        # Word list: from image (SPELLCHECK_WORDLIST_PATH)
-        # Pickle: from mounted cache volume (SPELLCHECK_CACHE_PATH)
+        # Word list and prebuilt dictionary: from image (SPELLCHECK_WORDLIST_PATH,
+        # SPELLCHECK_DICTIONARY_PATH)
+        # Dictionary built at runtime: in mounted cache volume (SPELLCHECK_CACHE_PATH)
         self._wordlist_path = Path(wordlist_path) if wordlist_path else Path(settings.SPELLCHECK_WORDLIST_PATH)
-        cache_path = Path(settings.SPELLCHECK_CACHE_PATH)
-        self._pickle_path = Path(pickle_path) if pickle_path else cache_path / "symspell_sl.pkl"
+        if dictionary_path:
+            self._dictionary_paths = [Path(dictionary_path)]
+        else:
+            self._dictionary_paths = [
+                Path(settings.SPELLCHECK_DICTIONARY_PATH),
+                Path(settings.SPELLCHECK_CACHE_PATH) / "symspell_sl.dict",
+            ]
 
         # Configuration - use provided or fall back to config
         self._max_edit_distance = max_edit_distance or settings.SPELLCHECK_MAX_EDIT_DISTANCE
@@ -71,7 +86,7 @@ class SlovenianSpellCheckService(SpellCheckService):
         logger.info(
             "Slovenian spell-check service initialized",
             wordlist_path=str(self._wordlist_path),
-            pickle_path=str(self._pickle_path),
+            dictionary_paths=[str(path) for path in self._dictionary_paths],
             max_edit_distance=self._max_edit_distance,
             prefix_length=self._prefix_length,
             suggestion_count=self._suggestion_count,
@@ -80,7 +95,7 @@ class SlovenianSpellCheckService(SpellCheckService):
 
     def load(self) -> bool:
         """
-        Load dictionary from pickle or build from word list.
+        Map the compact dictionary, building it from the word list if needed.
 
         Returns:
             True if loaded successfully, False otherwise
@@ -88,90 +103,103 @@ class SlovenianSpellCheckService(SpellCheckService):
         if self._loaded:
             return True
 
-        # Try loading from pickle first (fast)
-        if self._pickle_path.exists():
-            if self._load_from_pickle():
+        # Try a prebuilt dictionary first (fast)
+        for path in self._dictionary_paths:
+            if path.exists() and self._load_dictionary(path):
                 return True
-            # If pickle loading failed, try word list
 
         # Fall back to building from word list
         if self._wordlist_path.exists():
             return self._build_from_wordlist()
 
         logger.error(
-            "Neither pickle nor word list found",
-            pickle_path=str(self._pickle_path),
+            "Neither dictionary nor word list found",
+            dictionary_paths=[str(path) for path in self._dictionary_paths],
             wordlist_path=str(self._wordlist_path),
         )
         return False
 
-    def _load_from_pickle(self) -> bool:
-        """Load SymSpell from pickle file."""
+    def _load_dictionary(self, path: Path) -> bool:
+        """Memory-map a compact dictionary file built with the configured settings."""
+        from app.services.spellcheck_dictionary import CompactDictionary
+
         try:
             start_time = time.time()
 
-            with open(self._pickle_path, "rb") as f:
-                self._symspell = pickle.load(f)
+            dictionary = CompactDictionary(path)
+            if (dictionary.max_edit_distance, dictionary.prefix_length) != (
+                self._max_edit_distance, self._prefix_length
+            ):
+                logger.warning(
+                    "Dictionary built with other settings, ignoring it",
+                    dictionary_path=str(path),
+                    max_edit_distance=dictionary.max_edit_distance,
+                    prefix_length=dictionary.prefix_length,
+                )
+                dictionary.close()
+                return False
 
+            self._dictionary = dictionary
+            self._symspell = dictionary.to_symspell()
             self._loaded = True
             load_time = time.time() - start_time
 
             logger.info(
-                "Slovenian dictionary loaded from pickle",
-                load_time_seconds=round(load_time, 2),
-                pickle_path=str(self._pickle_path),
+                "Slovenian dictionary mapped",
+                load_time_seconds=round(load_time, 3),
+                word_count=self._symspell.word_count,
+                dictionary_path=str(path),
             )
             return True
 
         except Exception as e:
             logger.error(
-                "Failed to load pickle, will try word list",
+                "Failed to load dictionary, will try word list",
                 error=str(e),
-                pickle_path=str(self._pickle_path),
+                dictionary_path=str(path),
             )
             return False
 
     def _build_from_wordlist(self) -> bool:
-        """Build SymSpell dictionary from word list and save pickle."""
-        try:
-            start_time = time.time()
-
-            self._symspell = SymSpell(
-                max_dictionary_edit_distance=self._max_edit_distance,
-                prefix_length=self._prefix_length,
-            )
+        """Build the compact dictionary from the word list and map it."""
+        from app.services.spellcheck_dictionary import build_compact_dictionary
 
-            # Load word list - one word per line, no frequency data
-            # Using create_dictionary_entry for each word (more reliable than load_dictionary)
-            word_count = 0
-            with open(self._wordlist_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    word = line.strip()
-                    if word:  # Skip empty lines
-                        # Use count=1 for all words (no frequency data available)
-                        self._symspell.create_dictionary_entry(word, 1)
-                        word_count += 1
+        # Written to the last path (the cache volume); workers starting at the
+        # same time build it once
+        path = self._dictionary_paths[-1]
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path.with_name(path.name + ".lock"), "w") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                # Another worker may have built it while we waited
+                if path.exists() and self._load_dictionary(path):
+                    return True
+
+                start_time = time.time()
+                word_count, delete_count = build_compact_dictionary(
+                    self._wordlist_path,
+                    path,
+                    max_edit_distance=self._max_edit_distance,
+                    prefix_length=self._prefix_length,
+                )
 
             if word_count == 0:
+                path.unlink(missing_ok=True)
                 logger.error(
                     "No words loaded from word list",
                     wordlist_path=str(self._wordlist_path),
                 )
                 return False
 
-            build_time = time.time() - start_time
-
             logger.info(
                 "Slovenian dictionary built from word list",
                 word_count=word_count,
-                build_time_seconds=round(build_time, 2),
+                delete_count=delete_count,
+                build_time_seconds=round(time.time() - start_time, 2),
                 wordlist_path=str(self._wordlist_path),
+                dictionary_path=str(path),
             )
-
-            # Save pickle for fast loading next time
-            self._save_pickle()
-            self._loaded = True
-            return True
+            return self._load_dictionary(path)
 
         except Exception as e:
             logger.error(
@@ -182,27 +210,6 @@ class SlovenianSpellCheckService(SpellCheckService):
             )
             return False
 
-    def _save_pickle(self) -> None:
-        """Save SymSpell to pickle file for fast loading."""
-        try:
-            # Ensure directory exists
-            self._pickle_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(self._pickle_path, "wb") as f:
-                pickle.dump(self._symspell, f)
-
-            logger.info(
-                "Slovenian dictionary saved to pickle",
-                pickle_path=str(self._pickle_path),
-            )
-
-        except Exception as e:
-            logger.warning(
-                "Failed to save pickle (will rebuild on next start)",
-                error=str(e),
-                pickle_path=str(self._pickle_path),
-            )
-
     def check_text(self, text: str) -> List[SpellingIssue]:
         """
         Check text for spelling issues.
@@ -219,56 +226,78 @@ class SlovenianSpellCheckService(SpellCheckService):
 
         start_time = time.time()
 
-        # Tokenize text into words
-        words = self._tokenize(text)
+        words = self.extract_words(text)
+        verdicts = self.lookup_words(words)
+        issues = [
+            SpellingIssue(word=word, suggestions=verdicts[word])
+            for word in words
+            if verdicts[word] is not None
+        ]
 
-        # Track unique misspelled words (deduplicate)
-        issues: dict[str, List[str]] = {}
-        words_checked = 0  # Count unique words actually checked
+        elapsed_ms = (time.time() - start_time) * 1000
+        issue_ratio = (len(issues) / len(words) * 100) if words else 0
 
-        for word in words:
+        logger.info(
+            "Spell-check completed",
+            elapsed_ms=round(elapsed_ms, 2),
+            words_checked=len(words),
+            issues_found=len(issues),
+            issue_ratio_pct=round(issue_ratio, 1),
+        )
+
+        return issues
+
+    def extract_words(self, text: str) -> List[str]:
+        """
+        Get the words of a text that are spell-checked.
+
+        Args:
+            text: Text to check
+
+        Returns:
+            Unique lowercase words (at least min_word_length long), in order
+            of first occurrence
+        """
+        words: Dict[str, None] = {}
+        for word in self._tokenize(text):
             # Skip short words
             if len(word) < self._min_word_length:
                 continue
-
             # Normalize to lowercase for lookup
-            word_lower = word.lower()
+            words.setdefault(word.lower(), None)
+        return list(words)
 
-            # Skip if already processed
-            if word_lower in issues:
-                continue
+    def lookup_words(self, words: Iterable[str]) -> Dict[str, Optional[List[str]]]:
+        """
+        Look up words in the dictionary.
+
+        CPU-bound (a SymSpell lookup per word); async callers run it in a
+        worker thread (see app.services.spellcheck_engine).
+
+        Args:
+            words: Lowercase words (see extract_words)
 
-            words_checked += 1
+        Returns:
+            Dict of word -> suggested corrections if misspelled, None if the
+            word is spelled correctly (or no correction is known)
+        """
+        from symspellpy import Verbosity
 
-            # Check if word is in dictionary
+        verdicts: Dict[str, Optional[List[str]]] = {}
+        for word in words:
             suggestions = self._symspell.lookup(
-                word_lower,
+                word,
                 Verbosity.CLOSEST,
                 max_edit_distance=self._max_edit_distance,
             )
 
             # If word is correctly spelled, lookup returns the word itself as first suggestion
             # Only report if misspelled (first suggestion differs) and we have suggestions
-            if suggestions and suggestions[0].term != word_lower:
-                suggestion_terms = [s.term for s in suggestions[: self._suggestion_count]]
-                issues[word_lower] = suggestion_terms
-
-        elapsed_ms = (time.time() - start_time) * 1000
-        issue_count = len(issues)
-        issue_ratio = (issue_count / words_checked * 100) if words_checked > 0 else 0
-
-        logger.info(
-            "Spell-check completed",
-            elapsed_ms=round(elapsed_ms, 2),
-            words_checked=words_checked,
-            issues_found=issue_count,
-            issue_ratio_pct=round(issue_ratio, 1),
-        )
-
-        return [
-            SpellingIssue(word=word, suggestions=suggestions)
-            for word, suggestions in issues.items()
-        ]
+            if suggestions and suggestions[0].term != word:
+                verdicts[word] = [s.term for s in suggestions[: self._suggestion_count]]
+            else:
+                verdicts[word] = None
+        return verdicts
 
     def _tokenize(self, text: str) -> List[str]:
         """
@@ -288,6 +317,30 @@ class SlovenianSpellCheckService(SpellCheckService):
         """Check if dictionary is loaded."""
         return self._loaded
 
+    def get_dictionary_version(self) -> str:
+        """
+        Get the version of the loaded dictionary.
+
+        Derived from the dictionary size and the settings that change
+        check_text() results, so every worker loading the same dictionary
+        reports the same version.
+
+        Returns:
+            Short hex digest (empty string if not loaded)
+        """
+        if not self._loaded or self._symspell is None:
+            return ""
+        if self._dictionary_version is None:
+            identity = ":".join(str(value) for value in (
+                self.LANGUAGE_CODE,
+                self._symspell.word_count,
+                self._max_edit_distance,
+                self._suggestion_count,
+                self._min_word_length,
+            ))
+            self._dictionary_version = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:16]
+        return self._dictionary_version
+
     def get_language(self) -> str:
         """Get language code."""
         return self.LANGUAGE_CODE
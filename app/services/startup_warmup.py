@@ -0,0 +1,200 @@
+"""
+Background warm-up of heavy optional components.
+
+Startup used to wait for every component before the worker reported ready,
+including the Slovenian spell-check dictionary, which takes 60-90s to build
+from the word list when no prebuilt dictionary is available. The app now
+becomes ready as soon as the database and encryption are up; components that
+requests can do without are loaded in worker threads afterwards:
+
+- Until a component is ready, requests degrade as if it were disabled
+  (e.g. spelling issues are computed on a later read).
+- Component states (pending, warming, ready, failed) are reported by
+  /health/ready.
+
+With STARTUP_WARMUP_IN_BACKGROUND=false startup waits for the warm-up, as
+before.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from app.utils.logger import get_logger
+
+logger = get_logger("services.startup_warmup")
+
+PENDING = "pending"
+WARMING = "warming"
+READY = "ready"
+FAILED = "failed"
+
+
+async def _run_in_daemon_thread(func: Callable[[], Any], name: str) -> Any:
+    """
+    Run a blocking function in a daemon thread and wait for its result.
+
+    Unlike the default executor, a daemon thread does not hold up process
+    exit, so a dictionary build in progress does not delay a shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def set_result(result: Any, error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def run() -> None:
+        result, error = None, None
+        try:
+            result = func()
+        except BaseException as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(set_result, result, error)
+        except RuntimeError:
+            pass  # Event loop closed (shut down while warming)
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return await future
+
+
+@dataclass(eq=False)
+class _Component:
+    """A registered component and its warm-up state."""
+
+    name: str
+    load: Callable[[], bool]
+    status: str = PENDING
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+
+
+class ComponentWarmer:
+    """
+    Loads registered components in worker threads and tracks their state.
+
+    Usage:
+        warmer = get_component_warmer()
+        warmer.register("spellcheck_sl", initialize_slovenian_spellcheck)
+        warmer.start()          # background; or: await warmer.warm_all()
+        warmer.snapshot()       # {"spellcheck_sl": {"status": "warming", ...}}
+    """
+
+    def __init__(self):
+        """Initialize warmer without components."""
+        self._components: Dict[str, _Component] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def register(self, name: str, load: Callable[[], bool]) -> None:
+        """
+        Register a component.
+
+        Args:
+            name: Component name (reported by /health/ready)
+            load: Blocking loader, run in a worker thread; returns True if the
+                component is usable
+        """
+        self._components[name] = _Component(name=name, load=load)
+
+    def start(self) -> None:
+        """Start warming all pending components in the background (does not wait)."""
+        loop = asyncio.get_running_loop()
+        for name, component in self._components.items():
+            if component.status == PENDING and name not in self._tasks:
+                task = loop.create_task(self._warm(component))
+                task.add_done_callback(self._on_warm_done)
+                self._tasks[name] = task
+
+    async def warm_all(self) -> None:
+        """Warm all pending components and wait for them."""
+        self.start()
+        if self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def _warm(self, component: _Component) -> None:
+        """Run a component's loader in a worker thread and record the outcome."""
+        component.status = WARMING
+        component.started_at = time.monotonic()
+        logger.info("Warming up component", component=component.name)
+        try:
+            loaded = await _run_in_daemon_thread(component.load, f"warmup-{component.name}")
+        except Exception as e:
+            component.status = FAILED
+            component.error = str(e)
+            logger.warning("Component warm-up error", component=component.name, error=str(e))
+        else:
+            elapsed = round(time.monotonic() - component.started_at, 2)
+            if loaded:
+                component.status = READY
+                logger.info("Component warmed up", component=component.name, elapsed_seconds=elapsed)
+            else:
+                component.status = FAILED
+                component.error = "failed to load"
+                logger.warning("Component failed to load", component=component.name, elapsed_seconds=elapsed)
+        finally:
+            component.finished_at = time.monotonic()
+
+    @staticmethod
+    def _on_warm_done(task: asyncio.Task) -> None:
+        """Retrieve the outcome so a cancelled or crashed warm-up is not reported as unhandled."""
+        if not task.cancelled():
+            task.exception()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the warm-up state of each component.
+
+        Returns:
+            Dict of component name to status, elapsed_seconds (warming time
+            so far, or total once finished) and error
+        """
+        now = time.monotonic()
+        return {
+            name: {
+                "status": component.status,
+                "elapsed_seconds": (
+                    round((component.finished_at or now) - component.started_at, 2)
+                    if component.started_at is not None else None
+                ),
+                "error": component.error,
+            }
+            for name, component in self._components.items()
+        }
+
+    async def close(self) -> None:
+        """
+        Stop waiting for warm-ups in flight (used on shutdown and in tests).
+
+        Loaders already running in a thread run to completion.
+        """
+        tasks = [task for task in self._tasks.values() if not task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = {}
+
+
+# Global warmer instance
+_component_warmer: Optional[ComponentWarmer] = None
+
+
+def get_component_warmer() -> ComponentWarmer:
+    """
+    Get or create the global component warmer.
+
+    Returns:
+        Shared ComponentWarmer instance
+    """
+    global _component_warmer
+    if _component_warmer is None:
+        _component_warmer = ComponentWarmer()
+    return _component_warmer
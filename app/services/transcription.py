@@ -101,6 +101,17 @@ class TranscriptionService(ABC):
         """
         pass
 
+    def request_warmup(self) -> bool:
+        """
+        Ask the provider to get a worker ready (non-blocking).
+
+        Only providers with cold starts (RunPod endpoints) override this.
+
+        Returns:
+            True if a warmup was sent
+        """
+        return False
+
 
 def create_transcription_service(
     provider: str = "groq",
@@ -138,9 +149,17 @@ def create_transcription_service(
         # Import here to avoid circular dependency and fail gracefully if groq not installed
         try:
             from app.services.transcription_groq import GroqTranscriptionService
+            from app.config import settings
+
             return GroqTranscriptionService(
                 api_key=api_key,
-                model=model_name
+                model=model_name,
+                chunk_duration_seconds=settings.GROQ_CHUNK_DURATION_SECONDS,
+                chunk_overlap_seconds=settings.GROQ_CHUNK_OVERLAP_SECONDS,
+                use_silence_detection=settings.GROQ_USE_SILENCE_DETECTION,
+                chunk_format=settings.GROQ_CHUNK_FORMAT,
+                max_concurrent_chunks=settings.GROQ_MAX_CONCURRENT_CHUNKS,
+                requests_per_minute=settings.GROQ_TRANSCRIPTION_RPM
             )
         except ImportError as e:
             raise ValueError(
@@ -162,7 +181,9 @@ def create_transcription_service(
                 model=model_name,
                 poll_interval=settings.ASSEMBLYAI_POLL_INTERVAL,
                 timeout=settings.ASSEMBLYAI_TIMEOUT,
-                auto_delete=settings.ASSEMBLYAI_AUTO_DELETE
+                auto_delete=settings.ASSEMBLYAI_AUTO_DELETE,
+                webhook_url=settings.ASSEMBLYAI_WEBHOOK_URL,
+                webhook_secret=settings.ASSEMBLYAI_WEBHOOK_SECRET
             )
         except ImportError as e:
             raise ValueError(
@@ -196,7 +217,9 @@ def create_transcription_service(
                 timeout=settings.RUNPOD_TIMEOUT,
                 punctuate=settings.RUNPOD_PUNCTUATE,
                 denormalize=settings.RUNPOD_DENORMALIZE,
-                denormalize_style=settings.RUNPOD_DENORMALIZE_STYLE
+                denormalize_style=settings.RUNPOD_DENORMALIZE_STYLE,
+                async_jobs=settings.RUNPOD_ASYNC_JOBS,
+                audio_format=settings.SLOVENE_ASR_AUDIO_FORMAT
             )
         except ImportError as e:
             raise ValueError(
@@ -2,14 +2,15 @@
 AssemblyAI transcription service implementation.
 Supports async upload-submit-poll-delete workflow with GDPR compliance.
 """
-import asyncio
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 import httpx
 
+from app.services.assemblyai_poller import get_assemblyai_poller
 from app.services.transcription import TranscriptionService
+from app.utils.audio import get_audio_duration
 from app.utils.logger import get_logger
 
 logger = get_logger("transcription.assemblyai")
@@ -18,6 +19,9 @@ logger = get_logger("transcription.assemblyai")
 ASSEMBLYAI_UPLOAD_URL = "https://api.eu.assemblyai.com/v2/upload"
 ASSEMBLYAI_TRANSCRIPT_URL = "https://api.eu.assemblyai.com/v2/transcript"
 
+# Header AssemblyAI sends back on webhook calls (value = ASSEMBLYAI_WEBHOOK_SECRET)
+ASSEMBLYAI_WEBHOOK_AUTH_HEADER = "X-AssemblyAI-Webhook-Secret"
+
 
 class AssemblyAITranscriptionService(TranscriptionService):
     """
@@ -35,7 +39,9 @@ class AssemblyAITranscriptionService(TranscriptionService):
         model: str = "universal",
         poll_interval: float = DEFAULT_POLL_INTERVAL,
         timeout: float = DEFAULT_TIMEOUT,
-        auto_delete: bool = True
+        auto_delete: bool = True,
+        webhook_url: Optional[str] = None,
+        webhook_secret: Optional[str] = None
     ):
         """
         Initialize AssemblyAI transcription service.
@@ -43,15 +49,19 @@ class AssemblyAITranscriptionService(TranscriptionService):
         Args:
             api_key: AssemblyAI API key
             model: Speech model (default: "universal" for 99+ languages)
-            poll_interval: Seconds between status polls
+            poll_interval: Minimum seconds between status polls (shared poller adapts upward)
             timeout: Maximum seconds to wait for transcription
             auto_delete: Auto-delete transcript after extraction (GDPR compliance)
+            webhook_url: Public URL of the webhook route (None = polling only)
+            webhook_secret: Shared secret AssemblyAI sends back in the webhook auth header
         """
         self.api_key = api_key
         self.model = model
         self.poll_interval = poll_interval
         self.timeout = timeout
         self.auto_delete = auto_delete
+        self.webhook_url = webhook_url
+        self.webhook_secret = webhook_secret
 
         # 1-hour cache for available models (following Groq pattern)
         self._models_cache: Optional[list[Dict[str, Any]]] = None
@@ -147,6 +157,13 @@ class AssemblyAITranscriptionService(TranscriptionService):
                 payload["speakers_expected"] = speaker_count
             logger.info(f"Speaker diarization enabled with {speaker_count} expected speakers")
 
+        # Ask AssemblyAI to announce completion so the poller can resolve immediately
+        if self.webhook_url:
+            payload["webhook_url"] = self.webhook_url
+            if self.webhook_secret:
+                payload["webhook_auth_header_name"] = ASSEMBLYAI_WEBHOOK_AUTH_HEADER
+                payload["webhook_auth_header_value"] = self.webhook_secret
+
         async with httpx.AsyncClient(timeout=30.0) as client:
             response = await client.post(
                 ASSEMBLYAI_TRANSCRIPT_URL,
@@ -167,12 +184,21 @@ class AssemblyAITranscriptionService(TranscriptionService):
             logger.info(f"Transcription job submitted: id={transcript_id}")
             return transcript_id
 
-    async def _poll_transcription(self, transcript_id: str) -> Dict[str, Any]:
+    async def _poll_transcription(
+        self,
+        transcript_id: str,
+        audio_duration: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
-        Step 3: Poll for transcription completion.
+        Step 3: Wait for transcription completion.
+
+        Status polling is done by the shared AssemblyAIPoller, which tracks all
+        pending transcripts in one background task (and resolves immediately
+        when a webhook arrives).
 
         Args:
             transcript_id: ID of transcription job
+            audio_duration: Audio duration in seconds (paces the polls)
 
         Returns:
             Completed transcription response
@@ -180,42 +206,16 @@ class AssemblyAITranscriptionService(TranscriptionService):
         Raises:
             RuntimeError: If transcription fails or times out
         """
-        logger.info(f"Polling transcription status: id={transcript_id}")
-
-        start_time = asyncio.get_event_loop().time()
-        poll_url = f"{ASSEMBLYAI_TRANSCRIPT_URL}/{transcript_id}"
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            while True:
-                elapsed = asyncio.get_event_loop().time() - start_time
-                if elapsed > self.timeout:
-                    raise RuntimeError(
-                        f"AssemblyAI transcription timed out after {self.timeout}s"
-                    )
-
-                response = await client.get(poll_url, headers=self._get_headers())
-
-                if response.status_code != 200:
-                    raise RuntimeError(
-                        f"AssemblyAI poll failed: {response.status_code} - {response.text}"
-                    )
-
-                data = response.json()
-                status = data["status"]
-
-                if status == "completed":
-                    logger.info(f"Transcription completed: id={transcript_id}")
-                    return data
-                elif status == "error":
-                    error_msg = data.get("error", "Unknown error")
-                    raise RuntimeError(f"AssemblyAI transcription failed: {error_msg}")
-
-                # Still processing - wait before next poll
-                logger.debug(
-                    f"Transcription in progress: id={transcript_id}, "
-                    f"status={status}, elapsed={elapsed:.1f}s"
-                )
-                await asyncio.sleep(self.poll_interval)
+        logger.info(f"Waiting for transcription: id={transcript_id}")
+
+        return await get_assemblyai_poller().wait(
+            transcript_id,
+            self.api_key,
+            timeout=self.timeout,
+            audio_duration=audio_duration,
+            min_interval=self.poll_interval,
+            webhook=bool(self.webhook_url)
+        )
 
     async def _delete_transcript(self, transcript_id: str) -> None:
         """
@@ -310,8 +310,11 @@ class AssemblyAITranscriptionService(TranscriptionService):
                 speaker_count=speaker_count
             )
 
-            # Step 3: Poll until complete
-            result = await self._poll_transcription(transcript_id)
+            # Step 3: Wait until complete (shared poller)
+            result = await self._poll_transcription(
+                transcript_id,
+                audio_duration=get_audio_duration(str(audio_path))
+            )
 
             # Extract text and language
             transcribed_text = result.get("text", "")
@@ -1,13 +1,21 @@
 """
 Groq API transcription service implementation.
+
+Long recordings are split with AudioChunker (silence-aligned boundaries),
+each chunk is compressed (FLAC by default, Opus optional) before upload and
+chunks are transcribed concurrently under a shared rate limiter. Segment
+timestamps are shifted by each chunk's offset when stitching.
 """
+import asyncio
+import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional
-
-from groq import AsyncGroq
+from typing import Dict, Any, List, Optional
 
+from app.services.circuit_breaker import get_circuit_breaker
+from app.services.rate_limiter import get_provider_rate_limiter
 from app.services.transcription import TranscriptionService
+from app.utils.audio_chunking import AudioChunker, AudioChunk
 from app.utils.logger import get_logger
 
 logger = get_logger("transcription.groq")
@@ -19,10 +27,22 @@ class GroqTranscriptionService(TranscriptionService):
     Uses Groq's cloud-hosted Whisper API.
     """
 
+    # Valid chunk encodings for upload
+    VALID_CHUNK_FORMATS = ["flac", "opus", "wav"]
+
+    # Max attempts per chunk when Groq answers 429
+    MAX_RATE_LIMIT_ATTEMPTS = 3
+
     def __init__(
         self,
         api_key: str,
-        model: str = "whisper-large-v3"
+        model: str = "whisper-large-v3",
+        chunk_duration_seconds: int = 600,
+        chunk_overlap_seconds: int = 5,
+        use_silence_detection: bool = True,
+        chunk_format: str = "flac",
+        max_concurrent_chunks: int = 4,
+        requests_per_minute: int = 20
     ):
         """
         Initialize Groq transcription service.
@@ -30,17 +50,58 @@ class GroqTranscriptionService(TranscriptionService):
         Args:
             api_key: Groq API key
             model: Groq Whisper model name (default: whisper-large-v3)
+            chunk_duration_seconds: Max duration of one upload (longer audio is chunked)
+            chunk_overlap_seconds: Overlap at cuts that could not be aligned to silence
+            use_silence_detection: Align chunk boundaries to silences
+            chunk_format: Upload encoding - "flac" (lossless), "opus" or "wav"
+            max_concurrent_chunks: Max chunk requests in flight
+            requests_per_minute: Groq request rate limit shared by this process
         """
+        if chunk_format not in self.VALID_CHUNK_FORMATS:
+            raise ValueError(
+                f"Invalid chunk_format '{chunk_format}'. "
+                f"Must be one of: {', '.join(self.VALID_CHUNK_FORMATS)}"
+            )
+
         self.api_key = api_key
         self.model = model
-        self.client = AsyncGroq(api_key=api_key)
+        self._client = None
+        self.use_silence_detection = use_silence_detection
+        self.chunk_format = chunk_format
+        self.max_concurrent_chunks = max_concurrent_chunks
+
+        self._chunker = AudioChunker(
+            chunk_duration_seconds=chunk_duration_seconds,
+            overlap_seconds=chunk_overlap_seconds
+        )
+        self._rate_limiter = get_provider_rate_limiter(
+            "groq-transcription", requests_per_minute, 60.0
+        )
+        self._circuit = get_circuit_breaker("groq-transcription")
 
         # Cache for list_available_models() with 1-hour TTL
         self._models_cache: Optional[list[Dict[str, Any]]] = None
         self._models_cache_timestamp: Optional[datetime] = None
         self._cache_ttl = timedelta(hours=1)
 
-        logger.info(f"GroqTranscriptionService initialized with model={model}")
+        logger.info(
+            f"GroqTranscriptionService initialized with model={model}",
+            chunk_duration_s=chunk_duration_seconds,
+            chunk_format=chunk_format,
+            max_concurrent=max_concurrent_chunks
+        )
+
+    @property
+    def client(self):
+        """Groq API client, created on first use (the groq SDK is slow to import)."""
+        if self._client is None:
+            from groq import AsyncGroq
+            self._client = AsyncGroq(api_key=self.api_key)
+        return self._client
+
+    @client.setter
+    def client(self, client) -> None:
+        self._client = client
 
     async def transcribe_audio(
         self,
@@ -55,6 +116,9 @@ class GroqTranscriptionService(TranscriptionService):
         """
         Transcribe audio file using Groq's Whisper API.
 
+        Audio is compressed before upload; audio longer than the chunk
+        duration is split into silence-aligned chunks transcribed concurrently.
+
         Args:
             audio_path: Path to audio file
             language: Language code or 'auto' for automatic detection
@@ -90,47 +154,20 @@ class GroqTranscriptionService(TranscriptionService):
         )
 
         try:
-            # Read audio file
-            with open(audio_path, "rb") as audio_file:
-                # Call Groq transcription API
-                # Note: Groq API doesn't support beam_size parameter
-                transcription_params = {
-                    "file": (audio_path.name, audio_file),
-                    "model": effective_model,
-                    "response_format": "verbose_json",  # Get detailed response with segments
-                }
+            with tempfile.TemporaryDirectory(prefix="groq_chunks_") as temp_dir:
+                chunks = await self._prepare_chunks(audio_path, Path(temp_dir))
 
-                # Only add language if not "auto"
-                if language and language.lower() != "auto":
-                    transcription_params["language"] = language
-
-                # Add temperature if provided
-                if temperature is not None:
-                    transcription_params["temperature"] = temperature
-
-                response = await self.client.audio.transcriptions.create(**transcription_params)
-
-            # Extract data from response
-            # Groq's response structure matches OpenAI's Whisper API
-            transcribed_text = response.text
-            detected_language = getattr(response, "language", language)
-
-            # Extract segments if available
-            segments = []
-            if hasattr(response, "segments") and response.segments:
-                segments = [
-                    {
-                        "id": seg.get("id") if isinstance(seg, dict) else seg.id,
-                        "start": seg.get("start") if isinstance(seg, dict) else seg.start,
-                        "end": seg.get("end") if isinstance(seg, dict) else seg.end,
-                        "text": seg.get("text") if isinstance(seg, dict) else seg.text
-                    }
-                    for seg in response.segments
-                ]
+                results = await self._transcribe_chunks_parallel(
+                    chunks, effective_model, language, temperature
+                )
+
+            transcribed_text, segments = self._stitch_results(chunks, results)
+            detected_language = results[0]["language"] or language
 
             logger.info(
                 f"Groq transcription completed: file={audio_path.name}, "
-                f"language={detected_language}, length={len(transcribed_text)} chars"
+                f"language={detected_language}, length={len(transcribed_text)} chars, "
+                f"chunks={len(chunks)}"
             )
 
             return {
@@ -149,6 +186,214 @@ class GroqTranscriptionService(TranscriptionService):
             )
             raise RuntimeError(f"Groq transcription failed: {str(e)}") from e
 
+    async def _prepare_chunks(self, audio_path: Path, output_dir: Path) -> List[AudioChunk]:
+        """
+        Split and compress audio for upload (ffmpeg runs in a worker thread).
+
+        Falls back to uploading the original file as a single chunk if the
+        duration cannot be read or ffmpeg is unavailable.
+
+        Args:
+            audio_path: Path to audio file
+            output_dir: Directory for chunk files
+
+        Returns:
+            List of AudioChunk objects
+        """
+        try:
+            return await asyncio.to_thread(
+                self._chunker.chunk_audio,
+                audio_path,
+                output_dir,
+                self.use_silence_detection,
+                self.chunk_format
+            )
+        except Exception as e:
+            logger.warning(
+                "Audio chunking/encoding failed, uploading original file",
+                file=audio_path.name,
+                error=str(e)
+            )
+            return [AudioChunk(
+                index=0,
+                path=audio_path,
+                start_time_ms=0,
+                end_time_ms=0,
+                duration_ms=0
+            )]
+
+    async def _transcribe_chunks_parallel(
+        self,
+        chunks: List[AudioChunk],
+        model: str,
+        language: str,
+        temperature: Optional[float]
+    ) -> List[Dict[str, Any]]:
+        """
+        Transcribe chunks concurrently under the concurrency and rate limits.
+
+        Args:
+            chunks: Chunks to transcribe
+            model: Groq model id
+            language: Language code or 'auto'
+            temperature: Sampling temperature or None
+
+        Returns:
+            Per-chunk results (text, language, segments) in chunk order
+
+        Raises:
+            RuntimeError: If any chunk fails (a partial transcript is not returned)
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_chunks)
+
+        async def process_chunk(chunk: AudioChunk) -> Dict[str, Any]:
+            async with semaphore:
+                if len(chunks) > 1:
+                    logger.info(f"Transcribing chunk {chunk.index + 1}/{len(chunks)}")
+                return await self._transcribe_file(chunk.path, model, language, temperature)
+
+        return list(await asyncio.gather(*(process_chunk(chunk) for chunk in chunks)))
+
+    async def _transcribe_file(
+        self,
+        path: Path,
+        model: str,
+        language: str,
+        temperature: Optional[float]
+    ) -> Dict[str, Any]:
+        """
+        Transcribe a single file with one Groq request.
+
+        Requests go through the shared rate limiter. A 429 pauses the limiter
+        for the Retry-After period (all concurrent chunks back off) and the
+        request is retried. Requests are rejected with CircuitOpenError while
+        Groq's circuit is open.
+
+        Args:
+            path: Audio file to upload
+            model: Groq model id
+            language: Language code or 'auto'
+            temperature: Sampling temperature or None
+
+        Returns:
+            Dict with text, language and segments (chunk-relative times)
+        """
+        # Note: Groq API doesn't support beam_size parameter
+        transcription_params: Dict[str, Any] = {
+            "model": model,
+            "response_format": "verbose_json",  # Get detailed response with segments
+        }
+
+        # Only add language if not "auto"
+        if language and language.lower() != "auto":
+            transcription_params["language"] = language
+
+        # Add temperature if provided
+        if temperature is not None:
+            transcription_params["temperature"] = temperature
+
+        for attempt in range(self.MAX_RATE_LIMIT_ATTEMPTS):
+            await self._rate_limiter.acquire()
+            try:
+                with self._circuit.guard(), open(path, "rb") as audio_file:
+                    response = await self.client.audio.transcriptions.create(
+                        file=(path.name, audio_file),
+                        **transcription_params
+                    )
+                break
+            except Exception as e:
+                if getattr(e, "status_code", None) != 429 or attempt == self.MAX_RATE_LIMIT_ATTEMPTS - 1:
+                    raise
+                retry_after = self._get_retry_after(e)
+                logger.warning(f"Groq rate limited, retrying in {retry_after}s", attempt=attempt + 1)
+                self._rate_limiter.pause(retry_after)
+
+        # Groq's response structure matches OpenAI's Whisper API
+        segments = []
+        if hasattr(response, "segments") and response.segments:
+            segments = [
+                {
+                    "id": seg.get("id") if isinstance(seg, dict) else seg.id,
+                    "start": seg.get("start") if isinstance(seg, dict) else seg.start,
+                    "end": seg.get("end") if isinstance(seg, dict) else seg.end,
+                    "text": seg.get("text") if isinstance(seg, dict) else seg.text
+                }
+                for seg in response.segments
+            ]
+
+        return {
+            "text": response.text,
+            "language": getattr(response, "language", None),
+            "segments": segments,
+        }
+
+    @staticmethod
+    def _get_retry_after(error: Exception, default: float = 5.0) -> float:
+        """Read Retry-After (seconds) from a Groq API error, if present."""
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        try:
+            return float(headers.get("retry-after", default))
+        except (TypeError, ValueError):
+            return default
+
+    def _stitch_results(
+        self,
+        chunks: List[AudioChunk],
+        results: List[Dict[str, Any]]
+    ) -> tuple[str, List[Dict[str, Any]]]:
+        """
+        Combine chunk results into one transcript with absolute timestamps.
+
+        Segment times are shifted by the chunk's start offset. Where chunks
+        overlap (fixed cuts), each side keeps only segments whose midpoint
+        falls on its half of the overlap, so words are not duplicated.
+
+        Args:
+            chunks: Chunks in order
+            results: Per-chunk results in the same order
+
+        Returns:
+            Tuple of (text, segments)
+        """
+        if len(chunks) == 1:
+            return results[0]["text"], results[0]["segments"]
+
+        texts: List[str] = []
+        segments: List[Dict[str, Any]] = []
+
+        for i, (chunk, result) in enumerate(zip(chunks, results)):
+            offset = chunk.start_time_ms / 1000
+
+            # Owned time range: split overlaps with neighbours at their midpoint
+            own_start = offset
+            if i > 0 and chunks[i - 1].end_time_ms > chunk.start_time_ms:
+                own_start = (chunk.start_time_ms + chunks[i - 1].end_time_ms) / 2000
+            own_end = chunk.end_time_ms / 1000
+            if i + 1 < len(chunks) and chunks[i + 1].start_time_ms < chunk.end_time_ms:
+                own_end = (chunks[i + 1].start_time_ms + chunk.end_time_ms) / 2000
+
+            if not result["segments"]:
+                if result["text"]:
+                    texts.append(result["text"].strip())
+                continue
+
+            for seg in result["segments"]:
+                start = seg["start"] + offset
+                end = seg["end"] + offset
+                midpoint = (start + end) / 2
+                if not (own_start <= midpoint < own_end):
+                    continue
+                segments.append({
+                    "id": len(segments),
+                    "start": round(start, 3),
+                    "end": round(end, 3),
+                    "text": seg["text"]
+                })
+                texts.append(seg["text"].strip())
+
+        return " ".join(t for t in texts if t), segments
+
     def get_supported_languages(self) -> list[str]:
         """
         Get list of supported language codes for Groq Whisper.
@@ -0,0 +1,337 @@
+"""
+Hedged transcription requests.
+
+RunPod serverless endpoints have multi-minute cold starts, so
+clarin-slovene-asr latency is bimodal: seconds on a warm worker, minutes on
+a cold one. With hedging, a second request is sent to another provider when
+the primary has not answered within a deadline derived from its observed
+latency percentile. Latencies are tracked per audio second and the deadline
+is scaled by the recording's duration, so a long recording on a warm worker
+is not hedged just for being long. The first successful result wins and the
+other request is cancelled, including its RunPod job.
+
+Hedging is opt-in per user (UserPreference.transcription_hedging) because the
+hedge request is billed too; its audio seconds are recorded on the
+transcription (hedge_extra_audio_seconds).
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from app.config import settings
+from app.services.provider_registry import (
+    TRANSCRIPTION_PROVIDERS,
+    get_available_runpods_for_provider,
+    get_provider_service_registry,
+    is_transcription_provider_configured,
+)
+from app.services.runpod_jobs import RunPodJobOwner, own_runpod_jobs
+from app.services.transcription import TranscriptionService
+from app.utils.logger import get_logger
+
+logger = get_logger("services.transcription_hedging")
+
+# Provider used as hedge for non-diarized jobs (fast, no cold starts)
+FALLBACK_PROVIDER = "groq"
+
+
+class LatencyTracker:
+    """
+    Rolling window of transcription latencies per model, in seconds per audio second.
+
+    Usage:
+        tracker = get_latency_tracker()
+        tracker.record("clarin-slovene-asr-pyannote", 12.5 / 300)
+        p95 = tracker.percentile("clarin-slovene-asr-pyannote", 95)
+    """
+
+    def __init__(self, window: Optional[int] = None, min_samples: Optional[int] = None):
+        """
+        Initialize tracker.
+
+        Args:
+            window: Latencies kept per model (defaults to config)
+            min_samples: Samples needed before percentile() returns a value (defaults to config)
+        """
+        self.window = window if window is not None else settings.TRANSCRIPTION_HEDGE_LATENCY_WINDOW
+        self.min_samples = (
+            min_samples if min_samples is not None else settings.TRANSCRIPTION_HEDGE_MIN_SAMPLES
+        )
+        self._latencies: Dict[str, Deque[float]] = {}
+
+    def record(self, model_name: str, seconds_per_audio_second: float) -> None:
+        """
+        Record a latency.
+
+        Args:
+            model_name: Model name as returned by get_model_name()
+            seconds_per_audio_second: Seconds from request start to result,
+                divided by the audio duration
+        """
+        self._latencies.setdefault(model_name, deque(maxlen=self.window)).append(
+            seconds_per_audio_second
+        )
+
+    def percentile(self, model_name: str, pct: float) -> Optional[float]:
+        """
+        Get a latency percentile (nearest rank).
+
+        Args:
+            model_name: Model name as returned by get_model_name()
+            pct: Percentile (0-100)
+
+        Returns:
+            Seconds per audio second, None if fewer than min_samples were recorded
+        """
+        samples = self._latencies.get(model_name)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[rank]
+
+
+@dataclass
+class HedgeTarget:
+    """Provider (and RunPod variant) to send the hedge request to."""
+
+    provider: str
+    model: Optional[str] = None
+
+
+@dataclass
+class HedgeOutcome:
+    """How a hedged transcription was served."""
+
+    service: TranscriptionService  # Service whose result was used
+    hedge_fired: bool
+    hedge_service: Optional[TranscriptionService]  # Secondary service, if a hedge was sent
+    deadline_seconds: float
+
+    @property
+    def hedge_won(self) -> bool:
+        """Whether the hedge request's result was used."""
+        return self.hedge_fired and self.service is self.hedge_service
+
+
+def select_hedge_target(
+    provider: str,
+    model: Optional[str],
+    enable_diarization: bool,
+) -> Optional[HedgeTarget]:
+    """
+    Pick the secondary provider for a transcription.
+
+    Another configured RunPod variant of the same provider is preferred
+    (workers of different endpoints cold-start independently and support
+    diarization); non-diarized jobs can also fall back to Groq.
+
+    Args:
+        provider: Primary provider name
+        model: Primary RunPod variant (None = provider default)
+        enable_diarization: Whether diarization was requested
+
+    Returns:
+        HedgeTarget, or None if no suitable secondary is configured
+    """
+    provider = provider.lower()
+
+    if "runpods" in TRANSCRIPTION_PROVIDERS.get(provider, {}):
+        available = [r["id"] for r in get_available_runpods_for_provider(provider)]
+        primary_variant = model.lower() if model else (available[0] if available else None)
+        for variant in available:
+            if variant != primary_variant:
+                return HedgeTarget(provider=provider, model=variant)
+
+    if (
+        not enable_diarization
+        and provider != FALLBACK_PROVIDER
+        and is_transcription_provider_configured(FALLBACK_PROVIDER)
+    ):
+        return HedgeTarget(provider=FALLBACK_PROVIDER)
+
+    return None
+
+
+def get_hedge_service(
+    provider: str,
+    model: Optional[str],
+    enable_diarization: bool,
+) -> Optional[TranscriptionService]:
+    """
+    Get the shared service to hedge a transcription with.
+
+    Args:
+        provider: Primary provider name
+        model: Primary RunPod variant (None = provider default)
+        enable_diarization: Whether diarization was requested
+
+    Returns:
+        TranscriptionService, or None if no suitable secondary is configured
+    """
+    target = select_hedge_target(provider, model, enable_diarization)
+    if target is None:
+        return None
+    return get_provider_service_registry().get_transcription_service(target.provider, model=target.model)
+
+
+def hedge_deadline(
+    model_name: str,
+    audio_seconds: float,
+    tracker: Optional[LatencyTracker] = None,
+) -> float:
+    """
+    Seconds to wait for the primary before sending the hedge.
+
+    Args:
+        model_name: Primary model name (as returned by get_model_name())
+        audio_seconds: Duration of the recording
+        tracker: Latency tracker (defaults to the shared tracker)
+
+    Returns:
+        TRANSCRIPTION_HEDGE_PERCENTILE of the primary's latency per audio
+        second times audio_seconds, at least MIN_DELAY_SECONDS; until enough
+        samples exist DEFAULT_SECONDS_PER_AUDIO_SECOND is used instead, with
+        at least DEFAULT_DELAY_SECONDS
+    """
+    tracker = tracker or get_latency_tracker()
+    observed = tracker.percentile(model_name, settings.TRANSCRIPTION_HEDGE_PERCENTILE)
+    if observed is None:
+        return max(
+            audio_seconds * settings.TRANSCRIPTION_HEDGE_DEFAULT_SECONDS_PER_AUDIO_SECOND,
+            settings.TRANSCRIPTION_HEDGE_DEFAULT_DELAY_SECONDS,
+        )
+    return max(audio_seconds * observed, settings.TRANSCRIPTION_HEDGE_MIN_DELAY_SECONDS)
+
+
+async def transcribe_with_hedging(
+    primary: TranscriptionService,
+    secondary: Optional[TranscriptionService],
+    deadline_seconds: float,
+    transcribe_kwargs: Dict[str, Any],
+    tracker: Optional[LatencyTracker] = None,
+    audio_seconds: Optional[float] = None,
+) -> Tuple[Dict[str, Any], HedgeOutcome]:
+    """
+    Transcribe with the primary, hedging to the secondary after a deadline.
+
+    The hedge uses the secondary's default model (the primary's model name
+    does not apply to another provider). Once both requests run, the first
+    successful result wins and the other request is cancelled; if one fails
+    the other is awaited. Both requests run RunPod calls in job mode, so the
+    losing request's RunPod job is cancelled on RunPod too (see RunPodJobOwner).
+
+    Args:
+        primary: Primary transcription service
+        secondary: Secondary service (None = no hedging)
+        deadline_seconds: Seconds to wait for the primary before hedging
+        transcribe_kwargs: Arguments for transcribe_audio
+        tracker: Latency tracker (defaults to the shared tracker)
+        audio_seconds: Duration of the recording (latencies are not recorded
+            if unknown)
+
+    Returns:
+        Tuple of (transcription result, HedgeOutcome)
+
+    Raises:
+        Exception: The primary's error if both requests fail (or the primary
+                   fails before the deadline)
+    """
+    tracker = tracker or get_latency_tracker()
+    started = time.monotonic()
+
+    def record_latency(service: TranscriptionService) -> None:
+        if audio_seconds:
+            tracker.record(service.get_model_name(), (time.monotonic() - started) / audio_seconds)
+
+    async def timed(
+        service: TranscriptionService,
+        kwargs: Dict[str, Any],
+        owner: Optional[RunPodJobOwner],
+    ) -> Dict[str, Any]:
+        if owner is not None:
+            own_runpod_jobs(owner)
+        result = await service.transcribe_audio(**kwargs)
+        record_latency(service)
+        return result
+
+    if secondary is None:
+        result = await timed(primary, transcribe_kwargs, None)
+        return result, HedgeOutcome(primary, False, None, deadline_seconds)
+
+    primary_owner = RunPodJobOwner()
+    primary_task = asyncio.ensure_future(timed(primary, transcribe_kwargs, primary_owner))
+
+    try:
+        done, _ = await asyncio.wait({primary_task}, timeout=deadline_seconds)
+    except asyncio.CancelledError:
+        # asyncio.wait does not cancel what it waits for
+        primary_task.cancel()
+        raise
+    if done:
+        return primary_task.result(), HedgeOutcome(primary, False, None, deadline_seconds)
+
+    logger.info(
+        f"Primary transcription exceeded hedge deadline, sending hedge request",
+        primary=primary.get_model_name(),
+        secondary=secondary.get_model_name(),
+        deadline_s=round(deadline_seconds, 1)
+    )
+
+    secondary_owner = RunPodJobOwner()
+    secondary_task = asyncio.ensure_future(
+        timed(secondary, {**transcribe_kwargs, "model": None}, secondary_owner)
+    )
+    services = {primary_task: primary, secondary_task: secondary}
+    owners = {primary_task: primary_owner, secondary_task: secondary_owner}
+    pending = set(services)
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    winner = services[task]
+                    logger.info(
+                        f"Hedged transcription served",
+                        winner=winner.get_model_name(),
+                        hedge_won=winner is secondary,
+                        elapsed_s=round(time.monotonic() - started, 1)
+                    )
+                    # The loser's result is never needed: cancel its RunPod job too
+                    for loser in pending:
+                        owners[loser].abandon()
+                    return task.result(), HedgeOutcome(winner, True, secondary, deadline_seconds)
+                logger.warning(
+                    f"Hedged transcription request failed",
+                    model=services[task].get_model_name(),
+                    error=str(task.exception())
+                )
+    finally:
+        for task in pending:
+            task.cancel()
+        if not primary_task.done() or primary_task.cancelled():
+            # Lower bound of the primary's latency; keeps the percentile honest
+            record_latency(primary)
+
+    raise primary_task.exception()
+
+
+# Global tracker instance
+_latency_tracker: Optional[LatencyTracker] = None
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """
+    Get or create the global latency tracker.
+
+    Returns:
+        Shared LatencyTracker instance
+    """
+    global _latency_tracker
+    if _latency_tracker is None:
+        _latency_tracker = LatencyTracker()
+    return _latency_tracker
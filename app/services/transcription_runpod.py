@@ -14,6 +14,7 @@ from typing import Dict, Any, Optional, List
 
 import httpx
 
+from app.services.runpod_jobs import run_runpod_job, use_job_mode
 from app.services.transcription import TranscriptionService
 from app.utils.audio_chunking import AudioChunker, AudioChunk
 from app.utils.logger import get_logger
@@ -50,7 +51,8 @@ class RunPodTranscriptionService(TranscriptionService):
         timeout: int = 300,
         punctuate: bool = True,
         denormalize: bool = True,
-        denormalize_style: str = "default"
+        denormalize_style: str = "default",
+        async_jobs: bool = False
     ):
         """
         Initialize RunPod transcription service.
@@ -68,6 +70,8 @@ class RunPodTranscriptionService(TranscriptionService):
             punctuate: Enable punctuation & capitalization (default: True)
             denormalize: Enable text denormalization (default: True)
             denormalize_style: Denormalization style - default, technical, everyday
+            async_jobs: Use /run + /status job mode instead of /runsync
+                (hedged requests always use it, see transcription_hedging)
         """
         if not api_key:
             raise ValueError("api_key is required for RunPod provider")
@@ -81,6 +85,7 @@ class RunPodTranscriptionService(TranscriptionService):
         self.timeout = timeout
         self.max_concurrent_chunks = max_concurrent_chunks
         self.use_silence_detection = use_silence_detection
+        self.async_jobs = async_jobs
 
         # NLP pipeline defaults
         self.punctuate = punctuate
@@ -111,7 +116,8 @@ class RunPodTranscriptionService(TranscriptionService):
             max_concurrent=max_concurrent_chunks,
             punctuate=punctuate,
             denormalize=denormalize,
-            denormalize_style=self.denormalize_style
+            denormalize_style=self.denormalize_style,
+            async_jobs=async_jobs
         )
 
     def _get_headers(self) -> Dict[str, str]:
@@ -308,8 +314,9 @@ class RunPodTranscriptionService(TranscriptionService):
         with tempfile.TemporaryDirectory(prefix="runpod_chunks_") as temp_dir:
             output_dir = Path(temp_dir)
 
-            # Chunk audio
-            chunks = self._chunker.chunk_audio(
+            # Chunk audio (ffmpeg silence detection, off the event loop)
+            chunks = await asyncio.to_thread(
+                self._chunker.chunk_audio,
                 audio_path,
                 output_dir=output_dir,
                 use_silence_detection=self.use_silence_detection
@@ -476,6 +483,8 @@ class RunPodTranscriptionService(TranscriptionService):
 
         for attempt in range(self.max_retries):
             try:
+                if use_job_mode(self.async_jobs):
+                    return await self._call_runpod_job(input_data)
                 return await self._call_runpod_sync(input_data)
 
             except httpx.TimeoutException as e:
@@ -529,6 +538,31 @@ class RunPodTranscriptionService(TranscriptionService):
             f"RunPod transcription failed after {self.max_retries} attempts: {last_error}"
         )
 
+    async def _call_runpod_job(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run the request in RunPod async job mode (/run + /status).
+
+        A retry after a timeout resumes the already submitted job by id
+        instead of submitting it again.
+
+        Args:
+            input_data: Input payload for handler
+
+        Returns:
+            Output from handler
+
+        Raises:
+            httpx.TimeoutException: If the job did not finish in time
+            httpx.HTTPStatusError: On HTTP error when submitting
+            RuntimeError: On job failure
+        """
+        return await run_runpod_job(
+            self._base_url,
+            self.api_key,
+            input_data,
+            timeout=self.timeout
+        )
+
     async def _call_runpod_sync(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Make synchronous call to RunPod /runsync endpoint.
@@ -0,0 +1,338 @@
+"""
+Paged storage of diarized transcription segments.
+
+Segments (with word-level timings for some providers) used to be stored as
+one encrypted JSON blob per transcription, so every read decrypted and
+parsed all of them, even to show a few minutes of a long recording. They
+are now split into fixed-size pages (TRANSCRIPTION_SEGMENT_PAGE_SIZE
+segments), each encrypted on its own and indexed by segment position and
+time range (app/models/transcription_segment_page.py):
+
+- A window of the transcript (time range and/or cursor) decrypts only the
+  pages that can overlap it.
+- Segment positions count segments from 0 in transcript order and serve as
+  cursors for incremental loading.
+
+Transcriptions stored before pages existed keep their blob in
+Transcription.segments and are windowed in memory after decrypting it.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.services.database import db_service
+from app.services.envelope_encryption import EnvelopeEncryptionService
+from app.utils.encryption_helpers import decrypt_json, encrypt_json
+from app.utils.logger import get_logger
+
+logger = get_logger("services.transcription_segments")
+
+
+@dataclass
+class SegmentWindow:
+    """Segments of a window of a transcript."""
+
+    segments: List[Dict[str, Any]]
+    next_cursor: Optional[int]
+    total_segments: int
+    diarization_applied: bool
+
+
+def paginate_segments(segments: List[Dict[str, Any]], page_size: int) -> List[Dict[str, Any]]:
+    """
+    Split segments into pages and compute each page's index columns.
+
+    Args:
+        segments: Segments in transcript order (dicts with start, end, speaker)
+        page_size: Segments per page
+
+    Returns:
+        List of pages: page_index, first_position, segment_count, start_time,
+        end_time, has_speaker and the page's segments (not encrypted)
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+
+    pages = []
+    for page_index, first_position in enumerate(range(0, len(segments), page_size)):
+        page_segments = segments[first_position:first_position + page_size]
+        pages.append({
+            "page_index": page_index,
+            "first_position": first_position,
+            "segment_count": len(page_segments),
+            "start_time": min(float(s["start"]) for s in page_segments),
+            "end_time": max(float(s["end"]) for s in page_segments),
+            "has_speaker": any(s.get("speaker") is not None for s in page_segments),
+            "segments": page_segments,
+        })
+    return pages
+
+
+def _in_window(start_time: float, end_time: float, start: Optional[float], end: Optional[float]) -> bool:
+    """Whether a segment [start_time, end_time] overlaps the window [start, end)."""
+    if start is not None and end_time <= start and start_time < start:
+        return False
+    if end is not None and start_time >= end:
+        return False
+    return True
+
+
+def _page_in_window(row: Any, start: Optional[float], end: Optional[float]) -> bool:
+    """Whether a page (by its time range) can hold segments in the window [start, end)."""
+    if start is not None and row.end_time < start:
+        return False
+    if end is not None and row.start_time >= end:
+        return False
+    return True
+
+
+def _without_words(segment: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a segment without its word-level timings."""
+    return {key: value for key, value in segment.items() if key != "words"}
+
+
+def _select_segments(
+    positioned: Iterable[Tuple[int, Dict[str, Any]]],
+    start: Optional[float],
+    end: Optional[float],
+    limit: int,
+    include_words: bool,
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    Select up to limit segments in the window from (position, segment) pairs.
+
+    Returns:
+        Tuple of (segments, position of the next matching segment or None)
+    """
+    selected = []
+    for position, segment in positioned:
+        if not _in_window(float(segment["start"]), float(segment["end"]), start, end):
+            continue
+        if len(selected) == limit:
+            return selected, position
+        selected.append(segment if include_words else _without_words(segment))
+    return selected, None
+
+
+async def store_segment_pages(
+    encryption_service: EnvelopeEncryptionService,
+    db: AsyncSession,
+    transcription_id: UUID,
+    segments: List[Dict[str, Any]],
+    voice_entry_id: UUID,
+    user_id: UUID,
+) -> int:
+    """
+    Store the segments of a transcription as encrypted pages.
+
+    Replaces existing pages; saved with the session's commit.
+
+    Args:
+        encryption_service: Encryption service
+        db: Database session
+        transcription_id: Transcription UUID
+        segments: Segments in transcript order
+        voice_entry_id: VoiceEntry UUID (for DEK)
+        user_id: User UUID
+
+    Returns:
+        Number of pages stored
+    """
+    pages = paginate_segments(segments, settings.TRANSCRIPTION_SEGMENT_PAGE_SIZE)
+    for page in pages:
+        page["segments"] = await encrypt_json(
+            encryption_service,
+            db,
+            page["segments"],
+            voice_entry_id,
+            user_id,
+        )
+
+    await db_service.replace_segment_pages(db, transcription_id, pages)
+    return len(pages)
+
+
+async def load_segments(
+    encryption_service: Optional[EnvelopeEncryptionService],
+    db: AsyncSession,
+    transcription: Any,
+    voice_entry_id: UUID,
+    user_id: UUID,
+    with_segments: bool = True,
+) -> Tuple[Optional[List[Dict[str, Any]]], bool]:
+    """
+    Get all segments of a transcription, without word-level timings.
+
+    Args:
+        encryption_service: Encryption service
+        db: Database session
+        transcription: Transcription the segments belong to
+        voice_entry_id: VoiceEntry UUID (for DEK)
+        user_id: User UUID
+        with_segments: False to only determine whether any segment has a
+            speaker label (from the page index, without decrypting pages)
+
+    Returns:
+        Tuple of (segments or None if there are none or with_segments is
+        False, whether any segment has a speaker label)
+    """
+    if transcription.segments is not None:
+        segments = await decrypt_json(
+            encryption_service,
+            db,
+            transcription.segments,
+            voice_entry_id,
+            user_id,
+        )
+        if segments is None:
+            return None, False
+        return (
+            [_without_words(s) for s in segments] if with_segments else None,
+            any(s.get("speaker") is not None for s in segments),
+        )
+
+    index = await db_service.get_segment_page_index(db, transcription.id)
+    if not index:
+        return None, False
+    if not with_segments:
+        return None, any(row.has_speaker for row in index)
+
+    pages = await db_service.get_segment_pages(db, transcription.id, [row.page_index for row in index])
+    segments = []
+    for page in pages:
+        page_segments = await decrypt_json(
+            encryption_service,
+            db,
+            page.segments,
+            voice_entry_id,
+            user_id,
+        )
+        if page_segments is None:
+            return None, False
+        segments.extend(_without_words(s) for s in page_segments)
+
+    return segments, any(row.has_speaker for row in index)
+
+
+async def load_segment_window(
+    encryption_service: Optional[EnvelopeEncryptionService],
+    db: AsyncSession,
+    transcription: Any,
+    voice_entry_id: UUID,
+    user_id: UUID,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    cursor: int = 0,
+    limit: Optional[int] = None,
+    include_words: bool = True,
+) -> SegmentWindow:
+    """
+    Get the segments of a window of a transcript.
+
+    Returns the segments at position cursor or later that overlap the time
+    window [start, end), up to limit. Only pages that can hold such segments
+    are decrypted, in order, until limit segments were found.
+
+    Args:
+        encryption_service: Encryption service
+        db: Database session
+        transcription: Transcription the segments belong to
+        voice_entry_id: VoiceEntry UUID (for DEK)
+        user_id: User UUID
+        start: Window start in seconds (None = beginning)
+        end: Window end in seconds, exclusive (None = end of the transcript)
+        cursor: Position of the first segment to consider (next_cursor of
+            the previous window)
+        limit: Max segments (default TRANSCRIPTION_SEGMENT_PAGE_SIZE)
+        include_words: Include word-level timings of segments that have them
+
+    Returns:
+        SegmentWindow with the segments and the cursor of the next window
+        (None if there are no more segments in the time window)
+
+    Raises:
+        RuntimeError: If stored segments cannot be decrypted
+    """
+    if limit is None:
+        limit = settings.TRANSCRIPTION_SEGMENT_PAGE_SIZE
+
+    if transcription.segments is not None:
+        segments = await decrypt_json(
+            encryption_service,
+            db,
+            transcription.segments,
+            voice_entry_id,
+            user_id,
+        )
+        if segments is None:
+            raise RuntimeError("Failed to decrypt transcription segments")
+        selected, next_cursor = _select_segments(
+            ((position, s) for position, s in enumerate(segments) if position >= cursor),
+            start, end, limit, include_words,
+        )
+        return SegmentWindow(
+            segments=selected,
+            next_cursor=next_cursor,
+            total_segments=len(segments),
+            diarization_applied=any(s.get("speaker") is not None for s in segments),
+        )
+
+    index = await db_service.get_segment_page_index(db, transcription.id)
+    candidates = [
+        row for row in index
+        if row.first_position + row.segment_count > cursor
+        and _page_in_window(row, start, end)
+    ]
+
+    # Fetch enough pages for limit segments at a time; most windows need one batch
+    batch_size = limit // settings.TRANSCRIPTION_SEGMENT_PAGE_SIZE + 2
+    selected: List[Dict[str, Any]] = []
+    next_cursor = None
+    decrypted_pages = 0
+    for batch_start in range(0, len(candidates), batch_size):
+        batch = candidates[batch_start:batch_start + batch_size]
+        pages = await db_service.get_segment_pages(db, transcription.id, [row.page_index for row in batch])
+        for page in pages:
+            page_segments = await decrypt_json(
+                encryption_service,
+                db,
+                page.segments,
+                voice_entry_id,
+                user_id,
+            )
+            if page_segments is None:
+                raise RuntimeError("Failed to decrypt transcription segments")
+            decrypted_pages += 1
+
+            page_selected, next_cursor = _select_segments(
+                (
+                    (page.first_position + offset, s)
+                    for offset, s in enumerate(page_segments)
+                    if page.first_position + offset >= cursor
+                ),
+                start, end, limit - len(selected), include_words,
+            )
+            selected.extend(page_selected)
+            if next_cursor is not None:
+                break
+        if next_cursor is not None:
+            break
+
+    logger.debug(
+        "Transcription segment window loaded",
+        transcription_id=str(transcription.id),
+        segment_count=len(selected),
+        decrypted_pages=decrypted_pages,
+        total_pages=len(index),
+    )
+
+    return SegmentWindow(
+        segments=selected,
+        next_cursor=next_cursor,
+        total_segments=sum(row.segment_count for row in index),
+        diarization_applied=any(row.has_speaker for row in index),
+    )
@@ -8,6 +8,8 @@ Supports 3 pipeline variants, all using PROTOVERB Slovenian ASR model on RunPod
 
 All variants support:
 - Client-side audio chunking for long recordings (1h+)
+- Compressed audio transport (FLAC by default, Opus optional) - the handler
+  decodes back to 16kHz WAV, so ASR input is unchanged for FLAC
 - Speaker diarization with word-level timestamps
 - Punctuation and denormalization pipeline
 
@@ -18,10 +20,13 @@ import base64
 import random
 import tempfile
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 import httpx
 
+from app.services.circuit_breaker import CircuitOpenError, get_circuit_breaker
+from app.services.runpod_jobs import run_runpod_job, use_job_mode
+from app.services.runpod_warmup import get_endpoint_warmer
 from app.services.transcription import TranscriptionService
 from app.utils.audio_chunking import AudioChunker, AudioChunk
 from app.utils.logger import get_logger
@@ -51,6 +56,15 @@ class SloveneASRTranscriptionService(TranscriptionService):
     # Valid denormalization styles
     VALID_DENORMALIZE_STYLES = ["default", "technical", "everyday"]
 
+    # Audio transport encodings understood by the handlers
+    VALID_AUDIO_FORMATS = ["flac", "opus", "wav"]
+
+    # Payload transport version - bump when the audio fields change
+    AUDIO_TRANSPORT_VERSION = 1
+
+    # Chunk file extension -> transport format
+    AUDIO_FORMAT_BY_SUFFIX = {".wav": "wav", ".flac": "flac", ".ogg": "opus"}
+
     def __init__(
         self,
         api_key: str,
@@ -64,7 +78,9 @@ class SloveneASRTranscriptionService(TranscriptionService):
         timeout: int = 300,
         punctuate: bool = True,
         denormalize: bool = True,
-        denormalize_style: str = "default"
+        denormalize_style: str = "default",
+        async_jobs: bool = False,
+        audio_format: str = "wav"
     ):
         """
         Initialize Slovenian ASR transcription service.
@@ -82,6 +98,11 @@ class SloveneASRTranscriptionService(TranscriptionService):
             punctuate: Enable punctuation & capitalization (default: True)
             denormalize: Enable text denormalization (default: True)
             denormalize_style: Denormalization style - default, technical, everyday
+            async_jobs: Use /run + /status job mode instead of /runsync
+                (hedged requests always use it, see transcription_hedging)
+            audio_format: Upload encoding - "wav" (default, understood by every
+                handler), "flac" (lossless) or "opus"; use flac/opus only with
+                handlers that support audio_transport_version 1
         """
         if not api_key:
             raise ValueError("api_key is required for Slovenian ASR provider")
@@ -92,6 +113,11 @@ class SloveneASRTranscriptionService(TranscriptionService):
                 f"Invalid variant '{variant}'. "
                 f"Must be one of: {', '.join(self.VALID_VARIANTS)}"
             )
+        if audio_format not in self.VALID_AUDIO_FORMATS:
+            raise ValueError(
+                f"Invalid audio_format '{audio_format}'. "
+                f"Must be one of: {', '.join(self.VALID_AUDIO_FORMATS)}"
+            )
 
         self.api_key = api_key
         self.endpoint_id = endpoint_id
@@ -100,6 +126,8 @@ class SloveneASRTranscriptionService(TranscriptionService):
         self.timeout = timeout
         self.max_concurrent_chunks = max_concurrent_chunks
         self.use_silence_detection = use_silence_detection
+        self.async_jobs = async_jobs
+        self.audio_format = audio_format
 
         # NLP pipeline defaults
         self.punctuate = punctuate
@@ -122,6 +150,9 @@ class SloveneASRTranscriptionService(TranscriptionService):
         # RunPod API base URL
         self._base_url = f"https://api.runpod.ai/v2/{endpoint_id}"
 
+        # One circuit per endpoint, shared by all service instances
+        self._circuit = get_circuit_breaker(self.get_model_name())
+
         logger.info(
             f"SloveneASRTranscriptionService initialized",
             variant=variant,
@@ -130,7 +161,9 @@ class SloveneASRTranscriptionService(TranscriptionService):
             max_concurrent=max_concurrent_chunks,
             punctuate=punctuate,
             denormalize=denormalize,
-            denormalize_style=self.denormalize_style
+            denormalize_style=self.denormalize_style,
+            async_jobs=async_jobs,
+            audio_format=audio_format
         )
 
     def _get_headers(self) -> Dict[str, str]:
@@ -258,6 +291,9 @@ class SloveneASRTranscriptionService(TranscriptionService):
             "max_speakers": max_speakers
         }
 
+        # One real job per transcription, however many chunks and retries it takes
+        get_endpoint_warmer().record_job(self.get_model_name())
+
         # Check if chunking is needed
         if self._chunker.needs_chunking(audio_path, self.CHUNK_THRESHOLD_SECONDS):
             return await self._transcribe_with_chunking(audio_path, options)
@@ -281,13 +317,13 @@ class SloveneASRTranscriptionService(TranscriptionService):
         """
         logger.info("Transcribing single audio file (no chunking)", audio_path=str(audio_path))
 
-        # Read and encode audio
-        audio_bytes = audio_path.read_bytes()
-        audio_base64 = base64.b64encode(audio_bytes).decode("utf-8")
+        with tempfile.TemporaryDirectory(prefix="slovene_asr_audio_") as temp_dir:
+            upload_path, audio_format = await self._encode_for_upload(audio_path, Path(temp_dir))
+            audio_payload = self._build_audio_payload(upload_path, audio_format)
 
         # Call RunPod with all options
         result = await self._call_runpod_with_retry({
-            "audio_base64": audio_base64,
+            **audio_payload,
             "filename": audio_path.name,
             "punctuate": options["punctuate"],
             "denormalize": options["denormalize"],
@@ -324,11 +360,13 @@ class SloveneASRTranscriptionService(TranscriptionService):
         with tempfile.TemporaryDirectory(prefix="slovene_asr_chunks_") as temp_dir:
             output_dir = Path(temp_dir)
 
-            # Chunk audio
-            chunks = self._chunker.chunk_audio(
+            # Chunk audio (ffmpeg silence detection, off the event loop)
+            chunks = await asyncio.to_thread(
+                self._chunker.chunk_audio,
                 audio_path,
                 output_dir=output_dir,
-                use_silence_detection=self.use_silence_detection
+                use_silence_detection=self.use_silence_detection,
+                output_format=self.audio_format
             )
 
             logger.info(f"Created {len(chunks)} chunks for transcription")
@@ -388,6 +426,56 @@ class SloveneASRTranscriptionService(TranscriptionService):
                 "chunking_metadata": chunking_metadata
             }
 
+    async def _encode_for_upload(self, audio_path: Path, output_dir: Path) -> Tuple[Path, str]:
+        """
+        Encode audio in the transport format (ffmpeg runs in a worker thread).
+
+        Falls back to sending the original WAV if encoding fails.
+
+        Args:
+            audio_path: Path to audio file
+            output_dir: Directory for the encoded file
+
+        Returns:
+            Tuple of (path to upload, transport format)
+        """
+        if self.audio_format == "wav":
+            return audio_path, "wav"
+
+        extension = "ogg" if self.audio_format == "opus" else self.audio_format
+        output_path = output_dir / f"{audio_path.stem}.{extension}"
+
+        try:
+            await asyncio.to_thread(
+                self._chunker.encode_audio, audio_path, output_path, self.audio_format
+            )
+            return output_path, self.audio_format
+        except Exception as e:
+            logger.warning(
+                "Audio encoding failed, sending WAV",
+                audio_format=self.audio_format,
+                error=str(e)
+            )
+            return audio_path, "wav"
+
+    def _build_audio_payload(self, path: Path, audio_format: str) -> Dict[str, Any]:
+        """
+        Build the audio fields of the handler payload.
+
+        Args:
+            path: Audio file to send
+            audio_format: Transport format of the file ("wav", "flac" or "opus")
+
+        Returns:
+            Dict with audio_base64, audio_format and audio_transport_version
+        """
+        audio_bytes = path.read_bytes()
+        return {
+            "audio_base64": base64.b64encode(audio_bytes).decode("utf-8"),
+            "audio_format": audio_format,
+            "audio_transport_version": self.AUDIO_TRANSPORT_VERSION,
+        }
+
     def _parse_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """
         Parse RunPod response into standardized format.
@@ -487,12 +575,11 @@ class SloveneASRTranscriptionService(TranscriptionService):
                 try:
                     logger.info(f"Processing chunk {chunk.index + 1}/{len(chunks)}")
 
-                    # Read and encode chunk
-                    audio_bytes = chunk.path.read_bytes()
-                    audio_base64 = base64.b64encode(audio_bytes).decode("utf-8")
+                    # Chunks are already encoded in the transport format
+                    audio_format = self.AUDIO_FORMAT_BY_SUFFIX.get(chunk.path.suffix, "wav")
 
                     result = await self._call_runpod_with_retry({
-                        "audio_base64": audio_base64,
+                        **self._build_audio_payload(chunk.path, audio_format),
                         "filename": chunk.path.name,
                         "punctuate": options["punctuate"],
                         "denormalize": options["denormalize"],
@@ -577,6 +664,9 @@ class SloveneASRTranscriptionService(TranscriptionService):
         """
         Call RunPod API with exponential backoff retry.
 
+        Attempts go through the endpoint's circuit breaker; once it opens,
+        the remaining attempts are skipped.
+
         Args:
             input_data: Input payload for RunPod handler
 
@@ -584,13 +674,20 @@ class SloveneASRTranscriptionService(TranscriptionService):
             Output from RunPod handler
 
         Raises:
+            CircuitOpenError: If the endpoint's circuit is open
             RuntimeError: If all retries fail
         """
         last_error = None
 
         for attempt in range(self.max_retries):
             try:
-                return await self._call_runpod_sync(input_data)
+                with self._circuit.guard():
+                    if use_job_mode(self.async_jobs):
+                        return await self._call_runpod_job(input_data)
+                    return await self._call_runpod_sync(input_data)
+
+            except CircuitOpenError:
+                raise
 
             except httpx.TimeoutException as e:
                 last_error = e
@@ -643,6 +740,31 @@ class SloveneASRTranscriptionService(TranscriptionService):
             f"RunPod transcription failed after {self.max_retries} attempts: {last_error}"
         )
 
+    async def _call_runpod_job(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run the request in RunPod async job mode (/run + /status).
+
+        A retry after a timeout resumes the already submitted job by id
+        instead of submitting it again.
+
+        Args:
+            input_data: Input payload for handler
+
+        Returns:
+            Output from handler
+
+        Raises:
+            httpx.TimeoutException: If the job did not finish in time
+            httpx.HTTPStatusError: On HTTP error when submitting
+            RuntimeError: On job failure
+        """
+        return await run_runpod_job(
+            self._base_url,
+            self.api_key,
+            input_data,
+            timeout=self.timeout
+        )
+
     async def _call_runpod_sync(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Make synchronous call to RunPod /runsync endpoint.
@@ -698,6 +820,15 @@ class SloveneASRTranscriptionService(TranscriptionService):
         """
         return f"clarin-slovene-asr-{self.variant}"
 
+    def request_warmup(self) -> bool:
+        """
+        Submit a no-op warmup job so a worker boots before the audio arrives.
+
+        Returns:
+            True if a warmup was sent (False if debounced or disabled)
+        """
+        return get_endpoint_warmer().warm(self.get_model_name(), self._base_url, self.api_key)
+
     async def list_available_models(self) -> list[Dict[str, Any]]:
         """
         Get list of available models for this provider.
@@ -1,15 +1,18 @@
 """
 Audio chunking utilities for splitting long audio files.
-Used by RunPod transcription service to handle 1h+ recordings.
+Used by RunPod and Groq transcription services to handle 1h+ recordings.
 
 Uses mutagen for duration detection and ffmpeg for chunking (no pydub dependency).
+Chunk boundaries can be aligned to silences (ffmpeg silencedetect) and chunks
+can be encoded as FLAC or Opus to cut upload size.
 """
 import asyncio
+import re
 import subprocess
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from mutagen import File as MutagenFile
 
@@ -17,6 +20,16 @@ from app.utils.logger import get_logger
 
 logger = get_logger("audio_chunking")
 
+# Output formats for chunk files: (file extension, ffmpeg codec args)
+CHUNK_FORMATS = {
+    "wav": ("wav", []),
+    "flac": ("flac", ["-c:a", "flac"]),
+    "opus": ("ogg", ["-c:a", "libopus", "-b:a", "32k", "-application", "voip"]),
+}
+
+_SILENCE_START_RE = re.compile(r"silence_start:\s*(-?[\d.]+)")
+_SILENCE_END_RE = re.compile(r"silence_end:\s*(-?[\d.]+)")
+
 
 @dataclass
 class AudioChunk:
@@ -109,12 +122,109 @@ class AudioChunker:
             )
             raise
 
+    def _detect_silences(
+        self,
+        audio_path: Path,
+        window_start_ms: int,
+        window_end_ms: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Detect silences inside a time window using ffmpeg silencedetect.
+
+        Only the search window is decoded, not the whole file.
+
+        Args:
+            audio_path: Source audio file
+            window_start_ms: Window start in milliseconds
+            window_end_ms: Window end in milliseconds
+
+        Returns:
+            List of (start_ms, end_ms) silences in absolute time (empty on failure)
+        """
+        cmd = [
+            "ffmpeg",
+            "-ss", str(window_start_ms / 1000),
+            "-t", str((window_end_ms - window_start_ms) / 1000),
+            "-i", str(audio_path),
+            "-ac", "1",
+            "-ar", "16000",
+            "-af", f"silencedetect=noise={self.silence_thresh_db}dB:d={self.min_silence_len_ms / 1000}",
+            "-f", "null",
+            "-"
+        ]
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+        except Exception as e:
+            logger.warning("Silence detection failed", error=str(e))
+            return []
+
+        stderr = result.stderr if isinstance(result.stderr, str) else ""
+        if result.returncode != 0 or not stderr:
+            return []
+
+        silences = []
+        current_start: Optional[float] = None
+        for line in stderr.splitlines():
+            start_match = _SILENCE_START_RE.search(line)
+            if start_match:
+                current_start = max(0.0, float(start_match.group(1)))
+                continue
+            end_match = _SILENCE_END_RE.search(line)
+            if end_match and current_start is not None:
+                silences.append((
+                    window_start_ms + int(current_start * 1000),
+                    window_start_ms + int(float(end_match.group(1)) * 1000)
+                ))
+                current_start = None
+
+        # Silence running until the end of the window
+        if current_start is not None:
+            silences.append((window_start_ms + int(current_start * 1000), window_end_ms))
+
+        return silences
+
+    def _find_silence_boundary(
+        self,
+        audio_path: Path,
+        position_ms: int,
+        target_end_ms: int
+    ) -> Optional[int]:
+        """
+        Find a silence-aligned cut point at or before the target chunk end.
+
+        Searches the last silence_search_window_ms of the chunk and picks the
+        silence closest to the target end, cutting at its midpoint. Never
+        extends past the target, so chunks stay within the duration limit.
+
+        Args:
+            audio_path: Source audio file
+            position_ms: Chunk start in milliseconds
+            target_end_ms: Fixed-duration chunk end in milliseconds
+
+        Returns:
+            Cut point in milliseconds, or None if no usable silence was found
+        """
+        window_start = max(position_ms + 1000, target_end_ms - self.silence_search_window_ms)
+        if window_start >= target_end_ms:
+            return None
+
+        silences = self._detect_silences(audio_path, window_start, target_end_ms)
+        candidates = [
+            (start + end) // 2
+            for start, end in silences
+            if position_ms < (start + end) // 2 < target_end_ms
+        ]
+
+        return max(candidates) if candidates else None
+
     def _extract_chunk_ffmpeg(
         self,
         audio_path: Path,
         output_path: Path,
         start_ms: int,
-        end_ms: int
+        end_ms: int,
+        output_format: str = "wav"
     ) -> None:
         """
         Extract a chunk from audio file using ffmpeg.
@@ -124,9 +234,11 @@ class AudioChunker:
             output_path: Output chunk file path
             start_ms: Start time in milliseconds
             end_ms: End time in milliseconds
+            output_format: Chunk encoding - "wav", "flac" or "opus"
         """
         start_seconds = start_ms / 1000
         duration_seconds = (end_ms - start_ms) / 1000
+        _, codec_args = CHUNK_FORMATS[output_format]
 
         cmd = [
             "ffmpeg",
@@ -135,6 +247,7 @@ class AudioChunker:
             "-t", str(duration_seconds),
             "-ac", "1",           # Mono
             "-ar", "16000",       # 16kHz
+            *codec_args,          # Compression (FLAC/Opus) if requested
             "-y",                 # Overwrite
             str(output_path)
         ]
@@ -148,20 +261,72 @@ class AudioChunker:
         if result.returncode != 0:
             raise RuntimeError(f"ffmpeg failed: {result.stderr}")
 
+    def encode_audio(
+        self,
+        audio_path: Path,
+        output_path: Path,
+        output_format: str
+    ) -> Path:
+        """
+        Encode a whole audio file as 16kHz mono in the given format.
+
+        Args:
+            audio_path: Source audio file
+            output_path: Output file path
+            output_format: Encoding - "wav", "flac" or "opus"
+
+        Returns:
+            output_path
+
+        Raises:
+            ValueError: If output_format is unknown
+            RuntimeError: If ffmpeg fails
+        """
+        if output_format not in CHUNK_FORMATS:
+            raise ValueError(
+                f"Invalid output_format '{output_format}'. "
+                f"Must be one of: {', '.join(CHUNK_FORMATS)}"
+            )
+        _, codec_args = CHUNK_FORMATS[output_format]
+
+        cmd = [
+            "ffmpeg",
+            "-i", str(audio_path),
+            "-ac", "1",           # Mono
+            "-ar", "16000",       # 16kHz
+            *codec_args,
+            "-y",                 # Overwrite
+            str(output_path)
+        ]
+
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed: {result.stderr}")
+
+        return output_path
+
     def chunk_audio(
         self,
         audio_path: Path,
         output_dir: Optional[Path] = None,
-        use_silence_detection: bool = True
+        use_silence_detection: bool = True,
+        output_format: str = "wav"
     ) -> List[AudioChunk]:
         """
         Split audio file into chunks.
 
+        With silence detection, each cut is moved back to the nearest silence
+        within silence_search_window_ms of the target end. Cuts inside a
+        silence do not split words, so the next chunk starts exactly at the
+        cut (no overlap). Cuts without a usable silence fall back to fixed
+        boundaries with overlap.
+
         Args:
             audio_path: Path to input audio file (WAV recommended)
             output_dir: Directory for chunk files (uses temp dir if None)
-            use_silence_detection: Whether to use silence detection for boundaries
-                                   (currently ignored, uses fixed boundaries)
+            use_silence_detection: Whether to align boundaries to silences
+            output_format: Chunk encoding - "wav", "flac" or "opus". Non-WAV
+                           formats also re-encode audio that needs no chunking.
 
         Returns:
             List of AudioChunk objects with paths to chunk files
@@ -169,6 +334,13 @@ class AudioChunker:
         if not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
+        if output_format not in CHUNK_FORMATS:
+            raise ValueError(
+                f"Invalid output_format '{output_format}'. "
+                f"Must be one of: {', '.join(CHUNK_FORMATS)}"
+            )
+        extension, _ = CHUNK_FORMATS[output_format]
+
         # Get audio duration
         logger.info("Loading audio for chunking", audio_path=str(audio_path))
         duration_ms = self._get_duration_ms(audio_path)
@@ -183,16 +355,21 @@ class AudioChunker:
         else:
             output_dir.mkdir(parents=True, exist_ok=True)
 
-        # If audio is short enough, return single chunk (just reference original)
+        # If audio is short enough, return single chunk
         if duration_ms <= chunk_duration_ms:
             logger.info(
                 "Audio short enough, no chunking needed",
                 duration_ms=duration_ms,
                 chunk_threshold_ms=chunk_duration_ms
             )
+            chunk_path = audio_path
+            if output_format != "wav":
+                # Still compress for upload
+                chunk_path = output_dir / f"chunk_0000.{extension}"
+                self._extract_chunk_ffmpeg(audio_path, chunk_path, 0, duration_ms, output_format)
             return [AudioChunk(
                 index=0,
-                path=audio_path,
+                path=chunk_path,
                 start_time_ms=0,
                 end_time_ms=duration_ms,
                 duration_ms=duration_ms
@@ -202,15 +379,26 @@ class AudioChunker:
         chunk_index = 0
         position = 0
 
+        silence_cuts = 0
+
         while position < duration_ms:
             # Calculate chunk end
             chunk_end = min(position + chunk_duration_ms, duration_ms)
 
+            # Move the cut into a nearby silence (not needed for the last chunk)
+            silence_cut = False
+            if use_silence_detection and chunk_end < duration_ms:
+                boundary = self._find_silence_boundary(audio_path, position, chunk_end)
+                if boundary is not None:
+                    chunk_end = boundary
+                    silence_cut = True
+                    silence_cuts += 1
+
             # Export chunk using ffmpeg
-            chunk_filename = f"chunk_{chunk_index:04d}.wav"
+            chunk_filename = f"chunk_{chunk_index:04d}.{extension}"
             chunk_path = output_dir / chunk_filename
 
-            self._extract_chunk_ffmpeg(audio_path, chunk_path, position, chunk_end)
+            self._extract_chunk_ffmpeg(audio_path, chunk_path, position, chunk_end, output_format)
 
             chunks.append(AudioChunk(
                 index=chunk_index,
@@ -225,15 +413,17 @@ class AudioChunker:
                 chunk_index=chunk_index,
                 start_ms=position,
                 end_ms=chunk_end,
-                duration_ms=chunk_end - position
+                duration_ms=chunk_end - position,
+                silence_cut=silence_cut
             )
 
             # If we've reached the end of audio, we're done
             if chunk_end >= duration_ms:
                 break
 
-            # Move position, accounting for overlap to avoid cutting words
-            position = chunk_end - overlap_ms
+            # Move position - silence cuts need no overlap, fixed cuts
+            # overlap to avoid cutting words
+            position = chunk_end if silence_cut else chunk_end - overlap_ms
             chunk_index += 1
 
         logger.info(
@@ -242,7 +432,9 @@ class AudioChunker:
             total_duration_ms=duration_ms,
             num_chunks=len(chunks),
             chunk_duration_target_s=self.chunk_duration_seconds,
-            overlap_s=self.overlap_seconds
+            overlap_s=self.overlap_seconds,
+            silence_cuts=silence_cuts,
+            output_format=output_format
         )
 
         return chunks
@@ -0,0 +1,294 @@
+"""
+Text windowing for LLM cleanup of long transcripts.
+
+Cleanup prompts contain the whole transcript and the model writes it back, so
+a window has to fit both the model's context (template + transcript + output)
+and its output limit. Long transcripts are split into windows that are
+cleaned independently and stitched back together.
+
+Windows are cut on natural boundaries, in order of preference:
+- paragraphs (blank lines)
+- speaker turns ("Speaker 2: ..." labels from diarization)
+- sentences
+- words (only for a single sentence longer than a window)
+
+Consecutive windows share a small overlap (trailing sentences of the previous
+window) so the model sees context at the cut. When stitching, the overlap is
+located in both cleaned outputs by word matching and kept only once.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Callable, List, Optional, Tuple
+
+from app.utils.logger import get_logger
+
+logger = get_logger("utils.text_chunking")
+
+# Conservative characters-per-token for Slovenian/English with Llama/Gemma
+# tokenizers (real ratios are ~3.5-4.5); overestimating tokens keeps windows safe
+CHARS_PER_TOKEN = 3.0
+
+# Paragraph break in the cleanup output format
+BREAK_MARKER = "<break>"
+
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+_SPEAKER_TURN_RE = re.compile(r"(?=\b(?:Speaker|Govorec|Govornik) \d+:)")
+_SENTENCE_RE = re.compile(r"(?<=[.!?…])\s+")
+_WORD_RE = re.compile(r"\S+")
+
+TokenCounter = Callable[[str], int]
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of text (no tokenizer dependency).
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated number of tokens (rounded up)
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+@dataclass
+class TextWindow:
+    """One window of a split transcript."""
+
+    index: int
+    text: str
+    tokens: int
+    overlap_words: int  # Words at the start repeated from the previous window
+
+
+def cleanup_window_budget(
+    prompt_template: str,
+    context_window: int,
+    max_output_tokens: int,
+    count_tokens: TokenCounter = estimate_tokens,
+) -> int:
+    """
+    Compute the max transcript tokens per window for a cleanup prompt.
+
+    The transcript appears in the prompt and (cleaned) in the output, so a
+    window must fit into the context next to the template and the output,
+    and the output itself must fit into max_output_tokens.
+
+    Args:
+        prompt_template: Cleanup prompt with a {transcription_text} placeholder
+        context_window: Model context length in tokens
+        max_output_tokens: Max tokens the model may generate
+        count_tokens: Token counter
+
+    Returns:
+        Max tokens of transcript per window
+
+    Raises:
+        ValueError: If the template leaves no room for a transcript
+    """
+    template_tokens = count_tokens(prompt_template.replace("{transcription_text}", ""))
+    budget = min(context_window - max_output_tokens - template_tokens, max_output_tokens)
+    if budget <= 0:
+        raise ValueError(
+            f"Prompt template ({template_tokens} tokens) leaves no room for a transcript "
+            f"(context {context_window}, output {max_output_tokens})"
+        )
+    return budget
+
+
+def _split_units(text: str) -> List[str]:
+    """Split text into paragraphs, then speaker turns."""
+    units = []
+    for paragraph in _PARAGRAPH_RE.split(text):
+        for turn in _SPEAKER_TURN_RE.split(paragraph):
+            turn = turn.strip()
+            if turn:
+                units.append(turn)
+    return units
+
+
+def _fit_unit(unit: str, max_tokens: int, count_tokens: TokenCounter) -> List[str]:
+    """Break a unit that exceeds the budget into sentence (or word) pieces."""
+    if count_tokens(unit) <= max_tokens:
+        return [unit]
+
+    pieces = []
+    for sentence in _SENTENCE_RE.split(unit):
+        if count_tokens(sentence) <= max_tokens:
+            pieces.append(sentence)
+            continue
+
+        # A single sentence longer than a window: fall back to words
+        current: List[str] = []
+        for word in sentence.split():
+            if current and count_tokens(" ".join(current + [word])) > max_tokens:
+                pieces.append(" ".join(current))
+                current = []
+            current.append(word)
+        if current:
+            pieces.append(" ".join(current))
+
+    return pieces
+
+
+def split_transcript(
+    text: str,
+    max_tokens: int,
+    overlap_tokens: int = 0,
+    count_tokens: TokenCounter = estimate_tokens,
+) -> List[TextWindow]:
+    """
+    Split a transcript into windows of at most max_tokens.
+
+    Args:
+        text: Transcript (may contain paragraphs and "Speaker N:" turns)
+        max_tokens: Max tokens per window (see cleanup_window_budget)
+        overlap_tokens: Max tokens repeated from the end of the previous window
+        count_tokens: Token counter
+
+    Returns:
+        Windows in order; a single window if the transcript fits
+
+    Raises:
+        ValueError: If max_tokens is not positive
+    """
+    if max_tokens <= 0:
+        raise ValueError("max_tokens must be > 0")
+
+    text = text.strip()
+    total_tokens = count_tokens(text)
+    if total_tokens <= max_tokens:
+        return [TextWindow(index=0, text=text, tokens=total_tokens, overlap_words=0)]
+
+    # Boundary units (paragraphs/turns); each ends a possible cut
+    units: List[Tuple[str, bool]] = []  # (text, starts_new_block)
+    for unit in _split_units(text):
+        for i, piece in enumerate(_fit_unit(unit, max_tokens, count_tokens)):
+            units.append((piece, i == 0))
+
+    windows: List[TextWindow] = []
+    current: List[Tuple[str, bool]] = []
+    overlap_count = 0
+
+    def window_text(parts: List[Tuple[str, bool]]) -> str:
+        out = ""
+        for i, (piece, new_block) in enumerate(parts):
+            if i == 0:
+                out = piece
+            elif new_block:
+                out += "\n\n" + piece
+            else:
+                out += " " + piece
+        return out
+
+    for unit in units:
+        candidate = current + [unit]
+        if current and len(current) > overlap_count and count_tokens(window_text(candidate)) > max_tokens:
+            text_out = window_text(current)
+            overlap_words = sum(len(piece.split()) for piece, _ in current[:overlap_count])
+            windows.append(TextWindow(len(windows), text_out, count_tokens(text_out), overlap_words))
+
+            # Carry trailing sentences as context into the next window
+            overlap: List[Tuple[str, bool]] = []
+            if overlap_tokens > 0:
+                tail = current[-1][0]
+                for sentence in reversed(_SENTENCE_RE.split(tail)):
+                    trial = [(sentence, not overlap)] + overlap
+                    if count_tokens(window_text(trial)) > overlap_tokens:
+                        break
+                    overlap = trial
+                overlap = [(piece, False) for piece, _ in overlap]
+                if overlap and count_tokens(window_text(overlap + [unit])) > max_tokens:
+                    overlap = []
+            current = overlap + [unit]
+            overlap_count = len(overlap)
+        else:
+            current = candidate
+
+    if current:
+        text_out = window_text(current)
+        overlap_words = sum(len(piece.split()) for piece, _ in current[:overlap_count])
+        windows.append(TextWindow(len(windows), text_out, count_tokens(text_out), overlap_words))
+
+    return windows
+
+
+def _word_keys(text: str) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """Normalized words (for matching) and their character spans."""
+    keys = []
+    spans = []
+    for match in _WORD_RE.finditer(text):
+        key = re.sub(r"[^\w]", "", match.group().lower())
+        if key:
+            keys.append(key)
+            spans.append(match.span())
+    return keys, spans
+
+
+def _merge_overlap(previous: str, following: str, overlap_words: int) -> Optional[str]:
+    """
+    Join two cleaned windows, keeping their shared overlap once.
+
+    Returns:
+        Merged text, or None if the overlap could not be located
+    """
+    search = overlap_words * 2 + 5
+    prev_keys, prev_spans = _word_keys(previous)
+    next_keys, next_spans = _word_keys(following)
+
+    prev_offset = max(0, len(prev_keys) - search)
+    a = prev_keys[prev_offset:]
+    b = next_keys[:search]
+
+    match = SequenceMatcher(None, a, b, autojunk=False).find_longest_match(0, len(a), 0, len(b))
+    if match.size < min(3, overlap_words):
+        return None
+
+    # Keep the previous window up to the matched words, the following from there on
+    cut_previous = prev_spans[prev_offset + match.a][0]
+    cut_following = next_spans[match.b][0]
+    head = previous[:cut_previous].rstrip()
+    tail = following[cut_following:]
+    return f"{head} {tail}" if head else tail
+
+
+def stitch_cleaned_windows(outputs: List[str], windows: List[TextWindow]) -> str:
+    """
+    Stitch cleaned window outputs (with <break> markers) into one text.
+
+    Args:
+        outputs: Raw cleanup output per window, in order
+        windows: The windows the outputs were produced from
+
+    Returns:
+        Combined raw output; window boundaries become <break> markers
+    """
+    if not outputs:
+        return ""
+
+    merged = outputs[0].strip()
+    for output, window in zip(outputs[1:], windows[1:]):
+        output = output.strip()
+
+        if window.overlap_words:
+            joined = _merge_overlap(merged, output, window.overlap_words)
+            if joined is not None:
+                merged = joined
+                continue
+            logger.warning(
+                f"Could not locate window overlap, keeping both copies",
+                window=window.index,
+                overlap_words=window.overlap_words,
+            )
+
+        # Windows are cut on paragraph/turn boundaries
+        if merged.endswith(BREAK_MARKER) or output.startswith(BREAK_MARKER):
+            merged = f"{merged}{output}"
+        else:
+            merged = f"{merged}{BREAK_MARKER}{output}"
+
+    return merged
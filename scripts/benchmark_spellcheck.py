@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Benchmark Slovenian spell-checking of transcripts: check_text() on the event
+loop (the old path) vs the memoized engine (app/services/spellcheck_engine.py).
+
+Transcripts are sampled from the dictionary with Zipfian word frequencies
+(like real speech), recurring out-of-dictionary words and a few one-off
+misspellings. They are checked one after
+another, as a worker would over time, while a ticker coroutine measures how
+long the event loop was blocked. Both paths must report the same issues.
+
+Uses the real dictionary (word list or compact dictionary, see SPELLCHECK_* settings) if
+available, otherwise a synthetic dictionary of Slovene-like words.
+
+Usage:
+    # Real dictionary from the default paths, 30-minute session transcripts
+    python scripts/benchmark_spellcheck.py
+
+    # Specific word list
+    python scripts/benchmark_spellcheck.py --wordlist data/dictionaries/sl-words.txt
+
+    # Quick run on a small synthetic dictionary
+    python scripts/benchmark_spellcheck.py --synthetic-words 5000 --transcripts 5
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+# Settings require these; no database or secrets are used
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+os.environ.setdefault("DATABASE_PASSWORD", "benchmark")
+
+from app.config import settings  # noqa: E402
+from app.services.spellcheck_engine import SpellCheckEngine, WordVerdictCache  # noqa: E402
+from app.services.spellcheck_slovenian import SlovenianSpellCheckService  # noqa: E402
+
+SYLLABLES = [
+    "ka", "ne", "po", "pre", "sta", "ja", "li", "mo", "ri", "to", "va", "že",
+    "šo", "ču", "de", "zi", "lo", "na", "ve", "sko", "tri", "bra", "gle", "hi",
+]
+LETTERS = "abcčdefghijklmnoprsštuvzž"
+WORDS_PER_MINUTE = 150
+
+
+def synthetic_wordlist(count: int, rng: random.Random) -> List[str]:
+    """Slovene-like words built from syllables."""
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4))))
+    return sorted(words)
+
+
+def load_service(args: argparse.Namespace, rng: random.Random) -> SlovenianSpellCheckService:
+    """Load the real dictionary, or build a synthetic one."""
+    wordlist = Path(args.wordlist or settings.SPELLCHECK_WORDLIST_PATH)
+    # Without --dictionary, the service's default paths (image, then cache)
+    dictionary = Path(args.dictionary) if args.dictionary else None
+    prebuilt = dictionary or Path(settings.SPELLCHECK_DICTIONARY_PATH)
+    if wordlist.exists() or prebuilt.exists():
+        print(f"Dictionary: {prebuilt if prebuilt.exists() else wordlist}")
+    else:
+        tmp = Path(tempfile.mkdtemp(prefix="spellcheck-bench-"))
+        wordlist = tmp / "words.txt"
+        dictionary = tmp / "symspell.dict"
+        wordlist.write_text("\n".join(synthetic_wordlist(args.synthetic_words, rng)), encoding="utf-8")
+        print(f"Dictionary: synthetic, {args.synthetic_words} words")
+
+    service = SlovenianSpellCheckService(
+        wordlist_path=str(wordlist),
+        dictionary_path=str(dictionary) if dictionary else None,
+    )
+    start = time.perf_counter()
+    if not service.load():
+        raise SystemExit("Failed to load dictionary")
+    print(f"Loaded in {time.perf_counter() - start:.2f}s")
+    return service
+
+
+def vocabulary(service: SlovenianSpellCheckService, size: int, rng: random.Random) -> List[str]:
+    """Words of the dictionary ranked by (simulated) frequency."""
+    words = [word for word in service._symspell.words if len(word) >= 2]
+    return rng.sample(words, min(size, len(words)))
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    """Apply one random edit (substitution, deletion, insertion, transposition)."""
+    i = rng.randrange(len(word))
+    op = rng.randrange(4)
+    if op == 0:
+        return word[:i] + rng.choice(LETTERS) + word[i + 1:]
+    if op == 1 and len(word) > 3:
+        return word[:i] + word[i + 1:]
+    if op == 2:
+        return word[:i] + rng.choice(LETTERS) + word[i:]
+    if i < len(word) - 1:
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word + rng.choice(LETTERS)
+
+
+def make_transcripts(
+    vocab: List[str],
+    service: SlovenianSpellCheckService,
+    args: argparse.Namespace,
+    rng: random.Random,
+) -> List[str]:
+    """
+    Transcripts of Zipf-distributed words.
+
+    Besides dictionary words they contain recurring out-of-dictionary words
+    (names, loanwords, fillers - Zipf-distributed as well) and one-off
+    misspellings (ASR errors).
+    """
+    oov = set()
+    while len(oov) < args.oov_words:
+        word = misspell(misspell(rng.choice(vocab), rng), rng)
+        if word not in service._symspell.words:
+            oov.add(word)
+    oov = list(oov)
+
+    def zipf(words: List[str]) -> List[float]:
+        return [1 / (rank ** args.zipf) for rank in range(1, len(words) + 1)]
+
+    vocab_weights, oov_weights = zipf(vocab), zipf(oov)
+    transcripts = []
+    for _ in range(args.transcripts):
+        count = args.minutes * WORDS_PER_MINUTE
+        words = rng.choices(vocab, weights=vocab_weights, k=count)
+        oov_words = iter(rng.choices(oov, weights=oov_weights, k=count))
+        words = [
+            next(oov_words) if rng.random() < args.oov_rate
+            else misspell(w, rng) if rng.random() < args.misspelling_rate
+            else w
+            for w in words
+        ]
+        sentences = [" ".join(words[i:i + 12]).capitalize() + "." for i in range(0, len(words), 12)]
+        transcripts.append(" ".join(sentences))
+    return transcripts
+
+
+async def measure(check, transcripts: List[str]) -> Dict[str, Any]:
+    """Check transcripts sequentially; return timings, max loop block and results."""
+    blocked = []
+    stop = asyncio.Event()
+
+    async def ticker():
+        while not stop.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            blocked.append(time.perf_counter() - start - 0.001)
+
+    tick = asyncio.ensure_future(ticker())
+    await asyncio.sleep(0.01)
+    durations, results = [], []
+    for text in transcripts:
+        start = time.perf_counter()
+        results.append(await check(text))
+        durations.append(time.perf_counter() - start)
+        # Each transcript is a separate request
+        await asyncio.sleep(0.005)
+    stop.set()
+    await tick
+    return {
+        "total": sum(durations),
+        "first": durations[0],
+        "rest_mean": sum(durations[1:]) / max(1, len(durations) - 1),
+        "max_blocked": max(blocked, default=0.0),
+        "results": [[(issue.word, issue.suggestions) for issue in issues] for issues in results],
+    }
+
+
+async def run_benchmark(service: SlovenianSpellCheckService, transcripts: List[str], threads: int,
+                        cache_size: int) -> Dict[str, Dict[str, Any]]:
+    """Run the old path and the engine over the same transcripts."""
+    async def on_loop(text):
+        return service.check_text(text)
+
+    engine = SpellCheckEngine(WordVerdictCache(cache_size), threads)
+
+    async def with_engine(text):
+        return await engine.check_text(service, text)
+
+    baseline = await measure(on_loop, transcripts)
+    memoized = await measure(with_engine, transcripts)
+    memoized["hit_rate"] = engine.cache.hits / max(1, engine.cache.hits + engine.cache.misses)
+    memoized["cached_words"] = len(engine.cache)
+    engine.shutdown()
+    return {"check_text on event loop": baseline, "engine": memoized}
+
+
+def print_report(report: Dict[str, Dict[str, Any]]) -> None:
+    print(f"{'':28}{'total':>10}{'first':>10}{'next (avg)':>12}{'loop blocked':>14}")
+    for name, r in report.items():
+        print(
+            f"{name:28}{r['total'] * 1000:>8.0f}ms{r['first'] * 1000:>8.0f}ms"
+            f"{r['rest_mean'] * 1000:>10.1f}ms{r['max_blocked'] * 1000:>12.1f}ms"
+        )
+    baseline, engine = report["check_text on event loop"], report["engine"]
+    print(f"\nSpeedup: {baseline['total'] / engine['total']:.1f}x total, "
+          f"{baseline['rest_mean'] / max(engine['rest_mean'], 1e-9):.1f}x per transcript after the first")
+    print(f"Word cache: {engine['hit_rate']:.1%} hit rate, {engine['cached_words']} words")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Slovenian spell-checking of transcripts")
+    parser.add_argument("--wordlist", help="Word list (default: SPELLCHECK_WORDLIST_PATH)")
+    parser.add_argument("--dictionary", help="Compact dictionary (default: SPELLCHECK_DICTIONARY_PATH)")
+    parser.add_argument("--synthetic-words", type=int, default=20000,
+                        help="Size of the synthetic dictionary if no real one is found")
+    parser.add_argument("--vocabulary", type=int, default=20000, help="Distinct words used in transcripts")
+    parser.add_argument("--transcripts", type=int, default=20)
+    parser.add_argument("--minutes", type=int, default=30, help="Length of each transcript")
+    parser.add_argument("--oov-words", type=int, default=2000,
+                        help="Distinct recurring out-of-dictionary words (names, loanwords)")
+    parser.add_argument("--oov-rate", type=float, default=0.04, help="Share of out-of-dictionary words")
+    parser.add_argument("--misspelling-rate", type=float, default=0.01, help="Share of one-off misspellings")
+    parser.add_argument("--zipf", type=float, default=1.1, help="Zipf exponent of word frequencies")
+    parser.add_argument("--threads", type=int, default=settings.SPELLCHECK_LOOKUP_THREADS)
+    parser.add_argument("--cache-size", type=int, default=settings.SPELLCHECK_WORD_CACHE_SIZE)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    service = load_service(args, rng)
+    transcripts = make_transcripts(vocabulary(service, args.vocabulary, rng), service, args, rng)
+    print(f"{len(transcripts)} transcripts of {args.minutes} min (~{args.minutes * WORDS_PER_MINUTE} words)\n")
+
+    report = asyncio.run(run_benchmark(service, transcripts, args.threads, args.cache_size))
+    print_report(report)
+
+    if report["engine"]["results"] != report["check_text on event loop"]["results"]:
+        print("\nMISMATCH: engine results differ from check_text()")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
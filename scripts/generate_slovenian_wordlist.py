@@ -7,23 +7,54 @@ Sloleks is the official Slovenian morphological lexicon maintained by CJVT
 with ALL inflected word forms.
 
 This script extracts all unique word forms into a simple text file for
-use in spell-checking with SymSpellPy.
+use in spell-checking with SymSpellPy, and optionally builds the compact
+memory-mapped SymSpell dictionary (app/services/spellcheck_dictionary.py)
+the service loads.
 
 Requirements:
-    pip install datasets
+    pip install datasets symspellpy
 
 Usage:
     python scripts/generate_slovenian_wordlist.py
     python scripts/generate_slovenian_wordlist.py --output /path/to/sl-words.txt
 
+    # Word list and compact dictionary
+    python scripts/generate_slovenian_wordlist.py --dictionary-output sl-symspell.dict
+
+    # Compact dictionary from an existing word list (skips Sloleks)
+    python scripts/generate_slovenian_wordlist.py --wordlist sl-words.txt --dictionary-output sl-symspell.dict
+
 Output:
     sl-words.txt (~2-3 million unique word forms, one per line)
+    sl-symspell.dict (with --dictionary-output)
 """
 
 import argparse
 import sys
+import time
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def build_dictionary(wordlist: Path, output: Path, max_edit_distance: int, prefix_length: int):
+    """Build the compact SymSpell dictionary from a word list."""
+    from app.services.spellcheck_dictionary import build_compact_dictionary
+
+    print(f"\nBuilding compact dictionary from {wordlist}...")
+    print("(This takes a few minutes for the full word list)")
+    start = time.time()
+    word_count, delete_count = build_compact_dictionary(
+        wordlist,
+        output,
+        max_edit_distance=max_edit_distance,
+        prefix_length=prefix_length,
+    )
+    size_mb = output.stat().st_size / (1024 * 1024)
+    print(f"Done in {time.time() - start:.0f}s: {word_count:,} words, {delete_count:,} deletes")
+    print(f"File size: {size_mb:.2f} MB")
+    print(f"Output: {output}")
+
 
 def main():
     """Generate Slovenian word list from Sloleks dataset."""
@@ -35,8 +66,39 @@ def main():
         default="sl-words.txt",
         help="Output file path (default: sl-words.txt)"
     )
+    parser.add_argument(
+        "--wordlist",
+        help="Use this existing word list instead of generating one from Sloleks"
+    )
+    parser.add_argument(
+        "--dictionary-output",
+        help="Also build the compact SymSpell dictionary at this path"
+    )
+    parser.add_argument(
+        "--max-edit-distance",
+        type=int,
+        default=2,
+        help="Max edit distance of the dictionary (must match SPELLCHECK_MAX_EDIT_DISTANCE, default: 2)"
+    )
+    parser.add_argument(
+        "--prefix-length",
+        type=int,
+        default=7,
+        help="Prefix length of the dictionary (must match SPELLCHECK_PREFIX_LENGTH, default: 7)"
+    )
     args = parser.parse_args()
 
+    if args.wordlist:
+        wordlist = Path(args.wordlist)
+    else:
+        wordlist = generate_wordlist(Path(args.output))
+
+    if args.dictionary_output:
+        build_dictionary(wordlist, Path(args.dictionary_output), args.max_edit_distance, args.prefix_length)
+
+
+def generate_wordlist(output_file: Path) -> Path:
+    """Generate the word list from Sloleks; returns its path."""
     # Import datasets here to give better error message if not installed
     try:
         from datasets import load_dataset
@@ -80,7 +142,6 @@ def main():
     sorted_words = sorted(words)
 
     # Ensure output directory exists
-    output_file = Path(args.output)
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
     print(f"Writing to {output_file}...")
@@ -103,6 +164,8 @@ def main():
         status = "✓" if word in words else "✗"
         print(f"  {status} {word}")
 
+    return output_file
+
 
 if __name__ == "__main__":
     main()
@@ -235,6 +235,8 @@ def handler(job: Dict[str, Any]) -> Dict[str, Any]:
     1. Single request: {"input": {"prompt": "...", "temperature": 0.3, ...}}
     2. Batch request: {"input": {"batch": [{"prompt": "...", "id": "1"}, ...], ...}}
 
+    A {"input": {"warmup": true}} keep-alive ping only loads the model.
+
     Input fields:
         - prompt: str - Formatted prompt for single request
         - batch: list - List of {"prompt": str, "id": str} for batch request
@@ -245,11 +247,17 @@ def handler(job: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Single mode: {"text": str, "processing_time": float, ...}
         Batch mode: {"results": [...], "processing_time": float, ...}
+        Warmup: {"warmup": true}
         Error: {"error": str}
     """
     try:
         job_input = job.get("input", {})
 
+        # Keep-alive ping sent by the backend before a cleanup: load model, generate nothing
+        if job_input.get("warmup"):
+            load_model()
+            return {"warmup": True}
+
         # Extract common parameters
         temperature = job_input.get("temperature")
         top_p = job_input.get("top_p")
@@ -20,9 +20,9 @@ Pipeline:
             - Merge adjacent same-speaker segments < 3s
             - Gives PROTOVERB more acoustic context
 
-        Phase 2: Process segments in parallel
-            - Extract audio with 0.5s context padding before/after
-            - Run ASR on segment (captures words dropped on full audio)
+        Phase 2: Process segments in length-sorted batches
+            - Slice audio with 0.5s context padding before/after
+            - Run batched ASR (captures words dropped on full audio)
             - Run NFA for word-level timestamps (skipped on segments < 2s)
 
         Phase 3: Merge consecutive same-speaker segments
@@ -44,7 +44,9 @@ Pipeline:
 Input:
     {
         "input": {
-            "audio_base64": "<base64 encoded WAV audio>",
+            "audio_base64": "<base64 encoded audio>",
+            "audio_format": "flac",         # Transport encoding: wav, flac, opus (default: wav)
+            "audio_transport_version": 1,   # Payload version (default: 1)
             "filename": "optional_filename.wav",
             "punctuate": true,              # Add punctuation & capitalization (default: true)
             "denormalize": true,            # Convert numbers, dates, times (default: true)
@@ -92,14 +94,17 @@ Output (with diarization):
 import base64
 import logging
 import os
+import subprocess
 import sys
 import tempfile
 import time
 import warnings
 from concurrent.futures import ThreadPoolExecutor, wait
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple, Union
 
-import runpod
+import numpy as np
+
+from speaker_index import SpeakerIndex
 
 # Configure logging for our handler
 logging.basicConfig(
@@ -150,6 +155,15 @@ DENORMALIZER_PATH = os.environ.get("DENORMALIZER_PATH", "/app/Slovene_denormaliz
 # Maximum audio size (100MB)
 MAX_AUDIO_SIZE = 100 * 1024 * 1024
 
+# Audio transport (must match SloveneASRTranscriptionService)
+# Clients send FLAC/Opus to cut upload size; audio is decoded back to
+# 16kHz mono WAV before any model sees it.
+AUDIO_TRANSPORT_VERSION = 1
+AUDIO_FORMAT_SUFFIXES = {"wav": ".wav", "flac": ".flac", "opus": ".ogg"}
+
+# PROTOVERB input sample rate
+TARGET_SAMPLE_RATE = 16000
+
 # Model version identifier
 MODEL_VERSION = "protoverb-1.0"
 
@@ -188,6 +202,10 @@ def load_asr_model():
 
         ASR_MODEL.eval()
 
+        # run_asr() calls forward() directly - match transcribe() preprocessing
+        ASR_MODEL.preprocessor.featurizer.dither = 0.0
+        ASR_MODEL.preprocessor.featurizer.pad_to = 0
+
         # Set OUTPUT_TIMESTEP_DURATION for NFA alignment (from model config)
         # This is the audio frame duration in seconds (~0.04s for PROTOVERB)
         cfg = ASR_MODEL.cfg
@@ -748,9 +766,10 @@ def run_diarization(
 
 
 def run_forced_alignment(
-    audio_path: str,
+    audio: Union[str, np.ndarray],
     transcript: str,
-    segment_start: float = 0.0
+    segment_start: float = 0.0,
+    hypothesis: Optional[Any] = None
 ) -> List[Dict[str, Any]]:
     """
     Run forced alignment to get word-level timestamps using NeMo Forced Aligner.
@@ -782,9 +801,11 @@ def run_forced_alignment(
     Apache 2.0 licensed (commercial use allowed).
 
     Args:
-        audio_path: Path to audio file (WAV format)
+        audio: Path to audio file (WAV format), or in-memory float32 samples
         transcript: Full transcript text from ASR
         segment_start: Offset to add to all timestamps (for segment-based processing)
+        hypothesis: ASR hypothesis from run_asr() for this audio - its log probs
+            are reused instead of running the model again
 
     Returns:
         List of word timestamps: [{"word": str, "start": float, "end": float}, ...]
@@ -808,16 +829,23 @@ def run_forced_alignment(
             add_t_start_end_to_utt_obj,
         )
 
-        logger.info(f"Running NFA alignment on {audio_path} ({len(transcript.split())} words)")
+        audio_label = audio if isinstance(audio, str) else f"{len(audio) / TARGET_SAMPLE_RATE:.1f}s in-memory audio"
+        logger.info(f"Running NFA alignment on {audio_label} ({len(transcript.split())} words)")
         start_time = time.time()
 
+        # In-memory audio: get log probs with a direct forward pass
+        if hypothesis is None and isinstance(audio, np.ndarray):
+            hypothesis = run_asr(audio)
+
         # Step 1: Get CTC log probabilities using PROTOVERB model
+        # (from the hypothesis if we have one, otherwise transcribe the file)
         # Note: Both audio and gt_text_batch must be lists of same length
         log_probs, y, T, U, utt_objs, timestep_duration = get_batch_variables(
-            audio=[audio_path],
+            audio=[hypothesis] if hypothesis is not None else [audio],
             model=ASR_MODEL,
             gt_text_batch=[transcript],
             output_timestep_duration=OUTPUT_TIMESTEP_DURATION,
+            has_hypotheses=hypothesis is not None,
         )
 
         # Step 2: Viterbi alignment to find optimal character-to-frame mapping
@@ -862,6 +890,96 @@ def run_forced_alignment(
         return []  # Fallback to proportional splitting
 
 
+def run_forced_alignment_batch(
+    hypotheses: List[Any],
+    transcripts: List[str]
+) -> List[List[Dict[str, Any]]]:
+    """
+    Run NFA forced alignment on a batch of segments in one Viterbi pass.
+
+    Reuses the log probabilities from run_asr_batch (hypothesis.y_sequence),
+    so no second forward pass is needed. get_batch_variables pads the batch
+    to B x T_max x V and viterbi_decoding aligns all utterances at once.
+
+    Args:
+        hypotheses: Hypotheses from run_asr_batch, one per segment
+        transcripts: Non-empty transcript per segment
+
+    Returns:
+        Word timestamps per segment, relative to the start of each segment's
+        audio. A segment gets an empty list if alignment fails (falls back
+        to proportional splitting).
+    """
+    global ASR_MODEL, OUTPUT_TIMESTEP_DURATION
+
+    if not hypotheses:
+        return []
+
+    if ASR_MODEL is None:
+        logger.warning("ASR model not loaded, skipping forced alignment")
+        return [[] for _ in hypotheses]
+
+    try:
+        import torch
+        from nemo_compat.aligner_utils import (
+            get_batch_variables,
+            viterbi_decoding,
+            add_t_start_end_to_utt_obj,
+            Segment,
+            Word,
+        )
+
+        start_time = time.time()
+
+        log_probs, y, T, U, utt_objs, timestep_duration = get_batch_variables(
+            audio=hypotheses,
+            model=ASR_MODEL,
+            gt_text_batch=transcripts,
+            output_timestep_duration=OUTPUT_TIMESTEP_DURATION,
+            has_hypotheses=True,
+        )
+
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        alignments = viterbi_decoding(log_probs, y, T, U, viterbi_device=device)
+
+        results = []
+        for utt_obj, alignment in zip(utt_objs, alignments):
+            utt_obj = add_t_start_end_to_utt_obj(
+                utt_obj=utt_obj,
+                alignment_utt=alignment,
+                output_timestep_duration=timestep_duration,
+            )
+
+            words = []
+            for item in utt_obj.segments_and_tokens:
+                if isinstance(item, Segment):
+                    for word_item in item.words_and_tokens:
+                        if isinstance(word_item, Word) and word_item.t_start is not None:
+                            words.append({
+                                "word": word_item.text,
+                                "start": round(word_item.t_start, 3),
+                                "end": round(word_item.t_end, 3),
+                            })
+            results.append(words)
+
+        alignment_time = time.time() - start_time
+        logger.debug(
+            f"NFA batch alignment complete in {alignment_time:.2f}s: "
+            f"{len(results)} segments, {sum(len(w) for w in results)} words"
+        )
+        return results
+
+    except ImportError as e:
+        logger.error(f"NeMo aligner_utils not available: {e}")
+        return [[] for _ in hypotheses]
+
+    except Exception as e:
+        logger.error(f"Batch forced alignment failed ({len(hypotheses)} segments): {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return [[] for _ in hypotheses]
+
+
 def merge_words_with_speakers(
     words_with_timestamps: List[Dict[str, Any]],
     speaker_segments: List[Dict[str, Any]]
@@ -909,53 +1027,26 @@ def merge_words_with_speakers(
             "words": words_with_timestamps
         }]
 
-    # Sort speaker segments by start time
-    sorted_segments = sorted(speaker_segments, key=lambda s: s["start"])
+    # Sorted-interval index: O(log n) speaker lookup per word
+    speaker_index = SpeakerIndex(speaker_segments)
 
     # Map speaker IDs to friendly names (Speaker 1, Speaker 2, ...)
     speaker_map = {}
-    speaker_counter = 1
 
     def get_speaker_for_time(t: float) -> str | None:
         """
         Find which speaker is active at time t.
 
-        First tries exact match (time falls within a segment).
-        If no exact match, falls back to nearest segment by time distance.
-        This handles gaps between diarization segments where words may fall.
+        Exact match if t falls within a segment, otherwise the nearest
+        segment by time distance. This handles gaps between diarization
+        segments where words may fall.
         """
-        nonlocal speaker_counter  # Must be declared before any use
-
-        def get_or_create_speaker_name(speaker_id: str) -> str:
-            """Map internal speaker ID to friendly name (Speaker 1, Speaker 2, ...)"""
-            nonlocal speaker_counter
-            if speaker_id not in speaker_map:
-                speaker_map[speaker_id] = f"Speaker {speaker_counter}"
-                speaker_counter += 1
-            return speaker_map[speaker_id]
-
-        # First: try exact match (word falls within a speaker segment)
-        for seg in sorted_segments:
-            seg_start = seg["start"]
-            seg_end = seg_start + seg["duration"]
-            if seg_start <= t <= seg_end:
-                return get_or_create_speaker_name(seg["speaker"])
-
-        # Fallback: find closest segment by time distance
-        # This handles words that fall in gaps between speaker segments
-        if sorted_segments:
-            def distance_to_segment(seg):
-                seg_start = seg["start"]
-                seg_end = seg_start + seg["duration"]
-                if t < seg_start:
-                    return seg_start - t  # Time is before segment
-                else:
-                    return t - seg_end  # Time is after segment
-
-            closest_seg = min(sorted_segments, key=distance_to_segment)
-            return get_or_create_speaker_name(closest_seg["speaker"])
-
-        return None
+        speaker_id = speaker_index.speaker_at(t)
+        if speaker_id is None:
+            return None
+        if speaker_id not in speaker_map:
+            speaker_map[speaker_id] = f"Speaker {len(speaker_map) + 1}"
+        return speaker_map[speaker_id]
 
     # Assign speaker to each word based on midpoint
     words_with_speakers = []
@@ -1057,75 +1148,203 @@ def format_transcript_with_speakers(segments: List[Dict[str, Any]]) -> str:
     return " ".join(parts)
 
 
-def transcribe_audio(audio_path: str) -> str:
+def write_input_audio(audio_bytes: bytes, audio_format: str) -> str:
+    """
+    Write received audio to a temporary WAV file (NeMo requires file path).
+
+    FLAC is decoded losslessly with soundfile, so ASR input is identical to
+    sending WAV. Opus is decoded and resampled to 16kHz mono with ffmpeg.
+
+    Args:
+        audio_bytes: Decoded (non-base64) audio bytes
+        audio_format: Transport encoding - "wav", "flac" or "opus"
+
+    Returns:
+        Path to temporary WAV file (caller deletes it)
+    """
+    with tempfile.NamedTemporaryFile(suffix=AUDIO_FORMAT_SUFFIXES[audio_format], delete=False) as tmp:
+        tmp.write(audio_bytes)
+        encoded_path = tmp.name
+
+    if audio_format == "wav":
+        return encoded_path
+
+    wav_path = os.path.splitext(encoded_path)[0] + ".wav"
+    try:
+        if audio_format == "flac":
+            import soundfile as sf
+
+            audio_data, sample_rate = sf.read(encoded_path, dtype="int16")
+            sf.write(wav_path, audio_data, sample_rate, subtype="PCM_16")
+        else:
+            subprocess.run(
+                ["ffmpeg", "-y", "-i", encoded_path, "-ac", "1", "-ar", "16000", wav_path],
+                check=True,
+                capture_output=True
+            )
+    finally:
+        os.unlink(encoded_path)
+
+    return wav_path
+
+
+def load_audio_samples(audio_path: str) -> Tuple[np.ndarray, int]:
     """
-    Transcribe audio file using PROTOVERB ASR model.
+    Decode an audio file once into a float32 mono array at the ASR sample rate.
+
+    Diarization segments are cut from this array as NumPy views (zero-copy)
+    instead of re-reading the whole file and writing a temp WAV per segment.
+    Decoding matches NeMo's own loader (soundfile float32, librosa resample).
 
     Args:
         audio_path: Path to audio file
 
     Returns:
-        Transcribed text (lowercase, no punctuation)
+        Tuple of (samples, sample_rate)
     """
-    global ASR_MODEL
+    import soundfile as sf
 
-    if ASR_MODEL is None:
-        raise RuntimeError("ASR model not loaded")
+    audio_data, sample_rate = sf.read(audio_path, dtype="float32")
 
-    transcriptions = ASR_MODEL.transcribe([audio_path])
-    return transcriptions[0].strip() if transcriptions else ""
+    if audio_data.ndim > 1:
+        audio_data = audio_data.mean(axis=1, dtype=np.float32)
 
+    if sample_rate != TARGET_SAMPLE_RATE:
+        import librosa
 
-def extract_audio_segment(
-    audio_path: str,
+        audio_data = librosa.resample(
+            audio_data, orig_sr=sample_rate, target_sr=TARGET_SAMPLE_RATE
+        ).astype(np.float32, copy=False)
+        sample_rate = TARGET_SAMPLE_RATE
+
+    return audio_data, sample_rate
+
+
+def slice_audio_segment(
+    audio: np.ndarray,
+    sample_rate: int,
     start: float,
     end: float,
     padding_before: float = 0.0,
     padding_after: float = 0.0
 ) -> tuple:
     """
-    Extract audio segment to a temporary file with optional context padding.
+    Slice an audio segment with optional context padding.
 
-    Uses soundfile for efficient audio slicing without re-encoding.
+    Returns a view into the decoded audio - no copy, no temp file.
     Padding adds extra audio before/after for ASR context, which improves
     transcription quality on short segments.
 
     Args:
-        audio_path: Path to source audio file
+        audio: Full decoded audio (from load_audio_samples)
+        sample_rate: Sample rate of audio
         start: Start time in seconds (of the actual segment)
         end: End time in seconds (of the actual segment)
         padding_before: Extra audio to include before start (seconds)
         padding_after: Extra audio to include after end (seconds)
 
     Returns:
-        Tuple of (path to temp file, actual_start, actual_end) where
+        Tuple of (segment samples, actual_start, actual_end) where
         actual_start/end reflect the padding applied (clamped to file bounds)
     """
-    import soundfile as sf
-
-    # Read audio file
-    audio_data, sample_rate = sf.read(audio_path)
-    total_duration = len(audio_data) / sample_rate
+    total_duration = len(audio) / sample_rate
 
     # Apply padding (clamped to file bounds)
     padded_start = max(0, start - padding_before)
     padded_end = min(total_duration, end + padding_after)
 
-    # Calculate sample indices
-    start_sample = int(padded_start * sample_rate)
-    end_sample = int(padded_end * sample_rate)
+    # Calculate sample indices (clamped to valid range)
+    start_sample = max(0, int(padded_start * sample_rate))
+    end_sample = min(len(audio), int(padded_end * sample_rate))
+
+    return audio[start_sample:end_sample], padded_start, padded_end
+
+
+def run_asr_batch(batch: List[np.ndarray]) -> List[Any]:
+    """
+    Run PROTOVERB ASR on a batch of in-memory segments (one forward pass).
 
-    # Clamp to valid range
-    start_sample = max(0, start_sample)
-    end_sample = min(len(audio_data), end_sample)
+    Segments are zero-padded to the longest one and passed with their real
+    lengths, so the preprocessor (per-feature normalization) and the CTC
+    decoder ignore the padding. Equivalent to ASR_MODEL.transcribe(...,
+    return_hypotheses=True) without the temp manifest/file round trip. Each
+    returned hypothesis carries its per-frame log probabilities (y_sequence),
+    so forced alignment can reuse them instead of running the model again.
 
-    # Extract segment
-    segment_data = audio_data[start_sample:end_sample]
+    Args:
+        batch: float32 mono samples at TARGET_SAMPLE_RATE, one array per segment
 
-    # Write to temp file
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        sf.write(tmp.name, segment_data, sample_rate)
-        return tmp.name, padded_start, padded_end
+    Returns:
+        NeMo Hypotheses (text and y_sequence), in the order of batch
+    """
+    global ASR_MODEL
+
+    if ASR_MODEL is None:
+        raise RuntimeError("ASR model not loaded")
+
+    if not batch:
+        return []
+
+    import torch
+
+    device = next(ASR_MODEL.parameters()).device
+
+    lengths = [len(samples) for samples in batch]
+    signal = torch.zeros((len(batch), max(lengths)), dtype=torch.float32)
+    for i, samples in enumerate(batch):
+        signal[i, :lengths[i]] = torch.from_numpy(np.ascontiguousarray(samples, dtype=np.float32))
+    signal = signal.to(device)
+    signal_length = torch.tensor(lengths, device=device)
+
+    with torch.inference_mode():
+        log_probs, encoded_len, _ = ASR_MODEL.forward(
+            input_signal=signal,
+            input_signal_length=signal_length
+        )
+        hypotheses, _ = ASR_MODEL.decoding.ctc_decoder_predictions_tensor(
+            log_probs,
+            decoder_lengths=encoded_len,
+            return_hypotheses=True
+        )
+
+    for i, hypothesis in enumerate(hypotheses):
+        hypothesis.y_sequence = log_probs[i][:encoded_len[i]].cpu()
+    return list(hypotheses)
+
+
+def run_asr(samples: np.ndarray) -> Any:
+    """
+    Run PROTOVERB ASR on in-memory samples (single forward pass).
+
+    Args:
+        samples: float32 mono samples at TARGET_SAMPLE_RATE
+
+    Returns:
+        NeMo Hypothesis with text and y_sequence
+    """
+    return run_asr_batch([samples])[0]
+
+
+def transcribe_audio(audio: Union[str, np.ndarray]) -> str:
+    """
+    Transcribe audio using PROTOVERB ASR model.
+
+    Args:
+        audio: Path to audio file, or in-memory float32 samples
+
+    Returns:
+        Transcribed text (lowercase, no punctuation)
+    """
+    global ASR_MODEL
+
+    if ASR_MODEL is None:
+        raise RuntimeError("ASR model not loaded")
+
+    if isinstance(audio, np.ndarray):
+        return run_asr(audio).text.strip()
+
+    transcriptions = ASR_MODEL.transcribe([audio])
+    return transcriptions[0].strip() if transcriptions else ""
 
 
 # Configuration for segment processing
@@ -1134,6 +1353,12 @@ MAX_SEGMENT_FOR_ASR = 30.0  # Don't merge if result would exceed this (seconds)
 CONTEXT_PADDING = 0.5  # Add this much audio before/after for ASR context (seconds)
 MIN_SEGMENT_FOR_NFA = 2.0  # Skip NFA for segments shorter than this (seconds)
 
+# Batched segment inference: segments are sorted by length and grouped so that
+# each batch is one padded ASR forward pass (and one Viterbi pass for NFA).
+# Padded cost of a batch = batch size x longest segment in it.
+ASR_BATCH_MAX_SEGMENTS = int(os.environ.get("ASR_BATCH_MAX_SEGMENTS", "16"))
+ASR_BATCH_MAX_SECONDS = float(os.environ.get("ASR_BATCH_MAX_SECONDS", "240"))
+
 
 def merge_short_segments_for_asr(
     segments: List[Dict[str, Any]],
@@ -1226,134 +1451,170 @@ def merge_short_segments_for_asr(
     return merged
 
 
-def process_diarization_segment(
-    audio_path: str,
-    segment: Dict[str, Any],
-    segment_index: int
-) -> Dict[str, Any]:
+def plan_segment_batches(
+    durations: List[float],
+    max_batch_size: int = ASR_BATCH_MAX_SEGMENTS,
+    max_batch_seconds: float = ASR_BATCH_MAX_SECONDS
+) -> List[List[int]]:
     """
-    Process a single diarization segment: extract audio, run ASR, run NFA.
+    Group segments into length-sorted batches for batched inference.
 
-    This function is designed to be run in parallel for each segment.
+    Sorting by length keeps similar durations together, so little compute is
+    spent on padding. A batch is closed when it reaches max_batch_size or when
+    its padded audio (size x longest duration) would exceed max_batch_seconds.
+    A segment longer than max_batch_seconds gets a batch of its own.
 
-    Features:
-    - Context padding: Adds CONTEXT_PADDING seconds before/after for ASR quality
-    - Skips NFA on tiny segments (<MIN_SEGMENT_FOR_NFA) to reduce overhead
+    Args:
+        durations: Duration (seconds) of each segment's audio
+        max_batch_size: Maximum segments per batch
+        max_batch_seconds: Maximum padded audio per batch (seconds)
+
+    Returns:
+        Batches as lists of indices into durations, shortest segments first
+    """
+    if max_batch_size < 1:
+        raise ValueError("max_batch_size must be >= 1")
+
+    order = sorted(range(len(durations)), key=lambda i: durations[i])
+
+    batches = []
+    current = []
+    for i in order:
+        # Ascending order: the new segment is the longest in the batch
+        padded_seconds = (len(current) + 1) * durations[i]
+        if current and (len(current) >= max_batch_size or padded_seconds > max_batch_seconds):
+            batches.append(current)
+            current = []
+        current.append(i)
+
+    if current:
+        batches.append(current)
+
+    return batches
+
+
+def build_segment_result(
+    segment: Dict[str, Any],
+    segment_index: int,
+    text: str,
+    words: List[Dict[str, Any]],
+    error: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build the processed-segment dict returned by process_segments_batched.
 
     Args:
-        audio_path: Path to full audio file
         segment: Diarization segment {"start": float, "duration": float, "speaker": str}
-        segment_index: Index of this segment (for logging)
+        segment_index: Index of this segment
+        text: ASR transcript
+        words: Absolute word timestamps
+        error: Error message if the segment failed
 
     Returns:
-        Processed segment with text and word timestamps:
-        {
-            "id": int,
-            "start": float,
-            "end": float,
-            "speaker": str,
-            "text": str,
-            "words": [{"word": str, "start": float, "end": float}, ...]
-        }
+        {"id", "start", "end", "speaker", "text", "words"} (+ "error")
     """
     start = segment["start"]
-    duration = segment["duration"]
-    end = start + duration
-    speaker = segment["speaker"]
+    result = {
+        "id": segment_index,
+        "start": start,
+        "end": start + segment["duration"],
+        "speaker": segment["speaker"],
+        "text": text,
+        "words": words
+    }
+    if error:
+        result["error"] = error
+    return result
+
 
-    segment_audio_path = None
+def process_segment_batch(
+    segments: List[Dict[str, Any]],
+    slices: List[Tuple[np.ndarray, float, float]],
+    batch: List[int]
+) -> List[Dict[str, Any]]:
+    """
+    Run batched ASR and forced alignment for one batch of segments.
+
+    Features:
+    - Context padding: slices include CONTEXT_PADDING seconds before/after
+    - Skips alignment on empty and tiny segments (<MIN_SEGMENT_FOR_NFA)
+
+    Args:
+        segments: All diarization segments
+        slices: (samples, padded_start, padded_end) per segment, from slice_audio_segment
+        batch: Indices of the segments in this batch
+
+    Returns:
+        Processed segments (see build_segment_result), in batch order
+    """
     try:
-        # Extract audio segment with context padding for better ASR quality
-        segment_audio_path, padded_start, padded_end = extract_audio_segment(
-            audio_path, start, end,
-            padding_before=CONTEXT_PADDING,
-            padding_after=CONTEXT_PADDING
-        )
+        hypotheses = run_asr_batch([slices[i][0] for i in batch])
+    except Exception as e:
+        logger.error(f"ASR failed for batch of {len(batch)} segments: {e}")
+        return [build_segment_result(segments[i], i, "", [], error=str(e)) for i in batch]
 
-        # Run ASR on segment (with padded audio for context)
-        segment_text = transcribe_audio(segment_audio_path)
-
-        if not segment_text.strip():
-            logger.debug(f"Segment {segment_index}: empty transcription")
-            return {
-                "id": segment_index,
-                "start": start,
-                "end": end,
-                "speaker": speaker,
-                "text": "",
-                "words": []
-            }
+    texts = [hypothesis.text.strip() for hypothesis in hypotheses]
 
-        words = []
+    # Skip alignment on empty and very short segments (not worth the overhead)
+    to_align = [
+        k for k, i in enumerate(batch)
+        if texts[k] and segments[i]["duration"] >= MIN_SEGMENT_FOR_NFA
+    ]
 
-        # Skip NFA on very short segments (not worth the overhead)
-        if duration < MIN_SEGMENT_FOR_NFA:
-            logger.debug(
-                f"Segment {segment_index}: skipping NFA (duration={duration:.1f}s < "
-                f"{MIN_SEGMENT_FOR_NFA}s threshold)"
+    aligned = {}
+    if to_align:
+        try:
+            word_lists = run_forced_alignment_batch(
+                [hypotheses[k] for k in to_align],
+                [texts[k] for k in to_align]
             )
-        else:
-            # Run NFA on segment for word-level timestamps
-            word_timestamps = run_forced_alignment(segment_audio_path, segment_text)
-
-            # Adjust word timestamps to absolute time
-            # NFA timestamps are relative to padded audio, so add padded_start offset
-            for w in word_timestamps:
-                words.append({
-                    "word": w["word"],
-                    "start": round(padded_start + w["start"], 2),
-                    "end": round(padded_start + w["end"], 2)
-                })
+            aligned = dict(zip(to_align, word_lists))
+        except Exception as e:
+            logger.error(f"Alignment failed for batch of {len(to_align)} segments: {e}")
 
-        logger.debug(
-            f"Segment {segment_index} [{start:.1f}s-{end:.1f}s] {speaker}: "
-            f"{len(segment_text)} chars, {len(words)} words"
-        )
+    results = []
+    for k, i in enumerate(batch):
+        padded_start = slices[i][1]
 
-        return {
-            "id": segment_index,
-            "start": start,
-            "end": end,
-            "speaker": speaker,
-            "text": segment_text,
-            "words": words
-        }
+        # Alignment timestamps are relative to padded audio, so add padded_start offset
+        words = [
+            {
+                "word": w["word"],
+                "start": round(padded_start + w["start"], 2),
+                "end": round(padded_start + w["end"], 2)
+            }
+            for w in aligned.get(k, [])
+        ]
 
-    except Exception as e:
-        logger.error(f"Failed to process segment {segment_index}: {e}")
-        return {
-            "id": segment_index,
-            "start": start,
-            "end": end,
-            "speaker": speaker,
-            "text": "",
-            "words": [],
-            "error": str(e)
-        }
+        result = build_segment_result(segments[i], i, texts[k], words)
+        logger.debug(
+            f"Segment {i} [{result['start']:.1f}s-{result['end']:.1f}s] {result['speaker']}: "
+            f"{len(texts[k])} chars, {len(words)} words"
+        )
+        results.append(result)
 
-    finally:
-        # Cleanup temp file
-        if segment_audio_path:
-            try:
-                os.unlink(segment_audio_path)
-            except Exception:
-                pass
+    return results
 
 
-def process_segments_parallel(
+def process_segments_batched(
     audio_path: str,
     segments: List[Dict[str, Any]],
-    max_workers: int = 4
+    max_batch_size: int = ASR_BATCH_MAX_SEGMENTS,
+    max_batch_seconds: float = ASR_BATCH_MAX_SECONDS
 ) -> List[Dict[str, Any]]:
     """
-    Process all diarization segments in parallel.
+    Process all diarization segments with batched ASR + alignment.
 
-    Runs ASR + NFA on each segment concurrently using ThreadPoolExecutor.
+    The audio is decoded once and segments are zero-copy slices of it.
+    Segments are grouped into length-sorted batches (plan_segment_batches);
+    each batch is a single padded forward pass, which keeps the GPU busy
+    instead of serializing small per-segment calls.
 
     Args:
         audio_path: Path to full audio file
         segments: List of diarization segments from run_diarization()
-        max_workers: Maximum parallel workers (default: 4)
+        max_batch_size: Maximum segments per batch
+        max_batch_seconds: Maximum padded audio per batch (seconds)
 
     Returns:
         List of processed segments with text and word timestamps,
@@ -1362,30 +1623,34 @@ def process_segments_parallel(
     if not segments:
         return []
 
-    logger.info(f"Processing {len(segments)} segments in parallel (max_workers={max_workers})")
     start_time = time.time()
 
-    results = []
+    # Decode once - segments are sliced from this array in memory
+    audio, sample_rate = load_audio_samples(audio_path)
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all segments for processing
-        futures = {
-            executor.submit(
-                process_diarization_segment,
-                audio_path,
-                segment,
-                i
-            ): i for i, segment in enumerate(segments)
-        }
+    # Slice segments (zero-copy views) with context padding for better ASR quality
+    slices = [
+        slice_audio_segment(
+            audio, sample_rate, segment["start"], segment["start"] + segment["duration"],
+            padding_before=CONTEXT_PADDING,
+            padding_after=CONTEXT_PADDING
+        )
+        for segment in segments
+    ]
 
-        # Collect results as they complete
-        for future in futures:
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                segment_idx = futures[future]
-                logger.error(f"Segment {segment_idx} failed: {e}")
+    batches = plan_segment_batches(
+        [len(samples) / sample_rate for samples, _, _ in slices],
+        max_batch_size=max_batch_size,
+        max_batch_seconds=max_batch_seconds
+    )
+    logger.info(
+        f"Processing {len(segments)} segments in {len(batches)} batches "
+        f"(max_batch_size={max_batch_size}, max_batch_seconds={max_batch_seconds})"
+    )
+
+    results = []
+    for batch in batches:
+        results.extend(process_segment_batch(segments, slices, batch))
 
     # Sort by start time
     results.sort(key=lambda s: s["start"])
@@ -1397,7 +1662,7 @@ def process_segments_parallel(
     elapsed = time.time() - start_time
     total_words = sum(len(s.get("words", [])) for s in results)
     logger.info(
-        f"Parallel processing complete in {elapsed:.1f}s: "
+        f"Batched processing complete in {elapsed:.1f}s: "
         f"{len(results)} segments, {total_words} words"
     )
 
@@ -1478,7 +1743,9 @@ def handler(job: Dict[str, Any]) -> Dict[str, Any]:
 
     Args:
         job: RunPod job dict with "input" containing:
-            - audio_base64: Base64 encoded WAV audio
+            - audio_base64: Base64 encoded audio
+            - audio_format: Transport encoding - wav, flac, opus (default: "wav")
+            - audio_transport_version: Payload version (default: 1)
             - filename: Optional original filename
             - punctuate: Whether to add punctuation (default: True)
             - denormalize: Whether to denormalize text (default: True)
@@ -1486,6 +1753,7 @@ def handler(job: Dict[str, Any]) -> Dict[str, Any]:
             - enable_diarization: Whether to identify speakers (default: False)
             - speaker_count: Known number of speakers, null for auto-detect (default: null)
             - max_speakers: Maximum speakers for auto-detect (default: 10)
+            - warmup: If true, only load models and return {"warmup": true} (keep-alive ping)
 
     Returns:
         dict with:
@@ -1502,7 +1770,18 @@ def handler(job: Dict[str, Any]) -> Dict[str, Any]:
     """
     # Extract input
     job_input = job.get("input", {})
+
+    # Keep-alive ping sent by the backend before an upload: load models, process nothing.
+    # Includes the diarization (MSDD) models, so the first diarized job does not load them.
+    if job_input.get("warmup"):
+        try:
+            load_models_parallel(need_asr=True, need_punct=True, need_denorm=True, need_diarization=True)
+        except Exception as e:
+            return {"error": f"Failed to load models: {str(e)}"}
+        return {"warmup": True, "model_version": MODEL_VERSION}
     audio_base64 = job_input.get("audio_base64")
+    audio_format = job_input.get("audio_format", "wav")
+    transport_version = job_input.get("audio_transport_version", 1)
     filename = job_input.get("filename", "audio.wav")
 
     # Processing options (defaults: both enabled)
@@ -1547,6 +1826,18 @@ def handler(job: Dict[str, Any]) -> Dict[str, Any]:
     if not audio_base64:
         return {"error": "No audio_base64 provided in input"}
 
+    if not isinstance(transport_version, int) or transport_version > AUDIO_TRANSPORT_VERSION:
+        return {
+            "error": f"Unsupported audio_transport_version {transport_version} "
+                     f"(max: {AUDIO_TRANSPORT_VERSION})"
+        }
+
+    if audio_format not in AUDIO_FORMAT_SUFFIXES:
+        return {
+            "error": f"Unsupported audio_format '{audio_format}' "
+                     f"(supported: {', '.join(AUDIO_FORMAT_SUFFIXES)})"
+        }
+
     # Decode audio
     try:
         audio_bytes = base64.b64decode(audio_base64)
@@ -1566,12 +1857,10 @@ def handler(job: Dict[str, Any]) -> Dict[str, Any]:
         start_time = time.time()
         pipeline_steps: List[str] = []
 
-        # Save to temp file (NeMo requires file path)
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp.write(audio_bytes)
-            tmp_path = tmp.name
+        # Save to temp WAV file (NeMo requires file path)
+        tmp_path = write_input_audio(audio_bytes, audio_format)
 
-        logger.info(f"Processing {filename} ({len(audio_bytes)} bytes)")
+        logger.info(f"Processing {filename} ({len(audio_bytes)} bytes, {audio_format})")
         logger.info(
             f"Options: punctuate={do_punctuate}, denormalize={do_denormalize}, "
             f"style={denormalize_style}, diarization={do_diarization}, "
@@ -1593,9 +1882,9 @@ def handler(job: Dict[str, Any]) -> Dict[str, Any]:
             #
             # Flow:
             #   1. Diarization (full audio) → speaker segments with timestamps
-            #   2. For each segment in parallel:
-            #      - Extract segment audio
-            #      - ASR on segment → text
+            #   2. For each length-sorted batch of segments:
+            #      - Slice segment audio
+            #      - Batched ASR → text
             #      - NFA on segment → word timestamps
             #   3. Merge consecutive same-speaker segments
             #   4. Apply punctuation/denormalization per segment
@@ -1628,12 +1917,11 @@ def handler(job: Dict[str, Any]) -> Dict[str, Any]:
                     min_duration=MIN_SEGMENT_FOR_ASR
                 )
 
-                # Phase 2: Process each segment in parallel (ASR + NFA per segment)
-                logger.info("Phase 2: Processing segments in parallel (ASR + NFA per segment)")
-                processed_segments = process_segments_parallel(
+                # Phase 2: Batched ASR + alignment over length-sorted segment batches
+                logger.info("Phase 2: Processing segments in batches (ASR + alignment per batch)")
+                processed_segments = process_segments_batched(
                     tmp_path,
-                    merged_for_asr,  # Use pre-merged segments
-                    max_workers=4
+                    merged_for_asr  # Use pre-merged segments
                 )
                 pipeline_steps.append("asr")
                 pipeline_steps.append("align")
@@ -1752,4 +2040,5 @@ if __name__ == "__main__":
     load_models_parallel(need_asr=True, need_punct=True, need_denorm=True)
 
     # Start RunPod serverless worker
+    import runpod
     runpod.serverless.start({"handler": handler})
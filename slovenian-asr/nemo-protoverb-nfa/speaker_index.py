@@ -0,0 +1,103 @@
+"""
+Sorted-interval index for speaker lookups over diarization segments.
+
+Shared by all handler variants (nemo-protoverb-nfa, -mms, -pyannote). Each
+variant is its own Docker build context, so the file is copied into every
+variant directory like nemo_compat/ - keep the copies identical.
+
+Lookup semantics match the original linear scan in merge_words_with_speakers:
+- Exact match: the first segment (in start order) with start <= t <= end
+- Otherwise: the nearest segment by time distance (earliest on ties)
+
+Both are O(log n) per lookup with bisect instead of O(n).
+"""
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional
+
+
+class SpeakerIndex:
+    """
+    Time -> diarization segment index.
+
+    Usage:
+        index = SpeakerIndex(speaker_segments)
+        speaker = index.speaker_at(word_midpoint)
+    """
+
+    def __init__(self, segments: List[Dict[str, Any]]):
+        """
+        Build the index.
+
+        Args:
+            segments: Diarization segments
+                [{"start": float, "duration": float, "speaker": str}, ...]
+        """
+        # Stable sort: equal starts keep their input order (same as sorted() in the scan)
+        self.segments = sorted(segments, key=lambda s: s["start"])
+        self.starts = [seg["start"] for seg in self.segments]
+
+        # Running max of segment ends, and the first segment reaching that max.
+        # Segments can overlap, so ends are not sorted; the running max is.
+        self.max_ends: List[float] = []
+        self.max_end_index: List[int] = []
+        best_end = float("-inf")
+        best_index = -1
+        for i, seg in enumerate(self.segments):
+            end = seg["start"] + seg["duration"]
+            if end > best_end:
+                best_end = end
+                best_index = i
+            self.max_ends.append(best_end)
+            self.max_end_index.append(best_index)
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def segment_at(self, t: float) -> Optional[Dict[str, Any]]:
+        """
+        Find the segment active at time t, or the nearest one.
+
+        Args:
+            t: Time in seconds
+
+        Returns:
+            Matching segment, or None if the index is empty
+        """
+        if not self.segments:
+            return None
+
+        # Segments [0, k) start at or before t
+        k = bisect_right(self.starts, t)
+
+        if k:
+            # First segment in [0, k) whose end reaches t: the running max
+            # first crosses t exactly at that segment
+            i = bisect_left(self.max_ends, t, 0, k)
+            if i < k:
+                return self.segments[i]
+
+        # No exact match: every segment in [0, k) ended before t.
+        # Nearest before: the latest end; nearest after: the next start.
+        if k == 0:
+            return self.segments[0]
+        if k == len(self.segments):
+            return self.segments[self.max_end_index[k - 1]]
+
+        distance_before = t - self.max_ends[k - 1]
+        distance_after = self.starts[k] - t
+        if distance_before <= distance_after:
+            return self.segments[self.max_end_index[k - 1]]
+        return self.segments[k]
+
+    def speaker_at(self, t: float) -> Optional[str]:
+        """
+        Find the speaker active at time t, or the nearest one.
+
+        Args:
+            t: Time in seconds
+
+        Returns:
+            Speaker ID, or None if the index is empty
+        """
+        segment = self.segment_at(t)
+        return segment["speaker"] if segment is not None else None
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+CPU benchmark suite for the handlers' post-ASR stages.
+
+Times the pure-Python stages that run on (expensive) GPU workers after ASR:
+
+    parse_rttm                        - NeMo diarization output
+    parse_ctm_file                    - NFA word timestamps
+    merge_short_segments_for_asr      - pre-ASR segment merge
+    merge_words_with_speakers         - word -> speaker assignment
+    merge_consecutive_speaker_segments
+    format_transcript_with_speakers
+
+on synthetic diarization and CTM outputs at realistic scales (10 min to 3 h,
+2-10 speakers), for all three handler variants side by side. Outputs of the
+variants are compared as well - they must agree.
+
+Regression check: timings are normalized by a fixed pure-Python calibration
+workload, so a baseline recorded on one machine is usable on another. A stage
+regresses when it is slower than baseline x tolerance (default 2x: shared
+CPUs are noisy, and the regressions worth catching are algorithmic).
+
+No NeMo, pyannote, RunPod SDK or GPU needed - only numpy.
+
+Usage:
+    # Run and compare against the committed baseline (exit 1 on regression)
+    python scripts/benchmark_post_asr.py
+
+    # Record a new baseline after an intentional change
+    python scripts/benchmark_post_asr.py --save-baseline
+
+    # Quick run on the small scales only
+    python scripts/benchmark_post_asr.py --scales 10min 30min
+"""
+import argparse
+import gc
+import importlib.util
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).parent
+SLOVENIAN_ASR_DIR = SCRIPT_DIR.parent
+DEFAULT_BASELINE = SCRIPT_DIR / "post_asr_baseline.json"
+
+PIPELINE_DIRS = {
+    "nfa": "nemo-protoverb-nfa",
+    "mms": "nemo-protoverb-mms",
+    "pyannote": "nemo-protoverb-pyannote"
+}
+
+# name -> (duration in minutes, speakers)
+SCALES = {
+    "10min": (10, 2),
+    "30min": (30, 3),
+    "1h": (60, 4),
+    "3h": (180, 10),
+}
+
+# Diarization density (NeMo ClusteringDiarizer: ~1200 segments per 30 min)
+SEGMENTS_PER_MINUTE = 40
+WORDS_PER_MINUTE = 150
+
+STAGES = [
+    "parse_rttm",
+    "parse_ctm_file",
+    "merge_short_segments_for_asr",
+    "merge_words_with_speakers",
+    "merge_consecutive_speaker_segments",
+    "format_transcript_with_speakers",
+]
+
+# Ignore differences below this (normalized units) - timer noise
+MIN_REGRESSION_DELTA = 0.02
+
+
+def load_handler(variant: str):
+    """Import a handler module by path (no RunPod worker is started)."""
+    path = SLOVENIAN_ASR_DIR / PIPELINE_DIRS[variant] / "handler.py"
+    spec = importlib.util.spec_from_file_location(f"handler_{variant}", path)
+    module = importlib.util.module_from_spec(spec)
+    # Handlers import their sibling modules (speaker_index) from /app
+    sys.path.insert(0, str(path.parent))
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(str(path.parent))
+    return module
+
+
+def calibrate(repeats: int = 5) -> float:
+    """
+    Time a fixed pure-Python workload (dict/list/string churn like the stages).
+
+    Returns:
+        Best time in seconds; stage timings are divided by this
+    """
+    def workload():
+        items = [{"start": i * 0.37, "duration": 1.5, "speaker": f"s{i % 7}"} for i in range(60000)]
+        items.sort(key=lambda s: (s["speaker"], s["start"]))
+        return " ".join(s["speaker"] for s in items if s["start"] + s["duration"] > 100)
+
+    return best_time(workload, repeats)
+
+
+def best_time(fn: Callable[[], Any], repeats: int) -> float:
+    """Best wall time of fn over repeats (least affected by noise), GC off like timeit."""
+    best = float("inf")
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best
+
+
+def make_diarization(duration_min: float, speakers: int, seed: int) -> List[Dict[str, Any]]:
+    """Speaker turns with short gaps, occasional overlaps and many short turns."""
+    rng = np.random.default_rng(seed)
+    total = duration_min * 60
+    count = int(duration_min * SEGMENTS_PER_MINUTE)
+    bounds = np.sort(rng.uniform(0, total, count - 1))
+    edges = np.concatenate([[0.0], bounds, [total]])
+
+    segments = []
+    speaker = 0
+    for i in range(count):
+        # Same speaker keeps talking ~half the time (exercises the merges)
+        if rng.random() < 0.5:
+            speaker = int(rng.integers(speakers))
+        start = float(edges[i]) + float(rng.uniform(0.0, 0.2))
+        end = float(edges[i + 1]) + float(rng.choice([0.0, 0.3], p=[0.9, 0.1]))
+        segments.append({
+            "start": round(start, 3),
+            "duration": round(max(0.05, end - start), 3),
+            "speaker": f"speaker_{speaker}"
+        })
+    return segments
+
+
+def make_words(duration_min: float, seed: int) -> List[Dict[str, Any]]:
+    """Word timestamps (sorted by start), like NFA output."""
+    rng = np.random.default_rng(seed + 1)
+    count = int(duration_min * WORDS_PER_MINUTE)
+    starts = np.sort(rng.uniform(0, duration_min * 60, count))
+    lengths = rng.uniform(0.1, 0.5, count)
+    return [
+        {"word": f"beseda{i % 997}", "start": round(float(s), 3), "end": round(float(s + d), 3)}
+        for i, (s, d) in enumerate(zip(starts, lengths))
+    ]
+
+
+def make_processed_segments(diarization: List[Dict[str, Any]], words: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Segments in process_segments_batched() output shape."""
+    word_starts = np.array([w["start"] for w in words])
+    processed = []
+    for i, seg in enumerate(sorted(diarization, key=lambda s: s["start"])):
+        end = seg["start"] + seg["duration"]
+        lo, hi = np.searchsorted(word_starts, [seg["start"], end])
+        segment_words = words[lo:hi]
+        processed.append({
+            "id": i,
+            "start": seg["start"],
+            "end": end,
+            "speaker": seg["speaker"],
+            "text": " ".join(w["word"] for w in segment_words),
+            "words": segment_words
+        })
+    return processed
+
+
+def write_rttm(path: Path, diarization: List[Dict[str, Any]]) -> None:
+    with open(path, "w") as f:
+        for seg in diarization:
+            f.write(
+                f"SPEAKER audio 1 {seg['start']:.3f} {seg['duration']:.3f} "
+                f"<NA> <NA> {seg['speaker']} <NA> <NA>\n"
+            )
+
+
+def write_ctm(path: Path, words: List[Dict[str, Any]]) -> None:
+    with open(path, "w") as f:
+        for w in words:
+            f.write(f"audio 1 {w['start']:.3f} {w['end'] - w['start']:.3f} {w['word']}\n")
+
+
+def stage_calls(handler, inputs: Dict[str, Any]) -> Dict[str, Callable[[], Any]]:
+    """Stage name -> zero-arg call for one handler (stages it lacks are skipped)."""
+    calls = {
+        "parse_ctm_file": lambda: handler.parse_ctm_file(inputs["ctm_path"]),
+        "merge_short_segments_for_asr": lambda: handler.merge_short_segments_for_asr(inputs["diarization"]),
+        "merge_words_with_speakers": lambda: handler.merge_words_with_speakers(inputs["words"], inputs["diarization"]),
+        "merge_consecutive_speaker_segments": lambda: handler.merge_consecutive_speaker_segments(inputs["processed"]),
+        "format_transcript_with_speakers": lambda: handler.format_transcript_with_speakers(inputs["speaker_segments"]),
+    }
+    # pyannote has no RTTM step (diarization comes back as Python objects)
+    if hasattr(handler, "parse_rttm"):
+        calls["parse_rttm"] = lambda: handler.parse_rttm(inputs["rttm_path"])
+    return calls
+
+
+def run_suite(
+    handlers: Dict[str, Any],
+    scales: List[str],
+    repeats: int,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Time every stage of every handler at every scale.
+
+    Args:
+        handlers: variant -> loaded handler module
+        scales: Names from SCALES
+        repeats: Runs per measurement (best is kept)
+        seed: Synthetic data seed
+
+    Returns:
+        {"calibration": seconds, "results": {scale: {stage: {variant: seconds}}},
+         "mismatches": ["scale/stage: variants disagree", ...]}
+    """
+    calibration = calibrate()
+    results = {}
+    mismatches = []
+
+    with tempfile.TemporaryDirectory(prefix="post_asr_bench_") as temp_dir:
+        for scale in scales:
+            duration_min, speakers = SCALES[scale]
+            diarization = make_diarization(duration_min, speakers, seed)
+            words = make_words(duration_min, seed)
+
+            inputs = {
+                "diarization": diarization,
+                "words": words,
+                "processed": make_processed_segments(diarization, words),
+                "rttm_path": str(Path(temp_dir) / f"{scale}.rttm"),
+                "ctm_path": str(Path(temp_dir) / f"{scale}.ctm"),
+            }
+            write_rttm(Path(inputs["rttm_path"]), diarization)
+            write_ctm(Path(inputs["ctm_path"]), words)
+
+            # format_transcript_with_speakers consumes merge_words_with_speakers output
+            any_handler = next(iter(handlers.values()))
+            inputs["speaker_segments"] = any_handler.merge_words_with_speakers(words, diarization)
+
+            results[scale] = {}
+            for stage in STAGES:
+                timings = {}
+                outputs = {}
+                for variant, handler in handlers.items():
+                    call = stage_calls(handler, inputs).get(stage)
+                    if call is None:
+                        continue
+                    outputs[variant] = call()
+                    timings[variant] = best_time(call, repeats)
+
+                results[scale][stage] = timings
+                if len({json.dumps(out, sort_keys=True) for out in outputs.values()}) > 1:
+                    mismatches.append(f"{scale}/{stage}: variants disagree ({', '.join(outputs)})")
+
+    return {"calibration": calibration, "results": results, "mismatches": mismatches}
+
+
+def find_regressions(
+    suite: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float
+) -> List[str]:
+    """
+    Compare normalized timings against a baseline.
+
+    Args:
+        suite: run_suite() output
+        baseline: Saved baseline ({"normalized": {scale: {stage: {variant: units}}}})
+        tolerance: Allowed slowdown factor (e.g. 2.0)
+
+    Returns:
+        Human-readable regression descriptions (empty if none)
+    """
+    regressions = []
+    normalized = normalize(suite)
+    for scale, stages in normalized.items():
+        for stage, variants in stages.items():
+            for variant, units in variants.items():
+                base = baseline.get("normalized", {}).get(scale, {}).get(stage, {}).get(variant)
+                if base is None:
+                    continue
+                if units > base * tolerance and units - base > MIN_REGRESSION_DELTA:
+                    regressions.append(
+                        f"{scale}/{stage}/{variant}: {units:.3f} vs baseline {base:.3f} "
+                        f"({units / base:.2f}x > {tolerance}x)"
+                    )
+    return regressions
+
+
+def normalize(suite: Dict[str, Any]) -> Dict[str, Any]:
+    """Divide every timing by the calibration time (machine-independent units)."""
+    calibration = suite["calibration"]
+    return {
+        scale: {
+            stage: {variant: round(seconds / calibration, 4) for variant, seconds in variants.items()}
+            for stage, variants in stages.items()
+        }
+        for scale, stages in suite["results"].items()
+    }
+
+
+def print_report(suite: Dict[str, Any], variants: List[str]) -> None:
+    print(f"Calibration workload: {suite['calibration'] * 1000:.1f} ms")
+    for scale, stages in suite["results"].items():
+        duration_min, speakers = SCALES[scale]
+        print()
+        print(
+            f"== {scale}: {int(duration_min * SEGMENTS_PER_MINUTE)} segments, "
+            f"{int(duration_min * WORDS_PER_MINUTE)} words, {speakers} speakers (ms)"
+        )
+        print(f"{'stage':<36}" + "".join(f"{variant:>12}" for variant in variants))
+        for stage, timings in stages.items():
+            cells = "".join(
+                f"{timings[variant] * 1000:>12.2f}" if variant in timings else f"{'-':>12}"
+                for variant in variants
+            )
+            print(f"{stage:<36}{cells}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark post-ASR handler stages on CPU")
+    parser.add_argument("--variant", choices=[*PIPELINE_DIRS, "all"], default="all")
+    parser.add_argument("--scales", nargs="+", choices=list(SCALES), default=list(SCALES))
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per measurement (best is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=2.0, help="Allowed slowdown vs baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="Write results as the new baseline")
+    args = parser.parse_args()
+
+    variants = list(PIPELINE_DIRS) if args.variant == "all" else [args.variant]
+    handlers = {variant: load_handler(variant) for variant in variants}
+
+    suite = run_suite(handlers, args.scales, args.repeats, args.seed)
+    print_report(suite, variants)
+
+    failed = False
+    if suite["mismatches"]:
+        failed = True
+        print("\nVariant output mismatches:")
+        for mismatch in suite["mismatches"]:
+            print(f"  {mismatch}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps({"normalized": normalize(suite)}, indent=2) + "\n")
+        print(f"\nBaseline written to {args.baseline}")
+    elif args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+        regressions = find_regressions(suite, baseline, args.tolerance)
+        if regressions:
+            failed = True
+            print(f"\nRegressions vs {args.baseline.name}:")
+            for regression in regressions:
+                print(f"  {regression}")
+        else:
+            print(f"\nNo regressions vs {args.baseline.name} (tolerance {args.tolerance}x)")
+    else:
+        print(f"\nNo baseline at {args.baseline} (run with --save-baseline)")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
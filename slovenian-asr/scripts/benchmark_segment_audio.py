@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-segment audio handling in the diarization handlers (CPU only).
+
+Compares the old per-segment path (decode the full file, write a temp WAV,
+model reads it back for ASR and again for NFA) with the handlers' current
+path (decode once, zero-copy slices handed to batched ASR/NFA in memory).
+
+The ASR and alignment models are replaced by a stub that only touches the
+samples it receives, so the numbers isolate audio I/O cost. No NeMo,
+pyannote, RunPod SDK or GPU needed - only numpy and soundfile.
+
+Usage:
+    # 30-minute audio, pyannote-like segmentation (~126 segments)
+    python scripts/benchmark_segment_audio.py
+
+    # NeMo ClusteringDiarizer-like segmentation (~1200 segments)
+    python scripts/benchmark_segment_audio.py --segments 1200
+
+    # Specific handler variant, longer audio
+    python scripts/benchmark_segment_audio.py --variant nfa --duration-min 60
+"""
+import argparse
+import importlib.util
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import soundfile as sf
+
+SCRIPT_DIR = Path(__file__).parent
+SLOVENIAN_ASR_DIR = SCRIPT_DIR.parent
+
+PIPELINE_DIRS = {
+    "nfa": "nemo-protoverb-nfa",
+    "mms": "nemo-protoverb-mms",
+    "pyannote": "nemo-protoverb-pyannote"
+}
+
+SAMPLE_RATE = 16000
+
+
+class StubModel:
+    """Stands in for PROTOVERB/NFA: records how many samples each ASR call received."""
+
+    def __init__(self):
+        self.asr_calls = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _consume(samples: np.ndarray) -> int:
+        # Touch every sample, like a feature extractor would
+        float(np.abs(samples).sum())
+        return len(samples)
+
+    def _record(self, num_samples: int) -> None:
+        with self._lock:
+            self.asr_calls.append(num_samples)
+
+    def run_asr_batch(self, batch: list):
+        """In-memory batched ASR stub (replaces handler.run_asr_batch)."""
+        hypotheses = []
+        for samples in batch:
+            num_samples = self._consume(samples)
+            self._record(num_samples)
+            hypotheses.append(SimpleNamespace(text=f"segment of {num_samples} samples", y_sequence=None))
+        return hypotheses
+
+    def run_forced_alignment(self, audio, transcript, *args, **kwargs):
+        """Alignment stub (old path: NFA transcribed the temp file again)."""
+        samples, _ = sf.read(audio, dtype="float32")
+        self._consume(samples)
+        return [{"word": transcript.split()[0], "start": 0.0, "end": 0.1}]
+
+    def run_forced_alignment_batch(self, inputs, transcripts):
+        """Batched alignment stub (inputs are hypotheses, or segment samples for MMS)."""
+        return [[{"word": transcript.split()[0], "start": 0.0, "end": 0.1}] for transcript in transcripts]
+
+    def transcribe_file(self, path: str) -> str:
+        """File-based ASR stub (old path: NeMo reads the temp WAV)."""
+        samples, _ = sf.read(path, dtype="float32")
+        num_samples = self._consume(samples)
+        self._record(num_samples)
+        return f"segment of {num_samples} samples"
+
+
+def load_handler(variant: str):
+    """Import a handler module by path (no RunPod worker is started)."""
+    path = SLOVENIAN_ASR_DIR / PIPELINE_DIRS[variant] / "handler.py"
+    spec = importlib.util.spec_from_file_location(f"handler_{variant}", path)
+    module = importlib.util.module_from_spec(spec)
+    # Handlers import their sibling modules (speaker_index) from /app
+    sys.path.insert(0, str(path.parent))
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(str(path.parent))
+    return module
+
+
+def make_audio(path: Path, duration_min: float, seed: int) -> None:
+    """Write synthetic 16kHz mono PCM16 speech-like audio."""
+    rng = np.random.default_rng(seed)
+    num_samples = int(duration_min * 60 * SAMPLE_RATE)
+    t = np.arange(num_samples, dtype=np.float32) / SAMPLE_RATE
+    audio = 0.1 * np.sin(2 * np.pi * 220 * t) + 0.05 * rng.standard_normal(num_samples).astype(np.float32)
+    sf.write(str(path), audio, SAMPLE_RATE, subtype="PCM_16")
+
+
+def make_segments(duration_min: float, count: int, seed: int) -> list:
+    """Split the timeline into `count` speaker segments with random lengths."""
+    rng = np.random.default_rng(seed)
+    total = duration_min * 60
+    bounds = np.sort(rng.uniform(0, total, count - 1))
+    edges = np.concatenate([[0.0], bounds, [total]])
+    return [
+        {
+            "start": float(edges[i]),
+            "duration": float(edges[i + 1] - edges[i]),
+            "speaker": f"Speaker {i % 3 + 1}"
+        }
+        for i in range(count)
+    ]
+
+
+def run_legacy(handler, audio_path: str, segments: list, stub: StubModel, workers: int) -> float:
+    """Old path: full decode + temp WAV per segment, file read by ASR and NFA."""
+    def process(segment):
+        start = segment["start"]
+        end = start + segment["duration"]
+
+        audio_data, sample_rate = sf.read(audio_path)
+        total_duration = len(audio_data) / sample_rate
+        padded_start = max(0, start - handler.CONTEXT_PADDING)
+        padded_end = min(total_duration, end + handler.CONTEXT_PADDING)
+        segment_data = audio_data[int(padded_start * sample_rate):int(padded_end * sample_rate)]
+
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+            sf.write(tmp.name, segment_data, sample_rate)
+            segment_path = tmp.name
+        try:
+            text = stub.transcribe_file(segment_path)
+            if segment["duration"] >= handler.MIN_SEGMENT_FOR_NFA:
+                stub.run_forced_alignment(segment_path, text)
+        finally:
+            os.unlink(segment_path)
+
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(process, segments))
+    return time.perf_counter() - start_time
+
+
+def run_current(handler, audio_path: str, segments: list, stub: StubModel) -> float:
+    """Current handler path: decode once, in-memory slices, batched inference."""
+    handler.run_asr_batch = stub.run_asr_batch
+    handler.run_forced_alignment_batch = stub.run_forced_alignment_batch
+
+    start_time = time.perf_counter()
+    results = handler.process_segments_batched(audio_path, segments)
+    elapsed = time.perf_counter() - start_time
+
+    errors = [r for r in results if r.get("error")]
+    if errors:
+        raise RuntimeError(f"{len(errors)} segments failed, first: {errors[0]['error']}")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark handler segment audio handling on CPU")
+    parser.add_argument("--variant", choices=[*PIPELINE_DIRS, "all"], default="all")
+    parser.add_argument("--duration-min", type=float, default=30.0, help="Synthetic audio length (minutes)")
+    parser.add_argument("--segments", type=int, default=126, help="Diarization segments (pyannote ~126, NeMo ~1200 per 30 min)")
+    parser.add_argument("--workers", type=int, default=4, help="Legacy path worker threads (old handler default: 4)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    variants = list(PIPELINE_DIRS) if args.variant == "all" else [args.variant]
+
+    with tempfile.TemporaryDirectory(prefix="segment_bench_") as temp_dir:
+        audio_path = Path(temp_dir) / "audio.wav"
+        make_audio(audio_path, args.duration_min, args.seed)
+        segments = make_segments(args.duration_min, args.segments, args.seed)
+
+        print(f"Audio: {args.duration_min:.0f} min, {audio_path.stat().st_size / 1e6:.1f} MB WAV")
+        print(f"Segments: {len(segments)}, workers: {args.workers}")
+        print()
+        print(f"{'variant':<10} {'legacy (s)':>12} {'current (s)':>12} {'speedup':>9}  samples match")
+
+        for variant in variants:
+            handler = load_handler(variant)
+
+            # Handler pre-merges short segments before processing
+            merged = handler.merge_short_segments_for_asr(segments)
+
+            legacy_stub = StubModel()
+            legacy_time = run_legacy(handler, str(audio_path), merged, legacy_stub, args.workers)
+
+            current_stub = StubModel()
+            current_time = run_current(handler, str(audio_path), merged, current_stub)
+
+            # Same audio must reach ASR on both paths
+            matches = sorted(legacy_stub.asr_calls) == sorted(current_stub.asr_calls)
+
+            print(
+                f"{variant:<10} {legacy_time:>12.2f} {current_time:>12.2f} "
+                f"{legacy_time / current_time:>8.1f}x  {'yes' if matches else 'NO'}"
+            )
+
+            if not matches:
+                return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
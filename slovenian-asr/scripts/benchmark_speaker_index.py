@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark word -> speaker assignment in merge_words_with_speakers (CPU only).
+
+Compares the old linear scan (every diarization segment per word, plus a
+min() over all segments for words in gaps) with the handlers' sorted-interval
+SpeakerIndex, on synthetic 2-hour diarizations. Both must produce identical
+output. No NeMo, pyannote, RunPod SDK or GPU needed - only numpy.
+
+Usage:
+    # 2-hour session, pyannote-like and NeMo-like segment counts
+    python scripts/benchmark_speaker_index.py
+
+    # Longer session, more speakers
+    python scripts/benchmark_speaker_index.py --duration-min 180 --speakers 8
+"""
+import argparse
+import importlib.util
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).parent
+SLOVENIAN_ASR_DIR = SCRIPT_DIR.parent
+
+PIPELINE_DIRS = {
+    "nfa": "nemo-protoverb-nfa",
+    "mms": "nemo-protoverb-mms",
+    "pyannote": "nemo-protoverb-pyannote"
+}
+
+
+def load_handler(variant: str):
+    """Import a handler module by path (no RunPod worker is started)."""
+    path = SLOVENIAN_ASR_DIR / PIPELINE_DIRS[variant] / "handler.py"
+    spec = importlib.util.spec_from_file_location(f"handler_{variant}", path)
+    module = importlib.util.module_from_spec(spec)
+    # Handlers import their sibling modules (speaker_index) from /app
+    sys.path.insert(0, str(path.parent))
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(str(path.parent))
+    return module
+
+
+def legacy_assign_speakers(words: list, speaker_segments: list) -> list:
+    """Old per-word lookup from merge_words_with_speakers (linear scan)."""
+    sorted_segments = sorted(speaker_segments, key=lambda s: s["start"])
+    speaker_map = {}
+
+    def get_speaker_for_time(t):
+        for seg in sorted_segments:
+            seg_start = seg["start"]
+            seg_end = seg_start + seg["duration"]
+            if seg_start <= t <= seg_end:
+                speaker_id = seg["speaker"]
+                break
+        else:
+            def distance_to_segment(seg):
+                seg_start = seg["start"]
+                seg_end = seg_start + seg["duration"]
+                if t < seg_start:
+                    return seg_start - t
+                return t - seg_end
+
+            speaker_id = min(sorted_segments, key=distance_to_segment)["speaker"]
+
+        if speaker_id not in speaker_map:
+            speaker_map[speaker_id] = f"Speaker {len(speaker_map) + 1}"
+        return speaker_map[speaker_id]
+
+    return [
+        {**word, "speaker": get_speaker_for_time((word["start"] + word["end"]) / 2)}
+        for word in words
+    ]
+
+
+def make_diarization(duration_min: float, count: int, speakers: int, seed: int) -> list:
+    """Speaker turns with short gaps and occasional overlaps."""
+    rng = np.random.default_rng(seed)
+    total = duration_min * 60
+    bounds = np.sort(rng.uniform(0, total, count - 1))
+    edges = np.concatenate([[0.0], bounds, [total]])
+
+    segments = []
+    for i in range(count):
+        start = float(edges[i]) + float(rng.uniform(0.0, 0.3))  # gap before turn
+        end = float(edges[i + 1]) + float(rng.choice([0.0, 0.4], p=[0.9, 0.1]))  # some overlap
+        segments.append({
+            "start": round(start, 2),
+            "duration": round(max(0.05, end - start), 2),
+            "speaker": f"speaker_{int(rng.integers(speakers))}"
+        })
+    return segments
+
+
+def make_words(duration_min: float, words_per_minute: int, seed: int) -> list:
+    """Evenly spoken words with jittered lengths (sorted by start)."""
+    rng = np.random.default_rng(seed + 1)
+    count = int(duration_min * words_per_minute)
+    starts = np.sort(rng.uniform(0, duration_min * 60, count))
+    lengths = rng.uniform(0.1, 0.5, count)
+    return [
+        {"word": f"w{i}", "start": round(float(s), 3), "end": round(float(s + d), 3)}
+        for i, (s, d) in enumerate(zip(starts, lengths))
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark speaker assignment on synthetic diarizations")
+    parser.add_argument("--variant", choices=[*PIPELINE_DIRS, "all"], default="all")
+    parser.add_argument("--duration-min", type=float, default=120.0, help="Session length (minutes)")
+    parser.add_argument(
+        "--segments", type=int, nargs="+", default=[500, 1200, 4800],
+        help="Diarization segment counts (pyannote ~250/h, NeMo ~2400/h)"
+    )
+    parser.add_argument("--speakers", type=int, default=4)
+    parser.add_argument("--words-per-minute", type=int, default=150)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    variants = list(PIPELINE_DIRS) if args.variant == "all" else [args.variant]
+    handlers = {variant: load_handler(variant) for variant in variants}
+
+    words = make_words(args.duration_min, args.words_per_minute, args.seed)
+    print(f"Session: {args.duration_min:.0f} min, {len(words)} words, {args.speakers} speakers")
+    print()
+    print(f"{'segments':>8} {'variant':<10} {'legacy (s)':>11} {'indexed (s)':>12} {'speedup':>9}  identical")
+
+    failed = False
+    for count in args.segments:
+        segments = make_diarization(args.duration_min, count, args.speakers, args.seed)
+
+        start_time = time.perf_counter()
+        expected = legacy_assign_speakers(words, segments)
+        legacy_time = time.perf_counter() - start_time
+        expected_speakers = [w["speaker"] for w in expected]
+
+        for variant, handler in handlers.items():
+            start_time = time.perf_counter()
+            result = handler.merge_words_with_speakers(words, segments)
+            indexed_time = time.perf_counter() - start_time
+
+            speakers = [seg["speaker"] for seg in result for _ in seg["words"]]
+            identical = speakers == expected_speakers
+            failed |= not identical
+
+            print(
+                f"{count:>8} {variant:<10} {legacy_time:>11.2f} {indexed_time:>12.3f} "
+                f"{legacy_time / indexed_time:>8.0f}x  {'yes' if identical else 'NO'}"
+            )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -100,3 +100,17 @@ async def test_health_check_content_type(client: AsyncClient):
 
     assert response.status_code == 200
     assert "application/json" in response.headers["content-type"]
+
+
+@pytest.mark.asyncio
+async def test_readiness_check_success(client: AsyncClient):
+    """Test readiness reports ready with the database and encryption up."""
+    response = await client.get("/health/ready")
+
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["status"] == "ready"
+    assert data["database"] == "connected"
+    assert data["encryption"] == "ready"
+    assert isinstance(data["components"], dict)
@@ -7,6 +7,8 @@ from unittest.mock import patch
 import pytest
 from httpx import AsyncClient
 
+from app.services.provider_registry import ProviderServiceRegistry
+
 
 class TestUnifiedOptionsEndpoint:
     """Test GET /api/v1/options endpoint."""
@@ -156,7 +158,8 @@ class TestUnifiedOptionsEndpoint:
 
         # Mock settings and service creation
         with patch("app.routes.models.settings") as mock_settings, \
-                patch("app.routes.models.get_transcription_service_for_provider", return_value=mock_transcription_service):
+                patch("app.routes.models.get_provider_service_registry", return_value=ProviderServiceRegistry()), \
+                patch("app.services.provider_registry.get_transcription_service_for_provider", return_value=mock_transcription_service):
             mock_settings.DEFAULT_TRANSCRIPTION_PROVIDER = "groq"
             mock_settings.DEFAULT_LLM_PROVIDER = "noop"
 
@@ -194,7 +197,8 @@ class TestUnifiedOptionsEndpoint:
 
         # Mock settings and service creation
         with patch("app.routes.models.settings") as mock_settings, \
-                patch("app.routes.models.get_llm_service_for_provider", return_value=mock_llm_service):
+                patch("app.routes.models.get_provider_service_registry", return_value=ProviderServiceRegistry()), \
+                patch("app.services.provider_registry.get_llm_service_for_provider", return_value=mock_llm_service):
             mock_settings.DEFAULT_TRANSCRIPTION_PROVIDER = "noop"
             mock_settings.DEFAULT_LLM_PROVIDER = "groq"
 
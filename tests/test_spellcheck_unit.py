@@ -58,7 +58,7 @@ class TestSlovenianSpellCheckService:
         """Test graceful handling when dictionary not loaded."""
         service = SlovenianSpellCheckService(
             wordlist_path="/nonexistent/path.txt",
-            pickle_path="/nonexistent/pickle.pkl",
+            dictionary_path="/nonexistent/symspell.dict",
         )
         # Don't call load() - dictionary should not be loaded
         result = service.check_text("neki tekst")
@@ -68,7 +68,7 @@ class TestSlovenianSpellCheckService:
         """Test is_loaded() returns False before loading."""
         service = SlovenianSpellCheckService(
             wordlist_path="/nonexistent/path.txt",
-            pickle_path="/nonexistent/pickle.pkl",
+            dictionary_path="/nonexistent/symspell.dict",
         )
         assert service.is_loaded() is False
 
@@ -76,7 +76,7 @@ class TestSlovenianSpellCheckService:
         """Test get_language() returns 'sl'."""
         service = SlovenianSpellCheckService(
             wordlist_path="/nonexistent/path.txt",
-            pickle_path="/nonexistent/pickle.pkl",
+            dictionary_path="/nonexistent/symspell.dict",
         )
         assert service.get_language() == "sl"
 
@@ -84,7 +84,7 @@ class TestSlovenianSpellCheckService:
         """Test same misspelled word appears only once in results."""
         service = SlovenianSpellCheckService(
             wordlist_path="/nonexistent/path.txt",
-            pickle_path="/nonexistent/pickle.pkl",
+            dictionary_path="/nonexistent/symspell.dict",
         )
         service._loaded = True
 
@@ -107,7 +107,7 @@ class TestSlovenianSpellCheckService:
         """Test words shorter than min_length are skipped."""
         service = SlovenianSpellCheckService(
             wordlist_path="/nonexistent/path.txt",
-            pickle_path="/nonexistent/pickle.pkl",
+            dictionary_path="/nonexistent/symspell.dict",
             min_word_length=3,
         )
         service._loaded = True
@@ -129,7 +129,7 @@ class TestSlovenianSpellCheckService:
         """Test correctly spelled words are not reported."""
         service = SlovenianSpellCheckService(
             wordlist_path="/nonexistent/path.txt",
-            pickle_path="/nonexistent/pickle.pkl",
+            dictionary_path="/nonexistent/symspell.dict",
         )
         service._loaded = True
 
@@ -150,7 +150,7 @@ class TestSlovenianSpellCheckService:
         """Test misspelled words are reported with suggestions."""
         service = SlovenianSpellCheckService(
             wordlist_path="/nonexistent/path.txt",
-            pickle_path="/nonexistent/pickle.pkl",
+            dictionary_path="/nonexistent/symspell.dict",
             suggestion_count=3,
         )
         service._loaded = True
@@ -178,7 +178,7 @@ class TestSlovenianSpellCheckService:
         """Test _tokenize preserves original case."""
         service = SlovenianSpellCheckService(
             wordlist_path="/nonexistent/path.txt",
-            pickle_path="/nonexistent/pickle.pkl",
+            dictionary_path="/nonexistent/symspell.dict",
         )
         text = "Ljubljana SLOVENIJA čudovito"
         tokens = service._tokenize(text)
@@ -0,0 +1,265 @@
+"""
+Unit tests for the shared AssemblyAI poller and the webhook receiver route.
+Uses httpx.MockTransport as a stand-in for the AssemblyAI API.
+"""
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.routes import webhooks
+from app.services.assemblyai_poller import AssemblyAIPoller
+
+_RealAsyncClient = httpx.AsyncClient
+
+
+class FakeAssemblyAI:
+    """Transcripts complete after a number of polls (or when marked done)."""
+
+    def __init__(self, polls_until_done: int = 2):
+        self.polls_until_done = polls_until_done
+        self.polls = {}
+        self.done = set()
+        self.errors = set()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        transcript_id = request.url.path.rsplit("/", 1)[-1]
+        count = self.polls.get(transcript_id, 0) + 1
+        self.polls[transcript_id] = count
+
+        if transcript_id in self.errors:
+            return httpx.Response(200, json={"id": transcript_id, "status": "error", "error": "bad audio"})
+        if transcript_id in self.done or count >= self.polls_until_done:
+            return httpx.Response(200, json={"id": transcript_id, "status": "completed", "text": transcript_id})
+        return httpx.Response(200, json={"id": transcript_id, "status": "processing"})
+
+    def patch_client(self):
+        transport = httpx.MockTransport(self.handler)
+        return patch(
+            "app.services.assemblyai_poller.httpx.AsyncClient",
+            side_effect=lambda **kwargs: _RealAsyncClient(transport=transport, **kwargs),
+        )
+
+
+class TestNextInterval:
+    """Test adaptive poll interval."""
+
+    def test_sparse_before_expected_turnaround(self):
+        """Test long audio is polled sparsely early on."""
+        poller = AssemblyAIPoller(min_interval=3.0, max_interval=30.0)
+        # 1h audio -> ~18 min expected turnaround -> capped at max
+        assert poller.next_interval(elapsed=10, expected_seconds=1080) == 30.0
+
+    def test_min_interval_near_expected_finish(self):
+        """Test polling tightens around the expected finish."""
+        poller = AssemblyAIPoller(min_interval=3.0, max_interval=30.0)
+        assert poller.next_interval(elapsed=100, expected_seconds=102) == 3.0
+
+    def test_grows_with_elapsed_when_overdue(self):
+        """Test interval backs off once past the expected turnaround."""
+        poller = AssemblyAIPoller(min_interval=3.0, max_interval=30.0)
+        early = poller.next_interval(elapsed=60, expected_seconds=0)
+        late = poller.next_interval(elapsed=200, expected_seconds=0)
+        assert early < late <= 30.0
+
+    def test_webhook_uses_max_interval(self):
+        """Test polling is a slow safety net when a webhook is configured."""
+        poller = AssemblyAIPoller(min_interval=3.0, max_interval=30.0)
+        assert poller.next_interval(elapsed=0, expected_seconds=0, webhook=True) == 30.0
+
+
+class TestPoller:
+    """Test shared polling of many transcripts."""
+
+    @pytest.mark.asyncio
+    async def test_resolves_concurrent_transcripts(self):
+        """Test all waiters are woken by the single poll task."""
+        fake = FakeAssemblyAI(polls_until_done=2)
+        poller = AssemblyAIPoller(min_interval=0.01, max_interval=0.02)
+
+        with fake.patch_client():
+            results = await asyncio.gather(*(
+                poller.wait(f"tx{i}", "key", timeout=5) for i in range(10)
+            ))
+
+        assert [r["text"] for r in results] == [f"tx{i}" for i in range(10)]
+        assert all(count == 2 for count in fake.polls.values())
+        assert poller.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises(self):
+        """Test error transcripts raise RuntimeError for their waiter only."""
+        fake = FakeAssemblyAI(polls_until_done=1)
+        fake.errors.add("bad")
+        poller = AssemblyAIPoller(min_interval=0.01, max_interval=0.02)
+
+        with fake.patch_client():
+            good, bad = await asyncio.gather(
+                poller.wait("good", "key", timeout=5),
+                poller.wait("bad", "key", timeout=5),
+                return_exceptions=True,
+            )
+
+        assert good["text"] == "good"
+        assert isinstance(bad, RuntimeError)
+        assert "bad audio" in str(bad)
+
+    @pytest.mark.asyncio
+    async def test_timeout_untracks_transcript(self):
+        """Test a timed-out transcript stops being polled."""
+        fake = FakeAssemblyAI(polls_until_done=10_000)
+        poller = AssemblyAIPoller(min_interval=0.01, max_interval=0.02)
+
+        with fake.patch_client():
+            with pytest.raises(RuntimeError, match="timed out"):
+                await poller.wait("slow", "key", timeout=0.05)
+            await asyncio.sleep(0.05)
+
+        assert poller.pending_count == 0
+        # Background task exits once nothing is pending
+        assert poller._task.done()
+
+    @pytest.mark.asyncio
+    async def test_notify_triggers_immediate_fetch(self):
+        """Test notify() resolves a transcript without waiting for the next poll."""
+        fake = FakeAssemblyAI(polls_until_done=10_000)
+        poller = AssemblyAIPoller(min_interval=60, max_interval=60)
+
+        with fake.patch_client():
+            waiter = asyncio.create_task(poller.wait("tx1", "key", timeout=5))
+            await asyncio.sleep(0.05)  # First (immediate) poll: still processing
+
+            fake.done.add("tx1")
+            assert poller.notify("tx1") is True
+            result = await asyncio.wait_for(waiter, timeout=1)
+
+        assert result["text"] == "tx1"
+        assert fake.polls["tx1"] == 2
+
+    @pytest.mark.asyncio
+    async def test_waiter_timeout_keeps_other_waiters(self):
+        """Test a waiter giving up does not cancel another waiter of the same transcript."""
+        fake = FakeAssemblyAI(polls_until_done=10_000)
+        poller = AssemblyAIPoller(min_interval=0.01, max_interval=0.02)
+
+        with fake.patch_client():
+            patient = asyncio.create_task(poller.wait("tx1", "key", timeout=5))
+            with pytest.raises(RuntimeError, match="timed out"):
+                await poller.wait("tx1", "key", timeout=0.05)
+
+            assert poller.pending_count == 1
+            fake.done.add("tx1")
+            result = await asyncio.wait_for(patient, timeout=1)
+
+        assert result["text"] == "tx1"
+        assert poller.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_transcript_tracked_while_client_closes_is_polled(self):
+        """Test a transcript tracked while the idle poll task closes its client is still polled."""
+        fake = FakeAssemblyAI(polls_until_done=1)
+        transport = httpx.MockTransport(fake.handler)
+        closing = asyncio.Event()
+        release = asyncio.Event()
+
+        class SlowClosingClient(_RealAsyncClient):
+            async def __aexit__(self, *args):
+                closing.set()
+                await release.wait()
+                return await super().__aexit__(*args)
+
+        poller = AssemblyAIPoller(min_interval=60, max_interval=60)
+        with patch(
+            "app.services.assemblyai_poller.httpx.AsyncClient",
+            side_effect=lambda **kwargs: SlowClosingClient(transport=transport, **kwargs),
+        ):
+            assert (await poller.wait("tx1", "key", timeout=1))["text"] == "tx1"
+            await asyncio.wait_for(closing.wait(), timeout=1)
+
+            waiter = asyncio.create_task(poller.wait("tx2", "key", timeout=1))
+            await asyncio.sleep(0)
+            release.set()
+            result = await waiter
+
+        assert result["text"] == "tx2"
+
+    def test_notify_unknown_transcript(self):
+        """Test notify() for an untracked transcript is a no-op."""
+        assert AssemblyAIPoller().notify("unknown") is False
+
+
+class TestWebhookRoute:
+    """Test the webhook receiver route."""
+
+    @pytest.fixture
+    def app(self):
+        app = FastAPI()
+        app.include_router(webhooks.router, prefix="/api/v1")
+        return app
+
+    @pytest.mark.asyncio
+    async def test_webhook_resolves_pending_job(self, app):
+        """Test the webhook wakes the waiting transcription immediately."""
+        fake = FakeAssemblyAI(polls_until_done=10_000)
+        poller = AssemblyAIPoller(min_interval=60, max_interval=60)
+
+        with fake.patch_client(), \
+                patch("app.routes.webhooks.get_assemblyai_poller", return_value=poller), \
+                patch("app.routes.webhooks.settings") as mock_settings:
+            mock_settings.ASSEMBLYAI_WEBHOOK_URL = "https://example.com/api/v1/webhooks/assemblyai"
+            mock_settings.ASSEMBLYAI_WEBHOOK_SECRET = "s3cret"
+
+            waiter = asyncio.create_task(poller.wait("tx1", "key", timeout=5, webhook=True))
+            await asyncio.sleep(0.05)
+            fake.done.add("tx1")
+
+            async with _RealAsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                response = await client.post(
+                    "/api/v1/webhooks/assemblyai",
+                    json={"transcript_id": "tx1", "status": "completed"},
+                    headers={"X-AssemblyAI-Webhook-Secret": "s3cret"},
+                )
+
+            result = await asyncio.wait_for(waiter, timeout=1)
+
+        assert response.status_code == 200
+        assert response.json() == {"transcript_id": "tx1", "tracked": True}
+        assert result["text"] == "tx1"
+
+    @pytest.mark.asyncio
+    async def test_webhook_rejects_bad_secret(self, app):
+        """Test webhook calls without the shared secret are rejected."""
+        with patch("app.routes.webhooks.settings") as mock_settings:
+            mock_settings.ASSEMBLYAI_WEBHOOK_URL = "https://example.com/hook"
+            mock_settings.ASSEMBLYAI_WEBHOOK_SECRET = "s3cret"
+
+            async with _RealAsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                response = await client.post(
+                    "/api/v1/webhooks/assemblyai",
+                    json={"transcript_id": "tx1", "status": "completed"},
+                    headers={"X-AssemblyAI-Webhook-Secret": "wrong"},
+                )
+
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_webhook_disabled(self, app):
+        """Test the route is inert when no webhook URL is configured."""
+        with patch("app.routes.webhooks.settings") as mock_settings:
+            mock_settings.ASSEMBLYAI_WEBHOOK_URL = None
+
+            async with _RealAsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                response = await client.post(
+                    "/api/v1/webhooks/assemblyai",
+                    json={"transcript_id": "tx1", "status": "completed"},
+                )
+
+        assert response.status_code == 404
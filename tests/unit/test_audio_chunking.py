@@ -274,6 +274,126 @@ class TestChunkAudio:
         assert len(chunks) >= 1
 
 
+class TestSilenceAlignedChunking:
+    """Test silence-aligned boundaries and compressed chunk formats."""
+
+    @staticmethod
+    def _ffmpeg_with_silence(silence_offset_s: float):
+        """Fake subprocess.run: silencedetect reports one silence in each window."""
+        def run(cmd, **kwargs):
+            result = Mock()
+            result.returncode = 0
+            if "-af" in cmd:
+                result.stderr = (
+                    f"[silencedetect @ 0x1] silence_start: {silence_offset_s}\n"
+                    f"[silencedetect @ 0x1] silence_end: {silence_offset_s + 1.0} | silence_duration: 1.0\n"
+                )
+            else:
+                result.stderr = ""
+            return result
+        return run
+
+    @patch('app.utils.audio_chunking.subprocess')
+    @patch('app.utils.audio_chunking.MutagenFile')
+    def test_cuts_at_silence_without_overlap(self, mock_mutagen_file, mock_subprocess, tmp_path):
+        """Test cuts move into the detected silence and the next chunk starts there."""
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_bytes(b"fake audio")
+
+        mock_audio = Mock()
+        mock_audio.info.length = 600.0
+        mock_mutagen_file.return_value = mock_audio
+
+        # Search window is the last 30s of each chunk; silence 20-21s into it
+        mock_subprocess.run.side_effect = self._ffmpeg_with_silence(20.0)
+
+        chunker = AudioChunker(chunk_duration_seconds=240, overlap_seconds=5)
+        chunks = chunker.chunk_audio(audio_file, output_dir=tmp_path / "chunks")
+
+        # First window starts at 210s -> silence 230-231s -> cut at 230.5s
+        assert chunks[0].end_time_ms == 230500
+        assert chunks[1].start_time_ms == 230500
+        assert chunks[-1].end_time_ms == 600000
+
+    @patch('app.utils.audio_chunking.subprocess')
+    @patch('app.utils.audio_chunking.MutagenFile')
+    def test_disabled_silence_detection_uses_fixed_cuts(self, mock_mutagen_file, mock_subprocess, tmp_path):
+        """Test fixed boundaries (with overlap) when silence detection is off."""
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_bytes(b"fake audio")
+
+        mock_audio = Mock()
+        mock_audio.info.length = 600.0
+        mock_mutagen_file.return_value = mock_audio
+
+        mock_subprocess.run.side_effect = self._ffmpeg_with_silence(20.0)
+
+        chunker = AudioChunker(chunk_duration_seconds=240, overlap_seconds=5)
+        chunks = chunker.chunk_audio(
+            audio_file, output_dir=tmp_path / "chunks", use_silence_detection=False
+        )
+
+        assert chunks[0].end_time_ms == 240000
+        assert chunks[1].start_time_ms == 235000
+        assert not any("-af" in c[0][0] for c in mock_subprocess.run.call_args_list)
+
+    @patch('app.utils.audio_chunking.subprocess')
+    @patch('app.utils.audio_chunking.MutagenFile')
+    def test_flac_output_format(self, mock_mutagen_file, mock_subprocess, tmp_path):
+        """Test chunks are encoded as FLAC when requested."""
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_bytes(b"fake audio")
+
+        mock_audio = Mock()
+        mock_audio.info.length = 600.0
+        mock_mutagen_file.return_value = mock_audio
+
+        mock_result = Mock()
+        mock_result.returncode = 0
+        mock_subprocess.run.return_value = mock_result
+
+        chunker = AudioChunker(chunk_duration_seconds=240)
+        chunks = chunker.chunk_audio(
+            audio_file, output_dir=tmp_path / "chunks", output_format="flac"
+        )
+
+        assert all(c.path.suffix == ".flac" for c in chunks)
+        extract_cmd = mock_subprocess.run.call_args_list[-1][0][0]
+        assert extract_cmd[extract_cmd.index("-c:a") + 1] == "flac"
+
+    @patch('app.utils.audio_chunking.subprocess')
+    @patch('app.utils.audio_chunking.MutagenFile')
+    def test_short_audio_is_encoded_for_opus(self, mock_mutagen_file, mock_subprocess, tmp_path):
+        """Test short audio is still compressed when a non-WAV format is requested."""
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_bytes(b"fake audio")
+
+        mock_audio = Mock()
+        mock_audio.info.length = 60.0
+        mock_mutagen_file.return_value = mock_audio
+
+        mock_result = Mock()
+        mock_result.returncode = 0
+        mock_subprocess.run.return_value = mock_result
+
+        chunker = AudioChunker(chunk_duration_seconds=240)
+        chunks = chunker.chunk_audio(
+            audio_file, output_dir=tmp_path / "chunks", output_format="opus"
+        )
+
+        assert len(chunks) == 1
+        assert chunks[0].path == tmp_path / "chunks" / "chunk_0000.ogg"
+        assert "libopus" in mock_subprocess.run.call_args[0][0]
+
+    def test_invalid_output_format_raises(self, tmp_path):
+        """Test unknown output formats are rejected."""
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_bytes(b"fake audio")
+
+        with pytest.raises(ValueError, match="Invalid output_format"):
+            AudioChunker().chunk_audio(audio_file, output_format="mp3")
+
+
 class TestCleanupChunks:
     """Test cleanup_chunks method."""
 
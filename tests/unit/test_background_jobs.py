@@ -0,0 +1,313 @@
+"""
+Unit tests for cancellation of background jobs (app/services/background_jobs.py)
+and its propagation into RunPod jobs and hedged transcriptions.
+Jobs are simulated with events; no providers or database are used.
+"""
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app.database import DB_SCHEMA
+from app.services.background_jobs import (
+    _INSTANCE_ID,
+    CLEANUP_JOB,
+    TRANSCRIPTION_JOB,
+    VOICE_ENTRY_SCOPE,
+    BackgroundJobRegistry,
+    is_cancel_requested,
+)
+from app.services.pg_listener import PgListener
+from app.services.runpod_jobs import (
+    RunPodJobPoller,
+    RunPodJobStore,
+    run_runpod_job,
+    runpod_job_fingerprint,
+    use_job_mode,
+)
+from app.services.transcription_hedging import transcribe_with_hedging
+
+BASE_URL = "https://api.runpod.ai/v2/test-endpoint"
+ENTRY_ID = uuid.uuid4()
+
+_RealAsyncClient = httpx.AsyncClient
+
+
+async def settle():
+    """Let started tasks reach their first await."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+class Job:
+    """A job that runs until released and records how it ended."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.cancelled = False
+        self.saw_cancel_request = None
+
+    async def work(self):
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            self.saw_cancel_request = is_cancel_requested()
+            raise
+
+
+def start(registry, kind, job_id, job, voice_entry_id=ENTRY_ID, transcription_id=None):
+    """Run a job through the registry in the background."""
+    return asyncio.ensure_future(registry.run(
+        kind, job_id, job.work(), voice_entry_id=voice_entry_id, transcription_id=transcription_id
+    ))
+
+
+class TestBackgroundJobRegistry:
+    """Test running and cancelling registered jobs."""
+
+    @pytest.mark.asyncio
+    async def test_completed_job(self):
+        """Test a job that finishes returns True and is unregistered."""
+        registry = BackgroundJobRegistry()
+        job = Job()
+        runner = start(registry, TRANSCRIPTION_JOB, uuid.uuid4(), job)
+        await settle()
+        assert registry.running() == 1
+
+        job.release.set()
+
+        assert await runner is True
+        assert registry.running() == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_by_id(self):
+        """Test cancelling a job stops it and its runner returns False."""
+        registry = BackgroundJobRegistry()
+        job, other = Job(), Job()
+        cleanup_id = uuid.uuid4()
+        runner = start(registry, CLEANUP_JOB, cleanup_id, job)
+        other_runner = start(registry, CLEANUP_JOB, uuid.uuid4(), other)
+        await settle()
+
+        assert registry.cancel(CLEANUP_JOB, cleanup_id) == 1
+
+        assert await runner is False
+        assert job.cancelled and job.saw_cancel_request
+        assert not other.cancelled
+        other.release.set()
+        assert await other_runner is True
+
+    @pytest.mark.asyncio
+    async def test_cancel_voice_entry(self):
+        """Test deleting an entry cancels its transcription and cleanup jobs only."""
+        registry = BackgroundJobRegistry()
+        transcription, cleanup, foreign = Job(), Job(), Job()
+        runners = [
+            start(registry, TRANSCRIPTION_JOB, uuid.uuid4(), transcription),
+            start(registry, CLEANUP_JOB, uuid.uuid4(), cleanup),
+            start(registry, CLEANUP_JOB, uuid.uuid4(), foreign, voice_entry_id=uuid.uuid4()),
+        ]
+        await settle()
+
+        assert registry.cancel(VOICE_ENTRY_SCOPE, ENTRY_ID) == 2
+
+        foreign.release.set()
+        assert await asyncio.gather(*runners) == [False, False, True]
+
+    @pytest.mark.asyncio
+    async def test_cancel_transcription_includes_its_cleanups(self):
+        """Test cancelling a transcription also cancels cleanups of it."""
+        registry = BackgroundJobRegistry()
+        transcription_id = uuid.uuid4()
+        cleanup = Job()
+        runner = start(registry, CLEANUP_JOB, uuid.uuid4(), cleanup, transcription_id=transcription_id)
+        await settle()
+
+        assert registry.cancel(TRANSCRIPTION_JOB, transcription_id) == 1
+        assert await runner is False
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancellation_propagates(self):
+        """Test cancelling the runner itself cancels the job and is re-raised."""
+        registry = BackgroundJobRegistry()
+        job = Job()
+        runner = start(registry, TRANSCRIPTION_JOB, uuid.uuid4(), job)
+        await settle()
+
+        runner.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await runner
+        assert job.cancelled
+        assert job.saw_cancel_request is False
+
+    @pytest.mark.asyncio
+    async def test_cancel_request_visible_in_fan_out(self):
+        """Test chunk tasks created by a job are cancelled and see the request."""
+        registry = BackgroundJobRegistry()
+        chunks = [Job(), Job()]
+        job_id = uuid.uuid4()
+
+        async def fan_out():
+            await asyncio.gather(*(chunk.work() for chunk in chunks))
+
+        runner = asyncio.ensure_future(
+            registry.run(TRANSCRIPTION_JOB, job_id, fan_out(), voice_entry_id=ENTRY_ID)
+        )
+        await settle()
+        registry.cancel(TRANSCRIPTION_JOB, job_id)
+
+        assert await runner is False
+        assert all(chunk.cancelled and chunk.saw_cancel_request for chunk in chunks)
+
+    @pytest.mark.asyncio
+    async def test_cancellations_shared_with_other_workers(self):
+        """Test cancels are announced while listening and applied from other workers."""
+        registry = BackgroundJobRegistry()
+        registry._listener._task = asyncio.ensure_future(asyncio.sleep(3600))
+        job = Job()
+        cleanup_id = uuid.uuid4()
+        runner = start(registry, CLEANUP_JOB, cleanup_id, job)
+        await settle()
+
+        with patch.object(PgListener, "notify", AsyncMock()) as notify:
+            registry.cancel(CLEANUP_JOB, uuid.uuid4())
+            await settle()
+        assert notify.await_args.args[0].startswith(f"{DB_SCHEMA}:{_INSTANCE_ID}:cleanup:")
+
+        # Own notifications and other schemas are ignored
+        registry._on_notification(None, 1, "background_jobs_cancelled", f"{DB_SCHEMA}:{_INSTANCE_ID}:cleanup:{cleanup_id}")
+        registry._on_notification(None, 1, "background_jobs_cancelled", f"other_schema:other:cleanup:{cleanup_id}")
+        registry._on_notification(None, 1, "background_jobs_cancelled", "malformed")
+        await settle()
+        assert not job.cancelled
+
+        registry._on_notification(None, 1, "background_jobs_cancelled", f"{DB_SCHEMA}:other:cleanup:{cleanup_id}")
+        assert await runner is False
+        registry._listener._task.cancel()
+
+
+class FakeRunPod:
+    """RunPod API whose jobs never finish; records /cancel calls."""
+
+    def __init__(self):
+        self.cancelled = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/run"):
+            return httpx.Response(200, json={"id": "job-1", "status": "IN_QUEUE"})
+        if "/cancel/" in path:
+            self.cancelled.append(path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json={"id": "job-1", "status": "CANCELLED"})
+        return httpx.Response(200, json={"id": "job-1", "status": "IN_PROGRESS"})
+
+    def patch_client(self):
+        transport = httpx.MockTransport(self.handler)
+        return patch(
+            "app.services.runpod_jobs.httpx.AsyncClient",
+            side_effect=lambda **kwargs: _RealAsyncClient(transport=transport, **kwargs),
+        )
+
+
+class TestRunPodCancellation:
+    """Test cancelled jobs cancel their RunPod jobs."""
+
+    async def run_and_cancel(self, via_registry: bool):
+        """Start a RunPod job, cancel its wait, return (fake, store)."""
+        fake = FakeRunPod()
+        store = RunPodJobStore()
+        poller = RunPodJobPoller(initial_interval=0.01, max_interval=0.02)
+        registry = BackgroundJobRegistry()
+        job_id = uuid.uuid4()
+
+        async def work():
+            await run_runpod_job(BASE_URL, "key", {"x": 1}, timeout=5, poller=poller, store=store)
+
+        with fake.patch_client():
+            runner = asyncio.ensure_future(
+                registry.run(TRANSCRIPTION_JOB, job_id, work(), voice_entry_id=ENTRY_ID)
+            )
+            await asyncio.sleep(0.03)
+            if via_registry:
+                registry.cancel(TRANSCRIPTION_JOB, job_id)
+                assert await runner is False
+            else:
+                runner.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await runner
+            await asyncio.sleep(0.01)
+        await poller.close()
+        return fake, store
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_cancels_runpod_job(self):
+        """Test a cancelled job cancels its RunPod job and forgets it."""
+        fake, store = await self.run_and_cancel(via_registry=True)
+
+        assert fake.cancelled == ["job-1"]
+        assert store.get(runpod_job_fingerprint(BASE_URL, {"x": 1})) is None
+
+    @pytest.mark.asyncio
+    async def test_shutdown_keeps_runpod_job_for_resume(self):
+        """Test other cancellations leave the RunPod job running for a resume."""
+        fake, store = await self.run_and_cancel(via_registry=False)
+
+        assert fake.cancelled == []
+        assert store.get(runpod_job_fingerprint(BASE_URL, {"x": 1})) == "job-1"
+
+
+class TestHedgingCancellation:
+    """Test cancellation reaches hedged requests."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_before_deadline_cancels_primary(self):
+        """Test cancelling while waiting for the hedge deadline cancels the primary request."""
+        primary_job = Job()
+        primary = MagicMock()
+        primary.transcribe_audio = lambda **kwargs: primary_job.work()
+        secondary = MagicMock()
+
+        task = asyncio.ensure_future(transcribe_with_hedging(
+            primary, secondary, deadline_seconds=60, transcribe_kwargs={}, tracker=MagicMock()
+        ))
+        await settle()
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await settle()
+        assert primary_job.cancelled
+
+    @pytest.mark.asyncio
+    async def test_losing_runpod_job_cancelled_on_runpod(self):
+        """Test the RunPod job of a primary that lost to the hedge is cancelled on RunPod."""
+        fake = FakeRunPod()
+        store = RunPodJobStore()
+        poller = RunPodJobPoller(initial_interval=0.01, max_interval=0.02)
+        job_modes = []
+
+        async def transcribe_on_runpod(**kwargs):
+            # runsync configured: hedged requests still need the job id
+            job_modes.append(use_job_mode(False))
+            return await run_runpod_job(BASE_URL, "key", {"x": 1}, timeout=5, poller=poller, store=store)
+
+        primary = MagicMock()
+        primary.transcribe_audio = transcribe_on_runpod
+        secondary = MagicMock()
+        secondary.transcribe_audio = AsyncMock(return_value={"text": "from hedge"})
+
+        with fake.patch_client():
+            result, outcome = await transcribe_with_hedging(
+                primary, secondary, deadline_seconds=0.03, transcribe_kwargs={}, tracker=MagicMock()
+            )
+            await asyncio.sleep(0.01)
+        await poller.close()
+
+        assert result["text"] == "from hedge" and outcome.hedge_won
+        assert job_modes == [True]
+        assert fake.cancelled == ["job-1"]
+        assert store.get(runpod_job_fingerprint(BASE_URL, {"x": 1})) is None
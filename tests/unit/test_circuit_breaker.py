@@ -0,0 +1,281 @@
+"""
+Unit tests for provider circuit breakers (app/services/circuit_breaker.py).
+Provider calls are simulated; no network or Postgres connection is used.
+"""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.database import DB_SCHEMA
+from app.services.circuit_breaker import (
+    _INSTANCE_ID,
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    is_provider_failure,
+)
+from app.services.pg_listener import PgListener
+from app.services.transcription_slovene_asr import SloveneASRTranscriptionService
+
+
+def make_breaker(**overrides) -> CircuitBreaker:
+    """Breaker opening after 2 of 4 calls fail."""
+    options = {
+        "window_seconds": 60,
+        "min_calls": 4,
+        "failure_rate_threshold": 0.5,
+        "slow_call_seconds": 0,
+        "slow_call_rate_threshold": 0.8,
+        "open_seconds": 30,
+        "half_open_max_calls": 1,
+    }
+    options.update(overrides)
+    return CircuitBreaker("test-endpoint", **options)
+
+
+def http_error(status_code: int) -> httpx.HTTPStatusError:
+    """HTTPStatusError with the given status code."""
+    request = httpx.Request("POST", "https://api.runpod.ai/v2/endpoint/runsync")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError(f"HTTP {status_code}", request=request, response=response)
+
+
+async def call(breaker: CircuitBreaker, error: Exception = None):
+    """Make one guarded call that raises error (or succeeds)."""
+    with breaker.guard():
+        await asyncio.sleep(0)
+        if error is not None:
+            raise error
+
+
+async def fail(breaker: CircuitBreaker, times: int, error: Exception = None):
+    """Make failing guarded calls."""
+    for _ in range(times):
+        with pytest.raises(Exception):
+            await call(breaker, error or httpx.ConnectError("connection refused"))
+
+
+async def call_forever(breaker: CircuitBreaker):
+    """Guarded call that never finishes (until cancelled)."""
+    with breaker.guard():
+        await asyncio.sleep(3600)
+
+
+def expire_open_period(breaker: CircuitBreaker):
+    """Let the open period end."""
+    breaker._open_until = 0.0
+
+
+class TestCircuitBreaker:
+    """Test opening, fast failures and half-open probing."""
+
+    @pytest.mark.asyncio
+    async def test_opens_on_failure_rate(self):
+        """Test the circuit opens once the window's failure rate reaches the threshold."""
+        breaker = make_breaker()
+        await call(breaker)
+        await call(breaker)
+        await fail(breaker, 1)
+        assert breaker.state == CLOSED
+
+        await fail(breaker, 1)
+
+        assert breaker.state == OPEN
+        assert breaker.times_opened == 1
+
+    @pytest.mark.asyncio
+    async def test_min_calls_required(self):
+        """Test failures below min_calls do not open the circuit."""
+        breaker = make_breaker()
+        await fail(breaker, 3)
+        assert breaker.state == CLOSED
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        """Test calls are rejected without running while the circuit is open."""
+        breaker = make_breaker()
+        await fail(breaker, 4)
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            with breaker.guard():
+                pytest.fail("call must not run")
+
+        assert exc_info.value.retry_after > 0
+        assert breaker.rejected_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_count(self):
+        """Test 4xx and 429 responses mean the provider is up."""
+        breaker = make_breaker()
+        await fail(breaker, 2, error=http_error(400))
+        await fail(breaker, 2, error=http_error(429))
+        assert breaker.state == CLOSED
+
+        await fail(breaker, 4, error=http_error(503))
+        assert breaker.state == OPEN
+
+    def test_failure_classification(self):
+        """Test which errors count as provider failures."""
+        assert is_provider_failure(httpx.ReadTimeout("timed out"))
+        assert is_provider_failure(RuntimeError("job failed"))
+        assert is_provider_failure(http_error(502))
+        assert not is_provider_failure(http_error(404))
+
+        class GroqRateLimit(Exception):
+            status_code = 429
+
+        assert not is_provider_failure(GroqRateLimit())
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_success_closes(self):
+        """Test one probe is allowed after the open period and its success closes the circuit."""
+        breaker = make_breaker()
+        await fail(breaker, 4)
+        expire_open_period(breaker)
+        assert breaker.state == HALF_OPEN
+
+        breaker.before_call()
+        # Only one probe at a time
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_success(0.1)
+        assert breaker.state == CLOSED
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_failure_reopens(self):
+        """Test a failed probe opens the circuit again."""
+        breaker = make_breaker()
+        await fail(breaker, 4)
+        expire_open_period(breaker)
+
+        await fail(breaker, 1)
+
+        assert breaker.state == OPEN
+        assert breaker.times_opened == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_frees_slot(self):
+        """Test a cancelled probe lets the next probe through."""
+        breaker = make_breaker()
+        await fail(breaker, 4)
+        expire_open_period(breaker)
+
+        task = asyncio.ensure_future(call_forever(breaker))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        breaker.before_call()
+
+    @pytest.mark.asyncio
+    async def test_slow_calls_open_circuit(self):
+        """Test the latency window opens the circuit when most calls are slow."""
+        breaker = make_breaker(slow_call_seconds=10, slow_call_rate_threshold=0.75)
+        breaker.before_call()
+        for _ in range(3):
+            breaker.record_success(20.0)
+        breaker.record_success(1.0)
+
+        assert breaker.state == OPEN
+
+    @pytest.mark.asyncio
+    async def test_disabled_never_rejects(self):
+        """Test CIRCUIT_BREAKER_ENABLED=False lets every call through."""
+        breaker = make_breaker()
+        await fail(breaker, 4)
+
+        with patch("app.services.circuit_breaker.settings") as mock_settings:
+            mock_settings.CIRCUIT_BREAKER_ENABLED = False
+            await call(breaker)
+
+    @pytest.mark.asyncio
+    async def test_snapshot(self):
+        """Test snapshot reports state and window statistics."""
+        breaker = make_breaker()
+        breaker.before_call()
+        breaker.record_success(2.0)
+        breaker.record_failure(4.0)
+
+        snapshot = breaker.snapshot()
+
+        assert snapshot["state"] == CLOSED
+        assert snapshot["calls"] == 2
+        assert snapshot["failure_rate"] == 0.5
+        assert snapshot["p95_latency_seconds"] == 4.0
+        assert snapshot["retry_after_seconds"] is None
+
+
+class TestSharedState:
+    """Test transitions shared between workers."""
+
+    @pytest.mark.asyncio
+    async def test_local_transitions_are_announced(self):
+        """Test opening and closing notify other workers while the listener runs."""
+        registry = CircuitBreakerRegistry()
+        registry._listener._task = asyncio.ensure_future(asyncio.sleep(3600))
+        breaker = registry.get("test-endpoint")
+        breaker.min_calls = 1
+
+        with patch.object(PgListener, "notify", AsyncMock()) as notify:
+            await fail(breaker, 1)
+            expire_open_period(breaker)
+            await call(breaker)
+            await asyncio.sleep(0)
+
+        registry._listener._task.cancel()
+        payloads = [c.args[0] for c in notify.await_args_list]
+        assert payloads[0].startswith(f"{DB_SCHEMA}:{_INSTANCE_ID}:open:")
+        assert payloads[0].endswith(":test-endpoint")
+        assert payloads[1] == f"{DB_SCHEMA}:{_INSTANCE_ID}:closed:0.0:test-endpoint"
+
+    @pytest.mark.asyncio
+    async def test_remote_open_and_close(self):
+        """Test notifications from another worker open and close the local circuit."""
+        registry = CircuitBreakerRegistry()
+
+        registry._on_notification(None, 1, "circuit_breakers_changed", f"{DB_SCHEMA}:other:open:30.0:groq-llm")
+        with pytest.raises(CircuitOpenError):
+            registry.get("groq-llm").before_call()
+
+        registry._on_notification(None, 1, "circuit_breakers_changed", f"{DB_SCHEMA}:other:closed:0.0:groq-llm")
+        registry.get("groq-llm").before_call()
+
+    @pytest.mark.asyncio
+    async def test_own_and_foreign_schema_notifications_ignored(self):
+        """Test this worker's own notifications and other schemas are ignored."""
+        registry = CircuitBreakerRegistry()
+
+        registry._on_notification(None, 1, "circuit_breakers_changed", f"{DB_SCHEMA}:{_INSTANCE_ID}:open:30.0:groq-llm")
+        registry._on_notification(None, 1, "circuit_breakers_changed", "other_schema:other:open:30.0:groq-llm")
+        registry._on_notification(None, 1, "circuit_breakers_changed", "malformed")
+
+        assert registry.get("groq-llm").state == CLOSED
+
+
+class TestProviderIntegration:
+    """Test provider retry loops stop at an open circuit."""
+
+    @pytest.mark.asyncio
+    async def test_slovene_asr_skips_retries_when_open(self):
+        """Test RunPod retries stop as soon as the endpoint's circuit opens."""
+        service = SloveneASRTranscriptionService(
+            api_key="test-key",
+            endpoint_id="test-endpoint",
+            variant="nfa",
+            max_retries=3,
+        )
+        service._circuit = make_breaker(min_calls=1)
+        service._call_runpod_sync = AsyncMock(side_effect=http_error(503))
+
+        with pytest.raises(CircuitOpenError):
+            await service._call_runpod_with_retry({"audio_base64": ""})
+
+        # First attempt failed and opened the circuit; no backoff sleeps or further calls
+        assert service._call_runpod_sync.await_count == 1
@@ -0,0 +1,174 @@
+"""
+Unit tests for the deterministic cleanup cache (app/services/cleanup_cache.py)
+and its use in process_cleanup_background. The database is mocked.
+"""
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.cleaned_entry import CleanupStatus
+from app.routes.cleanup import process_cleanup_background
+from app.services.cleanup_cache import (
+    compute_cleanup_cache_key,
+    get_prompt_identity,
+    is_deterministic_cleanup,
+)
+
+KEY_ARGS = {
+    "transcription_text": "Sanjal sem o morju.",
+    "prompt_identity": "template:3:2",
+    "provider": "groq",
+    "model_name": "groq-llama-3.3-70b-versatile",
+    "temperature": 0.0,
+    "top_p": 0.0,
+}
+
+
+class TestCleanupCacheKey:
+    """Test cache keys and cacheability."""
+
+    def test_key_is_stable_hmac(self):
+        """Test equal inputs give equal 64-char keys that do not contain the text."""
+        key = compute_cleanup_cache_key(**KEY_ARGS)
+
+        assert key == compute_cleanup_cache_key(**KEY_ARGS)
+        assert len(key) == 64
+        assert "morju" not in key
+
+    @pytest.mark.parametrize("field,value", [
+        ("transcription_text", "Sanjal sem o gorah."),
+        ("prompt_identity", "template:3:3"),
+        ("provider", "runpod_llm_gams"),
+        ("model_name", "groq-other-model"),
+        ("temperature", None),
+        ("top_p", 0.9),
+    ])
+    def test_each_input_changes_key(self, field, value):
+        """Test every cleanup input is part of the key."""
+        assert compute_cleanup_cache_key(**{**KEY_ARGS, field: value}) != compute_cleanup_cache_key(**KEY_ARGS)
+
+    def test_deterministic_settings(self):
+        """Test only temperature-0 cleanups are cacheable."""
+        assert is_deterministic_cleanup("groq", 0.0)
+        assert not is_deterministic_cleanup("groq", 0.7)
+        # Groq's API default temperature is not 0
+        assert not is_deterministic_cleanup("groq", None)
+
+    def test_gams_default_temperature(self):
+        """Test GaMS cleanups without a temperature follow the configured default."""
+        with patch("app.services.cleanup_cache.settings") as mock_settings:
+            mock_settings.RUNPOD_LLM_GAMS_DEFAULT_TEMPERATURE = 0.0
+            assert is_deterministic_cleanup("runpod_llm_gams", None)
+            mock_settings.RUNPOD_LLM_GAMS_DEFAULT_TEMPERATURE = 0.3
+            assert not is_deterministic_cleanup("runpod_llm_gams", None)
+
+    @pytest.mark.asyncio
+    async def test_prompt_identity(self):
+        """Test the identity uses template id and version, or the built-in prompt."""
+        template = SimpleNamespace(id=3, version=2, is_valid=True)
+        cache = MagicMock()
+        with patch("app.services.cleanup_cache.get_prompt_template_cache", return_value=cache):
+            cache.get_active = AsyncMock(return_value=template)
+            assert await get_prompt_identity(MagicMock(), "dream") == ("template:3:2", 3)
+
+            cache.get_active = AsyncMock(return_value=None)
+            dream_identity, template_id = await get_prompt_identity(MagicMock(), "dream")
+            journal_identity, _ = await get_prompt_identity(MagicMock(), "journal")
+
+        assert dream_identity.startswith("builtin:") and template_id is None
+        assert dream_identity != journal_identity
+
+
+class TestCleanupBackgroundCache:
+    """Test process_cleanup_background consults and fills the cache."""
+
+    async def run_cleanup(self, cached_entry, temperature=0.0):
+        """Run the background task with mocked database, LLM and encryption."""
+        db = MagicMock()
+        db.commit = AsyncMock()
+        db.rollback = AsyncMock()
+
+        @asynccontextmanager
+        async def get_session():
+            yield db
+
+        mock_db_service = MagicMock()
+        mock_db_service.update_cleaned_entry_processing = AsyncMock()
+        mock_db_service.get_cleanup_cache_entry = AsyncMock(return_value=cached_entry)
+        mock_db_service.store_cleanup_cache_entry = AsyncMock()
+        mock_db_service.get_cleaned_entry_by_id = AsyncMock(return_value=MagicMock())
+        mock_db_service.get_primary_cleanup_for_voice_entry = AsyncMock(return_value=MagicMock())
+        mock_db_service.get_user_by_id = AsyncMock(return_value=None)
+        mock_db_service.get_transcription_by_id = AsyncMock(return_value=MagicMock(language_code="en"))
+        mock_db_service.save_job_checkpoint = AsyncMock()
+        mock_db_service.delete_job_checkpoint = AsyncMock()
+
+        llm_service = MagicMock()
+        llm_service.get_model_name.return_value = "groq-test-model"
+        llm_service.cleanup_transcription = AsyncMock(return_value={
+            "cleaned_text": "Sanjal sem o morju.",
+            "llm_raw_response": "Sanjal sem o morju.",
+            "prompt_template_id": None,
+        })
+
+        registry = MagicMock()
+        registry.get_llm_service.return_value = llm_service
+
+        voice_entry_id = uuid.uuid4()
+        with patch("app.database.get_session", get_session), \
+                patch("app.services.background_jobs.get_session", get_session), \
+                patch("app.services.background_jobs.db_service", mock_db_service), \
+                patch("app.routes.cleanup.get_provider_service_registry", return_value=registry), \
+                patch("app.routes.cleanup.create_envelope_encryption_service"), \
+                patch("app.routes.cleanup.encrypt_text", AsyncMock(return_value=b"ciphertext")), \
+                patch("app.routes.cleanup.get_prompt_identity", AsyncMock(return_value=("builtin:abc", None))), \
+                patch("app.routes.cleanup.db_service", mock_db_service):
+            await process_cleanup_background(
+                cleaned_entry_id=uuid.uuid4(),
+                transcription_text="sanjal sem o morju",
+                entry_type="dream",
+                user_id=uuid.uuid4(),
+                voice_entry_id=voice_entry_id,
+                temperature=temperature,
+                top_p=None,
+                llm_provider="groq",
+            )
+
+        return mock_db_service, llm_service, voice_entry_id
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_llm(self):
+        """Test a cached output is reused without calling the LLM."""
+        cached = SimpleNamespace(cleaned_text=b"cached-ciphertext", prompt_template_id=None)
+
+        mock_db_service, llm_service, _ = await self.run_cleanup(cached)
+
+        llm_service.cleanup_transcription.assert_not_awaited()
+        completed = mock_db_service.update_cleaned_entry_processing.await_args_list[-1].kwargs
+        assert completed["cleanup_status"] == CleanupStatus.COMPLETED
+        assert completed["cleaned_text"] == b"cached-ciphertext"
+        assert completed["cache_hit"] is True
+        mock_db_service.store_cleanup_cache_entry.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_stores_output(self):
+        """Test a deterministic cleanup that missed the cache fills it."""
+        mock_db_service, llm_service, voice_entry_id = await self.run_cleanup(None)
+
+        llm_service.cleanup_transcription.assert_awaited_once()
+        stored = mock_db_service.store_cleanup_cache_entry.await_args.kwargs
+        assert stored["voice_entry_id"] == voice_entry_id
+        assert stored["cleaned_text"] == b"ciphertext"
+        assert len(stored["cache_key"]) == 64
+
+    @pytest.mark.asyncio
+    async def test_non_deterministic_cleanup_bypasses_cache(self):
+        """Test cleanups with temperature > 0 neither read nor fill the cache."""
+        mock_db_service, llm_service, _ = await self.run_cleanup(None, temperature=0.8)
+
+        llm_service.cleanup_transcription.assert_awaited_once()
+        mock_db_service.get_cleanup_cache_entry.assert_not_awaited()
+        mock_db_service.store_cleanup_cache_entry.assert_not_awaited()
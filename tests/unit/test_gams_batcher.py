@@ -0,0 +1,175 @@
+"""
+Unit tests for the GaMS batch coalescer and its use by the GaMS cleanup service.
+The RunPod endpoint is replaced by a fake send function.
+"""
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.gams_batcher import GamsBatchCoalescer
+from app.services.llm_cleanup_runpod_gams import RunPodGamsLLMCleanupService
+
+PARAMS = {"temperature": 0.0, "top_p": 0.0, "max_tokens": 2048}
+KEY = ("endpoint", "key", 0.0, 0.0, 2048)
+
+
+class FakeGams:
+    """Echoes prompts back like the GaMS handler (single and batch mode)."""
+
+    def __init__(self, delay: float = 0.0):
+        self.inputs = []
+        self.delay = delay
+
+    async def send(self, input_data):
+        self.inputs.append(input_data)
+        await asyncio.sleep(self.delay)
+        if "batch" in input_data:
+            return {
+                "results": [
+                    {"id": item["id"], "text": f"clean {item['prompt']}", "token_count": {"prompt": 1, "completion": 1}}
+                    for item in input_data["batch"]
+                ],
+                "processing_time": 1.0,
+                "batch_size": len(input_data["batch"]),
+            }
+        return {"text": f"clean {input_data['prompt']}", "processing_time": 0.5}
+
+
+class TestGamsBatchCoalescer:
+    """Test coalescing of concurrent prompts."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_prompts_share_one_batch(self):
+        """Test prompts within the window go out as one batch, demultiplexed by id."""
+        fake = FakeGams()
+        batcher = GamsBatchCoalescer(window=0.02, max_batch_size=8)
+
+        outputs = await asyncio.gather(*(
+            batcher.submit(KEY, f"p{i}", PARAMS, fake.send) for i in range(5)
+        ))
+
+        assert len(fake.inputs) == 1
+        assert [item["prompt"] for item in fake.inputs[0]["batch"]] == [f"p{i}" for i in range(5)]
+        assert fake.inputs[0]["temperature"] == 0.0
+        assert [o["text"] for o in outputs] == [f"clean p{i}" for i in range(5)]
+        assert batcher.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_single_prompt_uses_single_mode(self):
+        """Test a lone prompt is sent in the handler's single-prompt mode."""
+        fake = FakeGams()
+        batcher = GamsBatchCoalescer(window=0.01, max_batch_size=8)
+
+        output = await batcher.submit(KEY, "only", PARAMS, fake.send)
+
+        assert fake.inputs == [{"prompt": "only", **PARAMS}]
+        assert output["text"] == "clean only"
+
+    @pytest.mark.asyncio
+    async def test_different_sampling_params_not_mixed(self):
+        """Test prompts with different keys go out in separate requests."""
+        fake = FakeGams()
+        batcher = GamsBatchCoalescer(window=0.02, max_batch_size=8)
+        other_key = ("endpoint", "key", 0.7, 0.9, 2048)
+
+        await asyncio.gather(
+            batcher.submit(KEY, "a", PARAMS, fake.send),
+            batcher.submit(other_key, "b", {**PARAMS, "temperature": 0.7, "top_p": 0.9}, fake.send),
+            batcher.submit(KEY, "c", PARAMS, fake.send),
+        )
+
+        assert len(fake.inputs) == 2
+        batch, single = sorted(fake.inputs, key=lambda i: "batch" not in i)
+        assert [item["prompt"] for item in batch["batch"]] == ["a", "c"]
+        assert single["prompt"] == "b" and single["temperature"] == 0.7
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_without_waiting(self):
+        """Test a group is flushed as soon as it reaches max_batch_size."""
+        fake = FakeGams()
+        batcher = GamsBatchCoalescer(window=10, max_batch_size=3)
+
+        start = time.monotonic()
+        await asyncio.gather(*(batcher.submit(KEY, f"p{i}", PARAMS, fake.send) for i in range(3)))
+
+        assert time.monotonic() - start < 1
+        assert len(fake.inputs[0]["batch"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_send_failure_reaches_all_waiters(self):
+        """Test a failed batch request raises for every prompt in it."""
+        async def send(input_data):
+            raise Exception("HTTP error: 500")
+
+        batcher = GamsBatchCoalescer(window=0.01, max_batch_size=8)
+
+        results = await asyncio.gather(
+            *(batcher.submit(KEY, f"p{i}", PARAMS, send) for i in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(str(r) == "HTTP error: 500" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_missing_result_is_an_error_for_that_prompt(self):
+        """Test a batch item without a result gets an error output."""
+        async def send(input_data):
+            return {"results": [{"id": "0", "text": "ok"}]}
+
+        batcher = GamsBatchCoalescer(window=0.01, max_batch_size=8)
+
+        first, second = await asyncio.gather(
+            batcher.submit(KEY, "a", PARAMS, send),
+            batcher.submit(KEY, "b", PARAMS, send),
+        )
+
+        assert first["text"] == "ok"
+        assert "error" in second
+
+    def test_invalid_settings_raise(self):
+        """Test invalid coalescer settings are rejected."""
+        with pytest.raises(ValueError):
+            GamsBatchCoalescer(window=0.01, max_batch_size=0)
+
+
+class TestGamsServiceBatching:
+    """Test concurrent cleanups through the GaMS service are batched."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cleanups_are_batched(self):
+        """Test concurrent cleanup_transcription calls share one RunPod request."""
+        mock_settings = MagicMock()
+        mock_settings.RUNPOD_API_KEY = "test-api-key"
+        mock_settings.RUNPOD_LLM_GAMS_ENDPOINT_ID = "test-endpoint-id"
+        mock_settings.RUNPOD_LLM_GAMS_MODEL = "GaMS-9B-Instruct"
+        mock_settings.RUNPOD_LLM_GAMS_TIMEOUT = 120
+        mock_settings.RUNPOD_LLM_GAMS_MAX_RETRIES = 0
+        mock_settings.RUNPOD_LLM_GAMS_DEFAULT_TEMPERATURE = 0.0
+        mock_settings.RUNPOD_LLM_GAMS_DEFAULT_TOP_P = 0.0
+        mock_settings.RUNPOD_LLM_GAMS_MAX_TOKENS = 2048
+        mock_settings.RUNPOD_LLM_GAMS_CONTEXT_WINDOW = 4096
+        mock_settings.LLM_CLEANUP_WINDOW_OVERLAP_TOKENS = 100
+        mock_settings.LLM_CLEANUP_MAX_CONCURRENT_WINDOWS = 8
+        mock_settings.RUNPOD_ASYNC_JOBS = False
+
+        fake = FakeGams()
+        batcher = GamsBatchCoalescer(window=0.02, max_batch_size=8)
+
+        with patch("app.services.llm_cleanup_runpod_gams.settings", mock_settings), \
+                patch("app.services.llm_cleanup_runpod_gams.get_gams_batcher", return_value=batcher):
+            services = [RunPodGamsLLMCleanupService() for _ in range(3)]
+
+        for service in services:
+            service._send_runpod_input = fake.send
+
+        results = await asyncio.gather(*(
+            service.cleanup_transcription(f"besedilo {i}", entry_type="dream")
+            for i, service in enumerate(services)
+        ))
+
+        assert len(fake.inputs) == 1
+        assert len(fake.inputs[0]["batch"]) == 3
+        for i, result in enumerate(results):
+            assert f"besedilo {i}" in result["cleaned_text"]
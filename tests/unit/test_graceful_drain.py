@@ -0,0 +1,390 @@
+"""
+Unit tests for draining, checkpointing and resuming background jobs on
+shutdown (app/services/background_jobs.py) and for RunPod jobs resumed from
+saved progress. The database is mocked; jobs are simulated with events.
+"""
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.services.background_jobs import (
+    _INSTANCE_ID,
+    TRANSCRIPTION_JOB,
+    BackgroundJobRegistry,
+    JobResume,
+    ensure_accepting_jobs,
+    get_job_progress,
+    record_job_progress,
+    register_resumable_task,
+)
+from app.services.runpod_jobs import (
+    RunPodJobPoller,
+    RunPodJobStore,
+    run_runpod_job,
+    runpod_job_fingerprint,
+)
+
+BASE_URL = "https://api.runpod.ai/v2/test-endpoint"
+ENTRY_ID = uuid.uuid4()
+USER_ID = uuid.uuid4()
+
+_RealAsyncClient = httpx.AsyncClient
+
+
+async def settle():
+    """Let started tasks reach their first await."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def mock_db_service():
+    """db_service of background_jobs with checkpoint methods mocked."""
+    @asynccontextmanager
+    async def get_session():
+        yield AsyncMock()
+
+    with patch("app.services.background_jobs.get_session", get_session), \
+            patch("app.services.background_jobs.db_service") as service:
+        service.save_job_checkpoint = AsyncMock()
+        service.delete_job_checkpoint = AsyncMock()
+        service.claim_job_checkpoints = AsyncMock(return_value=[])
+        service.fail_orphaned_jobs = AsyncMock(return_value=0)
+        yield service
+
+
+def resume_info():
+    """JobResume of a test job."""
+    return JobResume("test-task", USER_ID, {"entry_id": ENTRY_ID})
+
+
+class Job:
+    """A job that runs until released and records how it ended."""
+
+    def __init__(self):
+        self.started = False
+        self.release = asyncio.Event()
+        self.cancelled = False
+
+    async def work(self):
+        self.started = True
+        record_job_progress("chunk-0", "runpod-job-0")
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+def start(registry, job_id, job):
+    """Run a resumable job through the registry in the background."""
+    return asyncio.ensure_future(registry.run(
+        TRANSCRIPTION_JOB, job_id, job.work(), voice_entry_id=ENTRY_ID, resume=resume_info()
+    ))
+
+
+class TestCheckpoints:
+    """Test checkpoints of resumable jobs."""
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_saved_while_running_and_deleted_when_done(self, mock_db_service):
+        """Test a resumable job owns a checkpoint until it finishes."""
+        registry = BackgroundJobRegistry()
+        job_id = uuid.uuid4()
+        job = Job()
+        runner = start(registry, job_id, job)
+        await settle()
+
+        kwargs = mock_db_service.save_job_checkpoint.await_args.kwargs
+        assert kwargs["owner"] == _INSTANCE_ID
+        assert kwargs["task"] == "test-task"
+        assert kwargs["params"] == {"entry_id": str(ENTRY_ID)}
+
+        job.release.set()
+
+        assert await runner is True
+        mock_db_service.delete_job_checkpoint.assert_awaited_once()
+        assert mock_db_service.delete_job_checkpoint.await_args.args[1] == job_id
+
+    @pytest.mark.asyncio
+    async def test_job_not_started_without_checkpoint(self, mock_db_service):
+        """Test a job whose checkpoint cannot be created is not run (it would look orphaned)."""
+        mock_db_service.save_job_checkpoint.side_effect = RuntimeError("database unavailable")
+        registry = BackgroundJobRegistry()
+        job = Job()
+
+        with pytest.raises(RuntimeError, match="checkpoint"):
+            await start(registry, uuid.uuid4(), job)
+
+        assert not job.started
+        mock_db_service.delete_job_checkpoint.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_job_without_resume_has_no_checkpoint(self, mock_db_service):
+        """Test jobs started without JobResume do not touch the database."""
+        registry = BackgroundJobRegistry()
+        job = Job()
+        runner = asyncio.ensure_future(registry.run(TRANSCRIPTION_JOB, uuid.uuid4(), job.work(), voice_entry_id=ENTRY_ID))
+        await settle()
+        job.release.set()
+
+        assert await runner is True
+        mock_db_service.save_job_checkpoint.assert_not_awaited()
+        mock_db_service.delete_job_checkpoint.assert_not_awaited()
+
+
+class TestDrain:
+    """Test draining jobs on shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_jobs_finishing_before_deadline_complete(self, mock_db_service):
+        """Test a job finishing within the deadline is not interrupted."""
+        registry = BackgroundJobRegistry()
+        job = Job()
+        runner = start(registry, uuid.uuid4(), job)
+        await settle()
+
+        drain = asyncio.ensure_future(registry.drain(timeout=5))
+        await settle()
+        assert registry.draining
+        job.release.set()
+        await drain
+
+        assert await runner is True
+        assert not job.cancelled
+
+    @pytest.mark.asyncio
+    async def test_deadline_interrupts_and_releases_with_progress(self, mock_db_service):
+        """Test jobs still running at the deadline release their checkpoint with progress."""
+        registry = BackgroundJobRegistry()
+        job = Job()
+        runner = start(registry, uuid.uuid4(), job)
+        await settle()
+
+        await registry.drain(timeout=0.01)
+
+        assert await runner is False
+        assert job.cancelled
+        kwargs = mock_db_service.save_job_checkpoint.await_args.kwargs
+        assert kwargs["owner"] is None
+        assert kwargs["progress"] == {"chunk-0": "runpod-job-0"}
+        mock_db_service.delete_job_checkpoint.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_new_jobs_deferred_while_draining(self, mock_db_service):
+        """Test jobs arriving during a drain are checkpointed for resume, not started."""
+        registry = BackgroundJobRegistry()
+        await registry.drain(timeout=1)
+        job = Job()
+
+        assert await start(registry, uuid.uuid4(), job) is False
+        assert not job.started
+        assert mock_db_service.save_job_checkpoint.await_args.kwargs["owner"] is None
+
+    @pytest.mark.asyncio
+    async def test_requests_rejected_while_draining(self):
+        """Test routes starting jobs answer 503 with Retry-After while draining."""
+        registry = BackgroundJobRegistry()
+        with patch("app.services.background_jobs.get_background_job_registry", return_value=registry):
+            ensure_accepting_jobs()
+
+            await registry.drain(timeout=1)
+
+            with pytest.raises(HTTPException) as exc_info:
+                ensure_accepting_jobs()
+        assert exc_info.value.status_code == 503
+        assert "Retry-After" in exc_info.value.headers
+
+
+class TestChainedCleanup:
+    """Test the cleanup chained after a transcription (upload-transcribe-cleanup) across a shutdown."""
+
+    @staticmethod
+    async def run_chain(registry, job, cleanup_db_service):
+        """Run transcription_then_cleanup_task with the transcription job simulated by job."""
+        from app.routes.upload import transcription_then_cleanup_task
+
+        async def process_transcription_task(**kwargs):
+            return await registry.run(
+                TRANSCRIPTION_JOB, kwargs["transcription_id"], job.work(),
+                voice_entry_id=ENTRY_ID, resume=kwargs["resume"]
+            )
+
+        @asynccontextmanager
+        async def get_session():
+            yield AsyncMock()
+
+        with patch("app.routes.transcription.process_transcription_task", process_transcription_task), \
+                patch("app.routes.upload.get_background_job_registry", return_value=registry), \
+                patch("app.routes.upload.db_service", cleanup_db_service), \
+                patch("app.database.get_session", get_session):
+            return await transcription_then_cleanup_task(
+                transcription_id=uuid.uuid4(), entry_id=ENTRY_ID, audio_file_path="/tmp/audio.wav",
+                language="sl", transcription_provider="groq", cleaned_entry_id=uuid.uuid4(),
+                entry_type="dream", user_id=USER_ID,
+            )
+
+    @pytest.fixture
+    def cleanup_db_service(self):
+        from app.models.cleaned_entry import CleanupStatus
+
+        service = AsyncMock()
+        service.get_cleaned_entry_by_id.return_value = SimpleNamespace(status=CleanupStatus.PENDING)
+        service.get_transcription_by_id.return_value = SimpleNamespace(status="failed", transcribed_text=None)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_interrupted_transcription_leaves_cleanup_pending(self, mock_db_service, cleanup_db_service):
+        """Test a transcription interrupted by the drain deadline does not fail its cleanup."""
+        registry = BackgroundJobRegistry()
+        job = Job()
+        chain = asyncio.ensure_future(self.run_chain(registry, job, cleanup_db_service))
+        await settle()
+
+        await registry.drain(timeout=0.01)
+        await chain
+
+        assert job.cancelled
+        assert mock_db_service.save_job_checkpoint.await_args.kwargs["owner"] is None
+        cleanup_db_service.update_cleaned_entry_processing.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_deferred_transcription_leaves_cleanup_pending(self, mock_db_service, cleanup_db_service):
+        """Test a transcription not started because the worker is draining does not fail its cleanup."""
+        registry = BackgroundJobRegistry()
+        await registry.drain(timeout=1)
+        job = Job()
+
+        await self.run_chain(registry, job, cleanup_db_service)
+
+        assert not job.started
+        cleanup_db_service.update_cleaned_entry_processing.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_transcription_fails_cleanup(self, mock_db_service, cleanup_db_service):
+        """Test a cancelled transcription (not a shutdown) still fails its pending cleanup."""
+        from app.models.cleaned_entry import CleanupStatus
+
+        registry = BackgroundJobRegistry()
+        job = Job()
+        chain = asyncio.ensure_future(self.run_chain(registry, job, cleanup_db_service))
+        await settle()
+
+        registry.cancel(TRANSCRIPTION_JOB, next(iter(registry._jobs))[1])
+        await chain
+
+        kwargs = cleanup_db_service.update_cleaned_entry_processing.await_args.kwargs
+        assert kwargs["cleanup_status"] == CleanupStatus.FAILED
+
+
+class TestResume:
+    """Test resuming checkpointed jobs."""
+
+    @pytest.mark.asyncio
+    async def test_claimed_checkpoint_resumed_with_progress(self, mock_db_service):
+        """Test a claimed checkpoint runs its task, which sees the saved progress."""
+        registry = BackgroundJobRegistry()
+        job_id = uuid.uuid4()
+        seen = {}
+
+        async def resume(params):
+            async def work():
+                seen["progress"] = get_job_progress("chunk-0")
+            seen["params"] = params
+            await registry.run(TRANSCRIPTION_JOB, job_id, work(), voice_entry_id=ENTRY_ID, resume=resume_info())
+
+        register_resumable_task("test-task", resume)
+        mock_db_service.claim_job_checkpoints.return_value = [SimpleNamespace(
+            job_id=job_id, task="test-task", params={"entry_id": str(ENTRY_ID)}, progress={"chunk-0": "runpod-job-0"}
+        )]
+
+        assert await registry.resume_jobs(fail_orphans=True) == 1
+        await asyncio.gather(*registry._tasks)
+
+        assert seen == {"params": {"entry_id": str(ENTRY_ID)}, "progress": "runpod-job-0"}
+        mock_db_service.fail_orphaned_jobs.assert_awaited_once()
+        mock_db_service.delete_job_checkpoint.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_dropped_when_task_skips_job(self, mock_db_service):
+        """Test a checkpoint whose record is gone is deleted instead of resumed forever."""
+        registry = BackgroundJobRegistry()
+        job_id = uuid.uuid4()
+        register_resumable_task("test-skip", AsyncMock())
+        mock_db_service.claim_job_checkpoints.return_value = [SimpleNamespace(
+            job_id=job_id, task="test-skip", params={}, progress=None
+        )]
+
+        await registry.resume_jobs()
+        await asyncio.gather(*registry._tasks)
+
+        assert mock_db_service.delete_job_checkpoint.await_args.args[1] == job_id
+
+    @pytest.mark.asyncio
+    async def test_no_resume_while_draining(self, mock_db_service):
+        """Test a draining worker does not claim checkpoints."""
+        registry = BackgroundJobRegistry()
+        await registry.drain(timeout=1)
+
+        assert await registry.resume_jobs() == 0
+        mock_db_service.claim_job_checkpoints.assert_not_awaited()
+
+
+class TestRunPodProgress:
+    """Test RunPod jobs are recorded as progress and resumed from it."""
+
+    async def run_job(self, progress):
+        """Run a RunPod job inside a background job; return (submits, status polls, progress)."""
+        calls = {"submits": 0, "polled": []}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/run"):
+                calls["submits"] += 1
+                return httpx.Response(200, json={"id": "job-new", "status": "IN_QUEUE"})
+            calls["polled"].append(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json={"status": "COMPLETED", "output": {"text": "ok"}})
+
+        transport = httpx.MockTransport(handler)
+        registry = BackgroundJobRegistry()
+        poller = RunPodJobPoller(initial_interval=0.01, max_interval=0.02)
+        job_id = uuid.uuid4()
+        # As left by resume_jobs() for a claimed checkpoint
+        registry._check_loop()
+        registry._resumed_progress[job_id] = progress
+        saved = {}
+
+        async def work():
+            await run_runpod_job(BASE_URL, "key", {"x": 1}, timeout=5, poller=poller, store=RunPodJobStore())
+            saved.update(registry._jobs[(TRANSCRIPTION_JOB, job_id)].progress)
+
+        with patch(
+            "app.services.runpod_jobs.httpx.AsyncClient",
+            side_effect=lambda **kwargs: _RealAsyncClient(transport=transport, **kwargs),
+        ):
+            assert await registry.run(TRANSCRIPTION_JOB, job_id, work(), voice_entry_id=ENTRY_ID)
+        await poller.close()
+        return calls, saved
+
+    @pytest.mark.asyncio
+    async def test_completed_job_kept_in_progress(self):
+        """Test a submitted job stays in the progress after completing."""
+        calls, saved = await self.run_job({})
+
+        assert calls["submits"] == 1
+        assert saved == {f"runpod:{runpod_job_fingerprint(BASE_URL, {'x': 1})}": "job-new"}
+
+    @pytest.mark.asyncio
+    async def test_resumed_job_reuses_saved_runpod_job(self):
+        """Test a resumed job fetches its saved RunPod job instead of submitting again."""
+        key = f"runpod:{runpod_job_fingerprint(BASE_URL, {'x': 1})}"
+
+        calls, _ = await self.run_job({key: "job-saved"})
+
+        assert calls["submits"] == 0
+        assert calls["polled"] == ["job-saved"]
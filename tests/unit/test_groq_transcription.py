@@ -0,0 +1,213 @@
+"""
+Unit tests for Groq transcription chunking, stitching and rate limiting.
+The Groq client and the audio chunker are mocked.
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from app.services.rate_limiter import ProviderRateLimiter
+from app.services.transcription_groq import GroqTranscriptionService
+from app.utils.audio_chunking import AudioChunk
+
+
+def _make_chunks(tmp_path, bounds):
+    """Create chunk files for (start_ms, end_ms) bounds."""
+    chunks = []
+    for i, (start, end) in enumerate(bounds):
+        path = tmp_path / f"chunk_{i:04d}.flac"
+        path.write_bytes(b"fake flac")
+        chunks.append(AudioChunk(
+            index=i, path=path, start_time_ms=start, end_time_ms=end, duration_ms=end - start
+        ))
+    return chunks
+
+
+def _response(segments, language="slovenian"):
+    """Build a verbose_json-like Groq response."""
+    return SimpleNamespace(
+        text=" ".join(s["text"] for s in segments),
+        language=language,
+        segments=segments,
+    )
+
+
+class RateLimitError(Exception):
+    """Stand-in for groq.RateLimitError (status_code + response headers)."""
+
+    status_code = 429
+
+    def __init__(self, retry_after="0.05"):
+        super().__init__("rate limited")
+        self.response = SimpleNamespace(headers={"retry-after": retry_after})
+
+
+@pytest.fixture
+def service():
+    """Create a Groq service with a mocked client and a private rate limiter."""
+    service = GroqTranscriptionService(api_key="test-key", max_concurrent_chunks=4)
+    service.client = MagicMock()
+    service._rate_limiter = ProviderRateLimiter("test", max_requests=100, period=60)
+    return service
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    path = tmp_path / "audio.wav"
+    path.write_bytes(b"fake audio")
+    return path
+
+
+class TestGroqChunkedTranscription:
+    """Test transcription of chunked audio."""
+
+    @pytest.mark.asyncio
+    async def test_silence_cut_chunks_are_offset(self, service, audio_file, tmp_path):
+        """Test segment timestamps are shifted by each chunk's start time."""
+        chunks = _make_chunks(tmp_path, [(0, 230500), (230500, 400000)])
+        service._chunker.chunk_audio = Mock(return_value=chunks)
+
+        responses = {
+            "chunk_0000.flac": _response([{"id": 0, "start": 0.0, "end": 4.0, "text": " Prvi."}]),
+            "chunk_0001.flac": _response([{"id": 0, "start": 1.0, "end": 3.0, "text": " Drugi."}]),
+        }
+
+        async def create(file, **kwargs):
+            return responses[file[0]]
+
+        service.client.audio.transcriptions.create = AsyncMock(side_effect=create)
+
+        result = await service.transcribe_audio(audio_file, language="sl")
+
+        assert result["text"] == "Prvi. Drugi."
+        assert result["language"] == "slovenian"
+        assert [(s["id"], s["start"], s["end"]) for s in result["segments"]] == [
+            (0, 0.0, 4.0),
+            (1, 231.5, 233.5),
+        ]
+        args = service._chunker.chunk_audio.call_args[0]
+        assert args[3] == "flac"
+
+    @pytest.mark.asyncio
+    async def test_overlap_segments_are_deduplicated(self, service, audio_file, tmp_path):
+        """Test segments repeated in a fixed-cut overlap are kept once."""
+        # Chunks overlap by 5s (235-240s); split point is 237.5s
+        chunks = _make_chunks(tmp_path, [(0, 240000), (235000, 400000)])
+        service._chunker.chunk_audio = Mock(return_value=chunks)
+
+        responses = {
+            "chunk_0000.flac": _response([
+                {"id": 0, "start": 230.0, "end": 234.0, "text": " Before."},
+                {"id": 1, "start": 236.0, "end": 240.0, "text": " Overlap."},
+            ]),
+            "chunk_0001.flac": _response([
+                {"id": 0, "start": 1.0, "end": 5.0, "text": " Overlap."},
+                {"id": 1, "start": 6.0, "end": 9.0, "text": " After."},
+            ]),
+        }
+
+        async def create(file, **kwargs):
+            return responses[file[0]]
+
+        service.client.audio.transcriptions.create = AsyncMock(side_effect=create)
+
+        result = await service.transcribe_audio(audio_file, language="en")
+
+        assert result["text"] == "Before. Overlap. After."
+        assert [s["id"] for s in result["segments"]] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_transcribed_concurrently(self, service, audio_file, tmp_path):
+        """Test chunk requests overlap in time (bounded by max_concurrent_chunks)."""
+        chunks = _make_chunks(tmp_path, [(i * 100000, (i + 1) * 100000) for i in range(6)])
+        service._chunker.chunk_audio = Mock(return_value=chunks)
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def create(file, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return _response([{"id": 0, "start": 0.0, "end": 1.0, "text": file[0]}])
+
+        service.client.audio.transcriptions.create = AsyncMock(side_effect=create)
+
+        result = await service.transcribe_audio(audio_file, language="auto")
+
+        assert max_in_flight == 4
+        assert len(result["segments"]) == 6
+        assert "language" not in service.client.audio.transcriptions.create.call_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_chunk_is_retried(self, service, audio_file, tmp_path):
+        """Test a 429 pauses the shared limiter and the chunk is retried."""
+        chunks = _make_chunks(tmp_path, [(0, 60000)])
+        service._chunker.chunk_audio = Mock(return_value=chunks)
+
+        service.client.audio.transcriptions.create = AsyncMock(side_effect=[
+            RateLimitError(retry_after="0.05"),
+            _response([{"id": 0, "start": 0.0, "end": 1.0, "text": "Ok."}]),
+        ])
+
+        start = time.monotonic()
+        result = await service.transcribe_audio(audio_file, language="en")
+
+        assert result["text"] == "Ok."
+        assert service.client.audio.transcriptions.create.call_count == 2
+        assert time.monotonic() - start >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_fails_transcription(self, service, audio_file, tmp_path):
+        """Test a failing chunk fails the whole transcription."""
+        chunks = _make_chunks(tmp_path, [(0, 100000), (100000, 200000)])
+        service._chunker.chunk_audio = Mock(return_value=chunks)
+        service.client.audio.transcriptions.create = AsyncMock(side_effect=Exception("boom"))
+
+        with pytest.raises(RuntimeError, match="Groq transcription failed: boom"):
+            await service.transcribe_audio(audio_file, language="en")
+
+    @pytest.mark.asyncio
+    async def test_chunking_failure_uploads_original(self, service, audio_file):
+        """Test the original file is uploaded when chunking/encoding fails."""
+        service._chunker.chunk_audio = Mock(side_effect=RuntimeError("ffmpeg not found"))
+        service.client.audio.transcriptions.create = AsyncMock(
+            return_value=_response([{"id": 0, "start": 0.0, "end": 1.0, "text": "Hi"}])
+        )
+
+        result = await service.transcribe_audio(audio_file, language="en")
+
+        assert result["text"] == "Hi"
+        file_arg = service.client.audio.transcriptions.create.call_args.kwargs["file"]
+        assert file_arg[0] == "audio.wav"
+
+    def test_invalid_chunk_format_raises(self):
+        """Test unknown upload encodings are rejected."""
+        with pytest.raises(ValueError, match="Invalid chunk_format"):
+            GroqTranscriptionService(api_key="test-key", chunk_format="mp3")
+
+
+class TestProviderRateLimiter:
+    """Test the shared provider rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_pause_delays_all_requests(self):
+        """Test pause() blocks requests until the cool-down ends."""
+        limiter = ProviderRateLimiter("test", max_requests=10, period=1)
+        limiter.pause(0.1)
+
+        start = time.monotonic()
+        async with limiter:
+            pass
+
+        assert time.monotonic() - start >= 0.1
+
+    def test_invalid_limits_raise(self):
+        """Test invalid limiter settings are rejected."""
+        with pytest.raises(ValueError):
+            ProviderRateLimiter("test", max_requests=0, period=60)
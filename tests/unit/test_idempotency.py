@@ -0,0 +1,182 @@
+"""
+Unit tests for Idempotency-Key handling (app/services/idempotency.py).
+The database is mocked.
+"""
+import io
+import json
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import JSONResponse
+
+from app.schemas.transcription import TranscriptionTriggerResponse
+from app.services.idempotency import (
+    IDEMPOTENT_REPLAYED_HEADER,
+    IdempotentRequest,
+    compute_request_fingerprint,
+)
+
+USER_ID = uuid.uuid4()
+PARAMS = {"entry_id": uuid.UUID(int=1), "language": "sl"}
+
+
+def make_upload(content: bytes) -> UploadFile:
+    """UploadFile with the given content."""
+    return UploadFile(file=io.BytesIO(content), filename="memo.m4a")
+
+
+@pytest.fixture
+def db():
+    """Mocked database session."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_db_service():
+    """db_service with idempotency key methods mocked."""
+    with patch("app.services.idempotency.db_service") as service:
+        service.reserve_idempotency_key = AsyncMock(return_value=True)
+        service.get_idempotency_key = AsyncMock(return_value=None)
+        service.complete_idempotency_key = AsyncMock()
+        service.delete_idempotency_key = AsyncMock()
+        yield service
+
+
+async def stored_record(status_code=202, body=None, params=PARAMS, endpoint="transcribe"):
+    """Idempotency key row as stored by an earlier request."""
+    return SimpleNamespace(
+        request_fingerprint=await compute_request_fingerprint(endpoint, params),
+        status_code=status_code,
+        response_body=body,
+    )
+
+
+class TestRequestFingerprint:
+    """Test request fingerprints."""
+
+    @pytest.mark.asyncio
+    async def test_parameters_and_endpoint_change_fingerprint(self):
+        """Test the fingerprint covers endpoint and parameter values, not their order."""
+        fingerprint = await compute_request_fingerprint("transcribe", PARAMS)
+
+        assert fingerprint == await compute_request_fingerprint("transcribe", dict(reversed(PARAMS.items())))
+        assert fingerprint != await compute_request_fingerprint("cleanup", PARAMS)
+        assert fingerprint != await compute_request_fingerprint("transcribe", {**PARAMS, "language": "en"})
+
+    @pytest.mark.asyncio
+    async def test_upload_hashed_and_rewound(self):
+        """Test the uploaded file is part of the fingerprint and can still be saved."""
+        upload = make_upload(b"audio-1")
+
+        fingerprint = await compute_request_fingerprint("upload", {}, upload)
+
+        assert await upload.read() == b"audio-1"
+        assert fingerprint != await compute_request_fingerprint("upload", {}, make_upload(b"audio-2"))
+
+
+class TestIdempotentRequest:
+    """Test claiming, replaying and releasing keys."""
+
+    @pytest.mark.asyncio
+    async def test_without_key_is_noop(self, db, mock_db_service):
+        """Test requests without the header are handled as before."""
+        idempotency = IdempotentRequest(None, USER_ID, "transcribe")
+
+        assert await idempotency.begin(db, PARAMS) is None
+        await idempotency.complete(db, 202, TranscriptionTriggerResponse(
+            transcription_id=uuid.uuid4(), entry_id=uuid.uuid4(), status="processing", message="ok"
+        ))
+        await idempotency.release(db)
+
+        mock_db_service.reserve_idempotency_key.assert_not_awaited()
+        mock_db_service.complete_idempotency_key.assert_not_awaited()
+        mock_db_service.delete_idempotency_key.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_first_request_claims_and_stores_response(self, db, mock_db_service):
+        """Test a new key is claimed before the work and completed with the response."""
+        idempotency = IdempotentRequest("key-1", USER_ID, "transcribe")
+        response = TranscriptionTriggerResponse(
+            transcription_id=uuid.uuid4(), entry_id=uuid.uuid4(), status="processing", message="ok"
+        )
+
+        assert await idempotency.begin(db, PARAMS) is None
+        db.commit.assert_awaited_once()
+
+        await idempotency.complete(db, 202, response)
+
+        kwargs = mock_db_service.complete_idempotency_key.await_args.kwargs
+        assert kwargs["status_code"] == 202
+        assert kwargs["response_body"]["transcription_id"] == str(response.transcription_id)
+        assert kwargs["expires_at"] > datetime.utcnow() + timedelta(hours=23)
+        json.dumps(kwargs["response_body"])
+
+    @pytest.mark.asyncio
+    async def test_retry_replays_stored_response(self, db, mock_db_service):
+        """Test a retry gets the original status code and body."""
+        body = {"transcription_id": str(uuid.uuid4()), "status": "processing"}
+        mock_db_service.reserve_idempotency_key.return_value = False
+        mock_db_service.get_idempotency_key.return_value = await stored_record(202, body)
+
+        replay = await IdempotentRequest("key-1", USER_ID, "transcribe").begin(db, PARAMS)
+
+        assert isinstance(replay, JSONResponse)
+        assert replay.status_code == 202
+        assert json.loads(replay.body) == body
+        assert replay.headers[IDEMPOTENT_REPLAYED_HEADER] == "true"
+
+    @pytest.mark.asyncio
+    async def test_key_reused_for_other_request(self, db, mock_db_service):
+        """Test a key reused with different parameters is rejected."""
+        mock_db_service.reserve_idempotency_key.return_value = False
+        mock_db_service.get_idempotency_key.return_value = await stored_record(params={"language": "en"})
+
+        with pytest.raises(HTTPException) as exc_info:
+            await IdempotentRequest("key-1", USER_ID, "transcribe").begin(db, PARAMS)
+
+        assert exc_info.value.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_retry_while_in_progress(self, db, mock_db_service):
+        """Test a retry of a request that is still running gets 409."""
+        mock_db_service.reserve_idempotency_key.return_value = False
+        mock_db_service.get_idempotency_key.return_value = await stored_record(status_code=None)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await IdempotentRequest("key-1", USER_ID, "transcribe").begin(db, PARAMS)
+
+        assert exc_info.value.status_code == 409
+
+    @pytest.mark.asyncio
+    async def test_invalid_key(self, db, mock_db_service):
+        """Test empty and overlong keys are rejected."""
+        for key in ("", "k" * 256):
+            with pytest.raises(HTTPException) as exc_info:
+                await IdempotentRequest(key, USER_ID, "transcribe").begin(db, PARAMS)
+            assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_failed_request_releases_key(self, db, mock_db_service):
+        """Test a failed request deletes its claim so the client can retry."""
+        idempotency = IdempotentRequest("key-1", USER_ID, "transcribe")
+        await idempotency.begin(db, PARAMS)
+
+        await idempotency.release(db)
+
+        db.rollback.assert_awaited_once()
+        mock_db_service.delete_idempotency_key.assert_awaited_once_with(db, USER_ID, "transcribe", "key-1")
+
+    @pytest.mark.asyncio
+    async def test_store_failure_does_not_fail_request(self, db, mock_db_service):
+        """Test a failure to store the response is logged, not raised."""
+        mock_db_service.complete_idempotency_key.side_effect = HTTPException(status_code=500)
+        idempotency = IdempotentRequest("key-1", USER_ID, "transcribe")
+        await idempotency.begin(db, PARAMS)
+
+        await idempotency.complete(db, 202, TranscriptionTriggerResponse(
+            transcription_id=uuid.uuid4(), entry_id=uuid.uuid4(), status="processing", message="ok"
+        ))
@@ -0,0 +1,192 @@
+"""
+Unit tests for fair scheduling of background jobs (app/services/job_scheduler.py).
+Jobs are simulated with events; no providers or database are used.
+"""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.services.job_scheduler import (
+    BULK_LANE,
+    INTERACTIVE_LANE,
+    FairJobScheduler,
+    cleanup_cost_seconds,
+)
+
+
+class JobRecorder:
+    """Runs jobs through a scheduler and records their start order."""
+
+    def __init__(self, scheduler: FairJobScheduler):
+        self.scheduler = scheduler
+        self.started = []
+        self.release = {}
+        self.tasks = []
+
+    def submit(self, user: str, cost: float, name: str) -> asyncio.Task:
+        """Queue a job that holds its slot until finish(name)."""
+        self.release[name] = asyncio.Event()
+
+        async def job():
+            async with self.scheduler.slot(user, cost, kind="transcription"):
+                self.started.append(name)
+                await self.release[name].wait()
+
+        task = asyncio.ensure_future(job())
+        self.tasks.append(task)
+        return task
+
+    async def close(self):
+        """Cancel jobs still waiting or running."""
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    async def finish(self, name: str):
+        """Complete a running job and let the scheduler dispatch."""
+        self.release[name].set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+
+@pytest.fixture
+async def make_recorder():
+    """Create JobRecorders whose leftover jobs are cancelled after the test."""
+    recorders = []
+
+    def factory(**options) -> JobRecorder:
+        recorder = JobRecorder(FairJobScheduler(**options))
+        recorders.append(recorder)
+        return recorder
+
+    yield factory
+    for recorder in recorders:
+        await recorder.close()
+
+
+async def settle():
+    """Let queued tasks reach the scheduler."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+class TestFairJobScheduler:
+    """Test slots, per-user caps, lanes and round-robin order."""
+
+    @pytest.mark.asyncio
+    async def test_global_concurrency_limit(self, make_recorder):
+        """Test no more than max_concurrent jobs run at once."""
+        recorder = make_recorder(max_concurrent=2, max_per_user=5, interactive_max_seconds=300, quantum_seconds=600)
+        scheduler = recorder.scheduler
+        tasks = [recorder.submit("u1", 60, f"j{i}") for i in range(3)]
+        await settle()
+
+        assert recorder.started == ["j0", "j1"]
+
+        await recorder.finish("j0")
+        assert recorder.started == ["j0", "j1", "j2"]
+
+        for name in ("j1", "j2"):
+            await recorder.finish(name)
+        await asyncio.gather(*tasks)
+        assert scheduler.running == 0
+
+    @pytest.mark.asyncio
+    async def test_per_user_cap(self, make_recorder):
+        """Test a user's queued jobs do not block another user below the cap."""
+        recorder = make_recorder(max_concurrent=3, max_per_user=1, interactive_max_seconds=300, quantum_seconds=600)
+        recorder.submit("bulk-user", 60, "a1")
+        recorder.submit("bulk-user", 60, "a2")
+        recorder.submit("other", 60, "b1")
+        await settle()
+
+        assert recorder.started == ["a1", "b1"]
+
+    @pytest.mark.asyncio
+    async def test_interactive_lane_served_first(self, make_recorder):
+        """Test a short recording overtakes queued long ones."""
+        recorder = make_recorder(max_concurrent=1, max_per_user=5, interactive_max_seconds=300, quantum_seconds=600)
+        scheduler = recorder.scheduler
+        recorder.submit("bulk-user", 3600, "long1")
+        await settle()
+        recorder.submit("bulk-user", 3600, "long2")
+        recorder.submit("dreamer", 120, "memo")
+        await settle()
+
+        await recorder.finish("long1")
+
+        assert recorder.started == ["long1", "memo"]
+        assert scheduler.lane_for(120) == INTERACTIVE_LANE
+        assert scheduler.lane_for(3600) == BULK_LANE
+        assert scheduler.lane_for(None) == BULK_LANE
+
+    @pytest.mark.asyncio
+    async def test_round_robin_weighted_by_duration(self, make_recorder):
+        """Test users share the bulk lane by audio seconds, not job counts."""
+        recorder = make_recorder(max_concurrent=1, max_per_user=5, interactive_max_seconds=0, quantum_seconds=600)
+        recorder.submit("blocker", 1, "blocker")
+        await settle()
+        # A: two 20-minute recordings; B: four 10-minute recordings
+        for i in range(2):
+            recorder.submit("A", 1200, f"A{i}")
+        for i in range(4):
+            recorder.submit("B", 600, f"B{i}")
+        await settle()
+
+        await recorder.finish("blocker")
+        for _ in range(6):
+            await recorder.finish(recorder.started[-1])
+
+        # B gets two 10-minute jobs for each 20-minute job of A
+        assert recorder.started[1:] == ["B0", "A0", "B1", "B2", "A1", "B3"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self, make_recorder):
+        """Test a cancelled queued job is removed and does not take a slot."""
+        recorder = make_recorder(max_concurrent=1, max_per_user=5, interactive_max_seconds=300, quantum_seconds=600)
+        scheduler = recorder.scheduler
+        recorder.submit("u1", 60, "running")
+        waiting = recorder.submit("u1", 60, "cancelled")
+        recorder.submit("u2", 60, "next")
+        await settle()
+
+        waiting.cancel()
+        await settle()
+        await recorder.finish("running")
+
+        assert recorder.started == ["running", "next"]
+        assert scheduler.snapshot()[INTERACTIVE_LANE]["queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_times_reported_per_lane(self, make_recorder):
+        """Test queue waits are recorded for the lane of each job."""
+        recorder = make_recorder(max_concurrent=1, max_per_user=5, interactive_max_seconds=300, quantum_seconds=600)
+        scheduler = recorder.scheduler
+        recorder.submit("u1", 60, "first")
+        recorder.submit("u2", 60, "second")
+        await settle()
+        await asyncio.sleep(0.02)
+        await recorder.finish("first")
+
+        stats = scheduler.snapshot()[INTERACTIVE_LANE]
+        assert stats["dispatched"] == 2
+        assert stats["max_wait_seconds"] >= 0.02
+        assert scheduler.snapshot()[BULK_LANE]["dispatched"] == 0
+
+    @pytest.mark.asyncio
+    async def test_disabled_runs_immediately(self, make_recorder):
+        """Test SCHEDULER_ENABLED=False does not limit jobs."""
+        recorder = make_recorder(max_concurrent=1, max_per_user=1, interactive_max_seconds=300, quantum_seconds=600)
+
+        with patch("app.services.job_scheduler.settings") as mock_settings:
+            mock_settings.SCHEDULER_ENABLED = False
+            recorder.submit("u1", 60, "a")
+            recorder.submit("u1", 60, "b")
+            await settle()
+
+        assert recorder.started == ["a", "b"]
+
+    def test_cleanup_cost(self):
+        """Test cleanup cost is estimated from the text length."""
+        assert cleanup_cost_seconds("x" * 1500) == 100.0
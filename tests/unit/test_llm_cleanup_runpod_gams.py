@@ -23,6 +23,10 @@ def mock_settings():
     mock.RUNPOD_LLM_GAMS_DEFAULT_TEMPERATURE = 0.0
     mock.RUNPOD_LLM_GAMS_DEFAULT_TOP_P = 0.0
     mock.RUNPOD_LLM_GAMS_MAX_TOKENS = 2048
+    mock.RUNPOD_LLM_GAMS_CONTEXT_WINDOW = 4096
+    mock.LLM_CLEANUP_WINDOW_OVERLAP_TOKENS = 100
+    mock.LLM_CLEANUP_MAX_CONCURRENT_WINDOWS = 8
+    mock.RUNPOD_ASYNC_JOBS = False
     return mock
 
 
@@ -119,12 +119,16 @@ class TestPromptFallbackMechanisms:
 
     @pytest.mark.asyncio
     async def test_get_prompt_from_db_no_session(self):
-        """Test when no database session provided."""
+        """Test without a session the shared cache loads with its own session."""
         service = create_test_service(db_session=None)
 
-        result = await service._get_prompt_from_db("dream")
+        mock_cache = MagicMock()
+        mock_cache.get_active = AsyncMock(return_value=None)
+        with patch("app.services.llm_cleanup_groq.get_prompt_template_cache", return_value=mock_cache):
+            result = await service._get_prompt_from_db("dream")
 
         assert result is None
+        mock_cache.get_active.assert_awaited_once_with("dream", None)
 
     @pytest.mark.asyncio
     async def test_get_prompt_from_db_exception(self):
@@ -218,7 +222,10 @@ class TestPromptFallbackMechanisms:
         """Test using hardcoded fallback when no session provided."""
         service = create_test_service(db_session=None)
 
-        prompt_text, template_id = await service._get_cleanup_prompt("journal")
+        mock_cache = MagicMock()
+        mock_cache.get_active = AsyncMock(return_value=None)
+        with patch("app.services.llm_cleanup_groq.get_prompt_template_cache", return_value=mock_cache):
+            prompt_text, template_id = await service._get_cleanup_prompt("journal")
 
         # Should use hardcoded fallback
         assert "transcription cleanup assistant" in prompt_text.lower()
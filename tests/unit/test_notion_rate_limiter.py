@@ -134,7 +134,7 @@ async def test_tokens_dont_exceed_max():
     await asyncio.sleep(2)
 
     # Force refill
-    await limiter._refill_tokens()
+    limiter._refill_tokens()
 
     # Tokens should be capped at max_requests
     assert limiter.tokens <= limiter.max_requests
@@ -20,7 +20,7 @@ from app.services.notion_service import (
 @pytest.fixture
 def mock_notion_client():
     """Create a mock Notion client."""
-    with patch("app.services.notion_service.AsyncClient") as mock_client_class:
+    with patch("notion_client.AsyncClient") as mock_client_class:
         mock_client = AsyncMock()
         mock_client_class.return_value = mock_client
         yield mock_client
@@ -0,0 +1,93 @@
+"""
+Unit tests for the shared Postgres LISTEN/NOTIFY helper.
+asyncpg and the database session are mocked; no Postgres connection is used.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services import pg_listener
+from app.services.pg_listener import PgListener
+
+
+class FakeConnection:
+    """asyncpg connection that stays open until terminate() is called."""
+
+    def __init__(self):
+        self.listeners = []
+        self.termination_listeners = []
+        self.closed = False
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.append(callback)
+
+    async def add_listener(self, channel, callback):
+        self.listeners.append((channel, callback))
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+    def terminate(self):
+        for callback in self.termination_listeners:
+            callback(self)
+
+
+async def settle():
+    """Let scheduled callbacks and tasks run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestPgListener:
+    """Test the LISTEN loop and NOTIFY sending."""
+
+    @pytest.mark.asyncio
+    async def test_reconnects_and_calls_on_connect(self):
+        """Test a failed or closed connection is replaced and on_connect runs per connect."""
+        on_notification = MagicMock()
+        on_connect = MagicMock()
+        first, second = FakeConnection(), FakeConnection()
+        connect = AsyncMock(side_effect=[OSError("refused"), first, second])
+        listener = PgListener("test_channel", on_notification, on_connect=on_connect)
+
+        with patch("asyncpg.connect", connect), patch.object(pg_listener, "LISTENER_RETRY_SECONDS", 0):
+            listener.start()
+            await settle()
+            assert on_connect.call_count == 1
+            assert first.listeners == [("test_channel", on_notification)]
+
+            first.terminate()
+            await settle()
+            assert on_connect.call_count == 2
+            assert listener.listening
+
+            await listener.stop()
+
+        assert second.closed
+        assert not listener.listening
+
+    @pytest.mark.asyncio
+    async def test_announce_only_while_listening(self):
+        """Test announce sends nothing without a listener and a NOTIFY with one."""
+        listener = PgListener("test_channel", MagicMock())
+
+        with patch.object(PgListener, "notify", AsyncMock()) as notify:
+            listener.announce("ignored")
+            listener._task = asyncio.ensure_future(asyncio.sleep(3600))
+            listener.announce("payload")
+            await settle()
+            listener._task.cancel()
+
+        notify.assert_awaited_once_with("payload")
+
+    @pytest.mark.asyncio
+    async def test_notify_failure_not_raised(self):
+        """Test a failing NOTIFY is logged, not raised."""
+        listener = PgListener("test_channel", MagicMock())
+
+        with patch.object(pg_listener, "get_session", side_effect=RuntimeError("db down")):
+            await listener.notify("payload")
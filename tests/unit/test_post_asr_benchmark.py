@@ -0,0 +1,47 @@
+"""
+Unit tests for the Slovene ASR post-ASR benchmark harness
+(slovenian-asr/scripts/benchmark_post_asr.py), run at the smallest scale.
+"""
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+
+SCRIPT = Path(__file__).resolve().parents[2] / "slovenian-asr" / "scripts" / "benchmark_post_asr.py"
+
+
+@pytest.fixture(scope="module")
+def bench():
+    spec = importlib.util.spec_from_file_location("benchmark_post_asr", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def suite(bench):
+    handlers = {variant: bench.load_handler(variant) for variant in bench.PIPELINE_DIRS}
+    return bench.run_suite(handlers, ["10min"], repeats=1)
+
+
+class TestPostAsrBenchmark:
+    """Test the benchmark suite runs every stage and detects regressions."""
+
+    def test_all_stages_timed_and_variants_agree(self, bench, suite):
+        """Test every stage is timed for each variant that has it, with matching outputs."""
+        stages = suite["results"]["10min"]
+        assert list(stages) == bench.STAGES
+        assert set(stages["parse_rttm"]) == {"nfa", "mms"}  # pyannote has no RTTM step
+        assert set(stages["merge_words_with_speakers"]) == {"nfa", "mms", "pyannote"}
+        assert suite["mismatches"] == []
+
+    def test_slowdown_is_reported(self, bench, suite):
+        """Test a stage slower than baseline x tolerance is a regression."""
+        baseline = {"normalized": bench.normalize(suite)}
+        assert bench.find_regressions(suite, baseline, tolerance=2.0) == []
+
+        slower = {**suite, "calibration": suite["calibration"] / 10}
+        regressions = bench.find_regressions(slower, baseline, tolerance=2.0)
+        assert any("10min/merge_words_with_speakers/nfa" in r for r in regressions)
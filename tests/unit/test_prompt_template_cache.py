@@ -0,0 +1,141 @@
+"""
+Unit tests for the shared prompt template cache.
+The database session is mocked; no Postgres or LISTEN connection is used.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.database import DB_SCHEMA
+from app.models.prompt_template import PromptTemplate
+from app.services.prompt_template_cache import PromptTemplateCache
+
+
+def make_session(*templates):
+    """Mock session whose queries return the given templates in turn."""
+    session = MagicMock()
+    results = []
+    for template in templates:
+        result = MagicMock()
+        result.scalars.return_value.first.return_value = template
+        results.append(result)
+    session.execute = AsyncMock(side_effect=results)
+    return session
+
+
+def make_template(template_id: int, version: int = 1) -> PromptTemplate:
+    """Active dream template."""
+    return PromptTemplate(
+        id=template_id,
+        name=f"dream_v{version}",
+        entry_type="dream",
+        prompt_text="Clean {transcription_text}",
+        is_active=True,
+        version=version,
+    )
+
+
+class TestPromptTemplateCache:
+    """Test caching and invalidation of active templates."""
+
+    @pytest.mark.asyncio
+    async def test_cached_after_first_load(self):
+        """Test repeated lookups do not query the database."""
+        cache = PromptTemplateCache(ttl_seconds=300)
+        session = make_session(make_template(1))
+
+        first = await cache.get_active("dream", session)
+        second = await cache.get_active("dream", session)
+
+        assert session.execute.await_count == 1
+        assert first == second
+        assert (first.id, first.version, first.is_valid) == (1, 1, True)
+
+    @pytest.mark.asyncio
+    async def test_missing_template_is_cached(self):
+        """Test 'no active template' is cached too."""
+        cache = PromptTemplateCache(ttl_seconds=300)
+        session = make_session(None)
+
+        assert await cache.get_active("journal", session) is None
+        assert await cache.get_active("journal", session) is None
+        assert session.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_reloads_entry_type(self):
+        """Test invalidation of one entry type loads the new version."""
+        cache = PromptTemplateCache(ttl_seconds=300)
+        session = make_session(make_template(1), make_template(2, version=2))
+
+        await cache.get_active("dream", session)
+        cache.invalidate("dream")
+        template = await cache.get_active("dream", session)
+
+        assert template.id == 2 and template.version == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self):
+        """Test concurrent lookups of a missing entry share one query."""
+        cache = PromptTemplateCache(ttl_seconds=300)
+        session = make_session(make_template(1))
+
+        results = await asyncio.gather(*(cache.get_active("dream", session) for _ in range(5)))
+
+        assert session.execute.await_count == 1
+        assert all(r.id == 1 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_load_racing_invalidation_is_not_stored(self):
+        """Test a template loaded before an invalidation is not cached."""
+        cache = PromptTemplateCache(ttl_seconds=300)
+        session = make_session(make_template(1), make_template(2, version=2))
+        original_execute = session.execute
+
+        async def execute_and_invalidate(stmt):
+            result = await original_execute(stmt)
+            cache.invalidate("dream")  # activation committed while loading
+            return result
+
+        session.execute = execute_and_invalidate
+        await cache.get_active("dream", session)
+
+        session.execute = original_execute
+        assert (await cache.get_active("dream", session)).id == 2
+
+    @pytest.mark.asyncio
+    async def test_load_failure_not_cached(self):
+        """Test database errors propagate and are retried on the next lookup."""
+        cache = PromptTemplateCache(ttl_seconds=300)
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=Exception("Database error"))
+
+        with pytest.raises(Exception, match="Database error"):
+            await cache.get_active("dream", session)
+
+        session.execute = make_session(make_template(1)).execute
+        assert (await cache.get_active("dream", session)).id == 1
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_caching(self):
+        """Test ttl_seconds=0 queries on every lookup."""
+        cache = PromptTemplateCache(ttl_seconds=0)
+        session = make_session(make_template(1), make_template(1))
+
+        await cache.get_active("dream", session)
+        await cache.get_active("dream", session)
+
+        assert session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_notification_invalidates_own_schema_only(self):
+        """Test NOTIFY payloads from other schemas are ignored."""
+        cache = PromptTemplateCache(ttl_seconds=300)
+        session = make_session(make_template(1), make_template(2, version=2))
+        await cache.get_active("dream", session)
+
+        cache._on_notification(None, 1, "prompt_templates_changed", "other_schema:dream")
+        assert (await cache.get_active("dream", session)).id == 1
+
+        cache._on_notification(None, 1, "prompt_templates_changed", f"{DB_SCHEMA}:dream")
+        assert (await cache.get_active("dream", session)).id == 2
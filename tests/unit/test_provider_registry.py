@@ -2,6 +2,7 @@
 Unit tests for provider registry with runpods support.
 Tests the new multi-model provider architecture for clarin-slovene-asr.
 """
+import asyncio
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -547,6 +548,9 @@ class TestGetLLMServiceForProvider:
         mock_settings.RUNPOD_LLM_GAMS_DEFAULT_TEMPERATURE = 0.0
         mock_settings.RUNPOD_LLM_GAMS_DEFAULT_TOP_P = 0.0
         mock_settings.RUNPOD_LLM_GAMS_MAX_TOKENS = 2048
+        mock_settings.RUNPOD_LLM_GAMS_CONTEXT_WINDOW = 4096
+        mock_settings.LLM_CLEANUP_WINDOW_OVERLAP_TOKENS = 100
+        mock_settings.LLM_CLEANUP_MAX_CONCURRENT_WINDOWS = 8
 
         with patch("app.services.provider_registry.settings", mock_settings):
             with patch(
@@ -618,3 +622,131 @@ class TestLLMProviderCaseInsensitivity:
 
         service2 = get_llm_service_for_provider("Noop")
         assert service2 is not None
+
+
+# ============================================================================
+# ProviderServiceRegistry Tests
+# ============================================================================
+
+def make_model_service(*results):
+    """Mock service whose list_available_models returns/raises results in turn."""
+    from unittest.mock import AsyncMock
+
+    service = MagicMock()
+    service.list_available_models = AsyncMock(side_effect=list(results))
+    return service
+
+
+class TestProviderServiceRegistry:
+    """Test shared service instances and cached model listings."""
+
+    @pytest.mark.asyncio
+    async def test_services_are_reused(self):
+        """Test one instance per provider (case-insensitive)."""
+        from app.services.provider_registry import ProviderServiceRegistry
+
+        registry = ProviderServiceRegistry()
+
+        assert registry.get_llm_service("noop") is registry.get_llm_service("NOOP")
+        assert registry.get_transcription_service("noop") is registry.get_transcription_service("Noop")
+
+    @pytest.mark.asyncio
+    async def test_slovene_asr_variants_cached_separately(self):
+        """Test the default variant resolves to the same instance as the explicit one."""
+        from app.services.provider_registry import ProviderServiceRegistry
+
+        registry = ProviderServiceRegistry()
+        mock_settings = MagicMock()
+        mock_settings.SLOVENE_ASR_NFA_ENDPOINT_ID = "nfa-endpoint"
+        mock_settings.SLOVENE_ASR_MMS_ENDPOINT_ID = ""
+        mock_settings.SLOVENE_ASR_PYANNOTE_ENDPOINT_ID = "pyannote-endpoint"
+
+        with patch("app.services.provider_registry.settings", mock_settings), \
+                patch("app.services.provider_registry.get_transcription_service_for_provider",
+                      side_effect=lambda provider, model: MagicMock(variant=model)) as factory:
+            default = registry.get_transcription_service("clarin-slovene-asr")
+            nfa = registry.get_transcription_service("clarin-slovene-asr", model="nfa")
+            pyannote = registry.get_transcription_service("clarin-slovene-asr", model="pyannote")
+
+        assert default is nfa
+        assert pyannote is not nfa and pyannote.variant == "pyannote"
+        assert factory.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_models_served_from_memory(self):
+        """Test model lists are fetched once while fresh."""
+        from app.services.provider_registry import ProviderServiceRegistry
+
+        registry = ProviderServiceRegistry(refresh_seconds=3600, fetch_timeout_seconds=1)
+        service = make_model_service([{"id": "m1"}])
+
+        with patch("app.services.provider_registry.get_llm_service_for_provider", return_value=service):
+            first = await registry.list_models("llm", "groq")
+            second = await registry.list_models("llm", "groq")
+
+        assert first == second == [{"id": "m1"}]
+        assert service.list_available_models.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_models_returned_while_refreshing(self):
+        """Test a stale list is returned immediately and replaced in the background."""
+        from app.services.provider_registry import ProviderServiceRegistry
+
+        registry = ProviderServiceRegistry(refresh_seconds=0, fetch_timeout_seconds=1)
+        service = make_model_service([{"id": "old"}], [{"id": "new"}])
+
+        with patch("app.services.provider_registry.get_llm_service_for_provider", return_value=service):
+            assert await registry.list_models("llm", "groq") == [{"id": "old"}]
+            # Stale: returned as-is, refresh scheduled
+            assert await registry.list_models("llm", "groq") == [{"id": "old"}]
+            await asyncio.sleep(0)
+            assert (await registry.list_models("llm", "groq"))[0]["id"] == "new"
+
+        await registry.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_models(self):
+        """Test a failing model API does not drop the cached list."""
+        from app.services.provider_registry import ProviderServiceRegistry
+
+        registry = ProviderServiceRegistry(refresh_seconds=0, fetch_timeout_seconds=1)
+        service = make_model_service([{"id": "m1"}], RuntimeError("API down"), [{"id": "m1"}])
+
+        with patch("app.services.provider_registry.get_llm_service_for_provider", return_value=service):
+            await registry.list_models("llm", "groq")
+            assert await registry.list_models("llm", "groq") == [{"id": "m1"}]
+            await asyncio.sleep(0)
+            assert await registry.list_models("llm", "groq") == [{"id": "m1"}]
+
+        await registry.close()
+
+    @pytest.mark.asyncio
+    async def test_first_fetch_timeout(self):
+        """Test a slow first fetch times out but still fills the cache."""
+        from app.services.provider_registry import ProviderServiceRegistry
+
+        registry = ProviderServiceRegistry(refresh_seconds=3600, fetch_timeout_seconds=0.01)
+        release = asyncio.Event()
+
+        async def slow_models():
+            await release.wait()
+            return [{"id": "m1"}]
+
+        service = MagicMock()
+        service.list_available_models = slow_models
+
+        with patch("app.services.provider_registry.get_llm_service_for_provider", return_value=service):
+            with pytest.raises(asyncio.TimeoutError):
+                await registry.list_models("llm", "groq")
+
+            release.set()
+            await asyncio.sleep(0)
+            assert await registry.list_models("llm", "groq") == [{"id": "m1"}]
+
+    @pytest.mark.asyncio
+    async def test_unknown_kind_raises(self):
+        """Test list_models rejects unknown kinds."""
+        from app.services.provider_registry import ProviderServiceRegistry
+
+        with pytest.raises(ValueError, match="Unknown model kind"):
+            await ProviderServiceRegistry().list_models("tts", "groq")
@@ -0,0 +1,271 @@
+"""
+Unit tests for the RunPod async job client (/run + /status).
+Uses httpx.MockTransport to stand in for the RunPod API.
+"""
+import json
+from unittest.mock import patch, AsyncMock
+
+import httpx
+import pytest
+
+from app.services.runpod_jobs import (
+    RunPodJobPoller,
+    RunPodJobStore,
+    run_runpod_job,
+    runpod_job_fingerprint,
+)
+from app.services.transcription_slovene_asr import SloveneASRTranscriptionService
+
+BASE_URL = "https://api.runpod.ai/v2/test-endpoint"
+
+_RealAsyncClient = httpx.AsyncClient
+
+
+class FakeRunPod:
+    """Minimal RunPod API: jobs complete after a number of status polls."""
+
+    def __init__(self, polls_until_done: int = 2, final_status: str = "COMPLETED"):
+        self.polls_until_done = polls_until_done
+        self.final_status = final_status
+        self.submitted = []
+        self.status_polls = {}
+        self.known_jobs = set()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/run"):
+            job_id = f"job-{len(self.submitted) + 1}"
+            self.submitted.append(job_id)
+            self.known_jobs.add(job_id)
+            return httpx.Response(200, json={"id": job_id, "status": "IN_QUEUE"})
+
+        if "/status/" in path:
+            job_id = path.rsplit("/", 1)[-1]
+            if job_id not in self.known_jobs:
+                return httpx.Response(404, json={"error": "job not found"})
+            count = self.status_polls.get(job_id, 0) + 1
+            self.status_polls[job_id] = count
+            if count < self.polls_until_done:
+                return httpx.Response(200, json={"id": job_id, "status": "IN_PROGRESS"})
+            if self.final_status == "COMPLETED":
+                return httpx.Response(200, json={
+                    "id": job_id,
+                    "status": "COMPLETED",
+                    "output": {"text": f"result of {job_id}"},
+                })
+            return httpx.Response(200, json={
+                "id": job_id,
+                "status": self.final_status,
+                "error": "handler crashed",
+            })
+
+        return httpx.Response(404)
+
+    def patch_client(self):
+        transport = httpx.MockTransport(self.handler)
+        return patch(
+            "app.services.runpod_jobs.httpx.AsyncClient",
+            side_effect=lambda **kwargs: _RealAsyncClient(transport=transport, **kwargs),
+        )
+
+
+@pytest.fixture
+def poller():
+    return RunPodJobPoller(initial_interval=0.01, max_interval=0.02)
+
+
+class TestFingerprint:
+    """Test request fingerprinting."""
+
+    def test_stable_for_key_order(self):
+        """Test fingerprint ignores dict key order."""
+        a = runpod_job_fingerprint(BASE_URL, {"a": 1, "b": 2})
+        b = runpod_job_fingerprint(BASE_URL, {"b": 2, "a": 1})
+        assert a == b
+
+    def test_differs_per_endpoint_and_input(self):
+        """Test fingerprint covers endpoint and payload."""
+        base = runpod_job_fingerprint(BASE_URL, {"a": 1})
+        assert base != runpod_job_fingerprint(BASE_URL + "x", {"a": 1})
+        assert base != runpod_job_fingerprint(BASE_URL, {"a": 2})
+
+
+class TestJobStore:
+    """Test persistent job id store."""
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test a restarted process sees previously submitted jobs."""
+        path = tmp_path / "jobs.json"
+        RunPodJobStore(path=str(path), ttl_seconds=60).put("fp", "job-1")
+
+        assert RunPodJobStore(path=str(path), ttl_seconds=60).get("fp") == "job-1"
+
+    def test_expired_entries_ignored(self, tmp_path):
+        """Test entries older than the TTL are not resumed."""
+        path = tmp_path / "jobs.json"
+        store = RunPodJobStore(path=str(path), ttl_seconds=60)
+        store.put("fp", "job-1")
+        entries = json.loads(path.read_text())
+        entries["fp"]["submitted_at"] -= 120
+        path.write_text(json.dumps(entries))
+
+        assert store.get("fp") is None
+
+    def test_workers_keep_each_others_entries(self, tmp_path):
+        """Test stores of several workers on one file do not overwrite each other."""
+        path = tmp_path / "jobs.json"
+        first = RunPodJobStore(path=str(path), ttl_seconds=60)
+        second = RunPodJobStore(path=str(path), ttl_seconds=60)
+        assert first.get("fp-1") is None
+
+        first.put("fp-1", "job-1")
+        second.put("fp-2", "job-2")
+        first.put("fp-3", "job-3")
+        second.remove("fp-1")
+
+        assert first.get("fp-1") is None
+        assert first.get("fp-2") == "job-2"
+        assert second.get("fp-3") == "job-3"
+
+    def test_corrupt_file_starts_empty(self, tmp_path):
+        """Test unreadable state file does not break the store."""
+        path = tmp_path / "jobs.json"
+        path.write_text("not json")
+
+        assert RunPodJobStore(path=str(path)).get("fp") is None
+
+
+class TestRunJob:
+    """Test submit-or-resume job execution."""
+
+    @pytest.mark.asyncio
+    async def test_submit_and_complete(self, poller):
+        """Test job is submitted once and output returned."""
+        fake = FakeRunPod(polls_until_done=3)
+        store = RunPodJobStore()
+
+        with fake.patch_client():
+            output = await run_runpod_job(
+                BASE_URL, "key", {"x": 1}, timeout=5, poller=poller, store=store
+            )
+        await poller.close()
+
+        assert output == {"text": "result of job-1"}
+        assert fake.submitted == ["job-1"]
+        assert fake.status_polls["job-1"] == 3
+        # Finished jobs are forgotten
+        assert store.get(runpod_job_fingerprint(BASE_URL, {"x": 1})) is None
+
+    @pytest.mark.asyncio
+    async def test_timeout_then_retry_resumes_same_job(self, poller):
+        """Test a retry after timeout resumes the job instead of resubmitting."""
+        fake = FakeRunPod(polls_until_done=1000)
+        store = RunPodJobStore()
+
+        with fake.patch_client():
+            with pytest.raises(httpx.TimeoutException):
+                await run_runpod_job(
+                    BASE_URL, "key", {"x": 1}, timeout=0.05, poller=poller, store=store
+                )
+
+            fake.polls_until_done = 0
+            output = await run_runpod_job(
+                BASE_URL, "key", {"x": 1}, timeout=5, poller=poller, store=store
+            )
+        await poller.close()
+
+        assert output == {"text": "result of job-1"}
+        assert fake.submitted == ["job-1"]
+
+    @pytest.mark.asyncio
+    async def test_resume_after_restart(self, poller, tmp_path):
+        """Test a job id persisted by a previous process is resumed."""
+        fake = FakeRunPod(polls_until_done=1)
+        fake.known_jobs.add("job-old")
+        path = str(tmp_path / "jobs.json")
+        RunPodJobStore(path=path).put(runpod_job_fingerprint(BASE_URL, {"x": 1}), "job-old")
+
+        with fake.patch_client():
+            output = await run_runpod_job(
+                BASE_URL, "key", {"x": 1}, timeout=5,
+                poller=poller, store=RunPodJobStore(path=path)
+            )
+        await poller.close()
+
+        assert output == {"text": "result of job-old"}
+        assert fake.submitted == []
+
+    @pytest.mark.asyncio
+    async def test_expired_job_is_resubmitted(self, poller):
+        """Test unknown (purged) job id falls back to a fresh submit."""
+        fake = FakeRunPod(polls_until_done=1)
+        store = RunPodJobStore()
+        store.put(runpod_job_fingerprint(BASE_URL, {"x": 1}), "job-purged")
+
+        with fake.patch_client():
+            output = await run_runpod_job(
+                BASE_URL, "key", {"x": 1}, timeout=5, poller=poller, store=store
+            )
+        await poller.close()
+
+        assert output == {"text": "result of job-1"}
+        assert fake.submitted == ["job-1"]
+
+    @pytest.mark.asyncio
+    async def test_failed_job_raises(self, poller):
+        """Test FAILED status raises RuntimeError with the handler error."""
+        fake = FakeRunPod(polls_until_done=1, final_status="FAILED")
+
+        with fake.patch_client():
+            with pytest.raises(RuntimeError, match="RunPod job failed: handler crashed"):
+                await run_runpod_job(
+                    BASE_URL, "key", {"x": 1}, timeout=5,
+                    poller=poller, store=RunPodJobStore()
+                )
+        await poller.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_jobs_share_one_poller(self, poller):
+        """Test many outstanding jobs are multiplexed by a single poll task."""
+        import asyncio
+
+        fake = FakeRunPod(polls_until_done=2)
+        store = RunPodJobStore()
+
+        with fake.patch_client():
+            outputs = await asyncio.gather(*(
+                run_runpod_job(BASE_URL, "key", {"x": i}, timeout=5, poller=poller, store=store)
+                for i in range(5)
+            ))
+        await poller.close()
+
+        assert sorted(o["text"] for o in outputs) == sorted(
+            f"result of job-{i}" for i in range(1, 6)
+        )
+        assert poller.pending_count == 0
+
+
+class TestServiceIntegration:
+    """Test RunPod services route through job mode when enabled."""
+
+    @pytest.mark.asyncio
+    async def test_slovene_asr_uses_job_mode(self):
+        """Test async_jobs=True calls job mode instead of /runsync."""
+        service = SloveneASRTranscriptionService(
+            api_key="key", endpoint_id="ep", variant="nfa", async_jobs=True
+        )
+
+        with patch.object(service, "_call_runpod_job", new_callable=AsyncMock) as mock_job, \
+                patch.object(service, "_call_runpod_sync", new_callable=AsyncMock) as mock_sync:
+            mock_job.return_value = {"text": "ok"}
+            result = await service._call_runpod_with_retry({"audio_base64": "x"})
+
+        assert result == {"text": "ok"}
+        mock_sync.assert_not_called()
+
+    def test_job_mode_disabled_by_default(self):
+        """Test /runsync remains the default."""
+        service = SloveneASRTranscriptionService(
+            api_key="key", endpoint_id="ep", variant="nfa"
+        )
+        assert service.async_jobs is False
@@ -0,0 +1,147 @@
+"""
+Unit tests for RunPod endpoint pre-warming (app/services/runpod_warmup.py).
+The /run submission is mocked; no RunPod endpoint is called.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app.services.llm_cleanup_groq import GroqLLMCleanupService
+from app.services.runpod_warmup import WARMUP_INPUT, EndpointWarmer
+from app.services.transcription_slovene_asr import SloveneASRTranscriptionService
+
+ENDPOINT = "runpod_llm_gams-GaMS-9B-Instruct"
+BASE_URL = "https://api.runpod.ai/v2/endpoint-id"
+
+
+class TestEndpointWarmer:
+    """Test debounced warmups and warm-hit counting."""
+
+    @pytest.mark.asyncio
+    async def test_warmup_submits_noop_job(self):
+        """Test a warmup submits the no-op input to /run."""
+        warmer = EndpointWarmer(debounce_seconds=60, warm_seconds=300)
+        submit = AsyncMock(return_value="job-1")
+
+        with patch("app.services.runpod_warmup.submit_runpod_job", submit):
+            assert warmer.warm(ENDPOINT, BASE_URL, "test-key") is True
+            await asyncio.sleep(0)
+
+        submit.assert_awaited_once_with(BASE_URL, "test-key", WARMUP_INPUT)
+        assert warmer.metrics()[ENDPOINT]["warmups_sent"] == 1
+
+    @pytest.mark.asyncio
+    async def test_warmups_are_debounced(self):
+        """Test repeated warmups within the debounce window send one job."""
+        warmer = EndpointWarmer(debounce_seconds=60, warm_seconds=300)
+        submit = AsyncMock(return_value="job-1")
+
+        with patch("app.services.runpod_warmup.submit_runpod_job", submit):
+            results = [warmer.warm(ENDPOINT, BASE_URL, "test-key") for _ in range(3)]
+            # Other endpoints are debounced independently
+            assert warmer.warm("other-endpoint", BASE_URL, "test-key") is True
+            await asyncio.sleep(0)
+
+        assert results == [True, False, False]
+        assert submit.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_warmup_can_be_retried(self):
+        """Test a failed submission is counted and does not debounce the next warmup."""
+        warmer = EndpointWarmer(debounce_seconds=60, warm_seconds=300)
+        submit = AsyncMock(side_effect=RuntimeError("RunPod unavailable"))
+
+        with patch("app.services.runpod_warmup.submit_runpod_job", submit):
+            warmer.warm(ENDPOINT, BASE_URL, "test-key")
+            await asyncio.sleep(0)
+            assert warmer.warm(ENDPOINT, BASE_URL, "test-key") is True
+            await asyncio.sleep(0)
+
+        metrics = warmer.metrics()[ENDPOINT]
+        assert metrics["warmups_sent"] == 2
+        assert metrics["warmups_failed"] == 2
+        # A failed warmup does not make the next job a warm hit
+        assert warmer.record_job(ENDPOINT) is False
+
+    def test_disabled_sends_nothing(self):
+        """Test RUNPOD_WARMUP_ENABLED=False turns warmups off."""
+        warmer = EndpointWarmer(debounce_seconds=60, warm_seconds=300)
+        submit = AsyncMock()
+
+        with patch("app.services.runpod_warmup.settings") as mock_settings, \
+                patch("app.services.runpod_warmup.submit_runpod_job", submit):
+            mock_settings.RUNPOD_WARMUP_ENABLED = False
+            assert warmer.warm(ENDPOINT, BASE_URL, "test-key") is False
+
+        submit.assert_not_called()
+        assert warmer.metrics() == {}
+
+    @pytest.mark.asyncio
+    async def test_warm_hit_rate(self):
+        """Test jobs after a warmup count as warm hits, others do not."""
+        warmer = EndpointWarmer(debounce_seconds=60, warm_seconds=300)
+        assert warmer.record_job(ENDPOINT) is False
+
+        with patch("app.services.runpod_warmup.submit_runpod_job", AsyncMock(return_value="job-1")):
+            warmer.warm(ENDPOINT, BASE_URL, "test-key")
+            await asyncio.sleep(0)
+
+        assert warmer.record_job(ENDPOINT) is True
+        metrics = warmer.metrics()[ENDPOINT]
+        assert (metrics["jobs"], metrics["warm_hits"], metrics["warm_hit_rate"]) == (2, 1, 0.5)
+
+    @pytest.mark.asyncio
+    async def test_warm_window_expires(self):
+        """Test jobs after the warm window are not warm hits."""
+        warmer = EndpointWarmer(debounce_seconds=0, warm_seconds=0)
+
+        with patch("app.services.runpod_warmup.submit_runpod_job", AsyncMock(return_value="job-1")):
+            warmer.warm(ENDPOINT, BASE_URL, "test-key")
+            await asyncio.sleep(0)
+
+        assert warmer.record_job(ENDPOINT) is False
+
+
+class TestRequestWarmup:
+    """Test services without cold starts ignore warmups."""
+
+    def test_groq_does_not_warm(self):
+        """Test the default request_warmup sends nothing."""
+        service = GroqLLMCleanupService(api_key="test-key", model="llama-3.3-70b-versatile")
+        with patch("app.services.runpod_warmup.submit_runpod_job") as submit:
+            assert service.request_warmup() is False
+        submit.assert_not_called()
+
+
+class TestJobCounting:
+    """Test a transcription counts as one job, not one per chunk call."""
+
+    @pytest.mark.asyncio
+    async def test_chunked_transcription_counts_one_job(self, tmp_path):
+        """Test a chunked Slovenian ASR transcription with a retried chunk records one job."""
+        audio_file = tmp_path / "long_audio.wav"
+        audio_file.write_bytes(b"fake long audio")
+        chunks = [
+            MagicMock(index=i, path=tmp_path / f"chunk_{i:04d}.wav", start_time_ms=i * 240000,
+                      end_time_ms=(i + 1) * 240000)
+            for i in range(3)
+        ]
+        for chunk in chunks:
+            chunk.path.write_bytes(b"fake chunk")
+
+        service = SloveneASRTranscriptionService(api_key="test-key", endpoint_id="endpoint-id", variant="nfa")
+        warmer = EndpointWarmer(debounce_seconds=60, warm_seconds=300)
+        responses = [httpx.TimeoutException("timeout")] + [{"text": "Del.", "raw_text": "del"}] * 3
+
+        with patch("app.services.transcription_slovene_asr.get_endpoint_warmer", return_value=warmer), \
+                patch("app.services.transcription_slovene_asr.asyncio.sleep", AsyncMock()), \
+                patch.object(service._chunker, "needs_chunking", return_value=True), \
+                patch.object(service._chunker, "chunk_audio", return_value=chunks), \
+                patch.object(service._chunker, "get_chunk_metadata", return_value={"num_chunks": 3}), \
+                patch.object(service, "_call_runpod_sync", AsyncMock(side_effect=responses)) as call:
+            await service.transcribe_audio(audio_file, language="sl")
+
+        assert call.await_count == 4
+        assert warmer.metrics()[service.get_model_name()]["jobs"] == 1
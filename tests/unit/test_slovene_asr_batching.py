@@ -0,0 +1,168 @@
+"""
+Unit tests for batched segment inference in the Slovene ASR RunPod handlers.
+ASR and alignment are replaced by a stub model that records batch shapes, so
+no NeMo, torch or GPU is needed.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("soundfile")
+
+HANDLER_DIR = Path(__file__).resolve().parents[2] / "slovenian-asr"
+VARIANTS = ["nfa", "mms", "pyannote"]
+SAMPLE_RATE = 16000
+
+
+def _load_handler(variant):
+    """Import a handler module by path (no RunPod worker is started)."""
+    path = HANDLER_DIR / f"nemo-protoverb-{variant}" / "handler.py"
+    spec = importlib.util.spec_from_file_location(f"slovene_asr_handler_{variant}", path)
+    module = importlib.util.module_from_spec(spec)
+    # Handlers import their sibling modules (speaker_index) from /app
+    sys.path.insert(0, str(path.parent))
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(str(path.parent))
+    return module
+
+
+class StubModel:
+    """Records the (batch size, padded samples) shape of every model call."""
+
+    def __init__(self, silent_seconds: float = None):
+        self.asr_shapes = []
+        self.alignment_batches = []
+        # Segments of exactly this (padded) length transcribe to ""
+        self.silent_seconds = silent_seconds
+
+    def run_asr_batch(self, batch):
+        self.asr_shapes.append((len(batch), max(len(samples) for samples in batch)))
+        return [
+            SimpleNamespace(
+                text="" if len(samples) / SAMPLE_RATE == self.silent_seconds else f"dolzina {len(samples)}",
+                y_sequence=None,
+            )
+            for samples in batch
+        ]
+
+    def run_forced_alignment_batch(self, inputs, transcripts):
+        # inputs: hypotheses (NFA variants) or segment samples (MMS)
+        self.alignment_batches.append(len(transcripts))
+        return [[{"word": "dolzina", "start": 0.1, "end": 0.4}] for _ in transcripts]
+
+
+@pytest.fixture(params=VARIANTS)
+def handler(request):
+    return _load_handler(request.param)
+
+
+def _segments(durations, gap=1.0):
+    """Back-to-back segments with the given durations (seconds)."""
+    segments = []
+    start = 1.0
+    for i, duration in enumerate(durations):
+        segments.append({"start": start, "duration": duration, "speaker": f"SPEAKER_{i % 2}"})
+        start += duration + gap
+    return segments
+
+
+def _run(handler, stub, segments, **kwargs):
+    total = segments[-1]["start"] + segments[-1]["duration"] + 2.0
+    audio = np.zeros(int(total * SAMPLE_RATE), dtype=np.float32)
+    handler.load_audio_samples = lambda path: (audio, SAMPLE_RATE)
+    handler.run_asr_batch = stub.run_asr_batch
+    handler.run_forced_alignment_batch = stub.run_forced_alignment_batch
+    return handler.process_segments_batched("unused.wav", segments, **kwargs)
+
+
+class TestPlanSegmentBatches:
+    """Test length-sorted batch planning."""
+
+    def test_sorted_by_length_and_capped_by_size(self, handler):
+        """Test segments are sorted by duration and split at max_batch_size."""
+        durations = [9.0, 1.0, 5.0, 3.0, 7.0]
+        batches = handler.plan_segment_batches(durations, max_batch_size=2, max_batch_seconds=1000)
+        assert batches == [[1, 3], [2, 4], [0]]
+
+    def test_capped_by_padded_seconds(self, handler):
+        """Test a batch closes when size x longest would exceed max_batch_seconds."""
+        durations = [10.0, 10.0, 10.0, 25.0]
+        batches = handler.plan_segment_batches(durations, max_batch_size=16, max_batch_seconds=30)
+        assert batches == [[0, 1, 2], [3]]
+
+    def test_oversized_segment_gets_own_batch(self, handler):
+        """Test a segment longer than the budget is still processed, alone."""
+        batches = handler.plan_segment_batches([100.0, 1.0], max_batch_size=4, max_batch_seconds=30)
+        assert batches == [[1], [0]]
+
+    def test_invalid_batch_size_raises(self, handler):
+        """Test a non-positive batch size is rejected."""
+        with pytest.raises(ValueError):
+            handler.plan_segment_batches([1.0], max_batch_size=0)
+
+
+class TestProcessSegmentsBatched:
+    """Test batched ASR + alignment over diarization segments."""
+
+    def test_batches_are_length_sorted(self, handler):
+        """Test ASR runs once per batch on similar-length, padded segments."""
+        stub = StubModel()
+        segments = _segments([20.0, 3.0, 19.0, 4.0, 21.0, 3.5])
+
+        results = _run(handler, stub, segments, max_batch_size=3, max_batch_seconds=1000)
+
+        # 0.5s context padding on both sides of every segment
+        assert stub.asr_shapes == [(3, 5 * SAMPLE_RATE), (3, 22 * SAMPLE_RATE)]
+        assert [r["start"] for r in results] == [s["start"] for s in segments]
+        assert [r["id"] for r in results] == list(range(len(segments)))
+        assert results[1]["text"] == f"dolzina {4 * SAMPLE_RATE}"
+
+    def test_word_timestamps_are_absolute(self, handler):
+        """Test alignment output is shifted by the padded segment start."""
+        stub = StubModel()
+        segments = _segments([5.0, 6.0])
+
+        results = _run(handler, stub, segments)
+
+        first_padded_start = segments[0]["start"] - handler.CONTEXT_PADDING
+        assert stub.alignment_batches == [2]
+        assert results[0]["words"] == [
+            {"word": "dolzina", "start": round(first_padded_start + 0.1, 2), "end": round(first_padded_start + 0.4, 2)}
+        ]
+
+    def test_short_and_empty_segments_skip_alignment(self, handler):
+        """Test tiny and empty segments are transcribed but not aligned."""
+        stub = StubModel(silent_seconds=3.5)
+        # 1.0s: below MIN_SEGMENT_FOR_NFA; 2.5s (+1s padding): empty text; 8.0s: aligned
+        segments = _segments([1.0, 2.5, 8.0])
+
+        results = _run(handler, stub, segments)
+
+        assert stub.asr_shapes == [(3, 9 * SAMPLE_RATE)]
+        assert stub.alignment_batches == [1]
+        assert [len(r["words"]) for r in results] == [0, 0, 1]
+        assert results[0]["text"] and results[1]["text"] == ""
+
+    def test_failed_batch_marks_only_its_segments(self, handler):
+        """Test an ASR failure is reported on the segments of that batch only."""
+        stub = StubModel()
+        record = stub.run_asr_batch
+
+        def run_asr_batch(batch):
+            if len(batch[0]) > 10 * SAMPLE_RATE:
+                raise RuntimeError("CUDA out of memory")
+            return record(batch)
+
+        stub.run_asr_batch = run_asr_batch
+        segments = _segments([3.0, 15.0, 4.0])
+
+        results = _run(handler, stub, segments, max_batch_size=2, max_batch_seconds=1000)
+
+        assert [r.get("error") for r in results] == [None, "CUDA out of memory", None]
+        assert results[0]["text"] and results[2]["text"]
@@ -2,6 +2,8 @@
 Unit tests for Slovenian ASR transcription service.
 Tests SloveneASRTranscriptionService with mocked HTTP calls.
 """
+import base64
+import threading
 from unittest.mock import patch, AsyncMock, MagicMock
 
 import httpx
@@ -732,6 +734,160 @@ class TestRunPodAPICall:
                 assert call_count == 2
 
 
+class TestAudioTransport:
+    """Test compressed audio transport to the handlers."""
+
+    @pytest.mark.asyncio
+    async def test_single_file_sent_as_flac(self, tmp_path):
+        """Test short audio is encoded as FLAC and the payload declares it."""
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_bytes(b"fake wav audio")
+
+        service = SloveneASRTranscriptionService(
+            api_key="test-api-key",
+            endpoint_id="test-endpoint-id",
+            variant="nfa",
+            audio_format="flac"
+        )
+
+        def fake_encode(audio_path, output_path, output_format):
+            output_path.write_bytes(b"fake flac")
+            return output_path
+
+        with patch.object(service._chunker, 'needs_chunking', return_value=False), \
+                patch.object(service._chunker, 'encode_audio', side_effect=fake_encode) as mock_encode, \
+                patch.object(service, '_call_runpod_with_retry', new_callable=AsyncMock) as mock_call:
+            mock_call.return_value = {"text": "Test", "raw_text": "test"}
+
+            await service.transcribe_audio(audio_file, language="sl")
+
+        payload = mock_call.call_args[0][0]
+        assert mock_encode.call_args[0][2] == "flac"
+        assert payload["audio_format"] == "flac"
+        assert payload["audio_transport_version"] == 1
+        assert base64.b64decode(payload["audio_base64"]) == b"fake flac"
+        assert payload["filename"] == "test.wav"
+
+    @pytest.mark.asyncio
+    async def test_wav_by_default(self, tmp_path):
+        """Test audio is sent as WAV unless a compressed format is configured (old handlers only read WAV)."""
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_bytes(b"fake wav audio")
+
+        service = SloveneASRTranscriptionService(
+            api_key="test-api-key",
+            endpoint_id="test-endpoint-id",
+            variant="nfa"
+        )
+
+        with patch.object(service._chunker, 'needs_chunking', return_value=False), \
+                patch.object(service._chunker, 'encode_audio') as mock_encode, \
+                patch.object(service, '_call_runpod_with_retry', new_callable=AsyncMock) as mock_call:
+            mock_call.return_value = {"text": "Test", "raw_text": "test"}
+
+            await service.transcribe_audio(audio_file, language="sl")
+
+        payload = mock_call.call_args[0][0]
+        mock_encode.assert_not_called()
+        assert payload["audio_format"] == "wav"
+        assert base64.b64decode(payload["audio_base64"]) == b"fake wav audio"
+
+    @pytest.mark.asyncio
+    async def test_encoding_failure_falls_back_to_wav(self, tmp_path):
+        """Test the original WAV is sent when encoding fails."""
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_bytes(b"fake wav audio")
+
+        service = SloveneASRTranscriptionService(
+            api_key="test-api-key",
+            endpoint_id="test-endpoint-id",
+            variant="nfa",
+            audio_format="opus"
+        )
+
+        with patch.object(service._chunker, 'needs_chunking', return_value=False), \
+                patch.object(service._chunker, 'encode_audio', side_effect=RuntimeError("ffmpeg failed")), \
+                patch.object(service, '_call_runpod_with_retry', new_callable=AsyncMock) as mock_call:
+            mock_call.return_value = {"text": "Test", "raw_text": "test"}
+
+            await service.transcribe_audio(audio_file, language="sl")
+
+        payload = mock_call.call_args[0][0]
+        assert payload["audio_format"] == "wav"
+        assert base64.b64decode(payload["audio_base64"]) == b"fake wav audio"
+
+    @pytest.mark.asyncio
+    async def test_chunks_encoded_in_transport_format(self, tmp_path):
+        """Test chunks are cut in the transport format and tagged per file."""
+        audio_file = tmp_path / "long_audio.wav"
+        audio_file.write_bytes(b"fake long audio")
+
+        service = SloveneASRTranscriptionService(
+            api_key="test-api-key",
+            endpoint_id="test-endpoint-id",
+            variant="nfa",
+            audio_format="flac"
+        )
+
+        mock_chunks = [
+            MagicMock(index=0, path=tmp_path / "chunk_0000.flac", start_time_ms=0, end_time_ms=240000),
+            MagicMock(index=1, path=tmp_path / "chunk_0001.flac", start_time_ms=240000, end_time_ms=400000)
+        ]
+        for chunk in mock_chunks:
+            chunk.path.write_bytes(b"fake flac chunk")
+
+        with patch.object(service._chunker, 'needs_chunking', return_value=True), \
+                patch.object(service._chunker, 'chunk_audio', return_value=mock_chunks) as mock_chunk_audio, \
+                patch.object(service._chunker, 'get_chunk_metadata', return_value={"num_chunks": 2}), \
+                patch.object(service, '_call_runpod_with_retry', new_callable=AsyncMock) as mock_call:
+            mock_call.return_value = {"text": "Del.", "raw_text": "del"}
+
+            await service.transcribe_audio(audio_file, language="sl")
+
+        assert mock_chunk_audio.call_args.kwargs["output_format"] == "flac"
+        assert all(c[0][0]["audio_format"] == "flac" for c in mock_call.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_chunking_runs_off_event_loop(self, tmp_path):
+        """Test ffmpeg chunking (silence detection) does not block the event loop."""
+        audio_file = tmp_path / "long_audio.wav"
+        audio_file.write_bytes(b"fake long audio")
+
+        service = SloveneASRTranscriptionService(
+            api_key="test-api-key",
+            endpoint_id="test-endpoint-id",
+            variant="nfa"
+        )
+
+        chunk = MagicMock(index=0, path=tmp_path / "chunk_0000.wav", start_time_ms=0, end_time_ms=240000)
+        chunk.path.write_bytes(b"fake chunk")
+        threads = []
+
+        def chunk_audio(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return [chunk]
+
+        with patch.object(service._chunker, 'needs_chunking', return_value=True), \
+                patch.object(service._chunker, 'chunk_audio', side_effect=chunk_audio), \
+                patch.object(service._chunker, 'get_chunk_metadata', return_value={"num_chunks": 1}), \
+                patch.object(service, '_call_runpod_with_retry', new_callable=AsyncMock) as mock_call:
+            mock_call.return_value = {"text": "Del.", "raw_text": "del"}
+
+            await service.transcribe_audio(audio_file, language="sl")
+
+        assert threads and threads[0] != threading.get_ident()
+
+    def test_invalid_audio_format_raises(self):
+        """Test unknown transport encodings are rejected."""
+        with pytest.raises(ValueError, match="Invalid audio_format"):
+            SloveneASRTranscriptionService(
+                api_key="test-api-key",
+                endpoint_id="test-endpoint-id",
+                variant="nfa",
+                audio_format="mp3"
+            )
+
+
 class TestReassembly:
     """Test chunk transcription reassembly."""
 
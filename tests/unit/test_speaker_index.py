@@ -0,0 +1,95 @@
+"""
+Unit tests for the sorted-interval speaker index shared by the Slovene ASR
+handlers (slovenian-asr/nemo-protoverb-*/speaker_index.py).
+"""
+import importlib.util
+import random
+from pathlib import Path
+
+HANDLER_DIR = Path(__file__).resolve().parents[2] / "slovenian-asr"
+VARIANTS = ["nfa", "mms", "pyannote"]
+
+
+def _load_speaker_index():
+    path = HANDLER_DIR / "nemo-protoverb-nfa" / "speaker_index.py"
+    spec = importlib.util.spec_from_file_location("slovene_asr_speaker_index", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+SpeakerIndex = _load_speaker_index().SpeakerIndex
+
+
+def _linear_lookup(segments, t):
+    """Reference: the original linear scan from merge_words_with_speakers."""
+    sorted_segments = sorted(segments, key=lambda s: s["start"])
+    for seg in sorted_segments:
+        if seg["start"] <= t <= seg["start"] + seg["duration"]:
+            return seg
+    if not sorted_segments:
+        return None
+
+    def distance_to_segment(seg):
+        if t < seg["start"]:
+            return seg["start"] - t
+        return t - (seg["start"] + seg["duration"])
+
+    return min(sorted_segments, key=distance_to_segment)
+
+
+def _seg(start, duration, speaker):
+    return {"start": start, "duration": duration, "speaker": speaker}
+
+
+class TestSpeakerIndex:
+    """Test exact and nearest-segment lookups."""
+
+    def test_exact_match(self):
+        """Test a time inside a segment returns that segment's speaker."""
+        index = SpeakerIndex([_seg(5.0, 5.0, "B"), _seg(0.0, 4.0, "A")])
+        assert index.speaker_at(2.0) == "A"
+        assert index.speaker_at(7.5) == "B"
+        # Boundaries are inclusive
+        assert index.speaker_at(4.0) == "A"
+        assert index.speaker_at(5.0) == "B"
+
+    def test_gap_uses_nearest_segment(self):
+        """Test times in gaps, before the first and after the last segment."""
+        index = SpeakerIndex([_seg(0.0, 4.0, "A"), _seg(6.0, 4.0, "B")])
+        assert index.speaker_at(4.5) == "A"
+        assert index.speaker_at(5.5) == "B"
+        # Equidistant: earliest segment wins (like min() in the linear scan)
+        assert index.speaker_at(5.0) == "A"
+        assert index.speaker_at(-3.0) == "A"
+        assert index.speaker_at(100.0) == "B"
+
+    def test_overlapping_segments(self):
+        """Test overlaps resolve to the earliest-starting containing segment."""
+        index = SpeakerIndex([_seg(0.0, 20.0, "A"), _seg(5.0, 2.0, "B"), _seg(10.0, 15.0, "C")])
+        assert index.speaker_at(6.0) == "A"
+        assert index.speaker_at(22.0) == "C"
+
+    def test_empty_index(self):
+        """Test lookups on an empty index return None."""
+        assert SpeakerIndex([]).speaker_at(1.0) is None
+
+    def test_matches_linear_scan(self):
+        """Test random diarizations (gaps, overlaps, ties) against the linear scan."""
+        rng = random.Random(0)
+        for _ in range(200):
+            segments = [
+                _seg(rng.randint(0, 60) / 2, rng.randint(0, 20) / 2, f"S{i}")
+                for i in range(rng.randint(1, 12))
+            ]
+            index = SpeakerIndex(segments)
+            for t in [x / 4 for x in range(-8, 180)]:
+                assert index.segment_at(t) is _linear_lookup(segments, t), (segments, t)
+
+    def test_handler_copies_are_identical(self):
+        """Test every handler variant ships the same speaker_index.py."""
+        copies = {
+            variant: (HANDLER_DIR / f"nemo-protoverb-{variant}" / "speaker_index.py").read_text()
+            for variant in VARIANTS
+        }
+        assert len(set(copies.values())) == 1
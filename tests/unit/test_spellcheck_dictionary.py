@@ -0,0 +1,159 @@
+"""
+Unit tests for the compact memory-mapped SymSpell dictionary
+(app/services/spellcheck_dictionary.py) and loading it in the Slovenian
+spell-check service. Uses small real dictionaries.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from symspellpy import Verbosity
+
+from app.services.spellcheck_dictionary import (
+    CompactDictionary,
+    build_compact_dictionary,
+    build_symspell,
+)
+from app.services.spellcheck_slovenian import SlovenianSpellCheckService
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "generate_slovenian_wordlist.py"
+WORDS = [
+    "danes", "sem", "sanjal", "o", "morju", "napaka", "napake", "napako", "sanje",
+    "sanjam", "morje", "morja", "jutri", "bom", "šel", "na", "izlet", "čebela",
+    "žaba", "škatla", "kanal", "kanali", "sanjali", "sanjala", "izleti",
+]
+QUERIES = [
+    "danes", "dnes", "sanjl", "sanajl", "morjuu", "mroju", "napka", "npaka", "sanej",
+    "jtri", "izlte", "cebela", "zaba", "skatla", "kaanal", "xyzzyq", "s", "kanaliii",
+    "ščebela", "sanjalaa",
+]
+
+
+@pytest.fixture
+def wordlist(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("\n".join(WORDS) + "\n\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def compact(wordlist, tmp_path):
+    path = tmp_path / "symspell.dict"
+    build_compact_dictionary(wordlist, path, max_edit_distance=2, prefix_length=7)
+    dictionary = CompactDictionary(path)
+    yield dictionary
+    dictionary.close()
+
+
+class TestCompactDictionary:
+    """Test the mapped dictionary is equivalent to the in-memory one."""
+
+    @pytest.mark.parametrize("verbosity", [Verbosity.CLOSEST, Verbosity.TOP, Verbosity.ALL])
+    def test_same_suggestions_as_in_memory(self, wordlist, compact, verbosity):
+        """Test lookups return the same suggestions, distances, counts and order."""
+        in_memory = build_symspell(wordlist, max_edit_distance=2, prefix_length=7)
+        mapped = compact.to_symspell()
+
+        for query in QUERIES:
+            expected = [(s.term, s.distance, s.count) for s in in_memory.lookup(query, verbosity, 2)]
+            actual = [(s.term, s.distance, s.count) for s in mapped.lookup(query, verbosity, 2)]
+            assert actual == expected, query
+
+    def test_words_and_deletes(self, wordlist, compact):
+        """Test the mapped words and deletes match SymSpell's dictionaries."""
+        in_memory = build_symspell(wordlist, max_edit_distance=2, prefix_length=7)
+
+        assert list(compact.words) == list(in_memory.words)
+        assert len(compact.words) == in_memory.word_count
+        assert "čebela" in compact.words and compact.words["čebela"] == 1
+        assert "cebela" not in compact.words and compact.words.get("cebela") is None
+        assert len(compact.deletes) == len(in_memory._deletes)
+        for delete, suggestions in in_memory._deletes.items():
+            assert compact.deletes[delete] == suggestions
+        with pytest.raises(KeyError):
+            compact.deletes["xyzzyq"]
+
+    def test_build_parameters_stored(self, compact):
+        """Test the file records the parameters its deletes were built with."""
+        assert (compact.max_edit_distance, compact.prefix_length) == (2, 7)
+
+    def test_other_files_rejected(self, tmp_path):
+        """Test files that are not compact dictionaries are rejected."""
+        path = tmp_path / "symspell_sl.pkl"
+        path.write_bytes(b"\x80\x04" + bytes(200))
+
+        with pytest.raises(ValueError):
+            CompactDictionary(path)
+
+
+class TestServiceDictionaryLoading:
+    """Test the Slovenian service loads the compact dictionary."""
+
+    def test_builds_dictionary_once_then_maps_it(self, wordlist, tmp_path):
+        """Test a missing dictionary is built from the word list, and mapped afterwards."""
+        path = tmp_path / "cache" / "symspell_sl.dict"
+        service = SlovenianSpellCheckService(wordlist_path=str(wordlist), dictionary_path=str(path))
+
+        assert service.load()
+        assert path.exists()
+        issues = service.check_text("Danes sem sanjl o mroju.")
+
+        with patch("app.services.spellcheck_dictionary.build_compact_dictionary") as build:
+            mapped = SlovenianSpellCheckService(wordlist_path=str(wordlist), dictionary_path=str(path))
+            assert mapped.load()
+        build.assert_not_called()
+        assert mapped.check_text("Danes sem sanjl o mroju.") == issues
+        assert [issue.word for issue in issues] == ["sanjl", "mroju"]
+        assert mapped.get_dictionary_version() == service.get_dictionary_version()
+
+    def test_dictionary_with_other_settings_rebuilt(self, wordlist, tmp_path):
+        """Test a dictionary built with another max edit distance is not used."""
+        path = tmp_path / "symspell_sl.dict"
+        build_compact_dictionary(wordlist, path, max_edit_distance=1, prefix_length=7)
+
+        service = SlovenianSpellCheckService(
+            wordlist_path=str(wordlist), dictionary_path=str(path), max_edit_distance=2
+        )
+
+        assert service.load()
+        assert CompactDictionary(path).max_edit_distance == 2
+
+    def test_prebuilt_dictionary_preferred(self, wordlist, tmp_path):
+        """Test the dictionary from the image is used before the cache."""
+        prebuilt = tmp_path / "dictionaries" / "sl-symspell.dict"
+        build_compact_dictionary(wordlist, prebuilt, max_edit_distance=2, prefix_length=7)
+
+        with patch("app.services.spellcheck_slovenian.settings") as settings:
+            settings.SPELLCHECK_DICTIONARY_PATH = str(prebuilt)
+            settings.SPELLCHECK_CACHE_PATH = str(tmp_path / "cache")
+            settings.SPELLCHECK_MAX_EDIT_DISTANCE = 2
+            settings.SPELLCHECK_PREFIX_LENGTH = 7
+            settings.SPELLCHECK_SUGGESTION_COUNT = 5
+            settings.SPELLCHECK_MIN_WORD_LENGTH = 2
+            service = SlovenianSpellCheckService(wordlist_path="/nonexistent/path.txt")
+
+        assert service.load()
+        assert not (tmp_path / "cache").exists()
+
+
+class TestGenerateScript:
+    """Test the word list script builds the compact dictionary."""
+
+    def test_dictionary_from_existing_wordlist(self, wordlist, tmp_path):
+        """Test --wordlist with --dictionary-output builds the dictionary without Sloleks."""
+        spec = importlib.util.spec_from_file_location("generate_slovenian_wordlist", SCRIPT)
+        script = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(script)
+        output = tmp_path / "sl-symspell.dict"
+        argv = [
+            "generate_slovenian_wordlist.py",
+            "--wordlist", str(wordlist),
+            "--dictionary-output", str(output),
+        ]
+
+        with patch.object(sys, "argv", argv):
+            script.main()
+
+        assert len(CompactDictionary(output).words) == len(WORDS)
@@ -0,0 +1,149 @@
+"""
+Unit tests for the memoized spell-check engine (app/services/spellcheck_engine.py)
+and its benchmark (scripts/benchmark_spellcheck.py). SymSpell is mocked, except
+in the benchmark, which builds a small synthetic dictionary.
+"""
+import importlib.util
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.services.spellcheck_engine import SpellCheckEngine, WordVerdictCache
+from app.services.spellcheck_slovenian import SlovenianSpellCheckService
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "benchmark_spellcheck.py"
+DICTIONARY = {"danes", "sem", "sanjal", "morju", "napaka"}
+
+
+def make_service(word_count=len(DICTIONARY)):
+    """Loaded service whose dictionary knows DICTIONARY and suggests 'napaka' otherwise."""
+    service = SlovenianSpellCheckService(
+        wordlist_path="/nonexistent/path.txt",
+        dictionary_path="/nonexistent/symspell.dict",
+    )
+    service._loaded = True
+    service._symspell = Mock(word_count=word_count)
+    service._symspell.lookup.side_effect = lambda word, *args, **kwargs: [
+        Mock(term=word if word in DICTIONARY else "napaka")
+    ]
+    return service
+
+
+@pytest.fixture
+def engine():
+    engine = SpellCheckEngine(WordVerdictCache(max_size=100), lookup_threads=1)
+    yield engine
+    engine.shutdown()
+
+
+class TestWordVerdictCache:
+    """Test the word verdict LRU."""
+
+    def test_least_recently_used_evicted(self):
+        """Test the cache keeps at most max_size words, evicting the least recently used."""
+        cache = WordVerdictCache(max_size=2)
+        cache.put_many("v1", {"ena": None, "dva": ["dve"]})
+        cache.get_many("v1", ["ena"])
+        cache.put_many("v1", {"tri": None})
+
+        found, missing = cache.get_many("v1", ["ena", "dva", "tri"])
+
+        assert found == {"ena": None, "tri": None}
+        assert missing == ["dva"]
+
+    def test_new_dictionary_version_clears(self):
+        """Test verdicts of another dictionary version are not served or stored."""
+        cache = WordVerdictCache(max_size=10)
+        cache.get_many("v1", [])
+        cache.put_many("v1", {"ena": None})
+
+        assert cache.get_many("v2", ["ena"]) == ({}, ["ena"])
+        cache.put_many("v1", {"dva": None})
+        assert len(cache) == 0
+
+    def test_cached_suggestions_not_shared(self):
+        """Test callers get their own suggestion lists."""
+        cache = WordVerdictCache(max_size=10)
+        cache.get_many("v1", [])
+        cache.put_many("v1", {"napka": ["napaka"]})
+
+        found, _ = cache.get_many("v1", ["napka"])
+        found["napka"].append("changed")
+
+        assert cache.get_many("v1", ["napka"])[0] == {"napka": ["napaka"]}
+
+
+class TestSpellCheckEngine:
+    """Test checking texts with the engine."""
+
+    @pytest.mark.asyncio
+    async def test_same_results_as_check_text(self, engine):
+        """Test the engine reports the issues check_text() does, in the same order."""
+        service = make_service()
+        text = "Danes sem sanjal o morju, o morju in napkah. Sanjl sem."
+
+        assert await engine.check_text(service, text) == service.check_text(text)
+
+    @pytest.mark.asyncio
+    async def test_words_looked_up_once(self, engine):
+        """Test words seen in earlier texts are served from the cache."""
+        service = make_service()
+        await engine.check_text(service, "danes sem sanjal napka")
+        service._symspell.lookup.reset_mock()
+
+        issues = await engine.check_text(service, "sanjal napka morju")
+
+        assert [call.args[0] for call in service._symspell.lookup.call_args_list] == ["morju"]
+        assert [issue.word for issue in issues] == ["napka"]
+
+    @pytest.mark.asyncio
+    async def test_lookups_run_in_worker_thread(self, engine):
+        """Test dictionary lookups do not run on the event loop thread."""
+        service = make_service()
+        threads = set()
+        lookup = service.lookup_words
+
+        def recording_lookup(words):
+            threads.add(threading.get_ident())
+            return lookup(words)
+
+        with patch.object(service, "lookup_words", recording_lookup):
+            await engine.check_text(service, "danes napka")
+
+        assert threads and threading.get_ident() not in threads
+
+    @pytest.mark.asyncio
+    async def test_not_loaded_returns_empty(self, engine):
+        """Test a service without a dictionary reports no issues."""
+        service = SlovenianSpellCheckService(
+            wordlist_path="/nonexistent/path.txt",
+            dictionary_path="/nonexistent/symspell.dict",
+        )
+
+        assert await engine.check_text(service, "napka") == []
+
+
+class TestSpellCheckBenchmark:
+    """Test the benchmark runs at the smallest scale."""
+
+    def test_engine_matches_check_text(self, tmp_path):
+        """Test the benchmark completes and both paths report the same issues."""
+        spec = importlib.util.spec_from_file_location("benchmark_spellcheck", SCRIPT)
+        bench = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(bench)
+        argv = [
+            "benchmark_spellcheck.py",
+            "--wordlist", str(tmp_path / "missing.txt"),
+            "--dictionary", str(tmp_path / "missing.dict"),
+            "--synthetic-words", "1000",
+            "--vocabulary", "500",
+            "--oov-words", "50",
+            "--transcripts", "3",
+            "--minutes", "1",
+        ]
+
+        with patch.object(sys, "argv", argv):
+            assert bench.main() == 0
@@ -0,0 +1,190 @@
+"""
+Unit tests for non-blocking startup: background warm-up of heavy components
+(app/services/startup_warmup.py), the /health/ready endpoint and the
+import-time budget of the app.
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.routes.health import readiness_check
+from app.services import spellcheck
+from app.services.startup_warmup import ComponentWarmer
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Provider SDKs imported on first use, not when the app is imported
+LAZY_MODULES = ("groq", "notion_client", "symspellpy")
+
+# Generous for slow CI machines; importing app.main takes ~1.2s locally
+IMPORT_BUDGET_SECONDS = 4.0
+
+
+async def wait_for_status(warmer: ComponentWarmer, name: str, status: str) -> None:
+    for _ in range(200):
+        if warmer.snapshot()[name]["status"] == status:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"{name} never became {status}: {warmer.snapshot()[name]}")
+
+
+@pytest.fixture
+async def warmer():
+    warmer = ComponentWarmer()
+    yield warmer
+    await warmer.close()
+
+
+class TestComponentWarmer:
+    """Test components warming up in the background."""
+
+    @pytest.mark.asyncio
+    async def test_start_does_not_wait(self, warmer):
+        """Test start() returns while a component is still loading, and it becomes ready later."""
+        release = threading.Event()
+        warmer.register("dictionary", lambda: release.wait(5))
+
+        warmer.start()
+        await wait_for_status(warmer, "dictionary", "warming")
+        release.set()
+        await wait_for_status(warmer, "dictionary", "ready")
+
+        snapshot = warmer.snapshot()["dictionary"]
+        assert snapshot["error"] is None
+        assert snapshot["elapsed_seconds"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_loader_runs_off_event_loop(self, warmer):
+        """Test loaders run in another thread than the event loop."""
+        threads = []
+        warmer.register("dictionary", lambda: threads.append(threading.get_ident()) or True)
+
+        await warmer.warm_all()
+
+        assert threads and threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_failures_reported(self, warmer):
+        """Test loaders returning False or raising are reported as failed."""
+        def crash():
+            raise OSError("disk full")
+
+        warmer.register("missing", lambda: False)
+        warmer.register("crashing", crash)
+
+        await warmer.warm_all()
+
+        snapshot = warmer.snapshot()
+        assert snapshot["missing"]["status"] == "failed"
+        assert snapshot["crashing"] == {
+            "status": "failed",
+            "elapsed_seconds": snapshot["crashing"]["elapsed_seconds"],
+            "error": "disk full",
+        }
+
+    def test_registered_components_pending(self, warmer):
+        """Test components not started yet are reported as pending."""
+        warmer.register("dictionary", lambda: True)
+
+        assert warmer.snapshot() == {
+            "dictionary": {"status": "pending", "elapsed_seconds": None, "error": None}
+        }
+
+
+class TestSpellcheckInitialization:
+    """Test the spell-check singleton while it loads in the background."""
+
+    def test_published_only_once_loaded(self):
+        """Test requests do not see the service while its dictionary is loading."""
+        seen_during_load = []
+        service = Mock()
+        service.load.side_effect = lambda: seen_during_load.append(
+            spellcheck.get_slovenian_spellcheck_service()
+        ) or True
+
+        with patch.object(spellcheck, "_slovenian_service", None), \
+                patch.object(spellcheck, "SlovenianSpellCheckService", return_value=service):
+            assert spellcheck.initialize_slovenian_spellcheck()
+            assert spellcheck.get_slovenian_spellcheck_service() is service
+
+        assert seen_during_load == [None]
+
+
+class TestReadinessCheck:
+    """Test /health/ready."""
+
+    @staticmethod
+    def request(encryption_service):
+        return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(encryption_service=encryption_service)))
+
+    @pytest.mark.asyncio
+    async def test_ready_while_components_warm(self, warmer):
+        """Test the service is ready with a component still warming, which is reported."""
+        release = threading.Event()
+        warmer.register("spellcheck_sl", lambda: release.wait(5))
+        warmer.start()
+        await wait_for_status(warmer, "spellcheck_sl", "warming")
+
+        with patch("app.routes.health.get_component_warmer", return_value=warmer):
+            response = await readiness_check(self.request(Mock()), db=AsyncMock())
+        release.set()
+
+        assert response.status == "ready"
+        assert response.components["spellcheck_sl"].status == "warming"
+
+    @pytest.mark.asyncio
+    async def test_not_ready_without_encryption(self, warmer):
+        """Test the service is not ready before the encryption service is up."""
+        with patch("app.routes.health.get_component_warmer", return_value=warmer), \
+                pytest.raises(HTTPException) as exc_info:
+            await readiness_check(self.request(None), db=AsyncMock())
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.detail["encryption"] == "unavailable"
+
+    @pytest.mark.asyncio
+    async def test_not_ready_without_database(self, warmer):
+        """Test the service is not ready when the database does not answer."""
+        db = AsyncMock()
+        db.execute.side_effect = ConnectionRefusedError("connection refused")
+
+        with patch("app.routes.health.get_component_warmer", return_value=warmer), \
+                pytest.raises(HTTPException) as exc_info:
+            await readiness_check(self.request(Mock()), db=db)
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.detail["database"] == "disconnected"
+
+
+class TestImportBudget:
+    """Guard the time it takes a worker to import the app."""
+
+    def test_app_import_fast_and_without_provider_sdks(self):
+        """Test importing app.main stays within budget and does not import provider SDKs."""
+        code = (
+            "import json, sys, time\n"
+            "start = time.perf_counter()\n"
+            "import app.main\n"
+            "elapsed = time.perf_counter() - start\n"
+            f"print(json.dumps({{'elapsed': elapsed, 'loaded': [m for m in {LAZY_MODULES!r} if m in sys.modules]}}))\n"
+        )
+        env = {**os.environ, "JWT_SECRET_KEY": "import-budget", "DATABASE_PASSWORD": "import-budget"}
+
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+        assert report["loaded"] == []
+        assert report["elapsed"] < IMPORT_BUDGET_SECONDS
@@ -0,0 +1,139 @@
+"""
+Unit tests for spelling issues stored with texts (app/services/spellcheck.py).
+The dictionary and the encryption service are mocked.
+"""
+import json
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.schemas.spellcheck import SpellingIssue
+from app.services.spellcheck import compute_spelling_issues, load_spelling_issues
+from app.services.spellcheck_slovenian import SlovenianSpellCheckService
+
+ENTRY_ID = uuid.uuid4()
+USER_ID = uuid.uuid4()
+
+
+def make_service(word_count=100, **kwargs):
+    """Loaded spell-check service whose dictionary misses every word."""
+    service = SlovenianSpellCheckService(
+        wordlist_path="/nonexistent/path.txt",
+        dictionary_path="/nonexistent/symspell.dict",
+        **kwargs,
+    )
+    service._loaded = True
+    service._symspell = Mock(word_count=word_count)
+    service._symspell.lookup.return_value = [Mock(term="napaka")]
+    return service
+
+
+@pytest.fixture
+def encryption_service():
+    """Encryption service that 'encrypts' by encoding."""
+    service = AsyncMock()
+    service.encrypt_data.side_effect = lambda db, data, entry_id, user_id: data.encode("utf-8")
+    service.decrypt_data.side_effect = lambda db, data, entry_id, user_id: data
+    return service
+
+
+@pytest.fixture
+def spellcheck_service():
+    """Patch the Slovenian spell-check singleton."""
+    service = make_service()
+    with patch("app.services.spellcheck.get_slovenian_spellcheck_service", return_value=service):
+        yield service
+
+
+class TestDictionaryVersion:
+    """Test dictionary versions."""
+
+    def test_version_depends_on_dictionary_and_settings(self):
+        """Test the version is stable and changes with the dictionary or check settings."""
+        version = make_service().get_dictionary_version()
+
+        assert version == make_service().get_dictionary_version()
+        assert version != make_service(word_count=101).get_dictionary_version()
+        assert version != make_service(suggestion_count=1).get_dictionary_version()
+
+    def test_no_version_when_not_loaded(self):
+        """Test a service without a dictionary has no version."""
+        service = SlovenianSpellCheckService(
+            wordlist_path="/nonexistent/path.txt",
+            dictionary_path="/nonexistent/symspell.dict",
+        )
+
+        assert service.get_dictionary_version() == ""
+
+
+class TestComputeSpellingIssues:
+    """Test spelling issues computed on completion."""
+
+    @pytest.mark.asyncio
+    async def test_issues_encrypted_with_version(self, encryption_service, spellcheck_service):
+        """Test Slovenian text is checked and the issues encrypted for storage."""
+        encrypted, version = await compute_spelling_issues(
+            encryption_service, AsyncMock(), "napka", "sl", ENTRY_ID, USER_ID
+        )
+
+        assert json.loads(encrypted) == [{"word": "napka", "suggestions": ["napaka"]}]
+        assert version == spellcheck_service.get_dictionary_version()
+
+    @pytest.mark.asyncio
+    async def test_other_languages_not_checked(self, encryption_service, spellcheck_service):
+        """Test texts in unsupported languages get no stored issues."""
+        assert await compute_spelling_issues(
+            encryption_service, AsyncMock(), "napka", "en", ENTRY_ID, USER_ID
+        ) == (None, None)
+        spellcheck_service._symspell.lookup.assert_not_called()
+
+
+class TestLoadSpellingIssues:
+    """Test reading stored spelling issues."""
+
+    @pytest.mark.asyncio
+    async def test_stored_issues_served_without_checking(self, encryption_service, spellcheck_service):
+        """Test issues stored with the current dictionary version are not recomputed."""
+        stored = json.dumps([{"word": "stored", "suggestions": ["store"]}]).encode("utf-8")
+        record = SimpleNamespace(
+            spelling_issues=stored,
+            spelling_dictionary_version=spellcheck_service.get_dictionary_version(),
+        )
+
+        issues = await load_spelling_issues(
+            encryption_service, AsyncMock(), record, "napka", "sl", ENTRY_ID, USER_ID
+        )
+
+        assert issues == [SpellingIssue(word="stored", suggestions=["store"])]
+        spellcheck_service._symspell.lookup.assert_not_called()
+        assert record.spelling_issues is stored
+
+    @pytest.mark.asyncio
+    async def test_stale_issues_recomputed_and_stored(self, encryption_service, spellcheck_service):
+        """Test issues of another dictionary version (or none) are recomputed and set on the record."""
+        for stored_version in (None, "old-version"):
+            record = SimpleNamespace(
+                spelling_issues=b"[]" if stored_version else None,
+                spelling_dictionary_version=stored_version,
+            )
+
+            issues = await load_spelling_issues(
+                encryption_service, AsyncMock(), record, "napka", "sl", ENTRY_ID, USER_ID
+            )
+
+            assert issues == [SpellingIssue(word="napka", suggestions=["napaka"])]
+            assert json.loads(record.spelling_issues) == [{"word": "napka", "suggestions": ["napaka"]}]
+            assert record.spelling_dictionary_version == spellcheck_service.get_dictionary_version()
+
+    @pytest.mark.asyncio
+    async def test_disabled_spellcheck_returns_none(self, encryption_service, spellcheck_service):
+        """Test nothing is served or computed when spell-check is disabled."""
+        record = SimpleNamespace(spelling_issues=None, spelling_dictionary_version=None)
+
+        with patch("app.services.spellcheck.settings.SPELLCHECK_ENABLED", False):
+            assert await load_spelling_issues(
+                encryption_service, AsyncMock(), record, "napka", "sl", ENTRY_ID, USER_ID
+            ) is None
+        assert record.spelling_issues is None
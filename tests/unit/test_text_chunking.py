@@ -0,0 +1,293 @@
+"""
+Unit tests for transcript windowing (app/utils/text_chunking.py) and
+windowed cleanup of long transcripts in the LLM cleanup services.
+"""
+import asyncio
+import re
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.gams_batcher import GamsBatchCoalescer
+from app.services.llm_cleanup_groq import GroqLLMCleanupService
+from app.services.llm_cleanup_runpod_gams import RunPodGamsLLMCleanupService
+from app.utils.text_chunking import (
+    BREAK_MARKER,
+    cleanup_window_budget,
+    estimate_tokens,
+    split_transcript,
+    stitch_cleaned_windows,
+)
+
+
+def make_paragraphs(paragraphs: int, sentences: int) -> str:
+    """Transcript of numbered sentences in blank-line separated paragraphs."""
+    return "\n\n".join(
+        " ".join(f"Stavek {p}-{s} ima nekaj besed." for s in range(sentences))
+        for p in range(paragraphs)
+    )
+
+
+def fake_cleanup(window_text: str) -> str:
+    """Cleanup output like the LLM's: paragraphs become <break> markers."""
+    return re.sub(r"\n\s*\n", BREAK_MARKER, window_text)
+
+
+class TestSplitTranscript:
+    """Test splitting transcripts into windows."""
+
+    def test_short_text_is_one_window(self):
+        """Test a transcript that fits is returned unchanged as one window."""
+        windows = split_transcript("Kratko besedilo.", max_tokens=100, overlap_tokens=10)
+
+        assert len(windows) == 1
+        assert windows[0].text == "Kratko besedilo."
+        assert windows[0].overlap_words == 0
+
+    def test_windows_respect_budget(self):
+        """Test every window fits the token budget."""
+        text = make_paragraphs(paragraphs=12, sentences=10)
+
+        windows = split_transcript(text, max_tokens=200, overlap_tokens=30)
+
+        assert len(windows) > 1
+        assert all(estimate_tokens(w.text) <= 200 for w in windows)
+        assert [w.index for w in windows] == list(range(len(windows)))
+
+    def test_cuts_on_paragraph_boundaries(self):
+        """Test windows (minus overlap) start at paragraph starts."""
+        text = make_paragraphs(paragraphs=12, sentences=6)
+
+        windows = split_transcript(text, max_tokens=150, overlap_tokens=0)
+
+        assert len(windows) > 1
+        for window in windows:
+            assert re.match(r"Stavek \d+-0 ", window.text)
+
+    def test_cuts_on_speaker_turns(self):
+        """Test a single diarized paragraph is cut before speaker labels."""
+        text = " ".join(
+            f"Speaker {i % 2 + 1}: " + " ".join(f"beseda{i}_{j}" for j in range(20)) + "."
+            for i in range(10)
+        )
+
+        windows = split_transcript(text, max_tokens=200, overlap_tokens=0)
+
+        assert len(windows) > 1
+        assert all(w.text.startswith("Speaker ") for w in windows)
+
+    def test_oversized_sentence_falls_back_to_words(self):
+        """Test a sentence longer than a window is split on words."""
+        text = " ".join(f"beseda{i}" for i in range(300))
+
+        windows = split_transcript(text, max_tokens=100)
+
+        assert all(estimate_tokens(w.text) <= 100 for w in windows)
+        assert " ".join(w.text for w in windows) == text
+
+    def test_overlap_repeats_previous_sentences(self):
+        """Test a window starts with trailing sentences of the previous one."""
+        text = make_paragraphs(paragraphs=6, sentences=8)
+
+        windows = split_transcript(text, max_tokens=200, overlap_tokens=30)
+
+        for previous, window in zip(windows, windows[1:]):
+            assert window.overlap_words > 0
+            overlap = " ".join(window.text.split()[:window.overlap_words])
+            assert previous.text.endswith(overlap)
+
+    def test_invalid_budget_raises(self):
+        """Test a non-positive budget is rejected."""
+        with pytest.raises(ValueError):
+            split_transcript("Besedilo.", max_tokens=0)
+
+
+class TestStitchCleanedWindows:
+    """Test stitching cleaned window outputs."""
+
+    def test_roundtrip_with_overlap(self):
+        """Test identity cleanup of all windows reproduces the transcript once."""
+        text = make_paragraphs(paragraphs=10, sentences=8)
+        windows = split_transcript(text, max_tokens=200, overlap_tokens=30)
+
+        stitched = stitch_cleaned_windows([fake_cleanup(w.text) for w in windows], windows)
+
+        assert stitched == fake_cleanup(text)
+
+    def test_roundtrip_without_overlap(self):
+        """Test windows without overlap are joined with a paragraph break."""
+        text = make_paragraphs(paragraphs=8, sentences=6)
+        windows = split_transcript(text, max_tokens=150, overlap_tokens=0)
+
+        stitched = stitch_cleaned_windows([fake_cleanup(w.text) for w in windows], windows)
+
+        assert stitched == fake_cleanup(text)
+
+    def test_overlap_matched_despite_cleanup_edits(self):
+        """Test the overlap is found when punctuation and case were changed."""
+        text = make_paragraphs(paragraphs=6, sentences=8)
+        windows = split_transcript(text, max_tokens=200, overlap_tokens=30)
+        outputs = [fake_cleanup(w.text).replace(" ima ", " IMA, ") for w in windows]
+
+        stitched = stitch_cleaned_windows(outputs, windows)
+
+        for p in range(6):
+            for s in range(8):
+                assert stitched.count(f"Stavek {p}-{s} IMA,") == 1
+
+    def test_unmatched_overlap_keeps_both_copies(self):
+        """Test outputs whose overlap cannot be found are kept whole."""
+        text = make_paragraphs(paragraphs=6, sentences=8)
+        windows = split_transcript(text, max_tokens=200, overlap_tokens=30)
+        outputs = [f"Odstavek {w.index}." for w in windows]
+
+        stitched = stitch_cleaned_windows(outputs, windows)
+
+        assert stitched == BREAK_MARKER.join(outputs)
+
+
+class TestCleanupWindowBudget:
+    """Test the per-window token budget."""
+
+    def test_limited_by_output(self):
+        """Test large contexts are limited by the output length."""
+        assert cleanup_window_budget("Prompt {transcription_text}", 131072, 5000) == 5000
+
+    def test_limited_by_context(self):
+        """Test small contexts leave room for template and output."""
+        template = "x" * 300 + "{transcription_text}"
+
+        assert cleanup_window_budget(template, 4096, 2048) == 4096 - 2048 - 100
+
+    def test_template_too_long_raises(self):
+        """Test a template that fills the context is rejected."""
+        with pytest.raises(ValueError):
+            cleanup_window_budget("x" * 9000 + "{transcription_text}", 4096, 2048)
+
+
+class TestWindowedCleanup:
+    """Test long transcripts are cleaned in windows by the cleanup services."""
+
+    @pytest.mark.asyncio
+    async def test_gams_windows_share_one_batch(self):
+        """Test GaMS windows are sent as one batch and stitched back together."""
+        mock_settings = MagicMock()
+        mock_settings.RUNPOD_API_KEY = "test-api-key"
+        mock_settings.RUNPOD_LLM_GAMS_ENDPOINT_ID = "test-endpoint-id"
+        mock_settings.RUNPOD_LLM_GAMS_MODEL = "GaMS-9B-Instruct"
+        mock_settings.RUNPOD_LLM_GAMS_TIMEOUT = 120
+        mock_settings.RUNPOD_LLM_GAMS_MAX_RETRIES = 0
+        mock_settings.RUNPOD_LLM_GAMS_DEFAULT_TEMPERATURE = 0.0
+        mock_settings.RUNPOD_LLM_GAMS_DEFAULT_TOP_P = 0.0
+        mock_settings.RUNPOD_LLM_GAMS_MAX_TOKENS = 400
+        mock_settings.RUNPOD_LLM_GAMS_CONTEXT_WINDOW = 1200
+        mock_settings.LLM_CLEANUP_WINDOW_OVERLAP_TOKENS = 40
+        mock_settings.LLM_CLEANUP_MAX_CONCURRENT_WINDOWS = 8
+        mock_settings.RUNPOD_ASYNC_JOBS = False
+
+        inputs = []
+
+        async def send(input_data):
+            inputs.append(input_data)
+            return {
+                "results": [
+                    {"id": item["id"], "text": fake_cleanup(item["prompt"].split("TEXT:\n", 1)[1])}
+                    for item in input_data["batch"]
+                ]
+            }
+
+        batcher = GamsBatchCoalescer(window=0.02, max_batch_size=8)
+        with patch("app.services.llm_cleanup_runpod_gams.settings", mock_settings), \
+                patch("app.services.llm_cleanup_runpod_gams.get_gams_batcher", return_value=batcher):
+            service = RunPodGamsLLMCleanupService()
+        service._send_runpod_input = send
+        service._get_cleanup_prompt = AsyncMock(return_value=("Clean up.\nTEXT:\n{transcription_text}", 7))
+
+        text = make_paragraphs(paragraphs=12, sentences=8)
+        result = await service.cleanup_transcription(text, entry_type="dream")
+
+        assert len(inputs) == 1
+        assert len(inputs[0]["batch"]) > 1
+        assert result["cleaned_text"] == text
+        assert result["llm_raw_response"] == fake_cleanup(text)
+        assert result["prompt_template_id"] == 7
+
+    @pytest.mark.asyncio
+    async def test_groq_short_transcript_is_one_request(self):
+        """Test a transcript within the output limit is cleaned in one request."""
+        with patch("groq.AsyncGroq"):
+            service = GroqLLMCleanupService(api_key="test-key")
+        service._get_cleanup_prompt = AsyncMock(return_value=("Clean:\n{transcription_text}", None))
+        service._call_groq_cleanup = AsyncMock(
+            return_value={"cleaned_text": "ok", "llm_raw_response": "ok"}
+        )
+
+        await service.cleanup_transcription("Kratek sanj.", entry_type="dream")
+
+        service._call_groq_cleanup.assert_awaited_once()
+        assert service._call_groq_cleanup.await_args.args[0] == "Clean:\nKratek sanj."
+
+    @pytest.mark.asyncio
+    async def test_groq_window_failure_raises(self):
+        """Test a window that keeps failing fails the whole cleanup."""
+        from app.services.llm_cleanup_base import LLMCleanupError
+
+        with patch("groq.AsyncGroq"):
+            service = GroqLLMCleanupService(api_key="test-key")
+        service.max_retries = 0
+        service._get_cleanup_prompt = AsyncMock(return_value=("Clean:\n{transcription_text}", 3))
+
+        async def call(prompt, **kwargs):
+            await asyncio.sleep(0)
+            if "Stavek 0-0" in prompt:
+                raise Exception("rate limited")
+            return {"cleaned_text": "x", "llm_raw_response": "x"}
+
+        service._call_groq_cleanup = call
+
+        text = make_paragraphs(paragraphs=40, sentences=40)
+        with pytest.raises(LLMCleanupError) as exc_info:
+            await service.cleanup_transcription(text, entry_type="dream")
+
+        assert exc_info.value.prompt_template_id == 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider", ["groq", "gams"])
+    async def test_window_failure_stops_other_windows(self, provider):
+        """Test the first failing window cancels running windows and queued ones never start."""
+        from app.services.llm_cleanup_base import LLMCleanupError
+
+        if provider == "groq":
+            with patch("groq.AsyncGroq"):
+                service = GroqLLMCleanupService(api_key="test-key")
+        else:
+            service = RunPodGamsLLMCleanupService(api_key="test-key", endpoint_id="test-endpoint")
+        service.max_concurrent_windows = 2
+        service._get_cleanup_prompt = AsyncMock(return_value=("Clean:\n{transcription_text}", 3))
+        service.max_tokens = 400
+        if provider == "gams":
+            service.context_window = 1200
+
+        started, cancelled = [], []
+
+        async def clean(prompt, template_id, **kwargs):
+            started.append(prompt)
+            if "Stavek 0-0" in prompt:
+                await asyncio.sleep(0)
+                raise LLMCleanupError("rate limited", prompt_template_id=template_id)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(prompt)
+                raise
+            return {"cleaned_text": "x", "llm_raw_response": "x"}
+
+        service._cleanup_with_retries = clean
+
+        text = make_paragraphs(paragraphs=40, sentences=40)
+        with pytest.raises(LLMCleanupError):
+            await service.cleanup_transcription(text, entry_type="dream")
+        await asyncio.sleep(0)
+
+        assert len(started) == 2
+        assert len(cancelled) == 1
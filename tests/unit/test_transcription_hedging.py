@@ -0,0 +1,229 @@
+"""
+Unit tests for hedged transcription requests (app/services/transcription_hedging.py).
+Providers are replaced by local stand-in services that simulate RunPod cold starts.
+"""
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.transcription import TranscriptionService
+from app.services.transcription_hedging import (
+    HedgeTarget,
+    LatencyTracker,
+    hedge_deadline,
+    select_hedge_target,
+    transcribe_with_hedging,
+)
+
+
+class StandInTranscriptionService(TranscriptionService):
+    """Stand-in provider answering after a fixed delay (cold start + inference)."""
+
+    def __init__(self, name: str, delay: float, error: Exception = None):
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.calls = []
+        self.cancelled = False
+
+    async def transcribe_audio(self, audio_path: Path, language: str = "en", **kwargs):
+        self.calls.append(kwargs)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return {"text": f"text from {self.name}", "language": language}
+
+    def supports_diarization(self) -> bool:
+        return True
+
+    def get_supported_languages(self) -> list[str]:
+        return ["sl"]
+
+    def get_model_name(self) -> str:
+        return self.name
+
+    async def list_available_models(self):
+        return []
+
+
+KWARGS = {"audio_path": Path("audio.wav"), "language": "sl", "model": "pyannote", "enable_diarization": False}
+
+
+class TestTranscribeWithHedging:
+    """Test racing the primary against the hedge request."""
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_does_not_hedge(self):
+        """Test a primary answering before the deadline is used alone."""
+        primary = StandInTranscriptionService("warm", delay=0.0)
+        secondary = StandInTranscriptionService("other", delay=0.0)
+
+        result, outcome = await transcribe_with_hedging(primary, secondary, 0.5, KWARGS, LatencyTracker())
+
+        assert result["text"] == "text from warm"
+        assert not outcome.hedge_fired and outcome.service is primary
+        assert secondary.calls == []
+
+    @pytest.mark.asyncio
+    async def test_cold_primary_is_hedged_and_cancelled(self):
+        """Test the hedge wins against a cold start and the primary is cancelled."""
+        primary = StandInTranscriptionService("cold", delay=5.0)
+        secondary = StandInTranscriptionService("warm-variant", delay=0.01)
+
+        result, outcome = await transcribe_with_hedging(primary, secondary, 0.02, KWARGS, LatencyTracker())
+        await asyncio.sleep(0)
+
+        assert result["text"] == "text from warm-variant"
+        assert outcome.hedge_fired and outcome.hedge_won
+        assert primary.cancelled
+        # The hedge uses its own default model
+        assert secondary.calls[0]["model"] is None
+
+    @pytest.mark.asyncio
+    async def test_primary_still_wins_after_hedge(self):
+        """Test the primary's result is used if it finishes first after the hedge was sent."""
+        primary = StandInTranscriptionService("slow", delay=0.05)
+        secondary = StandInTranscriptionService("cold-variant", delay=5.0)
+
+        result, outcome = await transcribe_with_hedging(primary, secondary, 0.01, KWARGS, LatencyTracker())
+        await asyncio.sleep(0)
+
+        assert result["text"] == "text from slow"
+        assert outcome.hedge_fired and not outcome.hedge_won
+        assert secondary.cancelled
+
+    @pytest.mark.asyncio
+    async def test_failed_request_waits_for_the_other(self):
+        """Test a failing hedge does not fail the transcription."""
+        primary = StandInTranscriptionService("slow", delay=0.05)
+        secondary = StandInTranscriptionService("broken", delay=0.0, error=RuntimeError("endpoint down"))
+
+        result, outcome = await transcribe_with_hedging(primary, secondary, 0.01, KWARGS, LatencyTracker())
+
+        assert result["text"] == "text from slow"
+        assert outcome.service is primary
+
+    @pytest.mark.asyncio
+    async def test_both_failing_raises_primary_error(self):
+        """Test the primary's error is raised when both requests fail."""
+        primary = StandInTranscriptionService("a", delay=0.03, error=RuntimeError("primary failed"))
+        secondary = StandInTranscriptionService("b", delay=0.0, error=RuntimeError("hedge failed"))
+
+        with pytest.raises(RuntimeError, match="primary failed"):
+            await transcribe_with_hedging(primary, secondary, 0.01, KWARGS, LatencyTracker())
+
+    @pytest.mark.asyncio
+    async def test_long_warm_primary_not_hedged(self):
+        """Test a long recording on a warm primary gets a deadline long enough not to be hedged."""
+        tracker = LatencyTracker(window=100, min_samples=1)
+        for _ in range(20):
+            tracker.record("warm", 0.01)  # Short recordings, warm worker
+        primary = StandInTranscriptionService("warm", delay=0.05)
+        secondary = StandInTranscriptionService("other", delay=0.0)
+
+        with patch("app.services.transcription_hedging.settings") as mock_settings:
+            mock_settings.TRANSCRIPTION_HEDGE_PERCENTILE = 95.0
+            mock_settings.TRANSCRIPTION_HEDGE_MIN_DELAY_SECONDS = 0.0
+            # Ten times longer recording: same speed, ten times the latency
+            deadline = hedge_deadline("warm", 10.0, tracker)
+
+        result, outcome = await transcribe_with_hedging(
+            primary, secondary, deadline, KWARGS, tracker, audio_seconds=10.0
+        )
+
+        assert deadline == pytest.approx(0.1)
+        assert not outcome.hedge_fired and result["text"] == "text from warm"
+        assert secondary.calls == []
+
+    @pytest.mark.asyncio
+    async def test_latencies_recorded(self):
+        """Test completed and cancelled primaries both feed the latency window."""
+        tracker = LatencyTracker(window=10, min_samples=1)
+        primary = StandInTranscriptionService("cold", delay=5.0)
+        secondary = StandInTranscriptionService("warm", delay=0.0)
+
+        await transcribe_with_hedging(primary, secondary, 0.02, KWARGS, tracker, audio_seconds=0.5)
+
+        assert tracker.percentile("cold", 50) >= 0.04
+        assert tracker.percentile("warm", 50) is not None
+
+
+class TestHedgeDeadline:
+    """Test the percentile-based hedge deadline."""
+
+    def test_percentile_needs_min_samples(self):
+        """Test no percentile is reported before min_samples latencies."""
+        tracker = LatencyTracker(window=100, min_samples=3)
+        tracker.record("m", 1.0)
+        tracker.record("m", 2.0)
+        assert tracker.percentile("m", 95) is None
+
+        tracker.record("m", 3.0)
+        assert tracker.percentile("m", 50) == 2.0
+        assert tracker.percentile("m", 95) == 3.0
+
+    def test_window_drops_old_latencies(self):
+        """Test only the most recent latencies count."""
+        tracker = LatencyTracker(window=2, min_samples=1)
+        for seconds in (100.0, 1.0, 1.0):
+            tracker.record("m", seconds)
+        assert tracker.percentile("m", 100) == 1.0
+
+    def test_deadline_scales_with_duration(self):
+        """Test the default and the observed latency per audio second scale with the recording."""
+        tracker = LatencyTracker(window=100, min_samples=1)
+        with patch("app.services.transcription_hedging.settings") as mock_settings:
+            mock_settings.TRANSCRIPTION_HEDGE_PERCENTILE = 95.0
+            mock_settings.TRANSCRIPTION_HEDGE_DEFAULT_SECONDS_PER_AUDIO_SECOND = 1.0
+            mock_settings.TRANSCRIPTION_HEDGE_DEFAULT_DELAY_SECONDS = 60.0
+            mock_settings.TRANSCRIPTION_HEDGE_MIN_DELAY_SECONDS = 15.0
+
+            assert hedge_deadline("m", 30.0, tracker) == 60.0
+            assert hedge_deadline("m", 600.0, tracker) == 600.0
+
+            tracker.record("m", 0.2)
+            assert hedge_deadline("m", 30.0, tracker) == 15.0
+            assert hedge_deadline("m", 3600.0, tracker) == 720.0
+
+
+class TestSelectHedgeTarget:
+    """Test choosing the secondary provider."""
+
+    def configured(self, groq_key="", **endpoints):
+        """Settings with the given Slovene ASR endpoints and Groq key."""
+        mock_settings = MagicMock()
+        mock_settings.RUNPOD_API_KEY = "test-key"
+        mock_settings.GROQ_API_KEY = groq_key
+        mock_settings.SLOVENE_ASR_NFA_ENDPOINT_ID = endpoints.get("nfa", "")
+        mock_settings.SLOVENE_ASR_MMS_ENDPOINT_ID = endpoints.get("mms", "")
+        mock_settings.SLOVENE_ASR_PYANNOTE_ENDPOINT_ID = endpoints.get("pyannote", "")
+        return patch("app.services.provider_registry.settings", mock_settings)
+
+    def test_prefers_other_variant(self):
+        """Test another configured RunPod variant is preferred (keeps diarization)."""
+        with self.configured(groq_key="gsk", nfa="e1", pyannote="e2"):
+            target = select_hedge_target("clarin-slovene-asr", "pyannote", enable_diarization=True)
+        assert target == HedgeTarget(provider="clarin-slovene-asr", model="nfa")
+
+    def test_default_variant_is_not_its_own_hedge(self):
+        """Test the default (first available) variant is hedged with another one."""
+        with self.configured(nfa="e1", mms="e2"):
+            target = select_hedge_target("clarin-slovene-asr", None, enable_diarization=True)
+        assert target == HedgeTarget(provider="clarin-slovene-asr", model="mms")
+
+    def test_groq_for_non_diarized_jobs(self):
+        """Test Groq is used when no other variant exists and diarization is off."""
+        with self.configured(groq_key="gsk", pyannote="e2"):
+            assert select_hedge_target("clarin-slovene-asr", "pyannote", False) == HedgeTarget(provider="groq")
+            assert select_hedge_target("clarin-slovene-asr", "pyannote", True) is None
+
+    def test_no_hedge_for_groq(self):
+        """Test Groq itself is not hedged with Groq."""
+        with self.configured(groq_key="gsk"):
+            assert select_hedge_target("groq", None, False) is None
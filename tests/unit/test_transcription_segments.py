@@ -0,0 +1,298 @@
+"""
+Unit tests for paged storage of transcription segments
+(app/services/transcription_segments.py) and the windowed segments endpoint.
+Encryption and the database are replaced by in-memory fakes.
+"""
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.routes.transcription import get_transcription_segments
+from app.services import transcription_segments
+from app.services.transcription_segments import (
+    load_segment_window,
+    load_segments,
+    paginate_segments,
+    store_segment_pages,
+)
+
+PAGE_SIZE = 10
+
+
+def make_segments(count: int, speaker: bool = True) -> list:
+    """Segments of 2 seconds each with one word per second."""
+    return [
+        {
+            "id": i,
+            "start": 2.0 * i,
+            "end": 2.0 * i + 2.0,
+            "text": f"segment {i}",
+            "speaker": f"Speaker {i % 2 + 1}" if speaker else None,
+            "words": [
+                {"word": "segment", "start": 2.0 * i, "end": 2.0 * i + 1.0},
+                {"word": str(i), "start": 2.0 * i + 1.0, "end": 2.0 * i + 2.0},
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+class FakePageStore:
+    """In-memory stand-in for the segment page methods of db_service."""
+
+    def __init__(self):
+        self.pages = {}
+
+    async def replace_segment_pages(self, db, transcription_id, pages):
+        self.pages[transcription_id] = [SimpleNamespace(**page) for page in pages]
+
+    async def get_segment_page_index(self, db, transcription_id):
+        return list(self.pages.get(transcription_id, []))
+
+    async def get_segment_pages(self, db, transcription_id, page_indexes):
+        return [page for page in self.pages.get(transcription_id, []) if page.page_index in page_indexes]
+
+
+@pytest.fixture
+def store():
+    return FakePageStore()
+
+
+@pytest.fixture
+def decrypted():
+    """Encrypted payloads decrypted so far."""
+    return []
+
+
+@pytest.fixture(autouse=True)
+def fakes(store, decrypted):
+    async def fake_encrypt_json(encryption_service, db, data, voice_entry_id, user_id):
+        return json.dumps(data).encode()
+
+    async def fake_decrypt_json(encryption_service, db, encrypted_bytes, voice_entry_id, user_id):
+        decrypted.append(encrypted_bytes)
+        return json.loads(encrypted_bytes)
+
+    with patch.object(transcription_segments, "db_service", store), \
+            patch.object(transcription_segments, "encrypt_json", fake_encrypt_json), \
+            patch.object(transcription_segments, "decrypt_json", fake_decrypt_json), \
+            patch.object(transcription_segments.settings, "TRANSCRIPTION_SEGMENT_PAGE_SIZE", PAGE_SIZE):
+        yield
+
+
+async def stored_transcription(segments: list) -> SimpleNamespace:
+    transcription = SimpleNamespace(id=uuid4(), segments=None)
+    await store_segment_pages(Mock(), AsyncMock(), transcription.id, segments, uuid4(), uuid4())
+    return transcription
+
+
+async def window(transcription, **kwargs):
+    return await load_segment_window(Mock(), AsyncMock(), transcription, uuid4(), uuid4(), **kwargs)
+
+
+class TestPaginateSegments:
+    """Test splitting segments into indexed pages."""
+
+    def test_pages_and_index_columns(self):
+        """Test pages hold page_size segments with their position and time range."""
+        segments = make_segments(25)
+        segments[3]["end"] = 30.0  # Overlaps later segments
+
+        pages = paginate_segments(segments, PAGE_SIZE)
+
+        assert [p["segment_count"] for p in pages] == [10, 10, 5]
+        assert [p["first_position"] for p in pages] == [0, 10, 20]
+        assert (pages[0]["start_time"], pages[0]["end_time"]) == (0.0, 30.0)
+        assert (pages[2]["start_time"], pages[2]["end_time"]) == (40.0, 50.0)
+        assert [s for p in pages for s in p["segments"]] == segments
+
+    def test_speaker_flag(self):
+        """Test has_speaker is set only for pages with speaker labels."""
+        segments = make_segments(12, speaker=False)
+        segments[11]["speaker"] = "Speaker 1"
+
+        pages = paginate_segments(segments, PAGE_SIZE)
+
+        assert [p["has_speaker"] for p in pages] == [False, True]
+
+    def test_no_segments(self):
+        """Test no segments give no pages."""
+        assert paginate_segments([], PAGE_SIZE) == []
+
+
+class TestSegmentWindow:
+    """Test loading windows of stored segments."""
+
+    @pytest.mark.asyncio
+    async def test_time_window_decrypts_overlapping_pages_only(self, decrypted):
+        """Test a time window returns overlapping segments and decrypts only their pages."""
+        transcription = await stored_transcription(make_segments(100))
+
+        result = await window(transcription, start=41.0, end=45.0)
+
+        assert [s["id"] for s in result.segments] == [20, 21, 22]
+        assert result.next_cursor is None
+        assert result.total_segments == 100
+        assert result.diarization_applied
+        assert len(decrypted) == 1
+
+    @pytest.mark.asyncio
+    async def test_cursor_walks_whole_transcript(self, decrypted):
+        """Test following next_cursor returns every segment once, across pages."""
+        segments = make_segments(35)
+        transcription = await stored_transcription(segments)
+
+        ids, cursor = [], 0
+        while cursor is not None:
+            result = await window(transcription, cursor=cursor, limit=8)
+            assert len(result.segments) <= 8
+            ids.extend(s["id"] for s in result.segments)
+            cursor = result.next_cursor
+
+        assert ids == list(range(35))
+
+    @pytest.mark.asyncio
+    async def test_limit_across_page_boundary(self, decrypted):
+        """Test a window spanning two pages stops decrypting once limit is reached."""
+        transcription = await stored_transcription(make_segments(100))
+
+        result = await window(transcription, start=16.0, limit=5)
+
+        assert [s["id"] for s in result.segments] == [8, 9, 10, 11, 12]
+        assert result.next_cursor == 13
+        assert len(decrypted) == 2
+
+    @pytest.mark.asyncio
+    async def test_segment_ending_at_window_start_excluded(self):
+        """Test a segment ending exactly where the window starts is not returned."""
+        transcription = await stored_transcription(make_segments(5))
+
+        result = await window(transcription, start=4.0, end=6.0)
+
+        assert [s["id"] for s in result.segments] == [2]
+
+    @pytest.mark.asyncio
+    async def test_words_omitted(self):
+        """Test include_words=False drops word-level timings."""
+        transcription = await stored_transcription(make_segments(3))
+
+        with_words = await window(transcription)
+        without_words = await window(transcription, include_words=False)
+
+        assert with_words.segments[0]["words"][0]["word"] == "segment"
+        assert all("words" not in s for s in without_words.segments)
+
+    @pytest.mark.asyncio
+    async def test_no_segments(self):
+        """Test a transcription without segments gives an empty window."""
+        result = await window(SimpleNamespace(id=uuid4(), segments=None))
+
+        assert result.segments == []
+        assert result.total_segments == 0
+        assert not result.diarization_applied
+
+    @pytest.mark.asyncio
+    async def test_legacy_blob(self):
+        """Test segments stored as one blob are windowed the same way."""
+        segments = make_segments(30)
+        transcription = SimpleNamespace(id=uuid4(), segments=json.dumps(segments).encode())
+
+        result = await window(transcription, start=20.0, limit=4)
+
+        assert [s["id"] for s in result.segments] == [10, 11, 12, 13]
+        assert result.next_cursor == 14
+        assert result.total_segments == 30
+
+    @pytest.mark.asyncio
+    async def test_undecryptable_page(self, store):
+        """Test a page that cannot be decrypted raises RuntimeError."""
+        transcription = await stored_transcription(make_segments(3))
+
+        with patch.object(transcription_segments, "decrypt_json", AsyncMock(return_value=None)), \
+                pytest.raises(RuntimeError):
+            await window(transcription)
+
+
+class TestLoadSegments:
+    """Test loading all segments for the full transcription responses."""
+
+    @pytest.mark.asyncio
+    async def test_all_segments_without_words(self):
+        """Test all pages are joined and word timings dropped, as before pages."""
+        segments = make_segments(25)
+        transcription = await stored_transcription(segments)
+
+        loaded, diarization_applied = await load_segments(Mock(), AsyncMock(), transcription, uuid4(), uuid4())
+
+        assert loaded == [{k: v for k, v in s.items() if k != "words"} for s in segments]
+        assert diarization_applied
+
+    @pytest.mark.asyncio
+    async def test_index_only(self, decrypted):
+        """Test with_segments=False reports diarization without decrypting pages."""
+        transcription = await stored_transcription(make_segments(25))
+
+        loaded, diarization_applied = await load_segments(
+            Mock(), AsyncMock(), transcription, uuid4(), uuid4(), with_segments=False
+        )
+
+        assert loaded is None
+        assert diarization_applied
+        assert decrypted == []
+
+
+class TestSegmentsEndpoint:
+    """Test GET /transcriptions/{id}/segments."""
+
+    @pytest.mark.asyncio
+    async def test_window_returned(self):
+        """Test the endpoint returns the window with word timings and the next cursor."""
+        transcription = await stored_transcription(make_segments(30))
+        transcription.entry_id = uuid4()
+        user = SimpleNamespace(id=uuid4())
+
+        with patch("app.routes.transcription.db_service") as db_service:
+            db_service.get_transcription_by_id = AsyncMock(return_value=transcription)
+            db_service.get_entry_by_id = AsyncMock(return_value=SimpleNamespace(id=transcription.entry_id))
+            response = await get_transcription_segments(
+                transcription.id, from_seconds=10.0, to_seconds=None, cursor=0, limit=3,
+                include_words=True, db=AsyncMock(), current_user=user, encryption_service=Mock(),
+            )
+
+        assert [s.id for s in response.segments] == [5, 6, 7]
+        assert response.segments[0].words[1].word == "5"
+        assert response.next_cursor == 8
+        assert response.total_segments == 30
+
+    @pytest.mark.asyncio
+    async def test_other_users_transcription_not_found(self):
+        """Test segments of another user's transcription are not returned."""
+        transcription = SimpleNamespace(id=uuid4(), entry_id=uuid4(), segments=None)
+
+        with patch("app.routes.transcription.db_service") as db_service, \
+                pytest.raises(HTTPException) as exc_info:
+            db_service.get_transcription_by_id = AsyncMock(return_value=transcription)
+            db_service.get_entry_by_id = AsyncMock(return_value=None)
+            await get_transcription_segments(
+                transcription.id, from_seconds=None, to_seconds=None, cursor=0, limit=None,
+                include_words=True, db=AsyncMock(), current_user=SimpleNamespace(id=uuid4()),
+                encryption_service=Mock(),
+            )
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_empty_range_rejected(self):
+        """Test 'to' before 'from' is rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            await get_transcription_segments(
+                uuid4(), from_seconds=10.0, to_seconds=5.0, cursor=0, limit=None,
+                include_words=True, db=AsyncMock(), current_user=SimpleNamespace(id=uuid4()),
+                encryption_service=Mock(),
+            )
+
+        assert exc_info.value.status_code == 400